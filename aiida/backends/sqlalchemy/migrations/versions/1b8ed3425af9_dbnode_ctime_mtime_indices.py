@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida_core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Adding indices on the `ctime` and `mtime` column of the `DbNode` table
+
+Revision ID: 1b8ed3425af9
+Revises: 5a49629f0d45
+Create Date: 2019-04-02 10:12:53.118563
+
+"""
+# pylint: disable=invalid-name,no-member,import-error,no-name-in-module
+from __future__ import division
+from __future__ import print_function
+from __future__ import absolute_import
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '1b8ed3425af9'
+down_revision = '5a49629f0d45'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Migrations for the upgrade."""
+    op.create_index(op.f('ix_db_dbnode_ctime'), 'db_dbnode', ['ctime'], unique=False)
+    op.create_index(op.f('ix_db_dbnode_mtime'), 'db_dbnode', ['mtime'], unique=False)
+
+
+def downgrade():
+    """Migrations for the downgrade."""
+    op.drop_index(op.f('ix_db_dbnode_mtime'), table_name='db_dbnode')
+    op.drop_index(op.f('ix_db_dbnode_ctime'), table_name='db_dbnode')
@@ -38,8 +38,8 @@ class DbNode(Base):
     process_type = Column(String(255), index=True)
     label = Column(String(255), index=True, nullable=True, default='')  # Does it make sense to be nullable and have a default?
     description = Column(Text(), nullable=True, default='')
-    ctime = Column(DateTime(timezone=True), default=timezone.now)
-    mtime = Column(DateTime(timezone=True), default=timezone.now, onupdate=timezone.now)
+    ctime = Column(DateTime(timezone=True), default=timezone.now, index=True)
+    mtime = Column(DateTime(timezone=True), default=timezone.now, onupdate=timezone.now, index=True)
     nodeversion = Column(Integer, default=1)
     public = Column(Boolean, default=False)
     attributes = Column(JSONB)
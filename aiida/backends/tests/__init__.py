@@ -12,7 +12,7 @@ from __future__ import print_function
 from __future__ import absolute_import
 
 from six.moves import range
-from aiida.plugins.entry_point import ENTRYPOINT_MANAGER
+from aiida.plugins.entry_point import get_entry_points
 from aiida.backends.profile import BACKEND_SQLA, BACKEND_DJANGO
 
 db_test_list = {
@@ -66,6 +66,7 @@ db_test_list = {
         'cmdline.params.types.node': ['aiida.backends.tests.cmdline.params.types.test_node'],
         'cmdline.params.types.plugin': ['aiida.backends.tests.cmdline.params.types.test_plugin'],
         'cmdline.utils.common': ['aiida.backends.tests.cmdline.utils.test_common'],
+        'cmdline.utils.query': ['aiida.backends.tests.cmdline.utils.test_query'],
         'common.archive': ['aiida.backends.tests.common.test_archive'],
         'common.extendeddicts': ['aiida.backends.tests.common.test_extendeddicts'],
         'common.folders': ['aiida.backends.tests.common.test_folders'],
@@ -76,13 +77,16 @@ db_test_list = {
         'common.utils': ['aiida.backends.tests.common.test_utils'],
         'dataclasses': ['aiida.backends.tests.test_dataclasses'],
         'dbimporters': ['aiida.backends.tests.test_dbimporters'],
+        'engine.daemon.autoscaler': ['aiida.backends.tests.engine.daemon.test_autoscaler'],
         'engine.daemon.client': ['aiida.backends.tests.engine.daemon.test_client'],
+        'engine.daemon.profiling': ['aiida.backends.tests.engine.daemon.test_profiling'],
         'engine.calc_job': ['aiida.backends.tests.engine.test_calc_job'],
         'engine.calcfunctions': ['aiida.backends.tests.engine.test_calcfunctions'],
         'engine.class_loader': ['aiida.backends.tests.engine.test_class_loader'],
         'engine.daemon': ['aiida.backends.tests.engine.test_daemon'],
         'engine.futures': ['aiida.backends.tests.engine.test_futures'],
         'engine.launch': ['aiida.backends.tests.engine.test_launch'],
+        'engine.manager': ['aiida.backends.tests.engine.test_manager'],
         'engine.persistence': ['aiida.backends.tests.engine.test_persistence'],
         'engine.process': ['aiida.backends.tests.engine.test_process'],
         'engine.process_builder': ['aiida.backends.tests.engine.test_process_builder'],
@@ -117,6 +121,7 @@ db_test_list = {
         'orm.mixins': ['aiida.backends.tests.orm.test_mixins'],
         'orm.node': ['aiida.backends.tests.orm.node.test_node'],
         'orm.utils.calcjob': ['aiida.backends.tests.orm.utils.test_calcjob'],
+        'orm.utils.identity_map': ['aiida.backends.tests.orm.utils.test_identity_map'],
         'orm.utils.node': ['aiida.backends.tests.orm.utils.test_node'],
         'orm.utils.loaders': ['aiida.backends.tests.orm.utils.test_loaders'],
         'orm.utils.repository': ['aiida.backends.tests.orm.utils.test_repository'],
@@ -137,7 +142,7 @@ def get_db_test_names():
 
     # This is a temporary solution to be able to run tests in plugins. Once the plugin fixtures
     # have been made working and are released, we can replace this logic with them
-    for ep in [ep for ep in ENTRYPOINT_MANAGER.iter_entry_points(group='aiida.tests')]:
+    for ep in get_entry_points('aiida.tests'):
         retlist.append(ep.name)
 
     # Explode the list so that if I have a.b.c,
@@ -188,7 +193,7 @@ def get_db_test_list():
 
     # This is a temporary solution to be able to run tests in plugins. Once the plugin fixtures
     # have been made working and are released, we can replace this logic with them
-    for ep in [ep for ep in ENTRYPOINT_MANAGER.iter_entry_points(group='aiida.tests')]:
+    for ep in get_entry_points('aiida.tests'):
         retdict[ep.name].append(ep.module_name)
 
     # Explode the dictionary so that if I have a.b.c,
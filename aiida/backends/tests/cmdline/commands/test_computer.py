@@ -414,7 +414,7 @@ class TestVerdiComputerConfigure(AiidaTestCase):
         comp = self.comp_builder.new()
         comp.store()
 
-        result = self.cli_runner.invoke(computer_configure, ['local', comp.label], input='\n', catch_exceptions=False)
+        result = self.cli_runner.invoke(computer_configure, ['local', comp.label], input='\n\n', catch_exceptions=False)
         self.assertTrue(comp.is_user_configured(self.user), msg=result.output)
 
     def test_ssh_ni_empty(self):
@@ -643,6 +643,9 @@ class TestVerdiComputerCommands(AiidaTestCase):
         self.assertClickResultNoException(result)
         # Something should be printed to stdout
         self.assertIsNotNone(result.output)
+        # The limits and the number of active calculation jobs should be shown
+        self.assertIn('Maximum queued jobs', result.output)
+        self.assertIn('Active calculation jobs', result.output)
 
         # See if a non-existent computer will raise an error.
         result = self.cli_runner.invoke(computer_show, 'non_existent_computer_name')
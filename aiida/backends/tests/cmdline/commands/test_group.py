@@ -18,7 +18,8 @@ from click.testing import CliRunner
 import traceback
 from aiida.backends.testbase import AiidaTestCase
 from aiida.cmdline.commands.cmd_group import (group_list, group_create, group_delete, group_rename, group_description,
-                                              group_addnodes, group_removenodes, group_show, group_copy)
+                                              group_addnodes, group_removenodes, group_show, group_copy, group_union,
+                                              group_intersection, group_difference)
 
 
 class TestVerdiGroupSetup(AiidaTestCase):
@@ -193,3 +194,34 @@ class TestVerdiGroupSetup(AiidaTestCase):
         self.assertIsNone(result.exception, result.output)
         self.assertNotIn('CalculationNode', result.output)
         self.assertNotIn(str(node.pk), result.output)
+
+    def test_set_operations(self):
+        """Test the group union, intersection and difference commands."""
+        from aiida import orm
+
+        nodes = [orm.Data().store() for _ in range(3)]
+        group_a = orm.Group(label='set_operations_a').store()
+        group_b = orm.Group(label='set_operations_b').store()
+        group_a.add_nodes(nodes[:2])
+        group_b.add_nodes(nodes[1:])
+
+        expected = {
+            group_union: nodes,
+            group_intersection: nodes[1:2],
+            group_difference: nodes[:1],
+        }
+
+        for command, expected_nodes in expected.items():
+            result = self.cli_runner.invoke(command, ['-r', group_a.label, group_b.label])
+            self.assertClickResultNoException(result)
+            self.assertEqual(result.output.split(), [str(node.pk) for node in expected_nodes])
+
+            result = self.cli_runner.invoke(command, [group_a.label, group_b.label])
+            self.assertClickResultNoException(result)
+            self.assertIn('Total results: {}'.format(len(expected_nodes)), result.output)
+
+        options = ['--store', 'set_operations_c', group_a.label, group_b.label]
+        result = self.cli_runner.invoke(group_intersection, options)
+        self.assertClickResultNoException(result)
+        group_c = orm.Group.get(label='set_operations_c')
+        self.assertEqual([node.pk for node in group_c.nodes], [nodes[1].pk])
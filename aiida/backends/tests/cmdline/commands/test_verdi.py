@@ -11,6 +11,10 @@
 from __future__ import division
 from __future__ import print_function
 from __future__ import absolute_import
+
+import subprocess
+import sys
+
 from click.testing import CliRunner
 
 from aiida import get_version
@@ -44,3 +48,38 @@ class TestVerdi(AiidaTestCase):
 
         # Restore original CONFIG contents
         CONFIG._dictionary = config_dict
+
+    def test_verdi_lazy_subcommands(self):
+        """Test that the short help of the lazy subcommands matches the first line of the docstring of the commands."""
+        context = cmd_verdi.verdi.make_context('verdi', [])
+
+        for name, (_, short_help) in cmd_verdi.VERDI_SUBCOMMANDS.items():
+            command = cmd_verdi.verdi.get_command(context, name)
+            self.assertIsNotNone(command, name)
+            self.assertEqual(command.name, name)
+            self.assertEqual(command.help.strip().splitlines()[0], short_help)
+
+        result = self.cli_runner.invoke(cmd_verdi.verdi, ['--help'])
+        self.assertIsNone(result.exception, result.output)
+        for name in cmd_verdi.VERDI_SUBCOMMANDS:
+            self.assertIn(name, result.output)
+
+    def test_verdi_help_imports(self):
+        """Test that `verdi --help` does not import the modules of the subcommands nor any heavy dependencies."""
+        script = '\n'.join([
+            'import sys',
+            'from aiida.cmdline.commands.cmd_verdi import verdi',
+            'try:',
+            '    verdi(["--help"], prog_name="verdi")',
+            'except SystemExit:',
+            '    pass',
+            'heavy = ("aiida.orm", "aiida.cmdline.commands.cmd_", "django", "numpy", "sqlalchemy", "plumpy")',
+            'modules = [m for m in sys.modules if m.startswith(heavy) and m != "aiida.cmdline.commands.cmd_verdi"]',
+            'sys.stderr.write(" ".join(sorted(modules)))',
+        ])
+        process = subprocess.Popen([sys.executable, '-c', script], stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        stdout, stderr = process.communicate()
+
+        self.assertEqual(process.returncode, 0, stderr)
+        self.assertIn(b'daemon', stdout)
+        self.assertEqual(stderr.strip(), b'')
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida_core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Tests for the query utilities of the command line interface."""
+from __future__ import division
+from __future__ import print_function
+from __future__ import absolute_import
+
+from aiida.backends.testbase import AiidaTestCase
+from aiida.cmdline.utils.query.calculation import CalculationQueryBuilder, CalculationQueryWatcher
+from aiida.engine import ProcessState
+from aiida.orm import WorkFunctionNode
+
+
+def get_pks(query_set):
+    """Return the pks of the processes in the given query set."""
+    return [query_result['process']['id'] for query_result in query_set]
+
+
+class TestCalculationQueryBuilder(AiidaTestCase):
+    """Tests for the `CalculationQueryBuilder`."""
+
+    def test_get_projected_attributes(self):
+        """Test that only the attributes needed to format the projections are projected."""
+        builder = CalculationQueryBuilder()
+        get_attribute = builder.mapper.get_attribute
+
+        attributes = builder.get_projected_attributes(('pk', 'state', 'process_state'))
+        expected = ['id', 'ctime', 'mtime']
+        expected.extend([get_attribute(projection) for projection in ('process_state', 'paused', 'exit_status')])
+        self.assertEqual(attributes, expected)
+
+    def test_get_query_set(self):
+        """Test that the query set contains the attributes needed to format the projections."""
+        node = WorkFunctionNode()
+        node.set_process_state(ProcessState.RUNNING)
+        node.store()
+
+        builder = CalculationQueryBuilder()
+        projections = ('pk', 'state')
+        query_set = list(builder.get_query_set(filters={'id': node.pk}, projections=projections))
+
+        self.assertEqual(len(query_set), 1)
+        self.assertEqual(set(query_set[0]['process']), set(builder.get_projected_attributes(projections)))
+        self.assertEqual(builder.get_projected(query_set, projections)[1][0], node.pk)
+
+
+class TestCalculationQueryWatcher(AiidaTestCase):
+    """Tests for the `CalculationQueryWatcher`."""
+
+    def test_refresh(self):
+        """Test that the query set is updated with the processes that were created or modified since the refresh."""
+        builder = CalculationQueryBuilder()
+        filters = builder.get_filters(process_state=(ProcessState.RUNNING.value,))
+        watcher = CalculationQueryWatcher(builder, projections=('pk', 'state'), filters=filters)
+
+        first = WorkFunctionNode()
+        first.set_process_state(ProcessState.RUNNING)
+        first.store()
+
+        self.assertEqual(get_pks(watcher.refresh()), [first.pk])
+
+        second = WorkFunctionNode()
+        second.set_process_state(ProcessState.RUNNING)
+        second.store()
+
+        self.assertEqual(get_pks(watcher.refresh()), [first.pk, second.pk])
+
+        # A process that no longer matches the filters should be removed
+        first.set_process_state(ProcessState.FINISHED)
+
+        self.assertEqual(get_pks(watcher.refresh()), [second.pk])
+
+        # A process that now matches the filters should be added
+        first.set_process_state(ProcessState.RUNNING)
+
+        self.assertEqual(get_pks(watcher.refresh()), [first.pk, second.pk])
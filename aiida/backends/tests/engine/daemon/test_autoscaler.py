@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida_core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Unit tests for the autoscaler of the daemon workers."""
+from __future__ import division
+from __future__ import print_function
+from __future__ import absolute_import
+
+from tornado import concurrent
+
+from aiida.backends.testbase import AiidaTestCase
+from aiida.engine.daemon.autoscaler import DaemonAutoscaler, WorkerLoad
+
+
+def get_load(active_processes, process_slots=10, loop_lag=0.):
+    """Return the load of a worker as dumped by the `WorkerLoad`."""
+    return {
+        'active_processes': active_processes,
+        'process_slots': process_slots,
+        'loop_lag': loop_lag,
+        'maximum_loop_lag': loop_lag
+    }
+
+
+class TestWorkerLoad(AiidaTestCase):
+    """Unit tests for the `WorkerLoad` class."""
+
+    def test_track(self):
+        """Test that processes are counted as active until their future is done."""
+        load = WorkerLoad(process_slots=10)
+        futures = [load.track(concurrent.Future()) for _ in range(3)]
+        self.assertEqual(load.active_processes, 3)
+
+        futures[0].set_result(None)
+        futures[1].set_result(None)
+        self.assertEqual(load.active_processes, 1)
+
+    def test_as_dict(self):
+        """Test that the loop lag is averaged over the measurements since the last reset."""
+        load = WorkerLoad(process_slots=10)
+        load.set_process_slots(20)
+        load.record_loop_lag(0.1)
+        load.record_loop_lag(0.3)
+
+        result = load.as_dict()
+        self.assertEqual(result['process_slots'], 20)
+        self.assertAlmostEqual(result['loop_lag'], 0.2)
+        self.assertAlmostEqual(result['maximum_loop_lag'], 0.3)
+        self.assertEqual(load.as_dict()['loop_lag'], 0.)
+
+
+class TestDaemonAutoscaler(AiidaTestCase):
+    """Unit tests for the `DaemonAutoscaler` class."""
+
+    def setUp(self):
+        super(TestDaemonAutoscaler, self).setUp()
+        self.autoscaler = DaemonAutoscaler(
+            None,
+            minimum_workers=1,
+            maximum_workers=4,
+            process_slots=10,
+            idle_time=60,
+            maximum_loop_lag=0.5,
+            cooldown=120)
+
+    def test_scale_up_queue_depth(self):
+        """Test that enough workers are added to take the tasks waiting in the launch queue, up to the maximum."""
+        get_desired = self.autoscaler.get_desired_number_of_workers
+        self.assertEqual(get_desired(1, 15, [get_load(10)]), 3)
+        self.assertEqual(get_desired(1, 100, [get_load(10)]), 4)
+        # Without loads the configured number of process slots is used
+        self.assertEqual(get_desired(1, 5, []), 2)
+
+    def test_scale_up_loop_lag(self):
+        """Test that a worker is added if the average loop lag exceeds the maximum."""
+        get_desired = self.autoscaler.get_desired_number_of_workers
+        self.assertEqual(get_desired(2, 0, [get_load(5, loop_lag=0.5), get_load(5, loop_lag=0.2)], now=0), 2)
+        self.assertEqual(get_desired(2, 0, [get_load(5, loop_lag=1.), get_load(5, loop_lag=0.2)], now=0), 3)
+
+    def test_scale_up_loop_lag_capacity_used(self):
+        """Test that a worker is only added for the loop lag once the previous one runs processes and cooled down."""
+        get_desired = self.autoscaler.get_desired_number_of_workers
+        lagging = get_load(5, loop_lag=2.)
+
+        self.assertEqual(get_desired(1, 0, [lagging], now=0), 2)
+        # The new worker did not take any processes yet, or did not dump its load yet
+        self.assertEqual(get_desired(2, 0, [lagging, get_load(0)], now=200), 2)
+        self.assertEqual(get_desired(2, 0, [lagging], now=200), 2)
+        # The new worker runs processes, but the cooldown did not pass yet
+        self.assertEqual(get_desired(2, 0, [lagging, get_load(1, loop_lag=2.)], now=60), 2)
+        self.assertEqual(get_desired(2, 0, [lagging, get_load(1, loop_lag=2.)], now=120), 3)
+
+    def test_scale_down_idle(self):
+        """Test that a worker is only removed after spare capacity persisted for the idle time, one at a time."""
+        get_desired = self.autoscaler.get_desired_number_of_workers
+        loads = [get_load(1), get_load(0), get_load(0)]
+
+        self.assertEqual(get_desired(3, 0, loads, now=0), 3)
+        self.assertEqual(get_desired(3, 0, loads, now=30), 3)
+        self.assertEqual(get_desired(3, 0, loads, now=60), 2)
+        self.assertEqual(get_desired(2, 0, loads[:2], now=90), 2)
+        self.assertEqual(get_desired(2, 0, loads[:2], now=120), 1)
+        self.assertEqual(get_desired(1, 0, loads[:1], now=1000), 1)
+
+    def test_scale_down_reset(self):
+        """Test that the idle time restarts when the workers are busy in between."""
+        get_desired = self.autoscaler.get_desired_number_of_workers
+        idle = [get_load(0), get_load(0)]
+        busy = [get_load(8), get_load(8)]
+
+        self.assertEqual(get_desired(2, 0, idle, now=0), 2)
+        self.assertEqual(get_desired(2, 0, busy, now=30), 2)
+        self.assertEqual(get_desired(2, 0, idle, now=60), 2)
+        self.assertEqual(get_desired(2, 0, idle, now=120), 1)
@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida_core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Unit tests for the profiling of the steps of processes and of the code of daemon workers."""
+from __future__ import division
+from __future__ import print_function
+from __future__ import absolute_import
+
+import io
+import logging
+import os
+import pstats
+import shutil
+import tempfile
+
+from tornado import gen, ioloop
+
+from aiida.backends.testbase import AiidaTestCase
+from aiida.engine.daemon import profiling
+
+
+class TestStepProfile(AiidaTestCase):
+    """Unit tests for the `StepProfile` class."""
+
+    def test_measure(self):
+        """Test that steps are aggregated with their database time and are listed as running while measured."""
+        profile = profiling.StepProfile()
+
+        with profile.measure(profiling.CATEGORY_WORKCHAIN, 'MyWorkChain:0:setup', pk=1):
+            profile.record_query(0.5)
+            running = profile.as_dict()['running']
+            self.assertEqual([(step['step'], step['pk']) for step in running], [('MyWorkChain:0:setup', 1)])
+
+        with self.assertRaises(RuntimeError):
+            with profile.measure(profiling.CATEGORY_WORKCHAIN, 'MyWorkChain:0:setup', pk=2):
+                raise RuntimeError
+
+        result = profile.as_dict()
+        counters = result['steps'][profiling.CATEGORY_WORKCHAIN]['MyWorkChain:0:setup']
+        self.assertEqual(result['running'], [])
+        self.assertEqual(counters['count'], 2)
+        self.assertAlmostEqual(counters['db_time'], 0.5)
+        self.assertEqual(result['slow_steps'], [])
+
+    def test_slow_steps(self):
+        """Test that only the most recent steps above the threshold are kept as slow steps."""
+        profile = profiling.StepProfile(slow_step_threshold=1., maximum_slow_steps=2)
+
+        logging.disable(logging.WARNING)
+        try:
+            for pk, duration in enumerate([0.5, 1., 2., 3.]):
+                profile.record(profiling.CATEGORY_CALCJOB, 'upload', duration, db_time=0.1, pk=pk)
+        finally:
+            logging.disable(logging.NOTSET)
+
+        result = profile.as_dict()
+        self.assertEqual([step['pk'] for step in result['slow_steps']], [2, 3])
+        self.assertEqual(result['steps'][profiling.CATEGORY_CALCJOB]['upload']['max_time'], 3.)
+
+        profile.clear()
+        self.assertEqual(profile.as_dict()['steps'], {})
+
+    def test_handle_worker_request(self):
+        """Test that the worker answers requests for its step profile and rejects unknown requests."""
+        response = profiling.handle_worker_request(None, {'request': profiling.WORKER_REQUEST_STEP_PROFILE})
+        self.assertIn('steps', response)
+        self.assertIn('loop', response)
+
+        with self.assertRaises(ValueError):
+            profiling.handle_worker_request(None, {'request': 'unknown'})
+
+
+class TestCodeProfiler(AiidaTestCase):
+    """Unit tests for the `CodeProfiler` class."""
+
+    def setUp(self):
+        super(TestCodeProfiler, self).setUp()
+        self.directory = tempfile.mkdtemp()
+        self.loop = ioloop.IOLoop()
+
+    def tearDown(self):
+        self.loop.close()
+        shutil.rmtree(self.directory)
+        super(TestCodeProfiler, self).tearDown()
+
+    def run_loop(self, code_profiler, filepath):
+        """Run the event loop, doing some work, until the profile has been written."""
+
+        @gen.coroutine
+        def work():
+            while code_profiler.is_profiling or not os.path.isfile(filepath):
+                sum(range(1000))
+                yield gen.sleep(0.001)
+
+        self.loop.run_sync(work, timeout=10)
+
+    def test_deterministic(self):
+        """Test that the deterministic profile is written as a `pstats` file at the end of the window."""
+        code_profiler = profiling.CodeProfiler(self.loop, os.path.join(self.directory, 'profiles'))
+        response = code_profiler.start(duration=0.1)
+
+        self.assertEqual(response['pid'], os.getpid())
+        self.assertTrue(response['filepath'].endswith('.pstats'))
+        self.assertTrue(code_profiler.is_profiling)
+
+        with self.assertRaises(RuntimeError):
+            code_profiler.start(duration=0.1)
+
+        self.run_loop(code_profiler, response['filepath'])
+        self.assertFalse(code_profiler.is_profiling)
+        self.assertGreater(pstats.Stats(response['filepath']).total_calls, 0)
+
+    def test_sampling(self):
+        """Test that the sampled stacks of the event loop are written in the folded format."""
+        code_profiler = profiling.CodeProfiler(self.loop, self.directory)
+        request = {'request': profiling.WORKER_REQUEST_CODE_PROFILE, 'duration': 0.2, 'sampling': True}
+        # The path of the profile cannot be chosen by the sender of the request
+        request['filepath'] = os.path.join(self.directory, 'chosen.folded')
+
+        response = profiling.handle_worker_request(None, request, code_profiler=code_profiler)
+        filepath = response['filepath']
+        self.assertEqual(os.path.dirname(filepath), self.directory)
+        self.assertTrue(os.path.basename(filepath).startswith('worker-{}-'.format(os.getpid())))
+        self.assertTrue(filepath.endswith('.folded'))
+
+        self.run_loop(code_profiler, filepath)
+        self.assertEqual(os.listdir(self.directory), [os.path.basename(filepath)])
+
+        with io.open(filepath, encoding='utf8') as handle:
+            lines = handle.read().splitlines()
+
+        self.assertTrue(lines)
+        self.assertTrue(all('run_sync (' in line for line in lines))
+        for line in lines:
+            stack, count = line.rsplit(' ', 1)
+            self.assertGreater(int(count), 0)
+            self.assertTrue(stack)
+
+    def test_invalid_duration(self):
+        """Test that the duration of the profiling window should be positive."""
+        code_profiler = profiling.CodeProfiler(self.loop, self.directory)
+
+        with self.assertRaises(ValueError):
+            code_profiler.start(duration=0)
+
+        self.assertFalse(code_profiler.is_profiling)
@@ -0,0 +1,305 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida_core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Tests for the classes of the `aiida.engine.processes.calcjobs.manager` module."""
+from __future__ import division
+from __future__ import print_function
+from __future__ import absolute_import
+
+import mock
+from tornado import ioloop
+
+from aiida.backends.testbase import AiidaTestCase
+from aiida.engine.processes.calcjobs.manager import ComputerThrottle, JobManager, JobsList, JobSubmissionBuffer
+from aiida.engine.transports import TransportQueue
+from aiida import orm
+from aiida.schedulers.datastructures import JobInfo, JobState
+
+
+class TestComputerThrottle(AiidaTestCase):
+    """Tests for the `ComputerThrottle` class."""
+
+    def setUp(self, *args, **kwargs):
+        """Set up a simple authinfo for later use."""
+        super(TestComputerThrottle, self).setUp(*args, **kwargs)
+        self.authinfo = orm.AuthInfo(computer=self.computer, user=orm.User.objects.get_default()).store()
+        self.loop = ioloop.IOLoop()
+
+    def tearDown(self, *args, **kwargs):
+        self.computer.set_maximum_concurrent_transfers(0)
+        self.computer.set_maximum_queued_jobs(0)
+        self.computer.set_submission_rate(0.)
+        self.computer.set_submission_burst(1)
+        orm.AuthInfo.objects.delete(self.authinfo.id)
+        self.loop.close()
+        super(TestComputerThrottle, self).tearDown(*args, **kwargs)
+
+    def test_no_limits(self):
+        """Without limits all requests should be granted immediately."""
+        throttle = ComputerThrottle(self.authinfo, self.loop)
+
+        with throttle.request_transfer() as first, throttle.request_transfer() as second:
+            self.assertTrue(first.done())
+            self.assertTrue(second.done())
+
+        with throttle.request_submission() as first, throttle.request_submission() as second:
+            self.assertTrue(first.done())
+            self.assertTrue(second.done())
+
+    def test_maximum_concurrent_transfers(self):
+        """A transfer should be parked until another transfer has finished."""
+        self.computer.set_maximum_concurrent_transfers(1)
+        throttle = ComputerThrottle(self.authinfo, self.loop)
+
+        with throttle.request_transfer() as first:
+            with throttle.request_transfer() as second:
+                self.assertTrue(first.done())
+                self.assertFalse(second.done())
+                self.assertEqual(throttle.get_number_of_waiters()[ComputerThrottle.TRANSFER], 1)
+
+            # The parked request was abandoned so a new request should still have to wait
+            with throttle.request_transfer() as third:
+                self.assertFalse(third.done())
+
+        with throttle.request_transfer() as fourth:
+            self.assertTrue(fourth.done())
+
+    def test_maximum_queued_jobs(self):
+        """A submission should be parked as long as the queue is full."""
+        self.computer.set_maximum_queued_jobs(1)
+        throttle = ComputerThrottle(self.authinfo, self.loop)
+
+        with throttle.request_submission() as first:
+            self.assertTrue(first.done())
+            self.assertEqual(throttle.get_queue_depth(), 1)
+
+            with throttle.request_submission() as second:
+                self.assertFalse(second.done())
+
+    def test_submission_rate(self):
+        """Submissions beyond the burst should be parked until a new token is available."""
+        self.computer.set_submission_rate(100.)
+        self.computer.set_submission_burst(2)
+        throttle = ComputerThrottle(self.authinfo, self.loop)
+
+        with throttle.request_submission() as first, throttle.request_submission() as second:
+            with throttle.request_submission() as third:
+                self.assertTrue(first.done())
+                self.assertTrue(second.done())
+                self.assertFalse(third.done())
+
+                self.loop.run_sync(lambda: third, timeout=5)
+                self.assertTrue(third.done())
+
+
+class TestJobSubmissionBuffer(AiidaTestCase):
+    """Tests for the `JobSubmissionBuffer` class."""
+
+    def setUp(self, *args, **kwargs):
+        """Set up a simple authinfo and patch the submission functions of the execmanager."""
+        super(TestJobSubmissionBuffer, self).setUp(*args, **kwargs)
+        self.authinfo = orm.AuthInfo(computer=self.computer, user=orm.User.objects.get_default()).store()
+        self.loop = ioloop.IOLoop()
+        self.transport_queue = TransportQueue(self.loop)
+        self.computer.set_job_array_window(0.05)
+        self.computer.set_job_array_maximum_size(3)
+
+        self.patches = {
+            name: mock.patch('aiida.engine.daemon.execmanager.{}'.format(name))
+            for name in ['get_job_array_key', 'submit_calculation', 'submit_job_array', 'submit_job_bundle']
+        }
+        self.mocks = {name: patch.start() for name, patch in self.patches.items()}
+        self.mocks['get_job_array_key'].return_value = 'key'
+
+    def tearDown(self, *args, **kwargs):
+        for patch in self.patches.values():
+            patch.stop()
+        self.computer.set_job_array_window(orm.Computer.PROPERTY_JOB_ARRAY_WINDOW__DEFAULT)
+        self.computer.set_job_array_maximum_size(orm.Computer.PROPERTY_JOB_ARRAY_MAXIMUM_SIZE__DEFAULT)
+        self.computer.set_job_bundle_window(orm.Computer.PROPERTY_JOB_BUNDLE_WINDOW__DEFAULT)
+        orm.AuthInfo.objects.delete(self.authinfo.id)
+        self.loop.close()
+        super(TestJobSubmissionBuffer, self).tearDown(*args, **kwargs)
+
+    @staticmethod
+    def get_node(job_id):
+        """Return a stand-in for a calculation node that returns the given job id."""
+        node = mock.Mock()
+        node.get_job_id.return_value = job_id
+        return node
+
+    def test_window(self):
+        """Requests that arrive within the window should be submitted together as a job array once it has passed."""
+        self.mocks['submit_job_array'].return_value = ['1_0', '1_1']
+        buffer = JobSubmissionBuffer(self.authinfo, self.transport_queue)
+        nodes = [self.get_node(None), self.get_node(None)]
+
+        with buffer.request_job_submission(nodes[0], 'script') as first:
+            with buffer.request_job_submission(nodes[1], 'script') as second:
+                self.assertFalse(first.done())
+                self.loop.run_sync(lambda: second, timeout=5)
+                self.assertEqual(first.result(), '1_0')
+                self.assertEqual(second.result(), '1_1')
+
+        self.assertEqual(self.mocks['submit_job_array'].call_count, 1)
+        self.assertEqual(self.mocks['submit_job_array'].call_args[0][0], nodes)
+
+    def test_maximum_size(self):
+        """The requests should be flushed as soon as the maximum size is reached, without waiting for the window."""
+        self.computer.set_job_array_window(3600.)
+        self.mocks['submit_job_array'].return_value = ['1_0', '1_1', '1_2']
+        buffer = JobSubmissionBuffer(self.authinfo, self.transport_queue)
+
+        with buffer.request_job_submission(self.get_node(None), 'script') as first, \
+                buffer.request_job_submission(self.get_node(None), 'script') as second, \
+                buffer.request_job_submission(self.get_node(None), 'script') as third:
+            self.loop.run_sync(lambda: third, timeout=5)
+            self.assertEqual([first.result(), second.result(), third.result()], ['1_0', '1_1', '1_2'])
+
+    def test_single_request(self):
+        """A single request should be submitted as a normal job, not as an array of one."""
+        buffer = JobSubmissionBuffer(self.authinfo, self.transport_queue)
+
+        with buffer.request_job_submission(self.get_node('10'), 'script') as request:
+            self.loop.run_sync(lambda: request, timeout=5)
+            self.assertEqual(request.result(), '10')
+
+        self.assertEqual(self.mocks['submit_calculation'].call_count, 1)
+        self.assertEqual(self.mocks['submit_job_array'].call_count, 0)
+
+    def test_bundle(self):
+        """With job bundles enabled, all requests should get the job id of the bundle."""
+        self.computer.set_job_bundle_window(0.05)
+        self.mocks['submit_job_bundle'].return_value = '7'
+        buffer = JobSubmissionBuffer(self.authinfo, self.transport_queue)
+
+        with buffer.request_job_submission(self.get_node(None), 'script') as first, \
+                buffer.request_job_submission(self.get_node(None), 'script') as second:
+            self.loop.run_sync(lambda: second, timeout=5)
+            self.assertEqual([first.result(), second.result()], ['7', '7'])
+
+        self.assertEqual(self.mocks['submit_job_array'].call_count, 0)
+
+    def test_failure(self):
+        """An exception raised by the submission should be set on the futures of all the requests."""
+        self.mocks['submit_job_array'].side_effect = RuntimeError('submission failed')
+        buffer = JobSubmissionBuffer(self.authinfo, self.transport_queue)
+
+        with buffer.request_job_submission(self.get_node(None), 'script') as first, \
+                buffer.request_job_submission(self.get_node(None), 'script') as second:
+            with self.assertRaises(RuntimeError):
+                self.loop.run_sync(lambda: second, timeout=5)
+            self.assertIsInstance(first.exception(), RuntimeError)
+
+    def test_abandoned_request(self):
+        """A request that is abandoned before the window has passed should not be submitted."""
+        buffer = JobSubmissionBuffer(self.authinfo, self.transport_queue)
+
+        with buffer.request_job_submission(self.get_node('10'), 'script'):
+            pass
+
+        with buffer.request_job_submission(self.get_node('11'), 'script') as request:
+            self.loop.run_sync(lambda: request, timeout=5)
+            self.assertEqual(request.result(), '11')
+
+        self.assertEqual(self.mocks['submit_calculation'].call_count, 1)
+
+
+class TestJobManager(AiidaTestCase):
+    """Tests for the `JobManager` class."""
+
+    def setUp(self, *args, **kwargs):
+        """Set up authinfos of two users for later use."""
+        super(TestJobManager, self).setUp(*args, **kwargs)
+        created, other_user = orm.User.objects.get_or_create(email='other@localhost')
+        if created:
+            other_user.store()
+        self.authinfos = [
+            orm.AuthInfo(computer=self.computer, user=user).store()
+            for user in [orm.User.objects.get_default(), other_user]
+        ]
+        self.loop = ioloop.IOLoop()
+        self.job_manager = JobManager(TransportQueue(self.loop))
+
+    def tearDown(self, *args, **kwargs):
+        for authinfo in self.authinfos:
+            orm.AuthInfo.objects.delete(authinfo.id)
+        self.loop.close()
+        super(TestJobManager, self).tearDown(*args, **kwargs)
+
+    def test_job_list_key(self):
+        """Authinfos that connect to the same computer as the same remote user should share the jobs list."""
+        first, second = self.authinfos
+        self.assertEqual(self.job_manager.get_job_list_key(first), self.job_manager.get_job_list_key(second))
+
+    def test_job_list_key_username(self):
+        """Authinfos that connect to the same computer as different remote users should have their own jobs list."""
+        first, second = self.authinfos
+        first.set_auth_params({'username': 'first'})
+        second.set_auth_params({'username': 'second'})
+        self.assertNotEqual(self.job_manager.get_job_list_key(first), self.job_manager.get_job_list_key(second))
+
+
+class TestJobsList(AiidaTestCase):
+    """Tests for the `JobsList` class."""
+
+    def setUp(self, *args, **kwargs):
+        """Set up a simple authinfo for later use."""
+        super(TestJobsList, self).setUp(*args, **kwargs)
+        self.authinfo = orm.AuthInfo(computer=self.computer, user=orm.User.objects.get_default()).store()
+        self.loop = ioloop.IOLoop()
+        self.computer.set_minimum_job_poll_interval(10.)
+        self.computer.set_maximum_job_poll_interval(50.)
+
+    def tearDown(self, *args, **kwargs):
+        self.computer.set_minimum_job_poll_interval(orm.Computer.PROPERTY_MINIMUM_SCHEDULER_POLL_INTERVAL__DEFAULT)
+        self.computer.set_maximum_job_poll_interval(orm.Computer.PROPERTY_MAXIMUM_SCHEDULER_POLL_INTERVAL__DEFAULT)
+        orm.AuthInfo.objects.delete(self.authinfo.id)
+        self.loop.close()
+        super(TestJobsList, self).tearDown(*args, **kwargs)
+
+    @staticmethod
+    def get_job_info(job_state, requested_wallclock_time=None, wallclock_time=None):
+        """Return a job info of the job with id `1` in the given state."""
+        job_info = JobInfo()
+        job_info.job_id = '1'
+        job_info.job_state = job_state
+        job_info.requested_wallclock_time_seconds = requested_wallclock_time
+        job_info.wallclock_time_seconds = wallclock_time
+        return job_info
+
+    def test_poll_interval(self):
+        """The poll interval should back off while no job changes state and reset when one does."""
+        jobs_list = JobsList(self.authinfo, TransportQueue(self.loop))
+        jobs_list._job_update_requests = {'1': None}  # pylint: disable=protected-access
+        self.assertEqual(jobs_list.get_poll_interval(), 10.)
+
+        queued = {'1': self.get_job_info(JobState.QUEUED)}
+        intervals = []
+        for _ in range(4):
+            jobs_list._update_poll_interval(queued, queued)  # pylint: disable=protected-access
+            intervals.append(jobs_list.get_poll_interval())
+        self.assertEqual(intervals, [20., 40., 50., 50.])
+
+        running = {'1': self.get_job_info(JobState.RUNNING)}
+        jobs_list._update_poll_interval(queued, running)  # pylint: disable=protected-access
+        self.assertEqual(jobs_list.get_poll_interval(), 10.)
+
+    def test_poll_interval_wallclock_time(self):
+        """The poll interval should not exceed the time left before a running job reaches its wallclock time."""
+        # pylint: disable=protected-access
+        jobs_list = JobsList(self.authinfo, TransportQueue(self.loop))
+        jobs_list._job_update_requests = {'1': None}
+        jobs_list._poll_interval = 50.
+
+        jobs_list._jobs_cache = {'1': self.get_job_info(JobState.RUNNING, 3600, 3570)}
+        self.assertEqual(jobs_list.get_poll_interval(), 30.)
+
+        jobs_list._jobs_cache = {'1': self.get_job_info(JobState.RUNNING, 3600, 3598)}
+        self.assertEqual(jobs_list.get_poll_interval(), 10.)
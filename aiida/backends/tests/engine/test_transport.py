@@ -112,6 +112,37 @@ class TestTransportQueue(AiidaTestCase):
         finally:
             self.authinfo.get_transport().__class__.open = original
 
+    def test_circuit_breaker(self):
+        """Test that once opening keeps failing the requests are parked until the transport can be opened again."""
+        queue = TransportQueue(circuit_breaker_threshold=1, circuit_breaker_cooldown=0.1)
+        loop = queue.loop()
+        transport_class = self.authinfo.get_transport().__class__
+        original = transport_class.open
+        attempts = []
+
+        @coroutine
+        def test():
+            with queue.request_transport(self.authinfo) as request:
+                trans = yield request
+                raise Return(trans.is_open)
+
+        def flaky_open(trans):
+            attempts.append(trans)
+            if len(attempts) < 3:
+                raise RuntimeError("Could not open transport")
+            return original(trans)
+
+        try:
+            transport_class.open = flaky_open
+            results = loop.run_sync(lambda: [test(), test()])
+        finally:
+            transport_class.open = original
+
+        # Both requests should have been released together by the single successful attempt
+        self.assertEqual(results, [True, True])
+        self.assertEqual(len(attempts), 3)
+        self.assertFalse(queue.get_circuit_breaker(self.authinfo).is_open())
+
     def test_safe_interval(self):
         """Verify that the safe interval for a given in transport is respected by the transport queue."""
 
@@ -12,6 +12,8 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import absolute_import
 
+import mock
+
 from aiida import orm
 from aiida.backends.testbase import AiidaTestCase
 from aiida.common import exceptions
@@ -86,6 +88,86 @@ class TestGroups(AiidaTestCase):
         self.assertTrue(all([isinstance(node, orm.Data) for node in nodes_sliced]))
         self.assertTrue(all([node.uuid in set(node.uuid for node in nodes) for node in nodes_sliced]))
 
+    def test_node_iterator_windows(self):
+        """Test that the node iterator loads the nodes in windows and yields every node once in order of their pk."""
+        nodes = [orm.Data().store() for _ in range(5)]
+
+        group = orm.Group(label='label', description='description').store()
+        group.add_nodes(nodes)
+
+        with mock.patch.object(type(group.backend_entity), 'NODES_WINDOW_SIZE', 2):
+            self.assertEqual([node.pk for node in group.nodes], sorted(node.pk for node in nodes))
+            self.assertEqual(len(group.nodes), len(nodes))
+
+    def test_add_remove_nodes_batches(self):
+        """Test that nodes are added and removed correctly when this takes multiple batches."""
+        nodes = [orm.Data().store() for _ in range(5)]
+
+        group = orm.Group(label='test_add_remove_nodes_batches').store()
+
+        with mock.patch.object(type(group.backend_entity), 'NODES_BATCH_SIZE', 2):
+            group.add_nodes(nodes[:3])
+            # Nodes that are already in the group are skipped, also when they are in the same batch as new ones
+            group.add_nodes(nodes)
+            self.assertEqual(group.count(), len(nodes))
+            self.assertEqual(set(node.pk for node in group.nodes), set(node.pk for node in nodes))
+
+            group.remove_nodes(nodes[1:4])
+            self.assertEqual(set(node.pk for node in group.nodes), set([nodes[0].pk, nodes[4].pk]))
+
+    def test_set_operations(self):
+        """Test the union, intersection and difference of groups."""
+        nodes = [orm.Data().store() for _ in range(4)]
+
+        group_a = orm.Group(label='test_set_operations_a').store()
+        group_b = orm.Group(label='test_set_operations_b').store()
+        group_c = orm.Group(label='test_set_operations_c').store()
+        group_a.add_nodes(nodes[:3])
+        group_b.add_nodes(nodes[1:])
+        group_c.add_nodes(nodes[2:3])
+
+        def get_pks(node_set):
+            return [node.pk for node in node_set]
+
+        self.assertEqual(get_pks(group_a.union(group_b)), [node.pk for node in nodes])
+        self.assertEqual(get_pks(group_a.intersection(group_b)), [node.pk for node in nodes[1:3]])
+        self.assertEqual(get_pks(group_a.intersection(group_b, group_c)), [nodes[2].pk])
+        self.assertEqual(get_pks(group_a.difference(group_b)), [nodes[0].pk])
+        self.assertEqual(get_pks(group_a.difference(group_b, group_c)), [nodes[0].pk])
+        self.assertEqual(get_pks(group_a.difference(group_a)), [])
+        self.assertEqual(get_pks(group_a.union()), [node.pk for node in nodes[:3]])
+
+        self.assertEqual(group_a.union(group_b).count(), 4)
+        self.assertEqual(len(group_a.intersection(group_b)), 2)
+        self.assertEqual(list(group_a.difference(group_c).iter_pks()), [node.pk for node in (nodes[0], nodes[1])])
+
+        with mock.patch.object(orm.GroupNodeSet, 'WINDOW_SIZE', 2):
+            self.assertEqual(get_pks(group_a.union(group_b)), [node.pk for node in nodes])
+
+        with self.assertRaises(ValueError):
+            orm.GroupNodeSet('symmetric_difference', [group_a])
+
+        with self.assertRaises(ValueError):
+            group_a.union(orm.Group(label='test_set_operations_unstored'))
+
+    def test_set_operations_add_to_group(self):
+        """Test that the nodes of a set operation are added to a group in the database."""
+        nodes = [orm.Data().store() for _ in range(3)]
+
+        group_a = orm.Group(label='test_set_operations_add_a').store()
+        group_b = orm.Group(label='test_set_operations_add_b').store()
+        group_a.add_nodes(nodes[:2])
+        group_b.add_nodes(nodes[1:])
+
+        group = orm.Group(label='test_set_operations_add').store()
+        group.add_nodes(nodes[0])
+        group_a.union(group_b).add_to_group(group)
+        self.assertEqual(set(node.pk for node in group.nodes), set(node.pk for node in nodes))
+
+        # The destination group can also be one of the groups of the set operation
+        group_b.union(group_a).add_to_group(group_b)
+        self.assertEqual(group_b.count(), 3)
+
     def test_description(self):
         """Test the update of the description both for stored and unstored groups."""
         node = orm.Data().store()
@@ -219,6 +219,47 @@ class TestBackendLog(AiidaTestCase):
         self.assertEqual(logs[0].message, message)
         self.assertEqual(logs[1].message, message2)
 
+    def test_create_entries(self):
+        """Test that multiple log entries can be created at once."""
+        node = CalculationNode().store()
+        entries = [dict(self.log_record, dbnode_id=node.id, message='message {}'.format(index)) for index in range(5)]
+        Log.objects.create_entries(entries)
+
+        logs = Log.objects.get_logs_for(node)
+        self.assertEqual(sorted(log.message for log in logs), ['message {}'.format(index) for index in range(5)])
+        self.assertEqual(logs[0].metadata, self.log_record['metadata'])
+
+    def test_buffered_db_log_handler(self):
+        """Test that the buffered db log handler only stores the records once flushed, with trimmed metadata."""
+        from aiida.orm.utils.log import BufferedDBLogHandler, create_logger_adapter
+
+        handler = BufferedDBLogHandler(flush_size=100, flush_interval=60)
+        logger = logging.getLogger('aiida.test_buffered_db_log_handler')
+        logger.addHandler(handler)
+        logger.propagate = False
+
+        try:
+            node = CalculationNode().store()
+            adapter = create_logger_adapter(logger, node)
+            for index in range(5):
+                adapter.warning('message %d', index)
+
+            self.assertEqual(len(Log.objects.get_logs_for(node)), 0)
+            handler.flush()
+
+            logs = Log.objects.get_logs_for(node)
+            self.assertEqual(sorted(log.message for log in logs), ['message {}'.format(index) for index in range(5)])
+            self.assertIn('lineno', logs[0].metadata)
+            self.assertNotIn('msecs', logs[0].metadata)
+
+            # Closing the handler should write the records that are still buffered
+            adapter.warning('last message')
+            handler.close()
+            self.assertEqual(len(Log.objects.get_logs_for(node)), 6)
+        finally:
+            logger.removeHandler(handler)
+            handler.close()
+
     def test_log_querybuilder(self):
         """ Test querying for logs by joining on nodes in the QueryBuilder """
         from aiida.orm import QueryBuilder
@@ -13,9 +13,10 @@ from __future__ import print_function
 from __future__ import absolute_import
 
 from aiida.backends.testbase import AiidaTestCase
+from aiida.common.datastructures import CalcJobState
 from aiida.common.links import LinkType
 from aiida.orm import Dict, CalcJobNode
-from aiida.orm.utils.calcjob import CalcJobResultManager
+from aiida.orm.utils.calcjob import CalcJobResultManager, get_calcjob_state_counts
 from aiida.plugins import CalculationFactory
 from aiida.plugins.entry_point import get_entry_point_string_from_class
 
@@ -93,3 +94,30 @@ class TestCalcJobResultManager(AiidaTestCase):
         """Test that the manager support getattr operator."""
         manager = CalcJobResultManager(self.node)
         self.assertEqual(getattr(manager, self.key_one), self.val_one)
+
+
+class TestGetCalcjobStateCounts(AiidaTestCase):
+    """Tests for the `get_calcjob_state_counts` function."""
+
+    def test_counts(self):
+        """Only the calculation jobs whose process is active should be counted, for the requested states."""
+        from aiida.engine import ProcessState
+
+        for process_state, state in [(ProcessState.WAITING, CalcJobState.WITHSCHEDULER),
+                                     (ProcessState.WAITING, CalcJobState.WITHSCHEDULER),
+                                     (ProcessState.RUNNING, CalcJobState.UPLOADING),
+                                     (ProcessState.FINISHED, CalcJobState.WITHSCHEDULER)]:
+            node = CalcJobNode(computer=self.computer)
+            node.set_option('resources', {'num_machines': 1, 'num_mpiprocs_per_machine': 1})
+            node.set_process_state(process_state)
+            node.set_state(state)
+            node.store()
+
+        counts = get_calcjob_state_counts(self.computer)
+        self.assertEqual(counts[CalcJobState.WITHSCHEDULER.value], 2)
+        self.assertEqual(counts[CalcJobState.UPLOADING.value], 1)
+        self.assertEqual(counts[CalcJobState.PARSING.value], 0)
+        self.assertEqual(set(counts), set(state.value for state in CalcJobState))
+
+        counts = get_calcjob_state_counts(self.computer, states=[CalcJobState.WITHSCHEDULER])
+        self.assertEqual(counts, {CalcJobState.WITHSCHEDULER.value: 2})
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida_core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Tests for the identity map of loaded nodes."""
+from __future__ import division
+from __future__ import print_function
+from __future__ import absolute_import
+
+import gc
+import threading
+
+from aiida.backends.testbase import AiidaTestCase
+from aiida.orm import Data
+from aiida.orm.utils.identity_map import NodeIdentityMap, get_identity_map, identity_map
+
+
+class TestNodeIdentityMap(AiidaTestCase):
+    """Tests for the `NodeIdentityMap` class and the `identity_map` context manager."""
+
+    def test_get_add_remove(self):
+        """Test that nodes can be retrieved by their pk and uuid once added."""
+        node = Data().store()
+        nodes_map = NodeIdentityMap()
+
+        self.assertIsNone(nodes_map.get(pk=node.pk))
+        nodes_map.add(node)
+        self.assertIs(nodes_map.get(pk=node.pk), node)
+        self.assertIs(nodes_map.get(uuid=node.uuid), node)
+
+        nodes_map.remove(node)
+        self.assertIsNone(nodes_map.get(pk=node.pk))
+        self.assertIsNone(nodes_map.get(uuid=node.uuid))
+
+        with self.assertRaises(ValueError):
+            nodes_map.add(Data())
+
+    def test_bounded(self):
+        """Test that only the most recent nodes are kept alive by the map, the others only while referenced."""
+        nodes_map = NodeIdentityMap(maxsize=2)
+        pks = [nodes_map.add(Data().store()).pk for _ in range(4)]
+        kept = nodes_map.add(Data().store())
+        gc.collect()
+
+        self.assertEqual(len(nodes_map), 2)
+        self.assertIsNone(nodes_map.get(pk=pks[0]))
+        self.assertIsNotNone(nodes_map.get(pk=pks[3]))
+        self.assertIs(nodes_map.get(pk=kept.pk), kept)
+
+    def test_context(self):
+        """Test that the identity map is only active within the context and in the thread that activated it."""
+        self.assertIsNone(get_identity_map())
+
+        with identity_map(maxsize=10) as active_map:
+            self.assertIs(get_identity_map(), active_map)
+            self.assertEqual(active_map.maxsize, 10)
+
+            maps = []
+            thread = threading.Thread(target=lambda: maps.append(get_identity_map()))
+            thread.start()
+            thread.join()
+            self.assertEqual(maps, [None])
+
+        self.assertIsNone(get_identity_map())
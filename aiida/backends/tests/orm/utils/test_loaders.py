@@ -11,9 +11,10 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import absolute_import
 from aiida.backends.testbase import AiidaTestCase
-from aiida.common.exceptions import NotExistent
-from aiida.orm import Node, Group, Data
-from aiida.orm.utils import load_entity, load_code, load_computer, load_group, load_node
+from aiida.common.exceptions import MultipleObjectsError, NotExistent
+from aiida.orm import Code, Node, Group, Data
+from aiida.orm.utils import load_entity, load_code, load_computer, load_group, load_node, load_nodes
+from aiida.orm.utils.identity_map import identity_map
 from aiida.orm.utils.loaders import NodeEntityLoader
 
 
@@ -211,3 +212,59 @@ class TestOrmUtils(AiidaTestCase):
 
         with self.assertRaises(NotExistent):
             load_group('non-existent-uuid')
+
+    def test_load_nodes(self):
+        """Test the functionality of load_nodes."""
+        node_a = Data()
+        node_a.label = 'load_nodes_a'
+        node_a.store()
+        node_b = Data().store()
+        node_c = Data().store()
+
+        identifiers = [node_a.pk, node_b.uuid, 'load_nodes_a', node_c.uuid[:10], str(node_b.pk), node_a.pk]
+        loaded_nodes = load_nodes(identifiers)
+        self.assertEqual([node.uuid for node in loaded_nodes],
+                         [node_a.uuid, node_b.uuid, node_a.uuid, node_c.uuid, node_b.uuid, node_a.uuid])
+
+        # Duplicate identifiers are resolved to the same instance
+        self.assertIs(loaded_nodes[0], loaded_nodes[5])
+
+        self.assertEqual(load_nodes([]), [])
+
+        with self.assertRaises(NotExistent):
+            load_nodes([node_a.pk, 'non-existent-label!'])
+
+        # The sub classes narrow the query set
+        with self.assertRaises(NotExistent):
+            load_nodes([node_a.pk], sub_classes=(Code,))
+
+        node_d = Data()
+        node_d.label = 'load_nodes_a'
+        node_d.store()
+
+        with self.assertRaises(MultipleObjectsError):
+            load_nodes([node_b.pk, 'load_nodes_a'])
+
+    def test_load_nodes_identity_map(self):
+        """Test that nodes are taken from the identity map when it is active."""
+        node = Data().store()
+
+        self.assertIsNot(load_node(node.pk), load_node(node.pk))
+
+        with identity_map() as active_map:
+            loaded_node = load_node(node.pk)
+            self.assertIs(load_node(node.uuid), loaded_node)
+            self.assertIs(load_nodes([node.pk, node.uuid])[1], loaded_node)
+            self.assertEqual(len(active_map), 1)
+
+            # A node in the map that is not an instance of the sub classes is not returned
+            with self.assertRaises(NotExistent):
+                load_node(node.pk, sub_classes=(Code,))
+
+            # Nested contexts share the same map
+            with identity_map() as nested_map:
+                self.assertIs(nested_map, active_map)
+
+            self.assertIs(load_node(node.pk), loaded_node)
+
+        self.assertIsNot(load_node(node.pk), loaded_node)
@@ -114,3 +114,22 @@ class TestRepository(AiidaTestCase):
         key = os.path.join(basepath, 'subdir', 'a.txt')
         content = self.get_file_content(os.path.join('subdir', 'a.txt'))
         self.assertEqual(node.get_object_content(key), content)
+
+    def test_get_object_path(self):
+        """Test the `get_object_path` method, before and after the node is stored."""
+        key = os.path.join('subdir', 'a.txt')
+        content = self.get_file_content(key)
+
+        node = Node()
+        node.put_object_from_tree(self.tempdir)
+
+        with io.open(node.get_object_path(key), 'r', encoding='utf8') as handle:
+            self.assertEqual(handle.read(), content)
+
+        node.store()
+
+        with io.open(node.get_object_path(key), 'r', encoding='utf8') as handle:
+            self.assertEqual(handle.read(), content)
+
+        with self.assertRaises(ValueError):
+            node.get_object_path(os.path.join(self.tempdir, key))
@@ -11,12 +11,21 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import absolute_import
 
+import io
+import json
+import os
+import shutil
+import tempfile
+
+import mock
+
 from aiida.backends.testbase import AiidaTestCase
 from aiida.engine import CalcJob, WorkChain
 from aiida.orm import Data
 from aiida.parsers import Parser
 from aiida.plugins import factories
-from aiida.plugins.entry_point import get_entry_points
+from aiida.plugins import entry_point as entry_point_module
+from aiida.plugins.entry_point import EntryPoint, EntryPointIndex, get_entry_points
 from aiida.schedulers import Scheduler
 from aiida.transports import Transport
 from aiida.tools.dbexporters.tcod_plugins import BaseTcodtranslator
@@ -113,3 +122,80 @@ class TestExistingPlugins(AiidaTestCase):
             cls = factories.DbImporterFactory(entry_point.name)
             self.assertTrue(issubclass(cls, DbImporter),
                 'DbImporter plugin class {} is not subclass of {}'.format(cls, BaseTcodtranslator))
+
+
+class TestEntryPointIndex(AiidaTestCase):
+    """Test the persistent index of the entry points."""
+
+    SPECS = {
+        'aiida.calculations': ['arithmetic.add = aiida.calculations.plugins.arithmetic.add:ArithmeticAddCalculation'],
+        'aiida.data': ['dumps = json:dumps', 'duplicate = os.path:join', 'duplicate = os:getcwd'],
+    }
+
+    def setUp(self):
+        super(TestEntryPointIndex, self).setUp()
+        self.directory = tempfile.mkdtemp()
+        self.filepath = os.path.join(self.directory, 'cache', 'entry_points.json')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+        super(TestEntryPointIndex, self).tearDown()
+
+    def test_entry_point_parse(self):
+        """Test the parsing of entry point specifications."""
+        entry_point = EntryPoint.parse('int = aiida.orm.nodes.data.int:Int [extra]')
+        self.assertEqual(entry_point.name, 'int')
+        self.assertEqual(entry_point.module_name, 'aiida.orm.nodes.data.int')
+        self.assertEqual(entry_point.attrs, ('Int',))
+        self.assertEqual(EntryPoint.parse(str(entry_point)), entry_point)
+        self.assertEqual(EntryPoint.parse('path = os.path').load(), os.path)
+
+        with self.assertRaises(ValueError):
+            EntryPoint.parse('invalid')
+
+        with self.assertRaises(ImportError):
+            EntryPoint.parse('missing = os:missing').load()
+
+    def test_persistence(self):
+        """Test that the index is only rebuilt by scanning the distributions if their fingerprint changes."""
+        with mock.patch.object(entry_point_module, 'scan_entry_points', return_value=self.SPECS) as scan:
+            index = EntryPointIndex(self.filepath)
+            self.assertEqual([entry_point.name for entry_point in index.get_entry_points('aiida.data')],
+                             ['dumps', 'duplicate', 'duplicate'])
+            self.assertEqual(scan.call_count, 1)
+
+            with io.open(self.filepath, encoding='utf8') as handle:
+                self.assertEqual(json.load(handle)['entry_points'], self.SPECS)
+
+            # A new index, e.g. in a new interpreter, reads the file instead of scanning
+            index = EntryPointIndex(self.filepath)
+            self.assertEqual(index.get_entry_points('aiida.calculations')[0].name, 'arithmetic.add')
+            self.assertEqual(scan.call_count, 1)
+
+            with mock.patch.object(entry_point_module, 'get_distributions_fingerprint', return_value='changed'):
+                index = EntryPointIndex(self.filepath)
+                self.assertEqual(index.get_entry_points('aiida.workflows'), [])
+                self.assertEqual(scan.call_count, 2)
+
+    def test_lookup(self):
+        """Test the lookup of entry points by name and by class and that loaded entry points are memoized."""
+        from aiida.common.exceptions import MissingEntryPointError, MultipleEntryPointError
+
+        with mock.patch.object(entry_point_module, 'scan_entry_points', return_value=self.SPECS):
+            index = EntryPointIndex(self.filepath)
+
+            self.assertEqual(index.get_entry_point('aiida.data', 'dumps').module_name, 'json')
+            with self.assertRaises(MissingEntryPointError):
+                index.get_entry_point('aiida.data', 'missing')
+            with self.assertRaises(MultipleEntryPointError):
+                index.get_entry_point('aiida.data', 'duplicate')
+
+            group, entry_point = index.get_entry_point_from_class('json', 'dumps')
+            self.assertEqual((group, entry_point.name), ('aiida.data', 'dumps'))
+            self.assertEqual(index.get_entry_point_from_class('json', 'loads'), (None, None))
+
+            self.assertIs(index.load_entry_point('aiida.data', 'dumps'), json.dumps)
+
+            with mock.patch.object(EntryPoint, 'load') as load:
+                self.assertIs(index.load_entry_point('aiida.data', 'dumps'), json.dumps)
+                self.assertFalse(load.called)
@@ -26,7 +26,7 @@ from aiida.cmdline.utils import echo
 from aiida.cmdline.utils.decorators import with_dbenv
 from aiida.cmdline.utils.multi_line_input import ensure_scripts
 from aiida.common.exceptions import ValidationError, InputValidationError
-from aiida.plugins.entry_point import get_entry_points
+from aiida.plugins.entry_point import get_entry_point_names
 from aiida.transports import cli as transport_cli
 
 
@@ -465,9 +465,17 @@ def computer_list(all_entries, raw):
 @with_dbenv()
 def computer_show(computer):
     """
-    Show information on a given computer
+    Show information on a given computer, including the number of active calculation jobs in each state
     """
-    return echo.echo(computer.full_text_info)
+    from aiida.common.datastructures import CalcJobState
+    from aiida.orm.utils.calcjob import get_calcjob_state_counts
+
+    echo.echo(computer.full_text_info)
+
+    counts = get_calcjob_state_counts(computer)
+    echo.echo(" * Active calculation jobs:")
+    for state in CalcJobState:
+        echo.echo("   {:<14} {}".format('{}:'.format(state.value), counts[state.value]))
 
 
 @verdi_computer.command('rename')
@@ -617,7 +625,25 @@ def computer_delete(computer):
     echo.echo_success("Computer '{}' deleted.".format(compname))
 
 
-@verdi_computer.group('configure')
+class ComputerConfigureGroup(click.Group):
+    """Command group that creates the configure command of a transport type only when it is needed."""
+
+    TRANSPORT_ENTRY_POINT_GROUP = 'aiida.transports'
+
+    def list_commands(self, ctx):
+        """Add the names of the transport types to the command list."""
+        subcommands = set(super(ComputerConfigureGroup, self).list_commands(ctx))
+        subcommands.update(get_entry_point_names(self.TRANSPORT_ENTRY_POINT_GROUP))
+        return sorted(subcommands)
+
+    def get_command(self, ctx, cmd_name):
+        """Create the configure command of the transport type, if the name is that of a transport type."""
+        if cmd_name not in self.commands and cmd_name in get_entry_point_names(self.TRANSPORT_ENTRY_POINT_GROUP):
+            self.add_command(transport_cli.create_configure_cmd(cmd_name))
+        return super(ComputerConfigureGroup, self).get_command(ctx, cmd_name)
+
+
+@verdi_computer.group('configure', cls=ComputerConfigureGroup)
 def computer_configure():
     """Configure a computer with one of the available transport types."""
 
@@ -671,6 +697,3 @@ def computer_config_show(computer, user, defaults, as_option_string):
                 table.append(('* ' + name, '-'))
         echo.echo(tabulate.tabulate(table, tablefmt='plain'))
 
-
-for ep in get_entry_points('aiida.transports'):
-    computer_configure.add_command(transport_cli.create_configure_cmd(ep.name))
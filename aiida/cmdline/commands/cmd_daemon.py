@@ -23,7 +23,7 @@ from aiida.cmdline.commands.cmd_verdi import verdi
 from aiida.cmdline.utils import decorators, echo
 from aiida.cmdline.utils.common import get_env_with_venv_bin
 from aiida.cmdline.utils.daemon import get_daemon_status, print_client_response_status
-from aiida.manage.configuration import get_config
+from aiida.manage.configuration import get_config, get_config_option
 
 
 @verdi.group('daemon')
@@ -115,6 +115,33 @@ def decr(number):
     print_client_response_status(response)
 
 
+@verdi_daemon.command()
+@click.argument('number', type=click.IntRange(min=1))
+@decorators.with_dbenv()
+def slots(number):
+    """
+    Set the number of process slots of the daemon workers to NUMBER.
+
+    The process slots are the maximum number of processes that each daemon worker runs simultaneously. The number is
+    stored in the `daemon.worker_process_slots` option of the profile. It is the number of tasks that a worker takes
+    from the launch queue, which is fixed when the worker connects to it, so the workers that are running are
+    restarted, after which they continue their processes.
+    """
+    from aiida.engine.daemon.client import get_daemon_client
+
+    config = get_config()
+    client = get_daemon_client()
+
+    config.option_set('daemon.worker_process_slots', number, scope=client.profile.name)
+    config.store()
+    echo.echo_success('daemon.worker_process_slots set to {} for {}'.format(number, client.profile.name))
+
+    if client.is_daemon_running:
+        echo.echo('Restarting the daemon workers... ', nl=False)
+        response = client.restart_daemon(wait=True)
+        print_client_response_status(response)
+
+
 @verdi_daemon.command()
 def logshow():
     """
@@ -132,6 +159,160 @@ def logshow():
         process.kill()
 
 
+@verdi_daemon.command()
+@click.option('--json', 'as_json', is_flag=True, help='Print the statistics as JSON.')
+def stats(as_json):
+    """
+    Show the transport, scheduler and engine statistics of the daemon workers
+
+    For each authinfo, i.e. each combination of user and computer, the number, failures, duration and bytes
+    transferred of the operations are shown. Transport operations are single calls to the transport, e.g. executing a
+    command, scheduler operations include the command they execute and the parsing of its output and engine operations
+    are the complete transport tasks of calculation jobs, including their database and local file system work.
+
+    The statistics are dumped by each worker with the interval of the `daemon.stats_interval` option.
+    """
+    import json
+
+    from aiida.cmdline.utils.daemon import format_daemon_stats
+    from aiida.engine.daemon.client import get_daemon_client
+    from aiida.transports.instrumentation import IoStatistics
+
+    config = get_config()
+
+    if config.option_get('daemon.stats_interval') <= 0:
+        echo.echo_warning('the daemon workers do not dump their statistics: set the `daemon.stats_interval` option')
+
+    client = get_daemon_client()
+    statistics = IoStatistics.merge(client.get_worker_stats())
+
+    if as_json:
+        echo.echo(json.dumps(statistics, indent=4, sort_keys=True))
+    else:
+        echo.echo(format_daemon_stats(statistics))
+
+
+@verdi_daemon.command()
+@click.option('-w', '--worker', 'workers', type=int, multiple=True, help='Only profile the worker with this pid.')
+@click.option('-l', '--limit', type=int, default=10, show_default=True, help='Maximum number of rows per table.')
+@click.option(
+    '-d',
+    '--duration',
+    type=click.FloatRange(min=0),
+    default=None,
+    help='Profile the code run by the workers for this number of seconds instead of showing the profile of the steps.')
+@click.option('--sampling', is_flag=True, help='Sample the stack of the workers instead of using cProfile.')
+@click.option('--json', 'as_json', is_flag=True, help='Print the profiles as JSON.')
+@decorators.with_dbenv()
+@decorators.only_if_daemon_running()
+def profile(workers, limit, duration, sampling, as_json):
+    """
+    Show the profile of the steps of the processes run by the daemon workers.
+
+    All processes of a worker share a single event loop, such that a step that takes long blocks all the others. For
+    every worker the steps that are running, the lag of the event loop, the steps that took the most time in total
+    and the most recent steps that took longer than the `daemon.slow_step_threshold` option are shown. The time of the
+    steps spent in the database is shown separately.
+
+    With `--duration` the code run by the event loop of the workers is profiled instead for the given number of
+    seconds, without interrupting their processes. By default the deterministic `cProfile` profiler is used, which
+    writes a `pstats` file per worker that can be inspected with `python -m pstats`. With `--sampling` the stack of
+    the event loop is sampled from a separate thread instead, which has a lower overhead and writes the stacks in the
+    folded format that is read by flame graph tools.
+    """
+    import json
+
+    from aiida.cmdline.utils.daemon import format_daemon_profile
+    from aiida.engine.daemon.client import get_daemon_client
+    from aiida.engine.daemon.profiling import WORKER_REQUEST_STEP_PROFILE, send_worker_request
+    from aiida.manage.manager import get_manager
+
+    client = get_daemon_client()
+    response = client.get_worker_info()
+
+    if 'info' not in response:
+        echo.echo_critical('call to the circus controller failed: {}'.format(response['status']))
+
+    pids = [int(pid) for pid in response['info']]
+
+    for pid in workers:
+        if pid not in pids:
+            echo.echo_critical('{} is not the pid of a daemon worker, the workers are: {}'.format(pid, pids))
+
+    if duration is not None:
+        profile_code(workers or pids, limit, duration, sampling)
+        return
+
+    communicator = get_manager().get_communicator()
+    futures = {pid: send_worker_request(communicator, pid, WORKER_REQUEST_STEP_PROFILE) for pid in workers or pids}
+
+    profiles = {}
+    for pid, future in futures.items():
+        try:
+            profiles[pid] = future.result(timeout=get_config().option_get('daemon.timeout'))
+        except Exception as exception:  # pylint: disable=broad-except
+            profiles[pid] = exception
+
+    if as_json:
+        profiles = {str(pid): value for pid, value in profiles.items() if not isinstance(value, Exception)}
+        echo.echo(json.dumps(profiles, indent=4, sort_keys=True))
+    else:
+        echo.echo(format_daemon_profile(profiles, limit))
+
+
+def profile_code(pids, limit, duration, sampling):
+    """
+    Profile the code of the given daemon workers for the given duration and print a summary of the profiles.
+
+    :param pids: the pids of the workers
+    :param limit: the maximum number of functions to show per worker
+    :param duration: the duration in seconds of the profiling window
+    :param sampling: sample the stack of the workers instead of using cProfile
+    """
+    from aiida.cmdline.utils.daemon import format_code_profile
+    from aiida.engine.daemon.profiling import WORKER_REQUEST_CODE_PROFILE, send_worker_request
+    from aiida.manage.manager import get_manager
+
+    timeout = get_config().option_get('daemon.timeout')
+    communicator = get_manager().get_communicator()
+    futures = {
+        pid: send_worker_request(communicator, pid, WORKER_REQUEST_CODE_PROFILE, duration=duration, sampling=sampling)
+        for pid in pids
+    }
+
+    filepaths = {}
+    for pid, future in sorted(futures.items()):
+        try:
+            filepaths[pid] = future.result(timeout=timeout)['filepath']
+        except Exception as exception:  # pylint: disable=broad-except
+            echo.echo_warning('failed to start profiling worker {}: {}'.format(pid, exception))
+        else:
+            echo.echo_info('profiling worker {} for {} s to {}'.format(pid, duration, filepaths[pid]))
+
+    if not filepaths:
+        echo.echo_critical('no daemon worker could be profiled')
+
+    deadline = time.time() + duration + timeout
+
+    # The workers move a profile into place once it has been written completely, so it can be read once it exists
+    with spinner():
+        while time.time() < deadline and not all(os.path.isfile(path) for path in filepaths.values()):
+            time.sleep(0.5)
+
+    for pid, filepath in sorted(filepaths.items()):
+        click.secho('Worker {}'.format(pid), bold=True)
+        if not os.path.isfile(filepath):
+            echo.echo_warning('the profile was not written within the timeout, check the daemon log')
+            continue
+        echo.echo(format_code_profile(filepath, limit))
+        echo.echo('')
+
+    if sampling:
+        echo.echo_info('render a flame graph of the folded stacks with for example: flamegraph.pl FILE > FILE.svg')
+    else:
+        echo.echo_info('inspect the full profiles with: python -m pstats FILE')
+
+
 @verdi_daemon.command()
 @click.option('--no-wait', is_flag=True, help='Do not wait for confirmation.')
 @click.option('--all', 'all_profiles', is_flag=True, help='Stop all daemons.')
@@ -256,6 +437,21 @@ def start_circus(foreground):
         }]
     }  # yapf: disable
 
+    if get_config_option('daemon.autoscale_maximum_workers') > 0:
+        # The autoscaler adds and removes workers through the circus controller, so it is managed as a second watcher
+        arbiter_config['watchers'].append({
+            'name': client.autoscaler_name,
+            'cmd': client.autoscaler_cmd_string,
+            'virtualenv': client.virtualenv,
+            'copy_env': True,
+            'singleton': True,
+            'stdout_stream': {
+                'class': 'FileStream',
+                'filename': client.daemon_log_file,
+            },
+            'env': get_env_with_venv_bin(),
+        })  # yapf: disable
+
     if not foreground:
         daemonize()
 
@@ -32,3 +32,9 @@ def verdi_data():
 def data_plugins(ctx, entry_point):
     """Print a list of registered data plugins or details of a specific data plugin."""
     ctx.invoke(verdi_plugin.get_command(ctx, 'list'), entry_point_group='aiida.data', entry_point=entry_point)
+
+
+# Import to populate the `verdi data` sub commands
+# pylint: disable=wrong-import-position
+from aiida.cmdline.commands.cmd_data import (cmd_array, cmd_bands, cmd_cif, cmd_parameter, cmd_remote, cmd_structure,
+                                             cmd_trajectory, cmd_upf)
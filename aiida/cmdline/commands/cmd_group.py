@@ -330,5 +330,83 @@ def group_copy(source_group, destination_group):
 
     dest_group = orm.Group.objects.get_or_create(
         label=destination_group, type_string=GroupTypeString(source_group.type_string))[0]
-    dest_group.add_nodes(list(source_group.nodes))
+    source_group.union().add_to_group(dest_group)
     echo.echo_success("Nodes copied from group<{}> to group<{}>".format(source_group, destination_group))
+
+
+def echo_or_store_node_set(node_set, label, raw):
+    """
+    Show the nodes of the given set of nodes or, if a label is given, add them to the group with that label.
+
+    :param node_set: the lazy set of nodes that results from a set operation on groups
+    :param label: the label of the group to which to add the nodes, which is created if it does not exist
+    :param raw: only show a space-separated list of the PKs of the nodes
+    """
+    from tabulate import tabulate
+    from aiida import orm
+    from aiida.common import timezone
+    from aiida.common.utils import str_timedelta
+    from aiida.orm import GroupTypeString
+
+    if label is not None:
+        group, created = orm.Group.objects.get_or_create(label=label, type_string=GroupTypeString.USER)
+        node_set.add_to_group(group)
+        echo.echo_success("{} group<{}> now contains {} nodes".format('Created' if created else 'Updated', group.label,
+                                                                      group.count()))
+        return
+
+    if raw:
+        echo.echo(' '.join(str(pk) for pk in node_set.iter_pks()))
+        return
+
+    now = timezone.now()
+    table = []
+    for node in node_set:
+        table.append([
+            node.pk,
+            node.node_type.rsplit('.', 2)[1],
+            str_timedelta(now - node.ctime, short=True, negative_to_zero=True)
+        ])
+
+    echo.echo(tabulate(table, headers=['PK', 'Type', 'Created']))
+    echo.echo('\nTotal results: {}\n'.format(len(table)))
+
+
+STORE_OPTION = click.option(
+    '-s',
+    '--store',
+    'label',
+    type=click.STRING,
+    default=None,
+    help='Add the resulting nodes to the group with this label, which is created if it does not exist, instead of '
+    'showing them.')
+
+
+@verdi_group.command('union')
+@arguments.GROUPS(required=True)
+@STORE_OPTION
+@options.RAW(help='Show only a space-separated list of the PKs of the nodes.')
+@with_dbenv()
+def group_union(groups, label, raw):
+    """Show the nodes that are in any of the GROUPS."""
+    echo_or_store_node_set(groups[0].union(*groups[1:]), label, raw)
+
+
+@verdi_group.command('intersection')
+@arguments.GROUPS(required=True)
+@STORE_OPTION
+@options.RAW(help='Show only a space-separated list of the PKs of the nodes.')
+@with_dbenv()
+def group_intersection(groups, label, raw):
+    """Show the nodes that are in all of the GROUPS."""
+    echo_or_store_node_set(groups[0].intersection(*groups[1:]), label, raw)
+
+
+@verdi_group.command('difference')
+@arguments.GROUPS(required=True)
+@STORE_OPTION
+@options.RAW(help='Show only a space-separated list of the PKs of the nodes.')
+@with_dbenv()
+def group_difference(groups, label, raw):
+    """Show the nodes that are in the first of the GROUPS but in none of the others."""
+    echo_or_store_node_set(groups[0].difference(*groups[1:]), label, raw)
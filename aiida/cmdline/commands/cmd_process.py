@@ -15,8 +15,6 @@ from __future__ import absolute_import
 
 import click
 
-from kiwipy import communications
-
 from aiida.cmdline.commands.cmd_verdi import verdi
 from aiida.cmdline.params import arguments, options
 from aiida.cmdline.utils import decorators, echo
@@ -41,11 +39,24 @@ def verdi_process():
 @options.PAST_DAYS()
 @options.LIMIT()
 @options.RAW()
+@click.option(
+    '-w',
+    '--watch',
+    is_flag=True,
+    default=False,
+    help='Keep refreshing the list, only querying for the processes that were modified since the previous refresh.')
+@click.option(
+    '--interval',
+    type=click.FloatRange(min=0.1),
+    default=2.,
+    show_default=True,
+    help='Interval in seconds between two refreshes of the list in watch mode.')
 @decorators.with_dbenv()
-def process_list(all_entries, group, process_state, exit_status, failed, past_days, limit, project, raw):
+def process_list(all_entries, group, process_state, exit_status, failed, past_days, limit, project, raw, watch,
+                 interval):
     """Show a list of processes that are still running."""
-    from tabulate import tabulate
-    from aiida.cmdline.utils.common import print_last_process_state_change
+    import time
+    from aiida.cmdline.utils.query.calculation import CalculationQueryWatcher
 
     relationships = {}
 
@@ -54,8 +65,38 @@ def process_list(all_entries, group, process_state, exit_status, failed, past_da
 
     builder = CalculationQueryBuilder()
     filters = builder.get_filters(all_entries, process_state, exit_status, failed)
-    query_set = builder.get_query_set(relationships=relationships, filters=filters, past_days=past_days, limit=limit)
-    projected = builder.get_projected(query_set, projections=project)
+
+    if not watch:
+        query_set = builder.get_query_set(
+            relationships=relationships, filters=filters, past_days=past_days, limit=limit, projections=project)
+        echo_process_list(builder.get_projected(query_set, projections=project), raw)
+        return
+
+    if limit is not None:
+        echo.echo_critical('the limit option cannot be used in watch mode')
+
+    watcher = CalculationQueryWatcher(
+        builder, projections=project, relationships=relationships, filters=filters, past_days=past_days)
+
+    try:
+        while True:
+            projected = builder.get_projected(watcher.refresh(), projections=project)
+            click.clear()
+            echo_process_list(projected, raw)
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        pass
+
+
+def echo_process_list(projected, raw):
+    """
+    Print the projected query set of processes as a table.
+
+    :param projected: list of rows, where the first row contains the headers
+    :param raw: only print the rows, without the headers and the summary
+    """
+    from tabulate import tabulate
+    from aiida.cmdline.utils.common import print_last_process_state_change
 
     headers = projected.pop(0)
 
@@ -130,6 +171,7 @@ def process_status(processes):
 @decorators.only_if_daemon_running(echo.echo_warning, 'daemon is not running, so process may not be reachable')
 def process_kill(processes, timeout, wait):
     """Kill running processes."""
+    from kiwipy import communications
 
     controller = get_manager().get_process_controller()
 
@@ -161,6 +203,7 @@ def process_kill(processes, timeout, wait):
 @decorators.only_if_daemon_running(echo.echo_warning, 'daemon is not running, so process may not be reachable')
 def process_pause(processes, timeout, wait):
     """Pause running processes."""
+    from kiwipy import communications
 
     controller = get_manager().get_process_controller()
 
@@ -192,6 +235,7 @@ def process_pause(processes, timeout, wait):
 @decorators.only_if_daemon_running(echo.echo_warning, 'daemon is not running, so process may not be reachable')
 def process_play(processes, timeout, wait):
     """Play paused processes."""
+    from kiwipy import communications
 
     controller = get_manager().get_process_controller()
 
@@ -20,6 +20,7 @@ from aiida.cmdline.commands.cmd_verdi import verdi
 from aiida.cmdline.params.types.user import UserParamType
 from aiida.cmdline.utils.decorators import with_dbenv
 from aiida.cmdline.params import options
+from aiida.cmdline.params.options.interactive import InteractiveOption
 
 
 @verdi.group('user')
@@ -53,19 +54,19 @@ PASSWORD_UNCHANGED = '***'  # noqa
     prompt='First name',
     type=str,
     contextual_default=partial(get_default, 'first_name'),
-    cls=options.interactive.InteractiveOption)
+    cls=InteractiveOption)
 @click.option(
     '--last-name',
     prompt='Last name',
     type=str,
     contextual_default=partial(get_default, 'last_name'),
-    cls=options.interactive.InteractiveOption)
+    cls=InteractiveOption)
 @click.option(
     '--institution',
     prompt='Institution',
     type=str,
     contextual_default=partial(get_default, 'institution'),
-    cls=options.interactive.InteractiveOption)
+    cls=InteractiveOption)
 @click.option(
     '--password',
     prompt='Password',
@@ -74,7 +75,7 @@ PASSWORD_UNCHANGED = '***'  # noqa
     type=str,
     default=PASSWORD_UNCHANGED,
     confirmation_prompt=True,
-    cls=options.interactive.InteractiveOption)
+    cls=InteractiveOption)
 @with_dbenv()
 def configure(user, first_name, last_name, institution, password, non_interactive):
     """
@@ -15,11 +15,46 @@ from __future__ import absolute_import
 import click
 
 from aiida.cmdline.params import options
+from aiida.cmdline.utils.lazy import LazyGroup
 from aiida.common.extendeddicts import AttributeDict
 from aiida.common import exceptions
 
+# The module that registers each `verdi` subcommand and its short help, such that the module only has to be imported
+# when the subcommand is invoked. The short help should match the first line of the docstring of the subcommand.
+VERDI_SUBCOMMANDS = {
+    'calcjob': ('aiida.cmdline.commands.cmd_calcjob', 'Inspect and manage calcjobs.'),
+    'code': ('aiida.cmdline.commands.cmd_code', 'Setup and manage codes.'),
+    'comment': ('aiida.cmdline.commands.cmd_comment', 'Inspect, create and manage node comments.'),
+    'completioncommand': ('aiida.cmdline.commands.cmd_completioncommand',
+                          'Return the bash code to activate completion.'),
+    'computer': ('aiida.cmdline.commands.cmd_computer', 'Setup and manage computers.'),
+    'config': ('aiida.cmdline.commands.cmd_config',
+               'Set, unset and get profile specific or global configuration options.'),
+    'daemon': ('aiida.cmdline.commands.cmd_daemon', 'Inspect and manage the daemon.'),
+    'data': ('aiida.cmdline.commands.cmd_data', 'Inspect, create and manage data nodes.'),
+    'database': ('aiida.cmdline.commands.cmd_database', 'Inspect and manage the database.'),
+    'devel': ('aiida.cmdline.commands.cmd_devel', 'Commands for developers.'),
+    'export': ('aiida.cmdline.commands.cmd_export', 'Create and manage export archives.'),
+    'graph': ('aiida.cmdline.commands.cmd_graph', 'Create visual representations of part of the provenance graph.'),
+    'group': ('aiida.cmdline.commands.cmd_group', 'Inspect, create and manage groups.'),
+    'import': ('aiida.cmdline.commands.cmd_import', 'Import one or multiple exported AiiDA archives'),
+    'node': ('aiida.cmdline.commands.cmd_node', 'Inspect, create and manage nodes.'),
+    'plugin': ('aiida.cmdline.commands.cmd_plugin', 'Inspect installed plugins for various entry point categories.'),
+    'process': ('aiida.cmdline.commands.cmd_process', 'Inspect and manage processes.'),
+    'profile': ('aiida.cmdline.commands.cmd_profile', 'Inspect and manage the configured profiles.'),
+    'quicksetup': ('aiida.cmdline.commands.cmd_quicksetup',
+                   'Set up a sane configuration with as little interaction as possible.'),
+    'rehash': ('aiida.cmdline.commands.cmd_rehash', 'Recompute the hash for nodes in the database'),
+    'restapi': ('aiida.cmdline.commands.cmd_restapi', 'Run the AiiDA REST API server'),
+    'run': ('aiida.cmdline.commands.cmd_run', 'Execute an AiiDA script.'),
+    'setup': ('aiida.cmdline.commands.cmd_setup', 'Setup and configure a new profile.'),
+    'shell': ('aiida.cmdline.commands.cmd_shell', 'Start a python shell with preloaded AiiDA environment.'),
+    'status': ('aiida.cmdline.commands.cmd_status', 'Print status of AiiDA services.'),
+    'user': ('aiida.cmdline.commands.cmd_user', 'Inspect and manage users.'),
+}
 
-@click.group(invoke_without_command=True)
+
+@click.group(cls=LazyGroup, lazy_subcommands=VERDI_SUBCOMMANDS, invoke_without_command=True)
 @options.PROFILE()
 @click.option('--version', is_flag=True, is_eager=True, help='Print the version of AiiDA that is currently installed.')
 @click.pass_context
@@ -12,6 +12,7 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import absolute_import
 import click
+import six
 from tabulate import tabulate
 
 from aiida.cmdline.utils.common import format_local_time
@@ -89,3 +90,137 @@ def get_daemon_status(client):
                 'Use verdi daemon [incr | decr] [num] to increase / decrease the amount of workers')
 
     return template.format(**info)
+
+
+def format_daemon_stats(statistics):
+    """
+    Format the input/output statistics of the daemon workers as a table per authinfo.
+
+    :param statistics: the merged statistics, as returned by `IoStatistics.merge`
+    :return: the formatted string
+    """
+    if not statistics['authinfos']:
+        return 'No statistics have been recorded by the daemon workers yet'
+
+    sections = []
+    headers = ['Category', 'Operation', 'Count', 'Failures', 'Total [s]', 'Mean [s]', 'Max [s]', 'Bytes']
+
+    for _, authinfo in sorted(statistics['authinfos'].items(), key=lambda item: item[1]['label']):
+        rows = []
+        for category, operations in sorted(authinfo['operations'].items()):
+            for operation, counters in sorted(operations.items()):
+                mean = counters['total_time'] / counters['count'] if counters['count'] else 0.
+                rows.append([
+                    category, operation, counters['count'], counters['failures'], counters['total_time'], mean,
+                    counters['max_time'], counters['bytes']
+                ])
+
+        table = tabulate(rows, headers=headers, tablefmt='simple', floatfmt='.3f')
+        sections.append('{}\n{}'.format(click.style(authinfo['label'], bold=True), table))
+
+    template = 'Statistics of {} daemon worker(s)\n\n{}'
+    return template.format(len(statistics['pids']), '\n\n'.join(sections))
+
+
+def format_daemon_profile(profiles, limit=10):
+    """
+    Format the step profiles of the daemon workers as tables per worker.
+
+    For every worker the steps that are running, the steps with the largest total time and the most recent slow steps
+    are shown.
+
+    :param profiles: dictionary of the profiles, as returned by `StepProfile.as_dict`, per pid of the worker, where the
+        profile is replaced by an exception if the worker could not be reached
+    :param limit: the maximum number of steps to show per table
+    :return: the formatted string
+    """
+    if not profiles:
+        return 'No daemon workers are running'
+
+    sections = []
+
+    for pid, profile in sorted(profiles.items()):
+        title = click.style('Worker {}'.format(pid), bold=True)
+
+        if isinstance(profile, Exception):
+            sections.append('{}\nfailed to get the profile: {}'.format(title, profile))
+            continue
+
+        loop = profile['loop']
+        lines = [
+            '{}: {} of {} process slots used, event loop lag {:.1f} ms on average and {:.1f} ms at most'.format(
+                title, loop['active_processes'], loop['process_slots'], loop['loop_lag'] * 1000,
+                loop['maximum_loop_lag'] * 1000)
+        ]
+
+        if profile['running']:
+            rows = [[step['category'], step['step'], step['pk'], step['elapsed']] for step in profile['running']]
+            headers = ['Category', 'Running step', 'Process', 'Elapsed [s]']
+            lines.append(tabulate(rows[:limit], headers=headers, tablefmt='simple', floatfmt='.3f'))
+
+        rows = []
+        for category, steps in profile['steps'].items():
+            for step, counters in steps.items():
+                mean = counters['total_time'] / counters['count'] if counters['count'] else 0.
+                rows.append([
+                    category, step, counters['count'], counters['total_time'], mean, counters['max_time'],
+                    counters['db_time']
+                ])
+
+        if rows:
+            rows.sort(key=lambda row: row[3], reverse=True)
+            headers = ['Category', 'Step', 'Count', 'Total [s]', 'Mean [s]', 'Max [s]', 'Database [s]']
+            lines.append(tabulate(rows[:limit], headers=headers, tablefmt='simple', floatfmt='.3f'))
+        else:
+            lines.append('No steps have been recorded yet')
+
+        if profile['slow_steps']:
+            rows = [[
+                format_local_time(step['timestamp']), step['category'], step['step'], step['pk'], step['duration'],
+                step['db_time']
+            ] for step in reversed(profile['slow_steps'])]
+            headers = ['Time', 'Category', 'Slow step', 'Process', 'Duration [s]', 'Database [s]']
+            lines.append(tabulate(rows[:limit], headers=headers, tablefmt='simple', floatfmt='.3f'))
+
+        sections.append('\n\n'.join(lines))
+
+    return '\n\n'.join(sections)
+
+
+def format_code_profile(filepath, limit=10):
+    """
+    Format a summary of a profile of the code of a daemon worker as written by the `CodeProfiler`.
+
+    For a deterministic profile the functions with the largest cumulative time are shown, for a sampled profile the
+    functions in which the most samples were taken.
+
+    :param filepath: the path of the `pstats` file or of the file with the folded stacks
+    :param limit: the maximum number of functions to show
+    :return: the formatted string
+    """
+    import collections
+    import io
+    import pstats
+
+    if not filepath.endswith('.folded'):
+        stream = six.StringIO()
+        stats = pstats.Stats(filepath, stream=stream)
+        stats.sort_stats('cumulative').print_stats(limit)
+        return stream.getvalue().strip()
+
+    samples = collections.Counter()
+    with io.open(filepath, encoding='utf8') as handle:
+        for line in handle:
+            stack, _, count = line.rstrip().rpartition(' ')
+            if stack:
+                samples[stack.split(';')[-1]] += int(count)
+
+    total = sum(samples.values())
+
+    if not total:
+        return 'No samples were taken'
+
+    rows = [[function, count, count * 100. / total] for function, count in samples.most_common(limit)]
+    table = tabulate(rows, headers=['Function', 'Samples', 'Percentage'], tablefmt='simple', floatfmt='.1f')
+
+    return '{} samples in total\n{}'.format(total, table)
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida_core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""Click command group that imports the modules of its subcommands lazily."""
+from __future__ import division
+from __future__ import print_function
+from __future__ import absolute_import
+
+import importlib
+
+import click
+from click.utils import make_default_short_help
+
+
+class LazyGroup(click.Group):
+    """
+    A click command group that only imports the module of a subcommand when the subcommand is needed.
+
+    The modules of the subcommands register them with the group when they are imported. Until then, the group knows
+    the names of the subcommands and their short help, such that the help of the group and the completion of the names
+    of the subcommands do not have to import any of them.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """
+        Initialize with the lazy subcommands, a dictionary with a tuple of the module path and the short help of the
+        subcommand for each name.
+        """
+        self._lazy_subcommands = kwargs.pop('lazy_subcommands', {})
+        super(LazyGroup, self).__init__(*args, **kwargs)
+
+    @property
+    def lazy_subcommands(self):
+        """Return the dictionary of the module path and short help of the lazy subcommands per name."""
+        return self._lazy_subcommands
+
+    def list_commands(self, ctx):
+        """Return the names of the subcommands, both those that have been loaded and those that have not."""
+        subcommands = set(super(LazyGroup, self).list_commands(ctx))
+        subcommands.update(self._lazy_subcommands)
+        return sorted(subcommands)
+
+    def get_command(self, ctx, cmd_name):
+        """Return the subcommand with the given name, importing the module that registers it if necessary."""
+        if cmd_name not in self.commands and cmd_name in self._lazy_subcommands:
+            module_path, _ = self._lazy_subcommands[cmd_name]
+            importlib.import_module(module_path)
+
+        return super(LazyGroup, self).get_command(ctx, cmd_name)
+
+    def get_command_short_help(self, ctx, cmd_name, limit=45):
+        """
+        Return the short help of the subcommand with the given name, without importing its module if possible.
+
+        This method is also used by `click_completion` to show the subcommands when completing them.
+
+        :param cmd_name: the name of the subcommand
+        :param limit: the maximum length of the short help
+        :return: the short help
+        """
+        if cmd_name not in self.commands and cmd_name in self._lazy_subcommands:
+            _, short_help = self._lazy_subcommands[cmd_name]
+            return make_default_short_help(short_help, limit)
+
+        command = self.get_command(ctx, cmd_name)
+        return command.get_short_help_str(limit) if command else None
+
+    def get_command_hidden(self, ctx, cmd_name):
+        """
+        Return whether the subcommand with the given name is hidden, which lazy subcommands are not.
+
+        This method is used by `click_completion` to filter the subcommands when completing them.
+
+        :param cmd_name: the name of the subcommand
+        :return: boolean, True if the subcommand is hidden
+        """
+        if cmd_name not in self.commands and cmd_name in self._lazy_subcommands:
+            return False
+
+        command = self.get_command(ctx, cmd_name)
+        return command.hidden if command else False
+
+    def format_commands(self, ctx, formatter):
+        """Write the names and short help of the subcommands into the formatter, without importing their modules."""
+        names = [name for name in self.list_commands(ctx) if not self.get_command_hidden(ctx, name)]
+
+        if not names:
+            return
+
+        limit = formatter.width - 6 - max(len(name) for name in names)
+        rows = [(name, self.get_command_short_help(ctx, name, limit)) for name in names]
+
+        with formatter.section('Commands'):
+            formatter.write_dl(rows)
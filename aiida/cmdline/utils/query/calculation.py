@@ -11,6 +11,9 @@
 from __future__ import division
 from __future__ import print_function
 from __future__ import absolute_import
+
+import datetime
+
 from aiida.common.lang import classproperty
 from aiida.cmdline.utils.query.mapping import CalculationProjectionMapper
 
@@ -18,9 +21,9 @@ from aiida.cmdline.utils.query.mapping import CalculationProjectionMapper
 class CalculationQueryBuilder(object):  # pylint: disable=useless-object-inheritance
     """Utility class to construct a QueryBuilder instance for Calculation nodes and project the query set."""
 
-    # This tuple serves to mark compound projections that cannot explicitly be projected in the QueryBuilder, but will
-    # have to be manually projected from composing its individual projection constituents
-    _compound_projections = ('state',)
+    # This dictionary serves to mark compound projections that cannot explicitly be projected in the QueryBuilder, but
+    # will have to be manually projected from composing its individual projection constituents, which are the values
+    _compound_projections = {'state': ('process_state', 'paused', 'exit_status')}
     _default_projections = ('pk', 'ctime', 'state', 'process_label', 'process_status')
     _valid_projections = ('pk', 'uuid', 'ctime', 'mtime', 'state', 'process_state', 'process_status', 'exit_status',
                           'sealed', 'process_label', 'label', 'description', 'node_type', 'paused', 'process_type',
@@ -80,7 +83,40 @@ class CalculationQueryBuilder(object):  # pylint: disable=useless-object-inherit
 
         return filters
 
-    def get_query_set(self, relationships=None, filters=None, order_by=None, past_days=None, limit=None):
+    def get_projected_attributes(self, projections=None):
+        """
+        Return the attributes that the QueryBuilder has to project to be able to format the given projections.
+
+        The `pk`, `ctime` and `mtime` are always included as they are needed to identify, order and refresh the rows.
+
+        :param projections: the projections to format, by default all valid projections
+        :return: list of the attributes to project, without duplicates
+        """
+        if projections is None:
+            projections = self._valid_projections
+
+        constituents = ['pk', 'ctime', 'mtime']
+
+        for projection in projections:
+            constituents.extend(self._compound_projections.get(projection, (projection,)))
+
+        projected_attributes = []
+
+        for constituent in constituents:
+            attribute = self.mapper.get_attribute(constituent)
+            if attribute not in projected_attributes:
+                projected_attributes.append(attribute)
+
+        return projected_attributes
+
+    def get_query_set(self,
+                      relationships=None,
+                      filters=None,
+                      order_by=None,
+                      past_days=None,
+                      limit=None,
+                      projections=None,
+                      modified_since=None):
         """
         Return the query set of calculations for the given filters and query parameters
 
@@ -91,26 +127,73 @@ class CalculationQueryBuilder(object):  # pylint: disable=useless-object-inherit
         :param order_by: order the query set by this criterion
         :param past_days: only include entries from the last past days
         :param limit: limit the query set to this number of entries
+        :param projections: only project the attributes needed to format these projections, by default all of them
+        :param modified_since: only include entries that were modified at or after this datetime
         :return: the query set, a list of dictionaries
         """
-        import datetime
+        projected_attributes = self.get_projected_attributes(projections)
+
+        builder = self._get_builder(relationships, filters, past_days, modified_since, projected_attributes)
+
+        if order_by is not None:
+            builder.order_by({'process': order_by})
+        else:
+            builder.order_by({'process': {'ctime': 'asc'}})
+
+        if limit is not None:
+            builder.limit(limit)
+
+        return builder.iterdict()
+
+    def get_modified(self, relationships=None, past_days=None, modified_since=None):
+        """
+        Return the pk and modification time of the calculations modified since the given time, regardless of any
+        filters other than the relationships and the creation time.
+
+        :param relationships: a mapping of relationships to join on, see `get_query_set`
+        :param past_days: only include entries from the last past days
+        :param modified_since: only include entries that were modified at or after this datetime, by default all
+        :return: list of tuples of the pk and the modification time
+        """
+        builder = self._get_builder(relationships, None, past_days, modified_since, ['id', 'mtime'])
+        return builder.all()
+
+    def get_last_modified(self, relationships=None):
+        """
+        Return the latest modification time of all calculations.
+
+        :param relationships: a mapping of relationships to join on, see `get_query_set`
+        :return: the modification time or None if there are no calculations
+        """
+        builder = self._get_builder(relationships, None, None, None, ['mtime'])
+        builder.order_by({'process': {'mtime': 'desc'}})
+        builder.limit(1)
+        result = builder.first()
+        return result[0] if result else None
 
+    @staticmethod
+    def _get_builder(relationships, filters, past_days, modified_since, projected_attributes):
+        """
+        Return a `QueryBuilder` for calculations with the given filters that projects the given attributes.
+
+        :param relationships: a mapping of relationships to join on, see `get_query_set`
+        :param filters: rules to filter query results with, the dictionary is not modified
+        :param past_days: only include entries from the last past days
+        :param modified_since: only include entries that were modified at or after this datetime
+        :param projected_attributes: list of the attributes to project
+        :return: the query builder
+        """
         from aiida import orm
         from aiida.common import timezone
 
-        # Define the list of projections for the QueryBuilder, which are all valid minus the compound projections
-        projected_attributes = [
-            self.mapper.get_attribute(projection)
-            for projection in self._valid_projections
-            if projection not in self._compound_projections
-        ]
-
-        if filters is None:
-            filters = {}
+        filters = dict(filters or {})
 
         if past_days is not None:
             filters['ctime'] = {'>': timezone.now() - datetime.timedelta(days=past_days)}
 
+        if modified_since is not None:
+            filters['mtime'] = {'>=': modified_since}
+
         builder = orm.QueryBuilder()
         builder.append(cls=orm.ProcessNode, filters=filters, project=projected_attributes, tag='process')
 
@@ -118,15 +201,7 @@ class CalculationQueryBuilder(object):  # pylint: disable=useless-object-inherit
             for tag, entity in relationships.items():
                 builder.append(cls=type(entity), filters={'id': entity.id}, **{tag: 'process'})
 
-        if order_by is not None:
-            builder.order_by({'process': order_by})
-        else:
-            builder.order_by({'process': {'ctime': 'asc'}})
-
-        if limit is not None:
-            builder.limit(limit)
-
-        return builder.iterdict()
+        return builder
 
     def get_projected(self, query_set, projections):
         """
@@ -140,3 +215,88 @@ class CalculationQueryBuilder(object):  # pylint: disable=useless-object-inherit
             result.append(result_row)
 
         return result
+
+
+class CalculationQueryWatcher(object):
+    """
+    Keep the query set of calculations for the given filters up to date, by only querying for the calculations that
+    were modified since the previous refresh.
+
+    Each refresh queries for the pks of the calculations that were modified since the previous refresh, which is cheap
+    thanks to the index on the modification time, and only those calculations that still match the filters are
+    queried for again. Calculations that were modified but no longer match the filters, for example because they
+    terminated, are removed from the query set.
+    """
+
+    # pylint: disable=useless-object-inheritance,too-many-instance-attributes
+
+    # Calculations modified shortly before the previous refresh are queried for again, such that modifications that
+    # were committed after the refresh, but with an earlier modification time, are not missed
+    MTIME_MARGIN = datetime.timedelta(seconds=2)
+
+    def __init__(self, builder, projections, relationships=None, filters=None, past_days=None):
+        """
+        :param builder: the calculation query builder
+        :type builder: :class:`aiida.cmdline.utils.query.calculation.CalculationQueryBuilder`
+        :param projections: the projections to format
+        :param relationships: a mapping of relationships to join on, see `CalculationQueryBuilder.get_query_set`
+        :param filters: rules to filter query results with
+        :param past_days: only include entries from the last past days
+        """
+        super(CalculationQueryWatcher, self).__init__()
+        self._builder = builder
+        self._projections = projections
+        self._relationships = relationships
+        self._filters = filters
+        self._past_days = past_days
+        self._last_modified = None
+        self._query_set = {}
+
+    def refresh(self):
+        """
+        Bring the query set up to date and return it, the first call runs the full query.
+
+        Note that calculations are only noticed when they are modified, so a calculation that is added to a group
+        that is used as a relationship only appears once it is modified itself.
+
+        :return: the query set, a list of dictionaries ordered by creation time
+        """
+        from aiida.common import timezone
+
+        if self._last_modified is None:
+            # Determine the latest modification time before the query, such that no modification can be missed
+            self._last_modified = self._builder.get_last_modified(self._relationships)
+            self._query_set = {}
+            self._update(self._builder.get_query_set(**self._get_query_kwargs()))
+        else:
+            modified_since = self._last_modified - self.MTIME_MARGIN
+            modified = self._builder.get_modified(self._relationships, self._past_days, modified_since)
+
+            if modified:
+                self._last_modified = max(self._last_modified, max(mtime for _, mtime in modified))
+                for pk, _ in modified:
+                    self._query_set.pop(pk, None)
+                self._update(self._builder.get_query_set(modified_since=modified_since, **self._get_query_kwargs()))
+
+        if self._past_days is not None:
+            created_since = timezone.now() - datetime.timedelta(days=self._past_days)
+            for pk, query_result in list(self._query_set.items()):
+                if query_result['process']['ctime'] <= created_since:
+                    self._query_set.pop(pk)
+
+        return sorted(self._query_set.values(), key=lambda query_result: query_result['process']['ctime'])
+
+    def _get_query_kwargs(self):
+        """Return the keyword arguments of `CalculationQueryBuilder.get_query_set` for the filters of the watcher."""
+        return {
+            'relationships': self._relationships,
+            'filters': self._filters,
+            'past_days': self._past_days,
+            'projections': self._projections,
+        }
+
+    def _update(self, query_set):
+        """Add the calculations of the given query set to the current query set, replacing those with the same pk."""
+        pk_attribute = self._builder.mapper.get_attribute('pk')
+        for query_result in query_set:
+            self._query_set[query_result['process'][pk_attribute]] = query_result
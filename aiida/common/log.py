@@ -190,6 +190,16 @@ def configure_logging(with_orm=False, daemon=False, daemon_log_file=None):
             'level': get_config_option('logging.db_loglevel'),
             'class': 'aiida.orm.utils.log.DBLogHandler',
         }
+
+        # The daemon writes the records in batches from a background thread, such as not to block the event loop
+        buffer_size = get_config_option('logging.db_buffer_size')
+        if daemon is True and buffer_size > 0:
+            config['handlers'][handler_dblogger].update({
+                'class': 'aiida.orm.utils.log.BufferedDBLogHandler',
+                'buffer_size': buffer_size,
+                'flush_size': get_config_option('logging.db_flush_size'),
+                'flush_interval': get_config_option('logging.db_flush_interval'),
+            })
         config['loggers']['aiida']['handlers'].append(handler_dblogger)
 
     dictConfig(config)
@@ -0,0 +1,339 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida_core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""
+Autoscaling of the number of daemon workers.
+
+Every daemon worker keeps track of its load in a `WorkerLoad`: the number of processes it is running, the number of
+process slots, i.e. the maximum number of processes it takes from the launch queue, and the lag of its event loop,
+which is the delay with which callbacks are run and grows when the loop is busy. The load is dumped together with the
+input/output statistics of the worker.
+
+The `DaemonAutoscaler` runs as a separate process managed by circus, next to the workers. At every interval it reads
+the load of the workers and the number of tasks that are waiting in the launch queue and adds or removes workers
+within the configured bounds:
+
+    * tasks that are waiting in the launch queue mean that all workers are full, so as many workers are added as are
+      needed to take all the waiting tasks
+    * if the average loop lag exceeds the configured maximum, the workers cannot keep up with their processes and a
+      single worker is added. Processes that a worker has already taken are not handed over to a new worker, so this
+      is only done if every worker, including the one added last, is running processes and at most once per cooldown
+      period, otherwise a persistent lag would add workers up to the maximum
+    * if the workers have spare process slots for longer than the idle time, a single worker is removed, the processes
+      it was running are continued by the other workers
+"""
+from __future__ import division
+from __future__ import print_function
+from __future__ import absolute_import
+
+import logging
+import math
+import signal
+import threading
+import time
+
+__all__ = ('DaemonAutoscaler', 'WorkerLoad', 'get_worker_load')
+
+LOGGER = logging.getLogger(__name__)
+
+WORKER_LOAD = None
+
+
+def get_worker_load():
+    """
+    Return the load of the daemon worker running in this interpreter, creating it if necessary.
+
+    :rtype: :class:`aiida.engine.daemon.autoscaler.WorkerLoad`
+    """
+    global WORKER_LOAD  # pylint: disable=global-statement
+
+    if WORKER_LOAD is None:
+        WORKER_LOAD = WorkerLoad()
+
+    return WORKER_LOAD
+
+
+class WorkerLoad(object):
+    """
+    Keep track of the active processes, the process slots and the event loop lag of a daemon worker.
+    """
+
+    # pylint: disable=useless-object-inheritance
+
+    LOOP_LAG_INTERVAL = 1.
+
+    def __init__(self, process_slots=0):
+        """
+        :param process_slots: the maximum number of processes that the worker runs simultaneously
+        """
+        super(WorkerLoad, self).__init__()
+        self._lock = threading.Lock()
+        self._process_slots = process_slots
+        self._active_processes = 0
+        self._loop_lag_total = 0.
+        self._loop_lag_count = 0
+        self._loop_lag_maximum = 0.
+
+    @property
+    def active_processes(self):
+        """Return the number of processes that the worker is currently running."""
+        return self._active_processes
+
+    @property
+    def process_slots(self):
+        """Return the maximum number of processes that the worker runs simultaneously."""
+        return self._process_slots
+
+    def set_process_slots(self, process_slots):
+        """
+        Set the maximum number of processes that the worker runs simultaneously.
+
+        :param process_slots: the number of process slots
+        """
+        self._process_slots = process_slots
+
+    def track(self, future):
+        """
+        Count the process whose execution is represented by the given future as active until the future is done.
+
+        :param future: the future of the task that runs the process
+        :type future: :class:`tornado.concurrent.Future`
+        :return: the future
+        """
+        with self._lock:
+            self._active_processes += 1
+
+        def done(_):
+            with self._lock:
+                self._active_processes -= 1
+
+        future.add_done_callback(done)
+
+        return future
+
+    def record_loop_lag(self, lag):
+        """
+        Record a measurement of the lag of the event loop.
+
+        :param lag: the delay in seconds with which a scheduled callback was run
+        """
+        with self._lock:
+            self._loop_lag_total += lag
+            self._loop_lag_count += 1
+            self._loop_lag_maximum = max(self._loop_lag_maximum, lag)
+
+    def monitor_loop_lag(self, loop, interval=LOOP_LAG_INTERVAL):
+        """
+        Periodically measure the lag of the event loop, i.e. how late a callback scheduled with `call_later` is run.
+
+        :param loop: the event loop of the runner
+        :type loop: :class:`tornado.ioloop.IOLoop`
+        :param interval: the interval in seconds between measurements
+        """
+
+        def measure(expected):
+            """Record by how much this callback is late and schedule the next measurement."""
+            self.record_loop_lag(max(loop.time() - expected, 0.))
+            loop.call_later(interval, measure, loop.time() + interval)
+
+        loop.call_later(interval, measure, loop.time() + interval)
+
+    def as_dict(self, reset=True):
+        """
+        Return the load as a dictionary that can be serialized to JSON.
+
+        The loop lag is the average and the maximum of the measurements since the previous call that reset them.
+
+        :param reset: reset the measurements of the loop lag
+        :return: dictionary with the `active_processes`, `process_slots`, `loop_lag` and `maximum_loop_lag`
+        """
+        with self._lock:
+            result = {
+                'active_processes': self._active_processes,
+                'process_slots': self._process_slots,
+                'loop_lag': self._loop_lag_total / self._loop_lag_count if self._loop_lag_count else 0.,
+                'maximum_loop_lag': self._loop_lag_maximum,
+            }
+
+            if reset:
+                self._loop_lag_total = 0.
+                self._loop_lag_count = 0
+                self._loop_lag_maximum = 0.
+
+        return result
+
+
+class DaemonAutoscaler(object):
+    """
+    Add or remove daemon workers depending on the depth of the launch queue and the load of the workers.
+    """
+
+    # pylint: disable=useless-object-inheritance,too-many-instance-attributes
+
+    # Fraction of the process slots of the remaining workers that may be in use after a worker is removed
+    SCALE_DOWN_UTILIZATION = 0.5
+
+    def __init__(self, client, minimum_workers, maximum_workers, process_slots, idle_time, maximum_loop_lag, cooldown):
+        """
+        :param client: the daemon client of the profile
+        :type client: :class:`aiida.engine.daemon.client.DaemonClient`
+        :param minimum_workers: the minimum number of workers
+        :param maximum_workers: the maximum number of workers
+        :param process_slots: the number of process slots of a worker, used if no worker dumped its load yet
+        :param idle_time: the time in seconds that the workers must have spare slots before a worker is removed
+        :param maximum_loop_lag: the average loop lag in seconds above which a worker is added
+        :param cooldown: the time in seconds after workers were added before a worker is added because of the loop lag
+        """
+        super(DaemonAutoscaler, self).__init__()
+        self._client = client
+        self._minimum_workers = max(minimum_workers, 0)
+        self._maximum_workers = max(maximum_workers, self._minimum_workers)
+        self._process_slots = max(process_slots, 1)
+        self._idle_time = idle_time
+        self._maximum_loop_lag = maximum_loop_lag
+        self._cooldown = cooldown
+        self._idle_since = None
+        self._scaled_up_at = None
+        self._stopped = threading.Event()
+
+    def get_desired_number_of_workers(self, number_workers, queue_depth, worker_loads, now=None):
+        """
+        Return the number of workers that should be running given the current state of the daemon.
+
+        :param number_workers: the number of workers that are currently running
+        :param queue_depth: the number of tasks waiting in the launch queue
+        :param worker_loads: list of the loads of the workers, as returned by `WorkerLoad.as_dict`
+        :param now: the current time, by default `time.time()`
+        :return: the desired number of workers, within the bounds of the autoscaler
+        """
+        if now is None:
+            now = time.time()
+
+        process_slots = max([load['process_slots'] for load in worker_loads] or [self._process_slots])
+        process_slots = max(process_slots, 1)
+        active_processes = sum(load['active_processes'] for load in worker_loads)
+        loop_lags = [load['loop_lag'] for load in worker_loads]
+
+        desired = number_workers
+
+        if queue_depth > 0:
+            desired = number_workers + int(math.ceil(queue_depth / process_slots))
+            self._idle_since = None
+        elif loop_lags and sum(loop_lags) / len(loop_lags) > self._maximum_loop_lag:
+            # A new worker only takes new processes, so it only helps if all the workers, including the one that was
+            # added last, are actually running processes, and its effect on the lag is awaited for the cooldown
+            capacity_used = len(worker_loads) >= number_workers and all(
+                load['active_processes'] > 0 for load in worker_loads)
+            cooled_down = self._scaled_up_at is None or now - self._scaled_up_at >= self._cooldown
+            if capacity_used and cooled_down:
+                desired = number_workers + 1
+            self._idle_since = None
+        elif active_processes < (number_workers - 1) * process_slots * self.SCALE_DOWN_UTILIZATION:
+            if self._idle_since is None:
+                self._idle_since = now
+            elif now - self._idle_since >= self._idle_time:
+                desired = number_workers - 1
+                # Wait for the idle time again before removing the next worker
+                self._idle_since = now
+        else:
+            self._idle_since = None
+
+        desired = max(self._minimum_workers, min(self._maximum_workers, desired))
+
+        if desired > number_workers:
+            self._scaled_up_at = now
+
+        return desired
+
+    def step(self):
+        """
+        Check the state of the daemon and add or remove workers as required.
+
+        :return: the number of workers after the step or None if the state of the daemon could not be determined
+        """
+        from aiida.manage.external.rmq import get_launch_queue_depth
+
+        response = self._client.get_worker_info()
+
+        if response.get('status') != 'ok' or 'info' not in response:
+            LOGGER.warning('could not get the daemon workers from the circus controller: %s', response.get('status'))
+            return None
+
+        pids = set(str(pid) for pid in response['info'])
+        number_workers = len(pids)
+        worker_loads = [
+            statistics['worker']
+            for statistics in self._client.get_worker_stats()
+            if 'worker' in statistics and str(statistics['pid']) in pids
+        ]
+        queue_depth = get_launch_queue_depth(self._client.profile.rmq_prefix)
+
+        desired = self.get_desired_number_of_workers(number_workers, queue_depth, worker_loads)
+
+        if desired > number_workers:
+            LOGGER.info('adding %d daemon workers: %d tasks waiting, %d workers running', desired - number_workers,
+                        queue_depth, number_workers)
+            self._client.increase_workers(desired - number_workers)
+        elif desired < number_workers:
+            LOGGER.info('removing %d daemon workers: %d workers running', number_workers - desired, number_workers)
+            self._client.decrease_workers(number_workers - desired)
+
+        return desired
+
+    def run(self, interval):
+        """
+        Run the autoscaler until it is stopped.
+
+        :param interval: the interval in seconds between two steps
+        """
+        self._stopped.clear()
+
+        while not self._stopped.is_set():
+            try:
+                self.step()
+            except Exception:  # pylint: disable=broad-except
+                LOGGER.exception('the daemon autoscaler failed to check the daemon workers')
+
+            self._stopped.wait(interval)
+
+    def stop(self):
+        """Stop the autoscaler, if it is running."""
+        self._stopped.set()
+
+
+def start_autoscaler():
+    """
+    Start the autoscaler of the daemon workers of the currently configured profile.
+    """
+    from aiida.common.log import configure_logging
+    from aiida.engine.daemon.client import get_daemon_client
+    from aiida.manage.configuration import get_config_option
+
+    client = get_daemon_client()
+    configure_logging(daemon=True, daemon_log_file=client.daemon_log_file)
+
+    autoscaler = DaemonAutoscaler(
+        client,
+        minimum_workers=get_config_option('daemon.autoscale_minimum_workers'),
+        maximum_workers=get_config_option('daemon.autoscale_maximum_workers'),
+        process_slots=get_config_option('daemon.worker_process_slots'),
+        idle_time=get_config_option('daemon.autoscale_idle_time'),
+        maximum_loop_lag=get_config_option('daemon.autoscale_maximum_loop_lag') / 1000.,
+        cooldown=get_config_option('daemon.autoscale_cooldown'))
+
+    def shutdown_autoscaler(_num, _frame):
+        LOGGER.info('Received signal to shut down the daemon autoscaler')
+        autoscaler.stop()
+
+    signal.signal(signal.SIGINT, shutdown_autoscaler)
+    signal.signal(signal.SIGTERM, shutdown_autoscaler)
+
+    LOGGER.info('Starting the daemon autoscaler')
+    autoscaler.run(get_config_option('daemon.autoscale_interval'))
+    LOGGER.info('Daemon autoscaler stopped')
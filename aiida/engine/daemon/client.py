@@ -100,11 +100,33 @@ class DaemonClient(object):  # pylint: disable=too-many-public-methods,useless-o
         """
         Return the command string to start the AiiDA daemon
         """
+        return self._get_verdi_cmd_string('devel run_daemon')
+
+    @property
+    def autoscaler_name(self):
+        """
+        Get the name of the circus watcher of the autoscaler of the daemon workers
+        """
+        return '{}-autoscaler'.format(self.daemon_name)
+
+    @property
+    def autoscaler_cmd_string(self):
+        """
+        Return the command string to start the autoscaler of the daemon workers
+        """
+        return self._get_verdi_cmd_string('devel run_autoscaler')
+
+    def _get_verdi_cmd_string(self, command):
+        """
+        Return the command string to run the given verdi command for the profile of this client
+
+        :param command: the verdi command, e.g. `devel run_daemon`
+        """
         from aiida.common.exceptions import ConfigurationError
         if VERDI_BIN is None:
             raise ConfigurationError("Unable to find 'verdi' in the path. Make sure that you are working "
                                      "in a virtual environment, or that at least the 'verdi' executable is on the PATH")
-        return '{} -p {} devel run_daemon'.format(VERDI_BIN, self.profile.name)
+        return '{} -p {} {}'.format(VERDI_BIN, self.profile.name, command)
 
     @property
     def loglevel(self):
@@ -142,6 +164,55 @@ class DaemonClient(object):  # pylint: disable=too-many-public-methods,useless-o
     def daemon_pid_file(self):
         return self.profile.filepaths['daemon']['pid']
 
+    @property
+    def daemon_stats_directory(self):
+        return self.profile.filepaths['daemon']['stats']
+
+    @property
+    def daemon_profiles_directory(self):
+        return self.profile.filepaths['daemon']['profiles']
+
+    def get_worker_stats_file(self, pid):
+        """
+        Return the path of the file to which the daemon worker with the given pid dumps its input/output statistics.
+
+        :param pid: the pid of the daemon worker
+        :return: the absolute path of the file
+        """
+        return os.path.join(self.daemon_stats_directory, 'worker-{}.json'.format(pid))
+
+    def get_worker_stats(self):
+        """
+        Return the input/output statistics last dumped by the daemon workers that are still alive.
+
+        Files of workers that no longer exist, e.g. because they were killed, are removed.
+
+        :return: a list of dictionaries of statistics, as returned by `IoStatistics.as_dict`
+        """
+        import glob
+        import json
+        import psutil
+
+        statistics = []
+
+        for filepath in glob.glob(self.get_worker_stats_file('*')):
+            try:
+                with io.open(filepath, 'r', encoding='utf8') as handle:
+                    content = json.load(handle)
+            except (IOError, OSError, ValueError):
+                continue
+
+            if not psutil.pid_exists(content['pid']):
+                try:
+                    os.remove(filepath)
+                except OSError:
+                    pass
+                continue
+
+            statistics.append(content)
+
+        return statistics
+
     def get_circus_port(self):
         """
         Retrieve the port for the circus controller, which should be written to the circus port file. If the
@@ -30,6 +30,15 @@ from aiida.plugins import DataFactory
 from aiida.schedulers.datastructures import JobState
 
 REMOTE_WORK_DIRECTORY_LOST_FOUND = 'lost+found'
+JOB_ARRAY_SCRIPT_FILENAME = '_aiidasubmit_array.sh'
+JOB_BUNDLE_SCRIPT_FILENAME = '_aiidasubmit_bundle.sh'
+
+# The fields of the job template that end up in the scheduler directives of the submit script, jobs for which these
+# fields are identical are homogeneous and can be submitted together as a single job array or job bundle
+JOB_ARRAY_TEMPLATE_FIELDS = (
+    'shebang', 'submit_as_hold', 'rerunnable', 'job_environment', 'email', 'email_on_started', 'email_on_terminated',
+    'sched_output_path', 'sched_error_path', 'sched_join_files', 'queue_name', 'account', 'qos', 'job_resource',
+    'priority', 'max_memory_kb', 'max_wallclock_seconds', 'custom_scheduler_commands', 'import_sys_environment')
 
 execlogger = AIIDA_LOGGER.getChild('execmanager')
 
@@ -43,8 +52,7 @@ def upload_calculation(node, transport, calc_info, script_filename):
     :param script_filename: the job launch script returned by `CalcJobNode.presubmit`
     """
     from logging import LoggerAdapter
-    from tempfile import NamedTemporaryFile
-    from aiida.orm import load_node, Code, RemoteData
+    from aiida.orm import load_node, load_nodes, Code, RemoteData
 
     computer = node.computer
 
@@ -52,7 +60,7 @@ def upload_calculation(node, transport, calc_info, script_filename):
         return
 
     codes_info = calc_info.codes_info
-    input_codes = [load_node(_.code_uuid, sub_classes=(Code,)) for _ in codes_info]
+    input_codes = load_nodes([_.code_uuid for _ in codes_info], sub_classes=(Code,))
 
     logger_extra = get_dblogger_extra(node)
     transport.set_logger_extra(logger_extra)
@@ -130,21 +138,22 @@ def upload_calculation(node, transport, calc_info, script_filename):
     workdir = transport.getcwd()
     node.set_remote_workdir(workdir)
 
-    # I first create the code files, so that the code can put
-    # default files to be overwritten by the plugin itself.
-    # Still, beware! The code file itself could be overwritten...
-    # But I checked for this earlier.
+    # All local files are put with a single call to `put_archive`, which for remote transports can stream them in one
+    # go, rather than requiring several round trips for each file. The entries are put in order, so that the code
+    # files come first: the code can put default files that are then overwritten by the plugin itself.
+    # Still, beware! The code file itself could be overwritten... But I checked for this earlier.
+    archive_entries = []
+
     for code in input_codes:
         if code.is_local():
             # Note: this will possibly overwrite files
             for f in code.get_folder_list():
-                transport.put(code.get_abs_path(f), f)
-            transport.chmod(code.get_local_executable(), 0o755)  # rwxr-xr-x
+                archive_entries.append((code.get_abs_path(f), f))
 
     # copy all files, recursively with folders
     for f in folder.get_content_list():
         logger.debug("[submission of calculation {}] copying file/folder {}...".format(node.pk, f))
-        transport.put(folder.get_abs_path(f), f)
+        archive_entries.append((folder.get_abs_path(f), f))
 
     # local_copy_list is a list of tuples,
     # each with (uuid, dest_rel_path)
@@ -162,24 +171,26 @@ def upload_calculation(node, transport, calc_info, script_filename):
             except exceptions.NotExistent:
                 logger.warning('failed to load Node<{}> specified in the `local_copy_list`'.format(uuid))
 
-            # Note, once #2579 is implemented, use the `node.open` method instead of the named temporary file in
-            # combination with the new `Transport.put_object_from_filelike`
-            with NamedTemporaryFile(mode='w+') as handle:
-                handle.write(data_node.get_object_content(filename))
-                handle.flush()
-                transport.put(handle.name, target)
+            # The file is passed by its path in the repository, rather than by its content, such that the transport
+            # streams it and transports that support it, like the local one in the reflink mode, do not copy it at all
+            archive_entries.append((data_node.get_object_path(filename), target))
+
+    transport.put_archive(archive_entries)
+
+    for code in input_codes:
+        if code.is_local():
+            transport.chmod(code.get_local_executable(), 0o755)  # rwxr-xr-x
+
+    # The remote copies and symlinks are collected first, such that if there is more than one they can be performed by
+    # the transport in one go through `copy_and_symlink_many`, instead of requiring a round trip for each of them.
+    remote_operations = []
 
     if remote_copy_list is not None:
         for (remote_computer_uuid, remote_abs_path, dest_rel_path) in remote_copy_list:
             if remote_computer_uuid == computer.uuid:
                 logger.debug("[submission of calculation {}] copying {} remotely, directly on the machine {}".format(
                     node.pk, dest_rel_path, computer.name))
-                try:
-                    transport.copy(remote_abs_path, dest_rel_path)
-                except (IOError, OSError):
-                    logger.warning("[submission of calculation {}] Unable to copy remote resource from {} to {}! "
-                                   "Stopping.".format(node.pk, remote_abs_path, dest_rel_path))
-                    raise
+                remote_operations.append((transport.OPERATION_COPY, remote_abs_path, dest_rel_path))
             else:
                 # TODO: implement copy between two different machines!
                 raise NotImplementedError(
@@ -192,16 +203,30 @@ def upload_calculation(node, transport, calc_info, script_filename):
             if remote_computer_uuid == computer.uuid:
                 logger.debug("[submission of calculation {}] copying {} remotely, directly on the machine {}".format(
                     node.pk, dest_rel_path, computer.name))
-                try:
-                    transport.symlink(remote_abs_path, dest_rel_path)
-                except (IOError, OSError):
-                    logger.warning("[submission of calculation {}] Unable to create remote symlink from {} to {}! "
-                                   "Stopping.".format(node.pk, remote_abs_path, dest_rel_path))
-                    raise
+                remote_operations.append((transport.OPERATION_SYMLINK, remote_abs_path, dest_rel_path))
             else:
                 raise IOError("It is not possible to create a symlink between two different machines for "
                               "calculation {}".format(node.pk))
 
+    if len(remote_operations) > 1:
+        try:
+            transport.copy_and_symlink_many(remote_operations)
+        except (IOError, OSError):
+            logger.warning("[submission of calculation {}] Unable to copy or symlink remote resources! "
+                           "Stopping.".format(node.pk))
+            raise
+    elif remote_operations:
+        operation, remote_abs_path, dest_rel_path = remote_operations[0]
+        try:
+            if operation == transport.OPERATION_COPY:
+                transport.copy(remote_abs_path, dest_rel_path)
+            else:
+                transport.symlink(remote_abs_path, dest_rel_path)
+        except (IOError, OSError):
+            logger.warning("[submission of calculation {}] Unable to {} remote resource from {} to {}! "
+                           "Stopping.".format(node.pk, operation, remote_abs_path, dest_rel_path))
+            raise
+
     remotedata = RemoteData(computer=computer, remote_path=workdir)
     remotedata.add_incoming(node, link_type=LinkType.CREATE, link_label='remote_folder')
     remotedata.store()
@@ -226,6 +251,125 @@ def submit_calculation(calculation, transport, calc_info, script_filename):
     calculation.set_job_id(job_id)
 
 
+def get_job_template(calculation):
+    """
+    Return the dictionary of the job template that was used to write the submit script of a calculation
+
+    :param calculation: the instance of CalcJobNode
+    :return: the job template as a dictionary, as it was serialized in the raw input folder of the calculation
+    """
+    from aiida.common import json
+    return json.loads(calculation.get_object_content(os.path.join('.aiida', 'job_tmpl.json')))
+
+
+def get_job_array_key(calculation):
+    """
+    Return a key that is identical for all calculations that can be submitted together as a single job array or
+    job bundle
+
+    :param calculation: the instance of CalcJobNode
+    :return: a string
+    """
+    from aiida.common import json
+    job_tmpl = get_job_template(calculation)
+    return json.dumps({field: job_tmpl.get(field, None) for field in JOB_ARRAY_TEMPLATE_FIELDS}, sort_keys=True)
+
+
+def submit_job_array(calculations, transport, script_filename):
+    """
+    Submit a list of homogeneous calculations together as a single job array
+
+    The submit script of the job array is written to the working directory of the first calculation, and each task of
+    the job array executes the submit script of one of the calculations in its own working directory.
+
+    :param calculations: a list of CalcJobNode instances to submit, that should all have the same job array key
+    :param transport: an already opened transport to use to submit the calculations.
+    :param script_filename: the job launch script of each calculation, returned by `CalcJobNode._presubmit`
+    :return: the list of job ids of the calculations
+    """
+    scheduler = calculations[0].computer.get_scheduler()
+    scheduler.set_transport(transport)
+
+    job_tmpl = _get_shared_job_template(calculations[0], scheduler)
+    workdirs = [calculation.get_remote_workdir() for calculation in calculations]
+    script_content = scheduler.get_job_array_script(job_tmpl, workdirs, script_filename)
+    _put_script(transport, workdirs[0], script_content, JOB_ARRAY_SCRIPT_FILENAME)
+
+    job_ids = scheduler.submit_job_array_from_script(workdirs[0], JOB_ARRAY_SCRIPT_FILENAME, len(calculations))
+
+    for calculation, job_id in zip(calculations, job_ids):
+        calculation.set_job_id(job_id)
+
+    return job_ids
+
+
+def submit_job_bundle(calculations, transport, script_filename, parallel=False):
+    """
+    Submit a list of homogeneous calculations together as a single job that runs all of them inside one allocation
+
+    The submit script of the bundle is written to the working directory of the first calculation and executes the
+    submit script of each of the calculations in its own working directory. All calculations get the job id of the
+    bundle, such that they are updated, retrieved and parsed individually as usual. Note that this also means that
+    killing one of the calculations kills the whole bundle.
+
+    :param calculations: a list of CalcJobNode instances to submit, that should all have the same job array key
+    :param transport: an already opened transport to use to submit the calculations.
+    :param script_filename: the job launch script of each calculation, returned by `CalcJobNode._presubmit`
+    :param parallel: if True the calculations run at the same time, otherwise one after the other
+    :return: the job id of the bundle
+    """
+    scheduler = calculations[0].computer.get_scheduler()
+    scheduler.set_transport(transport)
+
+    job_tmpl = _get_shared_job_template(calculations[0], scheduler)
+    workdirs = [calculation.get_remote_workdir() for calculation in calculations]
+    script_content = scheduler.get_job_bundle_script(job_tmpl, workdirs, script_filename, parallel=parallel)
+    _put_script(transport, workdirs[0], script_content, JOB_BUNDLE_SCRIPT_FILENAME)
+
+    job_id = scheduler.submit_from_script(workdirs[0], JOB_BUNDLE_SCRIPT_FILENAME)
+
+    for calculation in calculations:
+        calculation.set_job_id(job_id)
+
+    return job_id
+
+
+def _get_shared_job_template(calculation, scheduler):
+    """
+    Rebuild the `JobTemplate` that was used to write the submit script of a calculation
+
+    :param calculation: the instance of CalcJobNode
+    :param scheduler: the scheduler of the computer of the calculation
+    :return: a `JobTemplate` instance
+    """
+    from aiida.schedulers.datastructures import JobTemplate
+
+    template = get_job_template(calculation)
+    resources = {key: value for key, value in template.pop('job_resource').items() if value is not None}
+    job_tmpl = JobTemplate({key: value for key, value in template.items() if key in JobTemplate.get_default_fields()})
+    job_tmpl.job_resource = scheduler.create_job_resource(**resources)
+
+    return job_tmpl
+
+
+def _put_script(transport, directory, content, filename):
+    """
+    Write the content of a script to a file in the given remote directory
+
+    :param transport: an already opened transport
+    :param directory: the absolute path of the remote directory
+    :param content: the content of the script
+    :param filename: the name of the script, relative to the remote directory
+    """
+    from tempfile import NamedTemporaryFile
+
+    transport.chdir(directory)
+    with NamedTemporaryFile(mode='w+') as handle:
+        handle.write(content)
+        handle.flush()
+        transport.put(handle.name, filename)
+
+
 def retrieve_calculation(calculation, transport, retrieved_temporary_folder):
     """
     Retrieve all the files of a completed job calculation using the given transport.
@@ -423,10 +567,15 @@ def retrieve_files_from_list(calculation, transport, folder, retrieve_list):
     treated as the work directory of the folder and the depth integer determines
     upto what level of the original remotepath nesting the files will be copied.
 
+    All the files are retrieved at once through `Transport.get_archive`, which for transports that support it
+    streams them back as a single archive, instead of one round trip per file.
+
     :param transport: the Transport instance
     :param folder: an absolute path to a folder to copy files in
     :param retrieve_list: the list of files to retrieve
     """
+    entries = []
+
     for item in retrieve_list:
         if isinstance(item, list):
             tmp_rname, tmp_lname, depth = item
@@ -439,7 +588,7 @@ def retrieve_files_from_list(calculation, transport, folder, retrieve_list):
                     local_names.append(os.path.sep.join([tmp_lname] + to_append))
             else:
                 remote_names = [tmp_rname]
-                to_append = remote_names.split(os.path.sep)[-depth:] if depth > 0 else []
+                to_append = tmp_rname.split(os.path.sep)[-depth:] if depth > 0 else []
                 local_names = [os.path.sep.join([tmp_lname] + to_append)]
             if depth > 1:  # create directories in the folder, if needed
                 for this_local_file in local_names:
@@ -459,4 +608,6 @@ def retrieve_files_from_list(calculation, transport, folder, retrieve_list):
         for rem, loc in zip(remote_names, local_names):
             transport.logger.debug(
                 "[retrieval of calc {}] Trying to retrieve remote item '{}'".format(calculation.pk, rem))
-            transport.get(rem, os.path.join(folder, loc), ignore_nonexisting=True)
+            entries.append((rem, loc))
+
+    transport.get_archive(entries, folder)
@@ -0,0 +1,405 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida_core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""
+Profiling of the steps that processes run on the event loop of a daemon worker.
+
+All processes of a worker share a single event loop, so a step that takes long blocks all the others. The steps are
+measured per category:
+
+    * `workchain`: a step of the outline of a work chain, named after the class and the position in the outline
+    * `calcjob`: the local work of a transport task of a calculation job, e.g. `upload`, once it got its transport
+    * `checkpoint`: saving the checkpoint of a process, named after the class of the process
+
+For every step the time spent in database queries is measured as well. Steps that take longer than the threshold are
+logged as slow and kept in a list of the most recent slow steps. The profile of a worker, including the steps that
+are running at the moment, can be requested through the communicator with `verdi daemon profile`, which is answered
+by the thread of the communicator, such that it also works when a step blocks the event loop.
+
+To find out where the time of the steps goes, the `CodeProfiler` of a worker can be started through the communicator
+for a window of time, without restarting the worker or interrupting its processes. It either runs the deterministic
+`cProfile` profiler on the event loop, which writes a `pstats` file, or samples the stack of the event loop from a
+separate thread, which writes the sampled stacks in the folded format of flame graph tools and has a lower overhead.
+"""
+from __future__ import division
+from __future__ import print_function
+from __future__ import absolute_import
+
+import collections
+import contextlib
+import errno
+import io
+import logging
+import os
+import sys
+import tempfile
+import threading
+import time
+
+import six
+
+__all__ = ('CodeProfiler', 'StepProfile', 'get_step_profile')
+
+LOGGER = logging.getLogger(__name__)
+
+CATEGORY_CALCJOB = 'calcjob'
+CATEGORY_CHECKPOINT = 'checkpoint'
+CATEGORY_WORKCHAIN = 'workchain'
+
+WORKER_RPC_IDENTIFIER = 'daemon.worker.{pid}'
+WORKER_REQUEST_STEP_PROFILE = 'step_profile'
+WORKER_REQUEST_CODE_PROFILE = 'code_profile'
+
+STEP_PROFILE = None
+
+
+def get_step_profile():
+    """
+    Return the profile of the steps of the processes run by this interpreter, creating it if necessary.
+
+    :rtype: :class:`aiida.engine.daemon.profiling.StepProfile`
+    """
+    global STEP_PROFILE  # pylint: disable=global-statement
+
+    if STEP_PROFILE is None:
+        STEP_PROFILE = StepProfile()
+
+    return STEP_PROFILE
+
+
+def get_worker_rpc_identifier(pid):
+    """
+    Return the identifier of the RPC subscriber through which the daemon worker with the given pid can be queried.
+
+    :param pid: the pid of the daemon worker
+    """
+    return WORKER_RPC_IDENTIFIER.format(pid=pid)
+
+
+def send_worker_request(communicator, pid, request, **kwargs):
+    """
+    Send a request to the daemon worker with the given pid through the communicator.
+
+    :param communicator: the communicator
+    :param pid: the pid of the daemon worker
+    :param request: the name of the request, e.g. `step_profile`
+    :param kwargs: the arguments of the request
+    :return: a future that resolves to the response of the worker
+    :rtype: :class:`kiwipy.Future`
+    """
+    import plumpy
+
+    message = dict(kwargs, request=request)
+    return plumpy.unwrap_kiwi_future(communicator.rpc_send(get_worker_rpc_identifier(pid), message))
+
+
+def handle_worker_request(_communicator, message, code_profiler=None):
+    """
+    Answer a request sent to a daemon worker through the communicator.
+
+    :param message: dictionary with the name of the `request` and its arguments
+    :param code_profiler: the code profiler of the worker, required for requests to profile the code
+    :type code_profiler: :class:`aiida.engine.daemon.profiling.CodeProfiler`
+    :return: the response to the request
+    :raises ValueError: if the request is not known
+    """
+    request = message.get('request') if isinstance(message, dict) else None
+
+    if request == WORKER_REQUEST_STEP_PROFILE:
+        return get_step_profile().as_dict()
+
+    if request == WORKER_REQUEST_CODE_PROFILE and code_profiler is not None:
+        return code_profiler.start(duration=message.get('duration', 60), sampling=message.get('sampling', False))
+
+    raise ValueError('unknown request for the daemon worker: {}'.format(request))
+
+
+def get_folded_stack(frame):
+    """
+    Return the stack of the given frame in the folded format of flame graph tools.
+
+    The frames are separated by semicolons, starting from the outermost frame, and identified by the name, the file and
+    the first line of their function, such that all samples in the same function are merged.
+
+    :param frame: the innermost frame of the stack
+    :return: the folded stack
+    """
+    functions = []
+
+    while frame is not None:
+        code = frame.f_code
+        functions.append('{} ({}:{})'.format(code.co_name, code.co_filename, code.co_firstlineno).replace(';', ','))
+        frame = frame.f_back
+
+    return ';'.join(reversed(functions))
+
+
+class CodeProfiler(object):
+    """
+    Profile the code run by the event loop of a daemon worker for a window of time.
+    """
+
+    # pylint: disable=useless-object-inheritance
+
+    SAMPLING_INTERVAL = 0.005
+
+    def __init__(self, loop, directory):
+        """
+        :param loop: the event loop of the runner of the worker
+        :type loop: :class:`tornado.ioloop.IOLoop`
+        :param directory: the directory in which the profiles are written
+        """
+        super(CodeProfiler, self).__init__()
+        self._loop = loop
+        self._directory = directory
+        self._lock = threading.Lock()
+        self._filepath = None
+
+    @property
+    def is_profiling(self):
+        """Return whether the worker is being profiled."""
+        return self._filepath is not None
+
+    def start(self, duration, sampling=False):
+        """
+        Start profiling the event loop for the given duration, after which the profile is written to a file.
+
+        The method can be called from any thread, the profiling itself starts on the event loop. The file is written in
+        the directory of the profiler and named after the pid of the worker and the time at which the profiling starts.
+
+        :param duration: the duration in seconds of the profiling window
+        :param sampling: sample the stack of the event loop instead of running the deterministic profiler
+        :return: dictionary with the `pid` of the worker, the `filepath` of the profile and the `duration`
+        :raises RuntimeError: if the worker is already being profiled
+        :raises ValueError: if the duration is not positive
+        """
+        if duration <= 0:
+            raise ValueError('the duration of the profiling window should be positive, got: {}'.format(duration))
+
+        filename = 'worker-{}-{}.{}'.format(os.getpid(), time.strftime('%Y%m%d-%H%M%S'),
+                                            'folded' if sampling else 'pstats')
+        filepath = os.path.join(self._directory, filename)
+
+        with self._lock:
+            if self._filepath is not None:
+                raise RuntimeError('the worker is already being profiled, to {}'.format(self._filepath))
+            self._filepath = filepath
+
+        if sampling:
+            self._loop.add_callback(self._start_sampling, duration, filepath)
+        else:
+            self._loop.add_callback(self._start_deterministic, duration, filepath)
+
+        LOGGER.info('profiling the daemon worker for %s s, the profile will be written to %s', duration, filepath)
+
+        return {'pid': os.getpid(), 'filepath': filepath, 'duration': duration}
+
+    def _start_deterministic(self, duration, filepath):
+        """Enable `cProfile` on the thread of the event loop and disable it again at the end of the window."""
+        import cProfile
+
+        profiler = cProfile.Profile()
+        profiler.enable()
+
+        def stop():
+            profiler.disable()
+            self._write(filepath, profiler.dump_stats)
+
+        self._loop.call_later(duration, stop)
+
+    def _start_sampling(self, duration, filepath):
+        """Start a thread that samples the stack of the thread of the event loop for the duration of the window."""
+        thread = threading.Thread(
+            target=self._sample, args=(threading.current_thread().ident, duration, filepath), name='code-profiler')
+        thread.daemon = True
+        thread.start()
+
+    def _sample(self, thread_id, duration, filepath):
+        """Sample the stack of the thread with the given identifier until the end of the window and write them."""
+        stacks = collections.Counter()
+        deadline = time.time() + duration
+
+        while time.time() < deadline:
+            frame = sys._current_frames().get(thread_id)  # pylint: disable=protected-access
+            if frame is not None:
+                stacks[get_folded_stack(frame)] += 1
+            del frame
+            time.sleep(self.SAMPLING_INTERVAL)
+
+        def dump(path):
+            with io.open(path, 'w', encoding='utf8') as handle:
+                for stack, count in stacks.most_common():
+                    handle.write(six.text_type('{} {}\n'.format(stack, count)))
+
+        self._write(filepath, dump)
+
+    def _write(self, filepath, dump):
+        """
+        Write the profile with the given function and allow the worker to be profiled again.
+
+        The profile is first written to a temporary file in the same folder that then replaces the file, such that
+        readers never see a partially written profile.
+
+        :param filepath: the absolute path of the file
+        :param dump: callable that writes the profile to the path it is passed
+        """
+        try:
+            try:
+                os.makedirs(os.path.dirname(filepath))
+            except OSError as exception:
+                if exception.errno != errno.EEXIST:
+                    raise
+            handle, temporary = tempfile.mkstemp(dir=os.path.dirname(filepath), prefix='.', suffix='.tmp')
+            os.close(handle)
+            try:
+                dump(temporary)
+                os.rename(temporary, filepath)
+            except Exception:
+                os.remove(temporary)
+                raise
+        except (IOError, OSError) as exception:
+            LOGGER.warning('failed to write the profile of the daemon worker to %s: %s', filepath, exception)
+        else:
+            LOGGER.info('the profile of the daemon worker was written to %s', filepath)
+        finally:
+            with self._lock:
+                self._filepath = None
+
+
+class StepProfile(object):
+    """
+    Aggregate the number, the duration and the database time of the steps of processes.
+    """
+
+    # pylint: disable=useless-object-inheritance
+
+    def __init__(self, slow_step_threshold=0., maximum_slow_steps=50):
+        """
+        :param slow_step_threshold: the duration in seconds above which a step is logged as slow, zero disables it
+        :param maximum_slow_steps: the number of most recent slow steps that are kept
+        """
+        super(StepProfile, self).__init__()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._steps = {}
+        self._running = {}
+        self._slow_steps = collections.deque(maxlen=maximum_slow_steps)
+        self.slow_step_threshold = slow_step_threshold
+
+    def clear(self):
+        """Reset the statistics of the steps, the steps that are running are kept."""
+        with self._lock:
+            self._steps = {}
+            self._slow_steps.clear()
+
+    def record_query(self, duration):
+        """
+        Record the duration of a database query executed by the current thread.
+
+        :param duration: the duration of the query in seconds
+        """
+        self._local.db_time = getattr(self._local, 'db_time', 0.) + duration
+
+    def get_db_time(self):
+        """Return the total time in seconds spent in database queries by the current thread."""
+        return getattr(self._local, 'db_time', 0.)
+
+    @contextlib.contextmanager
+    def measure(self, category, step, pk=None):
+        """
+        Context manager that records the step performed in its body, even if it raises.
+
+        :param category: the category of the step, e.g. `workchain`
+        :param step: the name of the step
+        :param pk: the pk of the process that runs the step
+        """
+        start = time.time()
+        db_start = self.get_db_time()
+        token = object()
+
+        with self._lock:
+            self._running[token] = (category, step, pk, start)
+
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._running.pop(token, None)
+            self.record(category, step, time.time() - start, self.get_db_time() - db_start, pk)
+
+    def record(self, category, step, duration, db_time=0., pk=None):
+        """
+        Record a single step and log it if it is slow.
+
+        :param category: the category of the step, e.g. `workchain`
+        :param step: the name of the step
+        :param duration: the duration of the step in seconds
+        :param db_time: the time in seconds spent in database queries during the step
+        :param pk: the pk of the process that ran the step
+        """
+        with self._lock:
+            steps = self._steps.setdefault(category, {})
+            try:
+                entry = steps[step]
+            except KeyError:
+                entry = {'count': 0, 'total_time': 0., 'max_time': 0., 'db_time': 0.}
+                steps[step] = entry
+
+            entry['count'] += 1
+            entry['total_time'] += duration
+            entry['max_time'] = max(entry['max_time'], duration)
+            entry['db_time'] += db_time
+
+            slow = self.slow_step_threshold > 0 and duration >= self.slow_step_threshold
+
+            if slow:
+                self._slow_steps.append({
+                    'category': category,
+                    'step': step,
+                    'pk': pk,
+                    'duration': duration,
+                    'db_time': db_time,
+                    'timestamp': time.time(),
+                })
+
+        if slow:
+            LOGGER.warning('slow %s step %s of process<%s> blocked the event loop for %.3f s, of which %.3f s in the '
+                           'database', category, step, pk, duration, db_time)
+
+    def as_dict(self):
+        """
+        Return the profile as a dictionary that can be serialized.
+
+        :return: dictionary with the pid of the process, the time at which the profile was taken, the aggregated
+            `steps` per category and step name, the most recent `slow_steps`, the steps that are `running` with the
+            time they have been running for and the `loop` lag of the worker
+        """
+        import copy
+        from aiida.engine.daemon.autoscaler import get_worker_load
+
+        now = time.time()
+
+        with self._lock:
+            steps = copy.deepcopy(self._steps)
+            slow_steps = list(self._slow_steps)
+            running = [{
+                'category': category,
+                'step': step,
+                'pk': pk,
+                'elapsed': now - start
+            } for category, step, pk, start in self._running.values()]
+
+        return {
+            'pid': os.getpid(),
+            'timestamp': now,
+            'steps': steps,
+            'slow_steps': slow_steps,
+            'running': sorted(running, key=lambda entry: entry['elapsed'], reverse=True),
+            'loop': get_worker_load().as_dict(reset=False),
+        }
@@ -12,12 +12,20 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import absolute_import
 
+import errno
+import functools
 import logging
+import os
 import signal
 
 from aiida.common.log import configure_logging
+from aiida.engine.daemon.autoscaler import get_worker_load
 from aiida.engine.daemon.client import get_daemon_client
+from aiida.engine.daemon.profiling import CodeProfiler, get_step_profile, get_worker_rpc_identifier
+from aiida.engine.daemon.profiling import handle_worker_request
+from aiida.manage.configuration import get_config, get_config_option
 from aiida.manage.manager import get_manager
+from aiida.transports.instrumentation import get_io_statistics
 
 LOGGER = logging.getLogger(__name__)
 
@@ -42,6 +50,20 @@ def start_daemon():
     signal.signal(signal.SIGINT, shutdown_daemon)
     signal.signal(signal.SIGTERM, shutdown_daemon)
 
+    stats_interval = get_config().option_get('daemon.stats_interval')
+    stats_file = daemon_client.get_worker_stats_file(os.getpid())
+
+    if get_config_option('daemon.autoscale_maximum_workers') > 0:
+        # The autoscaler relies on the load of the workers that is dumped along with the statistics
+        autoscale_interval = get_config_option('daemon.autoscale_interval')
+        stats_interval = min(stats_interval, autoscale_interval) if stats_interval > 0 else autoscale_interval
+
+    get_worker_load().monitor_loop_lag(runner.loop)
+    start_step_profiling(runner, daemon_client.daemon_profiles_directory)
+
+    if stats_interval > 0:
+        schedule_stats_dump(runner.loop, stats_file, stats_interval)
+
     LOGGER.info('Starting a daemon runner')
 
     try:
@@ -49,5 +71,67 @@ def start_daemon():
     except SystemError as exception:
         LOGGER.info('Received a SystemError: %s', exception)
         runner.close()
+    finally:
+        if stats_interval > 0:
+            remove_stats_dump(stats_file)
+
+        # Make sure that the log records buffered by the database log handler are written before exiting
+        for handler in logging.getLogger('aiida').handlers:
+            handler.flush()
 
     LOGGER.info('Daemon runner stopped')
+
+
+def start_step_profiling(runner, profiles_directory):
+    """
+    Profile the steps of the processes of this worker and answer requests for profiles through the communicator.
+
+    :param runner: the daemon runner
+    :param profiles_directory: the directory in which the profiles of the code of the worker are written
+    """
+    profile = get_step_profile()
+    profile.slow_step_threshold = get_config_option('daemon.slow_step_threshold') / 1000.
+
+    get_manager().get_backend().add_query_listener(profile.record_query)
+
+    handler = functools.partial(handle_worker_request, code_profiler=CodeProfiler(runner.loop, profiles_directory))
+    runner.communicator.add_rpc_subscriber(handler, identifier=get_worker_rpc_identifier(os.getpid()))
+
+
+def schedule_stats_dump(loop, filepath, interval):
+    """
+    Periodically dump the input/output statistics and the load of this worker as JSON to the given file.
+
+    :param loop: the event loop of the runner
+    :param filepath: the absolute path of the file
+    :param interval: the interval in seconds between dumps
+    """
+    dirpath = os.path.dirname(filepath)
+
+    def dump():
+        """Dump the statistics and schedule the next dump."""
+        try:
+            try:
+                os.makedirs(dirpath)
+            except OSError as exception:
+                # The directory may be created concurrently by another worker
+                if exception.errno != errno.EEXIST:
+                    raise
+            get_io_statistics().dump(filepath, extra={'worker': get_worker_load().as_dict()})
+        except (IOError, OSError) as exception:
+            LOGGER.warning('failed to dump the daemon worker statistics to %s: %s', filepath, exception)
+        loop.call_later(interval, dump)
+
+    loop.call_later(interval, dump)
+
+
+def remove_stats_dump(filepath):
+    """
+    Remove the file with the statistics dumped by this worker, if it exists.
+
+    :param filepath: the absolute path of the file
+    """
+    try:
+        os.remove(filepath)
+    except OSError:
+        pass
@@ -17,6 +17,7 @@ import traceback
 
 import plumpy
 
+from aiida.engine.daemon.profiling import CATEGORY_CHECKPOINT, get_step_profile
 from aiida.orm.utils import serialize
 
 __all__ = ('AiiDAPersister', 'ObjectLoader', 'get_object_loader')
@@ -59,18 +60,19 @@ class AiiDAPersister(plumpy.Persister):
         if tag is not None:
             raise NotImplementedError('Checkpoint tags not supported yet')
 
-        try:
-            bundle = plumpy.Bundle(process, plumpy.LoadSaveContext(loader=get_object_loader()))
-        except ValueError:
-            # Couldn't create the bundle
-            raise plumpy.PersistenceError("Failed to create a bundle for '{}': {}".format(
-                process, traceback.format_exc()))
-
-        try:
-            process.node.set_checkpoint(serialize.serialize(bundle))
-        except Exception:
-            raise plumpy.PersistenceError("Failed to store a checkpoint for '{}': {}".format(
-                process, traceback.format_exc()))
+        with get_step_profile().measure(CATEGORY_CHECKPOINT, process.__class__.__name__, process.pid):
+            try:
+                bundle = plumpy.Bundle(process, plumpy.LoadSaveContext(loader=get_object_loader()))
+            except ValueError:
+                # Couldn't create the bundle
+                raise plumpy.PersistenceError("Failed to create a bundle for '{}': {}".format(
+                    process, traceback.format_exc()))
+
+            try:
+                process.node.set_checkpoint(serialize.serialize(bundle))
+            except Exception:
+                raise plumpy.PersistenceError("Failed to store a checkpoint for '{}': {}".format(
+                    process, traceback.format_exc()))
 
         return bundle
 
@@ -123,7 +123,8 @@ class CalcJob(Process):
     @override
     def run(self):
         """Run the calculation, we put it in the TOSUBMIT state and then wait for it to be completed."""
-        from aiida.orm import Code, load_node
+        from aiida.orm import Code, load_nodes
+        from aiida.orm.utils.identity_map import identity_map
         from aiida.common.folders import SandboxFolder
         from aiida.common.exceptions import InputValidationError
 
@@ -134,12 +135,13 @@ class CalcJob(Process):
         if self.node.exit_status is not None:
             return self.node.exit_status
 
-        with SandboxFolder() as folder:
+        # The codes are loaded by the presubmit and again below, the identity map ensures they are only queried once
+        with SandboxFolder() as folder, identity_map():
             computer = self.node.computer
             if self.node.has_cached_links():
                 raise exceptions.InvalidOperation('calculation node has unstored links in cache')
             calc_info, script_filename = self.presubmit(folder)
-            input_codes = [load_node(_.code_uuid, sub_classes=(Code,)) for _ in calc_info.codes_info]
+            input_codes = load_nodes([_.code_uuid for _ in calc_info.codes_info], sub_classes=(Code,))
 
             for code in input_codes:
                 if not code.can_run_on(computer):
@@ -15,6 +15,7 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import absolute_import
 
+import collections
 import contextlib
 from functools import partial
 import time
@@ -26,15 +27,27 @@ from aiida import schedulers
 from aiida.common import exceptions
 from ...utils import RefObjectStore
 
-__all__ = ('JobsList', 'JobManager')
+__all__ = ('JobsList', 'JobSubmissionBuffer', 'ComputerThrottle', 'JobManager')
 
 
 class JobsList(object):  # pylint: disable=useless-object-inheritance
     """
     A list of submitted jobs on a machine connected to by transport based on the
     authorisation information.
+
+    The list is shared by all the authinfos that connect to the same computer as the same remote user, see
+    :meth:`JobManager.get_job_list_key`, such that the update requests of all their jobs are answered by a single
+    scheduler query per interval. The scheduler is queried through the transport of the authinfo the list was
+    created with.
+
+    The interval between updates adapts to the jobs: it starts at the minimum job poll interval of the computer and
+    is multiplied by `POLL_INTERVAL_BACKOFF` after every update in which none of the jobs changed state, up to the
+    maximum job poll interval of the computer. It drops back to the minimum as soon as a job changes state or a new
+    job is added, and never exceeds the time left before the first running job reaches its requested wallclock time.
     """
 
+    POLL_INTERVAL_BACKOFF = 2.
+
     def __init__(self, authinfo, transport_queue):
         """
         :param authinfo: The authinfo used to check the jobs list
@@ -43,13 +56,17 @@ class JobsList(object):  # pylint: disable=useless-object-inheritance
         :type: :class:`aiida.engine.transports.TransportQueue`
         """
         self._authinfo = authinfo
+        self._computer = authinfo.computer
         self._transport_queue = transport_queue
         self._loop = transport_queue.loop()
+        self._scheduler = None
 
         self._jobs_cache = {}
         self._last_updated = None  # type: float
         self._job_update_requests = {}  # Mapping: {job_id: Future}
         self._update_handle = None
+        self._update_deadline = None  # The loop time of the scheduled update, None if the update is in progress
+        self._poll_interval = None  # The current adaptive interval, None meaning the minimum interval
 
     def get_minimum_update_interval(self):
         """
@@ -57,7 +74,33 @@ class JobsList(object):  # pylint: disable=useless-object-inheritance
         :return: The minimum interval
         :rtype: float
         """
-        return self._authinfo.computer.get_minimum_job_poll_interval()
+        return self._computer.get_minimum_job_poll_interval()
+
+    def get_poll_interval(self):
+        """
+        Get the current interval between updates of the list, that adapts to the state of the jobs.
+
+        :return: The interval in seconds, between the minimum and maximum job poll interval of the computer
+        :rtype: float
+        """
+        minimum_interval, maximum_interval = self._get_poll_interval_bounds()
+
+        if self._poll_interval is None:
+            interval = minimum_interval
+        else:
+            interval = min(max(self._poll_interval, minimum_interval), maximum_interval)
+
+        # Do not wait beyond the moment the first running job is expected to reach its wallclock time limit
+        for job_id in self._job_update_requests:
+            job_info = self._jobs_cache.get(job_id, None)
+            if job_info is None or job_info.job_state != schedulers.JobState.RUNNING:
+                continue
+            requested = job_info.requested_wallclock_time_seconds
+            elapsed = job_info.wallclock_time_seconds
+            if requested is not None and elapsed is not None:
+                interval = min(interval, max(requested - elapsed, minimum_interval))
+
+        return interval
 
     def get_last_updated(self):
         """
@@ -68,6 +111,16 @@ class JobsList(object):  # pylint: disable=useless-object-inheritance
         """
         return self._last_updated
 
+    def _get_scheduler(self):
+        """
+        Return the scheduler of the computer, which is created once and reused for all the updates of the list.
+
+        :rtype: :class:`aiida.schedulers.Scheduler`
+        """
+        if self._scheduler is None:
+            self._scheduler = self._computer.get_scheduler()
+        return self._scheduler
+
     @gen.coroutine
     def _get_jobs_from_scheduler(self):
         """
@@ -79,28 +132,37 @@ class JobsList(object):  # pylint: disable=useless-object-inheritance
         with self._transport_queue.request_transport(self._authinfo) as request:
             transport = yield request
 
-            scheduler = self._authinfo.computer.get_scheduler()
+            scheduler = self._get_scheduler()
             scheduler.set_transport(transport)
 
             kwargs = {'as_dict': True}
             if scheduler.get_feature('can_query_by_user'):
+                # The output contains all the jobs of the user, only parse those that are being waited for
                 kwargs['user'] = "$USER"
+                kwargs['only_jobs'] = self._get_jobs_with_scheduler()
             else:
                 kwargs['jobs'] = self._get_jobs_with_scheduler()
 
             scheduler_response = scheduler.get_jobs(**kwargs)
             jobs_cache = {}
 
+            # Get the detailed job information of all the jobs that are done in a single batch
+            done_job_ids = [
+                job_id for job_id, job_info in iteritems(scheduler_response)
+                if job_info.job_state == schedulers.JobState.DONE
+            ]
+
+            detailed_job_infos = {}
+            if done_job_ids:
+                try:
+                    detailed_job_infos = scheduler.get_detailed_jobinfo_many(done_job_ids)
+                except exceptions.FeatureNotAvailable:
+                    detailed_job_infos = {
+                        job_id: 'This scheduler does not implement get_detailed_jobinfo' for job_id in done_job_ids
+                    }
+
             for job_id, job_info in iteritems(scheduler_response):
-                # If the job is done then get detailed job information
-                detailed_job_info = None
-                if job_info.job_state == schedulers.JobState.DONE:
-                    try:
-                        detailed_job_info = scheduler.get_detailed_jobinfo(job_id)
-                    except exceptions.FeatureNotAvailable:
-                        detailed_job_info = 'This scheduler does not implement get_detailed_jobinfo'
-
-                job_info.detailedJobinfo = detailed_job_info
+                job_info.detailedJobinfo = detailed_job_infos.get(job_id, None)
                 jobs_cache[job_id] = job_info
 
             raise gen.Return(jobs_cache)
@@ -119,7 +181,10 @@ class JobsList(object):  # pylint: disable=useless-object-inheritance
                 return
 
             # Update our cache of the job states
-            self._jobs_cache = yield self._get_jobs_from_scheduler()
+            jobs_cache = yield self._get_jobs_from_scheduler()
+            self._update_poll_interval(self._jobs_cache, jobs_cache)
+            self._jobs_cache = jobs_cache
+            self._last_updated = time.time()
         except Exception as exception:
             # Set the exception on all the update futures
             for future in itervalues(self._job_update_requests):
@@ -143,6 +208,10 @@ class JobsList(object):  # pylint: disable=useless-object-inheritance
         :return: A future that will resolve to a JobInfo object when the job changes state
         """
         # Get or create the future
+        if job_id not in self._jobs_cache and job_id not in self._job_update_requests:
+            # A job that was not seen in the last update, e.g. one that was just submitted, so poll it quickly
+            self._poll_interval = None
+
         request = self._job_update_requests.setdefault(job_id, concurrent.Future())
         assert not request.done(), "The future should be no be in the done state"
 
@@ -158,19 +227,31 @@ class JobsList(object):  # pylint: disable=useless-object-inheritance
         This will automatically stop if there are no outstanding requests.
         """
 
+        def schedule_update():
+            """ Schedule the next update """
+            delay = self._get_next_update_delay()
+            self._update_deadline = self._loop.time() + delay
+            self._update_handle = self._loop.call_later(delay, updating)
+
         @gen.coroutine
         def updating():
             """ Do the actual update, stop if not requests left """
+            self._update_deadline = None
             yield self._update_job_info()
             # Any outstanding requests?
             if self._update_requests_outstanding():
-                self._update_handle = self._loop.call_later(self._get_next_update_delay(), updating)
+                schedule_update()
             else:
                 self._update_handle = None
 
         # Check if we're already updating
         if self._update_handle is None:
-            self._update_handle = self._loop.call_later(self._get_next_update_delay(), updating)
+            schedule_update()
+        elif self._update_deadline is not None and self._loop.time() + self._get_next_update_delay() < \
+                self._update_deadline:
+            # The interval has shrunk since the update was scheduled, so bring it forward
+            self._loop.remove_timeout(self._update_handle)
+            schedule_update()
 
     @staticmethod
     def _has_job_state_changed(old, new):
@@ -188,11 +269,40 @@ class JobsList(object):  # pylint: disable=useless-object-inheritance
 
         return old.job_state != new.job_state or old.job_substate != new.job_substate
 
+    def _update_poll_interval(self, old_jobs_cache, new_jobs_cache):
+        """
+        Adapt the poll interval after an update: reset it to the minimum if any of the requested jobs changed state,
+        otherwise back off.
+
+        :param old_jobs_cache: the job infos of the previous update
+        :param new_jobs_cache: the job infos of this update
+        """
+        changed = any(
+            self._has_job_state_changed(old_jobs_cache.get(job_id, None), new_jobs_cache.get(job_id, None))
+            for job_id in self._job_update_requests)
+
+        if changed:
+            self._poll_interval = None
+        else:
+            minimum_interval, maximum_interval = self._get_poll_interval_bounds()
+            interval = minimum_interval if self._poll_interval is None else max(self._poll_interval, minimum_interval)
+            self._poll_interval = min(interval * self.POLL_INTERVAL_BACKOFF, maximum_interval)
+
+    def _get_poll_interval_bounds(self):
+        """
+        Return the minimum and maximum poll interval of the computer, where the maximum is at least the minimum.
+
+        :return: tuple of the minimum and maximum interval in seconds
+        """
+        minimum_interval = self._computer.get_minimum_job_poll_interval()
+        maximum_interval = max(self._computer.get_maximum_job_poll_interval(), minimum_interval)
+        return minimum_interval, maximum_interval
+
     def _get_next_update_delay(self):
         """
         Calculate when we are next allowed to call the scheduler get jobs command
-        based on when we last called it, how long has elapsed and the minimum given
-        update interval.
+        based on when we last called it, how long has elapsed and the current
+        adaptive update interval.
 
         :return: The delay (in seconds) for when it's safe to call the get jobs command
         :rtype: float
@@ -201,12 +311,12 @@ class JobsList(object):  # pylint: disable=useless-object-inheritance
             # Never updated, so do it straight away
             return 0.
 
-        # Make sure to actually 'get' it here, so that if the user changed it
-        # between times we use the current value
-        minimum_interval = self._authinfo.computer.get_minimum_job_poll_interval()
+        # Make sure to actually 'get' it here, so that if the user changed the
+        # bounds between times we use the current values
+        interval = self.get_poll_interval()
         elapsed = time.time() - self._last_updated
 
-        return max(minimum_interval - elapsed, 0.)
+        return max(interval - elapsed, 0.)
 
     def _update_requests_outstanding(self):
         return any(not request.done() for request in itervalues(self._job_update_requests))
@@ -221,6 +331,321 @@ class JobsList(object):  # pylint: disable=useless-object-inheritance
         return [str(job_id) for job_id, _ in self._job_update_requests.items()]
 
 
+class JobSubmissionBuffer(object):  # pylint: disable=useless-object-inheritance
+    """
+    A buffer of submission requests of jobs on a machine connected to by transport based on the authorisation
+    information. Requests of homogeneous jobs that arrive within a time window are submitted together, either as a
+    job bundle that runs all of them inside one allocation, or as a job array.
+    """
+
+    def __init__(self, authinfo, transport_queue):
+        """
+        :param authinfo: The authinfo used to submit the jobs
+        :type authinfo: :class:`aiida.orm.AuthInfo`
+        :param transport_queue: A transport queue
+        :type: :class:`aiida.engine.transports.TransportQueue`
+        """
+        self._authinfo = authinfo
+        self._transport_queue = transport_queue
+        self._loop = transport_queue.loop()
+
+        self._submission_requests = {}  # Mapping: {(job array key, script_filename): [(node, Future)]}
+        self._submit_handles = {}  # Mapping: {(job array key, script_filename): handle}
+
+    def _use_job_bundles(self):
+        """Return whether the jobs are submitted as job bundles rather than as job arrays."""
+        return self._authinfo.computer.get_job_bundle_window() > 0
+
+    def _get_window(self):
+        """Return the interval during which submission requests are collected."""
+        computer = self._authinfo.computer
+        if self._use_job_bundles():
+            return computer.get_job_bundle_window()
+        return computer.get_job_array_window()
+
+    def _get_maximum_size(self):
+        """Return the maximum number of jobs that are submitted together."""
+        computer = self._authinfo.computer
+        if self._use_job_bundles():
+            return computer.get_job_bundle_size()
+        return computer.get_job_array_maximum_size()
+
+    @contextlib.contextmanager
+    def request_job_submission(self, node, script_filename):
+        """
+        Request the submission of a job, which will be submitted together with the other homogeneous jobs
+        once the window has passed, or the maximum number of jobs that are submitted together has been reached.
+
+        :param node: the node that represents the job calculation, whose files should already have been uploaded
+        :param script_filename: the job launch script returned by `CalcJobNode._presubmit`
+        :return: A future that will resolve to the job id of the job
+        """
+        from aiida.engine.daemon import execmanager
+
+        key = (execmanager.get_job_array_key(node), script_filename)
+        request = concurrent.Future()
+        requests = self._submission_requests.setdefault(key, [])
+        requests.append((node, request))
+
+        if len(requests) >= self._get_maximum_size():
+            self._cancel_submission(key)
+            self._loop.add_callback(self._submit_jobs, key)
+        elif key not in self._submit_handles:
+            self._submit_handles[key] = self._loop.call_later(self._get_window(), self._submit_jobs, key)
+
+        try:
+            yield request
+        finally:
+            if not request.done():
+                # The request was abandoned before it was submitted, so remove it from the buffer
+                remaining = [entry for entry in self._submission_requests.get(key, []) if entry[1] is not request]
+                if remaining:
+                    self._submission_requests[key] = remaining
+                else:
+                    self._submission_requests.pop(key, None)
+                    self._cancel_submission(key)
+
+    def _cancel_submission(self, key):
+        """Cancel the scheduled submission of the jobs with the given key, if any."""
+        handle = self._submit_handles.pop(key, None)
+        if handle is not None:
+            self._loop.remove_timeout(handle)
+
+    @gen.coroutine
+    def _submit_jobs(self, key):
+        """
+        Submit all the outstanding requests for the given key, as a single job bundle or job array if there are
+        more than one.
+
+        This will set the futures of all the requests either to the job id of the corresponding job, or to the
+        exception that was raised during the submission.
+        """
+        from aiida.engine.daemon import execmanager
+
+        self._submit_handles.pop(key, None)
+        requests = [(node, request) for node, request in self._submission_requests.pop(key, []) if not request.done()]
+
+        if not requests:
+            return
+
+        _, script_filename = key
+        nodes = [node for node, _ in requests]
+
+        try:
+            with self._transport_queue.request_transport(self._authinfo) as transport_request:
+                transport = yield transport_request
+
+                if len(nodes) == 1:
+                    execmanager.submit_calculation(nodes[0], transport, None, script_filename)
+                    job_ids = [nodes[0].get_job_id()]
+                elif self._use_job_bundles():
+                    parallel = self._authinfo.computer.get_job_bundle_parallel()
+                    job_id = execmanager.submit_job_bundle(nodes, transport, script_filename, parallel=parallel)
+                    job_ids = [job_id] * len(nodes)
+                else:
+                    job_ids = execmanager.submit_job_array(nodes, transport, script_filename)
+        except Exception as exception:  # pylint: disable=broad-except
+            for _, request in requests:
+                if not request.done():
+                    request.set_exception(exception)
+        else:
+            for (_, request), job_id in zip(requests, job_ids):
+                if not request.done():
+                    request.set_result(job_id)
+
+
+class ComputerThrottle(object):  # pylint: disable=useless-object-inheritance
+    """
+    The limits of the engine on the jobs of a computer for a given user, based on the authorisation information:
+    the number of jobs that are queued with the scheduler, the number of concurrent uploads and retrievals and the
+    rate at which jobs are submitted, the latter enforced through a token bucket.
+
+    Calculation jobs that have to wait for one of the limits are parked on a future, such that they neither keep
+    requesting a transport nor go through the retry mechanism of the transport tasks in the meantime.
+    """
+
+    SUBMISSION = 'submission'
+    TRANSFER = 'transfer'
+
+    def __init__(self, authinfo, loop):
+        """
+        :param authinfo: The authinfo used to submit the jobs
+        :type authinfo: :class:`aiida.orm.AuthInfo`
+        :param loop: The event loop
+        :type loop: :class:`tornado.ioloop.IOLoop`
+        """
+        self._authinfo = authinfo
+        self._loop = loop
+
+        self._waiters = collections.deque()  # Queue of (kind, Future)
+        self._wakeup_handle = None
+        self._pending_submissions = 0
+        self._active_transfers = 0
+        self._tokens = None
+        self._last_refill = None
+
+    def get_limits(self):
+        """
+        Return the limits of the computer, where a value of zero means no limit.
+
+        :return: dictionary with the maximum number of queued jobs, the maximum number of concurrent transfers and
+            the submission rate in jobs per second
+        """
+        computer = self._authinfo.computer
+        return {
+            'maximum_queued_jobs': computer.get_maximum_queued_jobs(),
+            'maximum_concurrent_transfers': computer.get_maximum_concurrent_transfers(),
+            'submission_rate': computer.get_submission_rate(),
+        }
+
+    def get_queue_depth(self):
+        """
+        Return the number of jobs that are queued with the scheduler, which includes the jobs of all daemon workers
+        as well as the jobs that this throttle has allowed to be submitted but that have not been marked as such yet.
+
+        :rtype: int
+        """
+        from aiida.common.datastructures import CalcJobState
+        from aiida.orm.utils.calcjob import get_calcjob_state_counts
+
+        counts = get_calcjob_state_counts(
+            self._authinfo.computer, self._authinfo.user, states=[CalcJobState.WITHSCHEDULER])
+        return counts[CalcJobState.WITHSCHEDULER.value] + self._pending_submissions
+
+    def get_number_of_waiters(self):
+        """
+        Return the number of parked requests for each kind of request.
+
+        :return: dictionary with the kind of request as key and the number of waiting requests as value
+        """
+        counts = {self.SUBMISSION: 0, self.TRANSFER: 0}
+        for kind, future in self._waiters:
+            if not future.done():
+                counts[kind] += 1
+        return counts
+
+    @contextlib.contextmanager
+    def request_submission(self):
+        """
+        Request permission to submit a job, which is granted once the number of queued jobs is below the maximum
+        and a token is available. The permission is held for the duration of the context, which should therefore
+        include marking the job as being with the scheduler.
+
+        :return: A future that resolves once the submission is allowed
+        """
+        request = self._add_waiter(self.SUBMISSION)
+        try:
+            yield request
+        finally:
+            self._remove_waiter(request)
+            if request.done():
+                self._pending_submissions -= 1
+            self._process_waiters()
+
+    @contextlib.contextmanager
+    def request_transfer(self):
+        """
+        Request permission to upload or retrieve the files of a job, which is granted once the number of concurrent
+        transfers is below the maximum. The permission is held for the duration of the context.
+
+        :return: A future that resolves once the transfer is allowed
+        """
+        request = self._add_waiter(self.TRANSFER)
+        try:
+            yield request
+        finally:
+            self._remove_waiter(request)
+            if request.done():
+                self._active_transfers -= 1
+            self._process_waiters()
+
+    def notify_job_done(self):
+        """Notify the throttle that one of its jobs left the scheduler queue, such that a parked job can go ahead."""
+        if self._waiters:
+            self._process_waiters()
+
+    def _add_waiter(self, kind):
+        """Add a waiter of the given kind to the queue and grant all the requests that are allowed."""
+        request = concurrent.Future()
+        self._waiters.append((kind, request))
+        self._process_waiters()
+        return request
+
+    def _remove_waiter(self, request):
+        """Remove the waiter with the given request, if it is still in the queue."""
+        self._waiters = collections.deque(entry for entry in self._waiters if entry[1] is not request)
+
+    def _refill_tokens(self, rate, burst):
+        """Add the tokens that were generated since the last refill, up to the size of the burst."""
+        now = time.time()
+        if self._tokens is None:
+            self._tokens = float(burst)
+        else:
+            self._tokens = min(float(burst), self._tokens + (now - self._last_refill) * rate)
+        self._last_refill = now
+
+    def _process_waiters(self):
+        """
+        Grant the waiting requests, in order, as far as the limits allow. If requests remain parked because of a
+        limit that can lift without any local event, i.e. the submission rate or the queue that is shared with other
+        daemon workers, a new attempt is scheduled.
+        """
+        if self._wakeup_handle is not None:
+            self._loop.remove_timeout(self._wakeup_handle)
+            self._wakeup_handle = None
+
+        if not self._waiters:
+            return
+
+        computer = self._authinfo.computer
+        limits = self.get_limits()
+        maximum_queued_jobs = limits['maximum_queued_jobs']
+        maximum_transfers = limits['maximum_concurrent_transfers']
+        rate = limits['submission_rate']
+
+        queue_depth = None
+        delays = []
+        remaining = collections.deque()
+
+        for kind, request in self._waiters:
+            if request.done():
+                continue
+
+            if kind == self.TRANSFER:
+                if maximum_transfers and self._active_transfers >= maximum_transfers:
+                    remaining.append((kind, request))
+                    continue
+                self._active_transfers += 1
+                request.set_result(True)
+                continue
+
+            if maximum_queued_jobs:
+                if queue_depth is None:
+                    queue_depth = self.get_queue_depth()
+                if queue_depth >= maximum_queued_jobs:
+                    remaining.append((kind, request))
+                    delays.append(computer.get_minimum_job_poll_interval())
+                    continue
+
+            if rate:
+                self._refill_tokens(rate, max(computer.get_submission_burst(), 1))
+                if self._tokens < 1:
+                    remaining.append((kind, request))
+                    delays.append((1 - self._tokens) / rate)
+                    continue
+                self._tokens -= 1
+
+            if queue_depth is not None:
+                queue_depth += 1
+            self._pending_submissions += 1
+            request.set_result(True)
+
+        self._waiters = remaining
+
+        if delays:
+            self._wakeup_handle = self._loop.call_later(min(delays), self._process_waiters)
+
+
 class JobManager(object):  # pylint: disable=useless-object-inheritance
     """
     A manager for jobs on a (usually) remote resource such as a supercomputer
@@ -229,6 +654,83 @@ class JobManager(object):  # pylint: disable=useless-object-inheritance
     def __init__(self, transport_queue):
         self._transport_queue = transport_queue
         self._job_lists = RefObjectStore()
+        self._job_list_keys = {}
+        self._submission_buffers = RefObjectStore()
+        self._throttles = {}
+
+    def get_job_list_key(self, authinfo):
+        """
+        Return the key of the jobs list for the given authinfo.
+
+        The key is the computer and the remote username, such that AiiDA users or profiles that are mapped onto the
+        same account of a computer share a single jobs list and therefore a single scheduler query per interval. If
+        the username is not part of the auth params, e.g. for the local transport or when it is taken from the SSH
+        configuration, it is that of the user running the daemon, which is the same for all authinfos.
+
+        :param authinfo: The authinfo
+        :return: tuple of the pk of the computer and the remote username
+        """
+        try:
+            return self._job_list_keys[authinfo.id]
+        except KeyError:
+            key = (authinfo.computer.pk, authinfo.get_auth_params().get('username', None))
+            self._job_list_keys[authinfo.id] = key
+            return key
+
+    def get_throttle(self, authinfo):
+        """
+        Return the throttle that enforces the limits of the computer for the given authinfo.
+
+        The throttle is kept for the lifetime of the job manager, because it keeps track of the granted requests.
+
+        :param authinfo: The authinfo used to submit the jobs
+        :rtype: :class:`aiida.engine.processes.calcjobs.manager.ComputerThrottle`
+        """
+        try:
+            return self._throttles[authinfo.id]
+        except KeyError:
+            throttle = ComputerThrottle(authinfo, self._transport_queue.loop())
+            self._throttles[authinfo.id] = throttle
+            return throttle
+
+    @staticmethod
+    def should_buffer_submissions(authinfo):
+        """
+        Return whether jobs on the computer of the given authinfo should be submitted together with other homogeneous
+        jobs, i.e. whether a window for job bundles is configured for the computer, or a window for job arrays is
+        configured and its scheduler plugin supports job arrays.
+
+        :param authinfo: The authinfo used to submit the jobs
+        :rtype: bool
+        """
+        computer = authinfo.computer
+
+        if computer.get_job_bundle_window() > 0:
+            return True
+
+        if not computer.get_job_array_window() > 0:
+            return False
+
+        try:
+            return computer.get_scheduler().get_feature('can_submit_job_arrays')
+        except NotImplementedError:
+            return False
+
+    @contextlib.contextmanager
+    def request_job_submission(self, authinfo, node, script_filename):
+        """
+        Get a future that will resolve to the job id of the job, once it has been submitted together with the other
+        homogeneous jobs. This is a context manager so that if the user leaves the context the request is
+        automatically cancelled.
+
+        :return: A future that will resolve to the job id
+        :rtype: :class:`tornado.concurrent.Future`
+        """
+        create = partial(JobSubmissionBuffer, authinfo, self._transport_queue)
+
+        with self._submission_buffers.get(authinfo.id, create) as submission_buffer:
+            with submission_buffer.request_job_submission(node, script_filename) as request:
+                yield request
 
     @contextlib.contextmanager
     def request_job_info_update(self, authinfo, job_id):
@@ -242,7 +744,7 @@ class JobManager(object):  # pylint: disable=useless-object-inheritance
         # Define a way to create a JobsList if needed
         create = partial(JobsList, authinfo, self._transport_queue)
 
-        with self._job_lists.get(authinfo.id, create) as job_list:
+        with self._job_lists.get(self.get_job_list_key(authinfo), create) as job_list:
             with job_list.request_job_info_update(job_id) as request:
                 try:
                     yield request
@@ -11,6 +11,7 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import absolute_import
 
+import contextlib
 import functools
 import logging
 import sys
@@ -24,8 +25,11 @@ import plumpy
 from aiida.common.datastructures import CalcJobState
 from aiida.common.exceptions import TransportTaskException
 from aiida.engine.daemon import execmanager
+from aiida.engine.daemon.profiling import CATEGORY_CALCJOB, get_step_profile
 from aiida.engine.utils import exponential_backoff_retry, interruptable_task
+from aiida.orm.utils.identity_map import identity_map
 from aiida.schedulers.datastructures import JobState
+from aiida.transports.instrumentation import CATEGORY_ENGINE, measure_operation
 
 from ..process import ProcessState
 
@@ -41,8 +45,43 @@ TRANSPORT_TASK_MAXIMUM_ATTEMTPS = 5
 logger = logging.getLogger(__name__)
 
 
+@contextlib.contextmanager
+def _measure_task(transport, node, command):
+    """
+    Measure the local work of a transport task once it got its transport, which blocks the event loop.
+
+    The work is recorded as an engine operation in the statistics of the transport and as a step of the process.
+
+    :param transport: the transport of the task
+    :param node: the node that represents the job calculation
+    :param command: the transport task, e.g. `upload`
+    """
+    with measure_operation(transport, CATEGORY_ENGINE, command):
+        with get_step_profile().measure(CATEGORY_CALCJOB, command, node.pk):
+            yield
+
+
 @coroutine
-def task_upload_job(node, transport_queue, calc_info, script_filename, cancellable):
+def _wait_for_slot(node, slot, cancellable, limit, command):
+    """
+    Wait until the throttle of the computer grants the requested slot, updating the process status while parked.
+
+    :param node: the node that represents the job calculation
+    :param slot: the future of the slot requested from the throttle
+    :param cancellable: the cancelled flag that will be queried to determine whether the task was cancelled
+    :param limit: the name of the limit that is waited for, used in the process status
+    :param command: the transport task that is waiting, used to restore the process status
+    """
+    if slot.done():
+        return
+
+    node.set_process_status('Waiting for the number of {} to drop below the limit of the computer'.format(limit))
+    yield cancellable.with_interrupt(slot)
+    node.set_process_status('Waiting for transport task: {}'.format(command))
+
+
+@coroutine
+def task_upload_job(node, transport_queue, job_manager, calc_info, script_filename, cancellable):
     """
     Transport task that will attempt to upload the files of a job calculation to the remote
 
@@ -51,8 +90,12 @@ def task_upload_job(node, transport_queue, calc_info, script_filename, cancellab
     retry after an interval that increases exponentially with the number of retries, for a maximum number of retries.
     If all retries fail, the task will raise a TransportTaskException
 
+    Before requesting the transport, the task waits until the throttle of the computer allows another transfer.
+
     :param node: the node that represents the job calculation
     :param transport_queue: the TransportQueue from which to request a Transport
+    :param job_manager: The job manager
+    :type job_manager: :class:`aiida.engine.processes.calcjobs.manager.JobManager`
     :param calc_info: the calculation info datastructure returned by `CalcJobNode._presubmit`
     :param script_filename: the job launch script returned by `CalcJobNode._presubmit`
     :param cancellable: the cancelled flag that will be queried to determine whether the task was cancelled
@@ -69,13 +112,20 @@ def task_upload_job(node, transport_queue, calc_info, script_filename, cancellab
 
     authinfo = node.computer.get_authinfo(node.user)
 
+    throttle = job_manager.get_throttle(authinfo)
+
     @coroutine
     def do_upload():
-        with transport_queue.request_transport(authinfo) as request:
-            transport = yield cancellable.with_interrupt(request)
+        with throttle.request_transfer() as slot:
+            yield _wait_for_slot(node, slot, cancellable, 'concurrent transfers', UPLOAD_COMMAND)
+
+            with transport_queue.request_transport(authinfo) as request:
+                transport = yield cancellable.with_interrupt(request)
 
-            logger.info('uploading calculation<{}>'.format(node.pk))
-            raise Return(execmanager.upload_calculation(node, transport, calc_info, script_filename))
+                logger.info('uploading calculation<{}>'.format(node.pk))
+                with _measure_task(transport, node, UPLOAD_COMMAND), identity_map():
+                    result = execmanager.upload_calculation(node, transport, calc_info, script_filename)
+                raise Return(result)
 
     try:
         result = yield exponential_backoff_retry(
@@ -92,7 +142,7 @@ def task_upload_job(node, transport_queue, calc_info, script_filename, cancellab
 
 
 @coroutine
-def task_submit_job(node, transport_queue, calc_info, script_filename, cancellable):
+def task_submit_job(node, transport_queue, job_manager, calc_info, script_filename, cancellable):
     """
     Transport task that will attempt to submit a job calculation
 
@@ -101,8 +151,15 @@ def task_submit_job(node, transport_queue, calc_info, script_filename, cancellab
     retry after an interval that increases exponentially with the number of retries, for a maximum number of retries.
     If all retries fail, the task will raise a TransportTaskException
 
+    If job arrays are enabled for the computer, the submission is instead requested from the job manager, which will
+    submit it together with other homogeneous jobs as a single job array.
+
+    Before submitting, the task waits until the throttle of the computer allows another job to be queued.
+
     :param node: the node that represents the job calculation
     :param transport_queue: the TransportQueue from which to request a Transport
+    :param job_manager: The job manager
+    :type job_manager: :class:`aiida.engine.processes.calcjobs.manager.JobManager`
     :param calc_info: the calculation info datastructure returned by `CalcJobNode._presubmit`
     :param script_filename: the job launch script returned by `CalcJobNode._presubmit`
     :param cancellable: the cancelled flag that will be queried to determine whether the task was cancelled
@@ -120,13 +177,32 @@ def task_submit_job(node, transport_queue, calc_info, script_filename, cancellab
 
     authinfo = node.computer.get_authinfo(node.user)
 
+    throttle = job_manager.get_throttle(authinfo)
+
     @coroutine
-    def do_submit():
+    def submit():
+        if job_manager.should_buffer_submissions(authinfo):
+            with job_manager.request_job_submission(authinfo, node, script_filename) as request:
+                logger.info('submitting CalcJob<{}> together with homogeneous jobs'.format(node.pk))
+                job_id = yield cancellable.with_interrupt(request)
+                raise Return(job_id)
+
         with transport_queue.request_transport(authinfo) as request:
             transport = yield cancellable.with_interrupt(request)
 
             logger.info('submitting CalcJob<{}>'.format(node.pk))
-            raise Return(execmanager.submit_calculation(node, transport, calc_info, script_filename))
+            with _measure_task(transport, node, SUBMIT_COMMAND):
+                job_id = execmanager.submit_calculation(node, transport, calc_info, script_filename)
+            raise Return(job_id)
+
+    @coroutine
+    def do_submit():
+        # The job has to be marked as being with the scheduler before the slot is released, for it to be counted
+        with throttle.request_submission() as slot:
+            yield _wait_for_slot(node, slot, cancellable, 'queued jobs', SUBMIT_COMMAND)
+            job_id = yield submit()
+            node.set_state(CalcJobState.WITHSCHEDULER)
+            raise Return(job_id)
 
     try:
         result = yield exponential_backoff_retry(
@@ -138,7 +214,6 @@ def task_submit_job(node, transport_queue, calc_info, script_filename, cancellab
         raise TransportTaskException('submit_calculation failed {} times consecutively'.format(max_attempts))
     else:
         logger.info('submitting CalcJob<{}> successful'.format(node.pk))
-        node.set_state(CalcJobState.WITHSCHEDULER)
         raise Return(result)
 
 
@@ -199,12 +274,13 @@ def task_update_job(node, job_manager, cancellable):
         logger.info('updating CalcJob<{}> successful'.format(node.pk))
         if job_done:
             node.set_state(CalcJobState.RETRIEVING)
+            job_manager.get_throttle(authinfo).notify_job_done()
 
         raise Return(job_done)
 
 
 @coroutine
-def task_retrieve_job(node, transport_queue, retrieved_temporary_folder, cancellable):
+def task_retrieve_job(node, transport_queue, job_manager, retrieved_temporary_folder, cancellable):
     """
     Transport task that will attempt to retrieve all files of a completed job calculation
 
@@ -213,8 +289,12 @@ def task_retrieve_job(node, transport_queue, retrieved_temporary_folder, cancell
     retry after an interval that increases exponentially with the number of retries, for a maximum number of retries.
     If all retries fail, the task will raise a TransportTaskException
 
+    Before requesting the transport, the task waits until the throttle of the computer allows another transfer.
+
     :param node: the node that represents the job calculation
     :param transport_queue: the TransportQueue from which to request a Transport
+    :param job_manager: The job manager
+    :type job_manager: :class:`aiida.engine.processes.calcjobs.manager.JobManager`
     :param cancellable: the cancelled flag that will be queried to determine whether the task was cancelled
     :type cancellable: :class:`aiida.engine.utils.InterruptableFuture`
     :raises: Return if the tasks was successfully completed
@@ -229,13 +309,20 @@ def task_retrieve_job(node, transport_queue, retrieved_temporary_folder, cancell
 
     authinfo = node.computer.get_authinfo(node.user)
 
+    throttle = job_manager.get_throttle(authinfo)
+
     @coroutine
     def do_retrieve():
-        with transport_queue.request_transport(authinfo) as request:
-            transport = yield cancellable.with_interrupt(request)
+        with throttle.request_transfer() as slot:
+            yield _wait_for_slot(node, slot, cancellable, 'concurrent transfers', RETRIEVE_COMMAND)
 
-            logger.info('retrieving CalcJob<{}>'.format(node.pk))
-            raise Return(execmanager.retrieve_calculation(node, transport, retrieved_temporary_folder))
+            with transport_queue.request_transport(authinfo) as request:
+                transport = yield cancellable.with_interrupt(request)
+
+                logger.info('retrieving CalcJob<{}>'.format(node.pk))
+                with _measure_task(transport, node, RETRIEVE_COMMAND):
+                    result = execmanager.retrieve_calculation(node, transport, retrieved_temporary_folder)
+                raise Return(result)
 
     try:
         result = yield exponential_backoff_retry(
@@ -282,7 +369,9 @@ def task_kill_job(node, transport_queue, cancellable):
         with transport_queue.request_transport(authinfo) as request:
             transport = yield cancellable.with_interrupt(request)
             logger.info('killing CalcJob<{}>'.format(node.pk))
-            raise Return(execmanager.kill_calculation(node, transport))
+            with _measure_task(transport, node, KILL_COMMAND):
+                result = execmanager.kill_calculation(node, transport)
+            raise Return(result)
 
     try:
         result = yield exponential_backoff_retry(do_kill, initial_interval, max_attempts, logger=node.logger)
@@ -315,6 +404,7 @@ class Waiting(plumpy.Waiting):
 
         node = self.process.node
         transport_queue = self.process.runner.transport
+        job_manager = self.process.runner.job_manager
 
         if isinstance(self.data, tuple):
             command = self.data[0]
@@ -327,25 +417,26 @@ class Waiting(plumpy.Waiting):
         try:
 
             if command == UPLOAD_COMMAND:
-                calc_info, script_filename = yield self._launch_task(task_upload_job, node, transport_queue, *args)
+                calc_info, script_filename = yield self._launch_task(
+                    task_upload_job, node, transport_queue, job_manager, *args)
                 raise Return(self.submit(calc_info, script_filename))
 
             elif command == SUBMIT_COMMAND:
-                yield self._launch_task(task_submit_job, node, transport_queue, *args)
+                yield self._launch_task(task_submit_job, node, transport_queue, job_manager, *args)
                 raise Return(self.update())
 
             elif self.data == UPDATE_COMMAND:
                 job_done = False
 
                 while not job_done:
-                    job_done = yield self._launch_task(task_update_job, node, self.process.runner.job_manager)
+                    job_done = yield self._launch_task(task_update_job, node, job_manager)
 
                 raise Return(self.retrieve())
 
             elif self.data == RETRIEVE_COMMAND:
                 # Create a temporary folder that has to be deleted by JobProcess.retrieved after successful parsing
                 temp_folder = tempfile.mkdtemp()
-                yield self._launch_task(task_retrieve_job, node, transport_queue, temp_folder)
+                yield self._launch_task(task_retrieve_job, node, transport_queue, job_manager, temp_folder)
                 raise Return(self.parse(temp_folder))
 
             else:
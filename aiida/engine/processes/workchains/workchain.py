@@ -23,6 +23,7 @@ from plumpy.workchains import if_, while_, return_, _PropagateReturn
 from aiida.common import exceptions
 from aiida.common.extendeddicts import AttributeDict
 from aiida.common.lang import override
+from aiida.engine.daemon.profiling import CATEGORY_WORKCHAIN, get_step_profile
 from aiida.orm import Node, WorkChainNode
 from aiida.orm.utils import load_node
 
@@ -152,8 +153,12 @@ class WorkChain(Process):
         self._awaitables = []
         result = None
 
+        # The position in the outline, e.g. `1:while_(should_run)(0:run_calculation)`, identifies the step
+        step = '{}:{}'.format(self.__class__.__name__, self._stepper)
+
         try:
-            finished, stepper_result = self._stepper.step()
+            with get_step_profile().measure(CATEGORY_WORKCHAIN, step, self.node.pk):
+                finished, stepper_result = self._stepper.step()
         except _PropagateReturn as exception:
             finished, result = True, exception.exit_code
         else:
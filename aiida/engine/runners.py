@@ -42,7 +42,13 @@ class Runner(object):  # pylint: disable=useless-object-inheritance
     _controller = None
     _closed = False
 
-    def __init__(self, poll_interval=0, loop=None, communicator=None, rmq_submit=False, persister=None):
+    def __init__(self,
+                 poll_interval=0,
+                 loop=None,
+                 communicator=None,
+                 rmq_submit=False,
+                 persister=None,
+                 count_file_bytes=False):
         """
         Construct a new runner
 
@@ -54,6 +60,8 @@ class Runner(object):  # pylint: disable=useless-object-inheritance
         :param rmq_submit: if True, processes will be submitted to RabbitMQ, otherwise they will be scheduled here
         :param persister: the persister to use to persist processes
         :type persister: :class:`plumpy.Persister`
+        :param count_file_bytes: whether the transports count the bytes of the files that they put or retrieve in the
+            input/output statistics
         """
         assert not (rmq_submit and persister is None), \
             'Must supply a persister if you want to submit using communicator'
@@ -61,7 +69,7 @@ class Runner(object):  # pylint: disable=useless-object-inheritance
         self._loop = loop if loop is not None else tornado.ioloop.IOLoop()
         self._poll_interval = poll_interval
         self._rmq_submit = rmq_submit
-        self._transport = transports.TransportQueue(self._loop)
+        self._transport = transports.TransportQueue(self._loop, count_file_bytes=count_file_bytes)
         self._job_manager = manager.JobManager(self._transport)
         self._persister = persister
 
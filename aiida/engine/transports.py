@@ -14,9 +14,12 @@ from __future__ import absolute_import
 from collections import namedtuple
 import contextlib
 import logging
+import time
 import traceback
 from tornado import concurrent, gen, ioloop
 
+from aiida.transports.instrumentation import InstrumentedTransport
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -28,6 +31,66 @@ class TransportRequest(object):
         super(TransportRequest, self).__init__()
         self.future = concurrent.Future()
         self.count = 0
+        self.open_callback_handle = None
+
+
+class CircuitBreaker(object):
+    """
+    Keeps track of the consecutive failures to open a transport for an authinfo.
+
+    Once the number of consecutive failures reaches the threshold the circuit is open: requests for a transport are
+    no longer answered with a failure but are parked, and a single attempt to open the transport is made after a
+    cooldown period. If that attempt succeeds the circuit is closed again and all parked requests are given the
+    transport together, otherwise the cooldown is doubled, up to a maximum, and the requests remain parked.
+    """
+
+    # pylint: disable=useless-object-inheritance
+    def __init__(self, threshold, cooldown, maximum_cooldown):
+        """
+        :param threshold: the number of consecutive failures after which the circuit opens
+        :param cooldown: the time in seconds to wait after the circuit opened before attempting to open the transport
+        :param maximum_cooldown: the maximum time in seconds between attempts to open the transport
+        """
+        super(CircuitBreaker, self).__init__()
+        self._threshold = threshold
+        self._initial_cooldown = cooldown
+        self._maximum_cooldown = maximum_cooldown
+        self._cooldown = cooldown
+        self._failures = 0
+        self._last_failure = None
+
+    @property
+    def failures(self):
+        """Return the number of consecutive failures."""
+        return self._failures
+
+    @property
+    def cooldown(self):
+        """Return the current cooldown period in seconds."""
+        return self._cooldown
+
+    def is_open(self):
+        """Return whether the circuit is open, i.e. whether requests should be parked."""
+        return self._threshold > 0 and self._failures >= self._threshold
+
+    def record_failure(self):
+        """Record a failed attempt to open the transport, doubling the cooldown if the circuit was already open."""
+        if self.is_open():
+            self._cooldown = min(self._cooldown * 2, self._maximum_cooldown)
+        self._failures += 1
+        self._last_failure = time.time()
+
+    def record_success(self):
+        """Record a successful attempt to open the transport, which closes the circuit."""
+        self._failures = 0
+        self._last_failure = None
+        self._cooldown = self._initial_cooldown
+
+    def get_delay(self):
+        """Return the time in seconds until the next attempt to open the transport is allowed."""
+        if not self.is_open():
+            return 0
+        return max(0, self._last_failure + self._cooldown - time.time())
 
 
 class TransportQueue(object):  # pylint: disable=useless-object-inheritance
@@ -40,21 +103,98 @@ class TransportQueue(object):  # pylint: disable=useless-object-inheritance
     it will open the transport and give it to all the clients that asked for it
     up to that point.  This way opening of transports (a costly operation) can
     be minimised.
+
+    If opening the transport for an authinfo keeps failing, for example because
+    the computer is down, a circuit breaker stops the queue from opening it for
+    every single request: the requests are parked and the transport is only
+    probed once per cooldown period, see :class:`CircuitBreaker`.
+
+    The transports are wrapped in an :class:`aiida.transports.instrumentation.InstrumentedTransport`, such that the
+    operations performed through them are recorded in the input/output statistics of the interpreter.
+
+    The configuration of the transport of each authinfo, i.e. the transport class and its parameters, is loaded once
+    and reused for every transport that is opened afterwards, so changes to the configuration of a computer only take
+    effect for a new transport queue, e.g. after restarting the daemon.
     """
     AuthInfoEntry = namedtuple('AuthInfoEntry', ['authinfo', 'transport', 'callbacks', 'callback_handle'])
 
-    def __init__(self, loop=None):
+    CIRCUIT_BREAKER_THRESHOLD = 5
+    CIRCUIT_BREAKER_COOLDOWN = 60.
+    CIRCUIT_BREAKER_MAXIMUM_COOLDOWN = 600.
+
+    def __init__(self,
+                 loop=None,
+                 circuit_breaker_threshold=CIRCUIT_BREAKER_THRESHOLD,
+                 circuit_breaker_cooldown=CIRCUIT_BREAKER_COOLDOWN,
+                 circuit_breaker_maximum_cooldown=CIRCUIT_BREAKER_MAXIMUM_COOLDOWN,
+                 count_file_bytes=False):
         """
         :param loop: The event loop to use, will use `tornado.ioloop.IOLoop.current()` if not supplied
         :type loop: :class:`tornado.ioloop.IOLoop`
+        :param circuit_breaker_threshold: the number of consecutive failures to open a transport after which requests
+            are parked, zero disables the circuit breaker
+        :param circuit_breaker_cooldown: the initial time in seconds between attempts to open a transport once the
+            circuit is open
+        :param circuit_breaker_maximum_cooldown: the maximum time in seconds between attempts to open a transport
+        :param count_file_bytes: whether the transports count the bytes of the files that they put or retrieve in the
+            input/output statistics, see :class:`aiida.transports.instrumentation.InstrumentedTransport`
         """
         self._loop = loop if loop is not None else ioloop.IOLoop.current()
         self._transport_requests = {}
+        self._transport_configurations = {}
+        self._circuit_breakers = {}
+        self._circuit_breaker_threshold = circuit_breaker_threshold
+        self._circuit_breaker_cooldown = circuit_breaker_cooldown
+        self._circuit_breaker_maximum_cooldown = circuit_breaker_maximum_cooldown
+        self._count_file_bytes = count_file_bytes
 
     def loop(self):
         """ Get the loop being used by this transport queue """
         return self._loop
 
+    def get_circuit_breaker(self, authinfo):
+        """
+        Get the circuit breaker for the given authinfo, creating it if it does not exist yet
+
+        :param authinfo: The authinfo
+        :rtype: :class:`aiida.engine.transports.CircuitBreaker`
+        """
+        try:
+            return self._circuit_breakers[authinfo.id]
+        except KeyError:
+            breaker = CircuitBreaker(self._circuit_breaker_threshold, self._circuit_breaker_cooldown,
+                                     self._circuit_breaker_maximum_cooldown)
+            self._circuit_breakers[authinfo.id] = breaker
+            return breaker
+
+    def get_transport(self, authinfo):
+        """
+        Return a new, instrumented but not yet opened, transport for the given authinfo.
+
+        :param authinfo: The authinfo
+        :rtype: :class:`aiida.transports.instrumentation.InstrumentedTransport`
+        """
+        try:
+            transport_class, hostname, params, label = self._transport_configurations[authinfo.id]
+        except KeyError:
+            from aiida.common.exceptions import ConfigurationError, MissingPluginError
+            from aiida.plugins import TransportFactory
+
+            computer = authinfo.computer
+            try:
+                transport_class = TransportFactory(computer.get_transport_type())
+            except MissingPluginError as exc:
+                raise ConfigurationError('No transport found for {} [type {}], message: {}'.format(
+                    computer.hostname, computer.get_transport_type(), exc))
+
+            hostname = computer.hostname
+            params = dict(list(computer.get_transport_params().items()) + list(authinfo.get_auth_params().items()))
+            label = '{} on {}'.format(authinfo.user.email, computer.name)
+            self._transport_configurations[authinfo.id] = (transport_class, hostname, params, label)
+
+        transport = transport_class(machine=hostname, **params)
+        return InstrumentedTransport(transport, authinfo.id, label, count_file_bytes=self._count_file_bytes)
+
     @contextlib.contextmanager
     def request_transport(self, authinfo):
         """
@@ -71,7 +211,6 @@ class TransportQueue(object):  # pylint: disable=useless-object-inheritance
         :param authinfo: The authinfo to be used to get transport
         :return: A future that can be yielded to give the transport
         """
-        open_callback_handle = None
         transport_request = self._transport_requests.get(authinfo.id, None)
 
         if transport_request is None:
@@ -79,27 +218,47 @@ class TransportQueue(object):  # pylint: disable=useless-object-inheritance
             transport_request = TransportRequest()
             self._transport_requests[authinfo.id] = transport_request
 
-            transport = authinfo.get_transport()
+            transport = self.get_transport(authinfo)
             safe_open_interval = transport.get_safe_open_interval()
+            breaker = self.get_circuit_breaker(authinfo)
 
             def do_open():
                 """ Actually open the transport """
+                transport_request.open_callback_handle = None
+
                 if transport_request.count > 0:
                     # The user still wants the transport so open it
                     _LOGGER.debug('Transport request opening transport for %s', authinfo)
                     try:
                         transport.open()
                     except Exception as exception:  # pylint: disable=broad-except
+                        breaker.record_failure()
+
+                        if breaker.is_open():
+                            # Park the requests until the next attempt rather than letting each of them retry
+                            _LOGGER.warning(
+                                'opening transport for %s failed %d times consecutively, parking %d requests and '
+                                'trying again in %g seconds: %s', authinfo, breaker.failures, transport_request.count,
+                                breaker.cooldown, exception)
+                            transport_request.open_callback_handle = self._loop.call_later(
+                                breaker.get_delay(), do_open)
+                            return
+
                         _LOGGER.error('exception occurred while trying to open transport:\n %s', exception)
                         transport_request.future.set_exception(exception)
 
                         # Cleanup of the stale TransportRequest with the excepted transport future
                         self._transport_requests.pop(authinfo.id, None)
                     else:
+                        if breaker.is_open():
+                            _LOGGER.info('opening transport for %s succeeded again, releasing %d parked requests',
+                                         authinfo, transport_request.count)
+                        breaker.record_success()
                         transport_request.future.set_result(transport)
 
             # Save the handle so that we can cancel the callback if the user no longer wants it
-            open_callback_handle = self._loop.call_later(safe_open_interval, do_open)
+            transport_request.open_callback_handle = self._loop.call_later(
+                max(safe_open_interval, breaker.get_delay()), do_open)
 
         try:
             transport_request.count += 1
@@ -118,7 +277,7 @@ class TransportQueue(object):  # pylint: disable=useless-object-inheritance
                 if transport_request.future.done():
                     _LOGGER.debug('Transport request closing transport for %s', authinfo)
                     transport_request.future.result().close()
-                elif open_callback_handle is not None:
-                    self._loop.remove_timeout(open_callback_handle)
+                elif transport_request.open_callback_handle is not None:
+                    self._loop.remove_timeout(transport_request.open_callback_handle)
 
                 self._transport_requests.pop(authinfo.id, None)
@@ -104,6 +104,83 @@ CONFIG_OPTIONS = {
         'default': DEFAULT_DAEMON_TIMEOUT,
         'description': 'The timeout in seconds for calls to the circus client',
     },
+    'daemon.stats_interval': {
+        'key': 'daemon_stats_interval',
+        'valid_type': 'int',
+        'valid_values': None,
+        'default': 60,
+        'description': 'The interval in seconds with which daemon workers dump their transport and scheduler '
+                       'statistics for `verdi daemon stats`, zero disables the dumps',
+    },
+    'daemon.stats_file_bytes': {
+        'key': 'daemon_stats_file_bytes',
+        'valid_type': 'bool',
+        'valid_values': None,
+        'default': False,
+        'description': 'Boolean whether the transport statistics also count the bytes of the files that are put or '
+                       'retrieved, which requires walking the local files after each transfer',
+    },
+    'daemon.slow_step_threshold': {
+        'key': 'daemon_slow_step_threshold',
+        'valid_type': 'int',
+        'valid_values': None,
+        'default': 1000,
+        'description': 'The duration in milliseconds above which the steps of processes that block the event loop '
+                       'of daemon workers are logged as slow, zero disables the logging',
+    },
+    'daemon.worker_process_slots': {
+        'key': 'daemon_worker_process_slots',
+        'valid_type': 'int',
+        'valid_values': None,
+        'default': 100,
+        'description': 'Maximum number of processes that a daemon worker runs simultaneously, can be changed with '
+                       '`verdi daemon slots`, which also restarts the running workers',
+    },
+    'daemon.autoscale_minimum_workers': {
+        'key': 'daemon_autoscale_minimum_workers',
+        'valid_type': 'int',
+        'valid_values': None,
+        'default': 1,
+        'description': 'Minimum number of daemon workers kept running by the autoscaler',
+    },
+    'daemon.autoscale_maximum_workers': {
+        'key': 'daemon_autoscale_maximum_workers',
+        'valid_type': 'int',
+        'valid_values': None,
+        'default': 0,
+        'description': 'Maximum number of daemon workers started by the autoscaler, zero disables the autoscaler',
+    },
+    'daemon.autoscale_interval': {
+        'key': 'daemon_autoscale_interval',
+        'valid_type': 'int',
+        'valid_values': None,
+        'default': 30,
+        'description': 'The interval in seconds with which the autoscaler checks the load of the daemon workers',
+    },
+    'daemon.autoscale_idle_time': {
+        'key': 'daemon_autoscale_idle_time',
+        'valid_type': 'int',
+        'valid_values': None,
+        'default': 600,
+        'description': 'The time in seconds that the daemon workers must have spare process slots before the '
+                       'autoscaler removes a worker',
+    },
+    'daemon.autoscale_maximum_loop_lag': {
+        'key': 'daemon_autoscale_maximum_loop_lag',
+        'valid_type': 'int',
+        'valid_values': None,
+        'default': 500,
+        'description': 'The average lag in milliseconds of the event loop of the daemon workers above which the '
+                       'autoscaler adds a worker',
+    },
+    'daemon.autoscale_cooldown': {
+        'key': 'daemon_autoscale_cooldown',
+        'valid_type': 'int',
+        'valid_values': None,
+        'default': 300,
+        'description': 'The time in seconds after the autoscaler added workers before it adds a worker because of '
+                       'the lag of the event loop of the daemon workers',
+    },
     'verdi.shell.auto_import': {
         'key': 'verdi_shell_auto_import',
         'valid_type': 'string',
@@ -125,6 +202,30 @@ CONFIG_OPTIONS = {
         'default': 'REPORT',
         'description': 'Minimum level to log to the DbLog table',
     },
+    'logging.db_buffer_size': {
+        'key': 'logging_db_buffer_size',
+        'valid_type': 'int',
+        'valid_values': None,
+        'default': 10000,
+        'description': 'Maximum number of log records that daemon workers buffer before writing them to the DbLog '
+                       'table in batches, the oldest records are dropped when the buffer is full, zero writes each '
+                       'record immediately',
+    },
+    'logging.db_flush_size': {
+        'key': 'logging_db_flush_size',
+        'valid_type': 'int',
+        'valid_values': None,
+        'default': 500,
+        'description': 'Number of log records buffered by daemon workers that triggers a write to the DbLog table',
+    },
+    'logging.db_flush_interval': {
+        'key': 'logging_db_flush_interval',
+        'valid_type': 'int',
+        'valid_values': None,
+        'default': 1,
+        'description': 'Maximum interval in seconds between writes of the log records buffered by daemon workers to '
+                       'the DbLog table',
+    },
     'logging.tornado_loglevel': {
         'key': 'logging_tornado_log_level',
         'valid_type': 'string',
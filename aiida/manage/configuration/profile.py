@@ -24,6 +24,8 @@ CIRCUS_PID_FILE_TEMPLATE = os.path.join(DAEMON_DIR, 'circus-{}.pid')
 DAEMON_PID_FILE_TEMPLATE = os.path.join(DAEMON_DIR, 'aiida-{}.pid')
 CIRCUS_LOG_FILE_TEMPLATE = os.path.join(DAEMON_LOG_DIR, 'circus-{}.log')
 DAEMON_LOG_FILE_TEMPLATE = os.path.join(DAEMON_LOG_DIR, 'aiida-{}.log')
+DAEMON_STATS_DIR_TEMPLATE = os.path.join(DAEMON_DIR, 'aiida-{}-stats')
+DAEMON_PROFILES_DIR_TEMPLATE = os.path.join(DAEMON_DIR, 'aiida-{}-profiles')
 CIRCUS_PORT_FILE_TEMPLATE = os.path.join(DAEMON_DIR, 'circus-{}.port')
 CIRCUS_SOCKET_FILE_TEMPATE = os.path.join(DAEMON_DIR, 'circus-{}.sockets')
 CIRCUS_CONTROLLER_SOCKET_TEMPLATE = 'circus.c.sock'
@@ -154,5 +156,7 @@ class Profile(object):  # pylint: disable=useless-object-inheritance
             'daemon': {
                 'log': DAEMON_LOG_FILE_TEMPLATE.format(self.name),
                 'pid': DAEMON_PID_FILE_TEMPLATE.format(self.name),
+                'stats': DAEMON_STATS_DIR_TEMPLATE.format(self.name),
+                'profiles': DAEMON_PROFILES_DIR_TEMPLATE.format(self.name),
             }
         }
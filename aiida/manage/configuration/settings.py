@@ -25,6 +25,7 @@ DEFAULT_CONFIG_FILE_NAME = 'config.json'
 DEFAULT_CONFIG_INDENT_SIZE = 4
 DEFAULT_DAEMON_DIR_NAME = 'daemon'
 DEFAULT_DAEMON_LOG_DIR_NAME = 'log'
+DEFAULT_CACHE_DIR_NAME = 'cache'
 
 AIIDA_PATH = [os.path.expanduser(path) for path in os.environ.get(DEFAULT_AIIDA_PATH_VARIABLE, '').split(':') if path]
 AIIDA_PATH.append(os.path.expanduser('~'))
@@ -41,3 +42,4 @@ else:
 
 DAEMON_DIR = os.path.join(AIIDA_CONFIG_FOLDER, DEFAULT_DAEMON_DIR_NAME)
 DAEMON_LOG_DIR = os.path.join(DAEMON_DIR, DEFAULT_DAEMON_LOG_DIR_NAME)
+CACHE_DIR = os.path.join(AIIDA_CONFIG_FOLDER, DEFAULT_CACHE_DIR_NAME)
@@ -101,6 +101,33 @@ def get_task_exchange_name(prefix):
     return '{}.{}'.format(prefix, _TASK_EXCHANGE)
 
 
+def get_launch_queue_depth(prefix):
+    """
+    Return the number of tasks in the launch queue that are ready, i.e. that have not been taken by a daemon worker.
+
+    A new connection is opened for every call, such that it can be used by processes without an event loop, e.g. the
+    autoscaler of the daemon workers.
+
+    :param prefix: a string prefix for the RabbitMQ communication queues and exchanges
+    :returns: the number of ready tasks, zero if the launch queue does not exist yet
+    """
+    import pika
+    from pika.exceptions import ChannelClosed
+
+    connection = pika.BlockingConnection(pika.URLParameters(get_rmq_url()))
+
+    try:
+        channel = connection.channel()
+        try:
+            result = channel.queue_declare(queue=get_launch_queue_name(prefix), passive=True)
+        except ChannelClosed:
+            return 0
+        return result.method.message_count
+    finally:
+        if connection.is_open:
+            connection.close()
+
+
 def _store_inputs(inputs):
     """
     Try to store the values in the input dictionary. For nested dictionaries, the values are stored by recursively.
@@ -260,8 +260,22 @@ class Manager(object):  # pylint: disable=useless-object-inheritance
         """
         import plumpy
         from aiida.engine import persistence
+        from aiida.engine.daemon.autoscaler import get_worker_load
+        from aiida.manage.configuration import get_config_option
         from aiida.manage.external import rmq
-        runner = self.create_runner(rmq_submit=True, loop=loop)
+
+        # The process slots are the maximum number of tasks, i.e. processes, that the worker takes simultaneously. This
+        # is the task prefetch count of the communicator, which is fixed when it is created, so a communicator that
+        # already exists, for example in tests, keeps the prefetch count that it was created with.
+        process_slots = get_config_option('daemon.worker_process_slots')
+        worker_load = get_worker_load()
+        worker_load.set_process_slots(process_slots)
+
+        if self._communicator is None:
+            self._communicator = self.create_communicator(task_prefetch_count=process_slots)
+
+        runner = self.create_runner(
+            rmq_submit=True, loop=loop, count_file_bytes=get_config_option('daemon.stats_file_bytes'))
         runner_loop = runner.loop
 
         # Listen for incoming launch requests
@@ -272,7 +286,8 @@ class Manager(object):  # pylint: disable=useless-object-inheritance
             loader=persistence.get_object_loader())
 
         def callback(*args, **kwargs):
-            return plumpy.create_task(functools.partial(task_receiver, *args, **kwargs), loop=runner_loop)
+            return worker_load.track(
+                plumpy.create_task(functools.partial(task_receiver, *args, **kwargs), loop=runner_loop))
 
         runner.communicator.add_task_subscriber(callback)
 
@@ -47,6 +47,26 @@ class Computer(entities.Entity):
 
     PROPERTY_MINIMUM_SCHEDULER_POLL_INTERVAL = 'minimum_scheduler_poll_interval'  # pylint: disable=invalid-name
     PROPERTY_MINIMUM_SCHEDULER_POLL_INTERVAL__DEFAULT = 10.  # pylint: disable=invalid-name
+    PROPERTY_MAXIMUM_SCHEDULER_POLL_INTERVAL = 'maximum_scheduler_poll_interval'  # pylint: disable=invalid-name
+    PROPERTY_MAXIMUM_SCHEDULER_POLL_INTERVAL__DEFAULT = 0.  # pylint: disable=invalid-name
+    PROPERTY_JOB_ARRAY_WINDOW = 'job_array_window'
+    PROPERTY_JOB_ARRAY_WINDOW__DEFAULT = 0.
+    PROPERTY_JOB_ARRAY_MAXIMUM_SIZE = 'job_array_maximum_size'
+    PROPERTY_JOB_ARRAY_MAXIMUM_SIZE__DEFAULT = 1000
+    PROPERTY_JOB_BUNDLE_WINDOW = 'job_bundle_window'
+    PROPERTY_JOB_BUNDLE_WINDOW__DEFAULT = 0.
+    PROPERTY_JOB_BUNDLE_SIZE = 'job_bundle_size'
+    PROPERTY_JOB_BUNDLE_SIZE__DEFAULT = 16
+    PROPERTY_JOB_BUNDLE_PARALLEL = 'job_bundle_parallel'
+    PROPERTY_JOB_BUNDLE_PARALLEL__DEFAULT = False
+    PROPERTY_MAXIMUM_QUEUED_JOBS = 'maximum_queued_jobs'
+    PROPERTY_MAXIMUM_QUEUED_JOBS__DEFAULT = 0
+    PROPERTY_MAXIMUM_CONCURRENT_TRANSFERS = 'maximum_concurrent_transfers'  # pylint: disable=invalid-name
+    PROPERTY_MAXIMUM_CONCURRENT_TRANSFERS__DEFAULT = 0  # pylint: disable=invalid-name
+    PROPERTY_SUBMISSION_RATE = 'submission_rate'
+    PROPERTY_SUBMISSION_RATE__DEFAULT = 0.
+    PROPERTY_SUBMISSION_BURST = 'submission_burst'
+    PROPERTY_SUBMISSION_BURST__DEFAULT = 1
     PROPERTY_WORKDIR = 'workdir'
     PROPERTY_SHEBANG = 'shebang'
 
@@ -117,6 +137,15 @@ class Computer(entities.Entity):
         def_cpus_machine = self.get_default_mpiprocs_per_machine()
         if def_cpus_machine is not None:
             ret_lines.append(" * Default number of cpus per machine: {}".format(def_cpus_machine))
+
+        def format_limit(value, unit=''):
+            return '{}{}'.format(value, unit) if value else 'unlimited'
+
+        ret_lines.append(" * Maximum queued jobs:          {}".format(format_limit(self.get_maximum_queued_jobs())))
+        ret_lines.append(" * Maximum concurrent transfers: {}".format(
+            format_limit(self.get_maximum_concurrent_transfers())))
+        ret_lines.append(" * Submission rate:              {}".format(
+            format_limit(self.get_submission_rate(), ' jobs/s (burst {})'.format(self.get_submission_burst()))))
         # pylint: disable=fixme
         # TODO: Put back following line when we port Node to new backend system
         # ret_lines.append(" * Used by:        {} nodes".format(len(self._dbcomputer.dbnodes.all())))
@@ -466,6 +495,206 @@ class Computer(entities.Entity):
         """
         self.set_property(self.PROPERTY_MINIMUM_SCHEDULER_POLL_INTERVAL, interval)
 
+    def get_maximum_job_poll_interval(self):
+        """
+        Get the maximum interval between subsequent requests to update the list of jobs currently running on this
+        computer. As long as none of the jobs change state, the interval grows from the minimum up to this value.
+        A value that is not larger than the minimum interval disables this adaptive polling.
+
+        :return: The maximum interval (in seconds)
+        :rtype: float
+        """
+        return self.get_property(self.PROPERTY_MAXIMUM_SCHEDULER_POLL_INTERVAL,
+                                 self.PROPERTY_MAXIMUM_SCHEDULER_POLL_INTERVAL__DEFAULT)
+
+    def set_maximum_job_poll_interval(self, interval):
+        """
+        Set the maximum interval between subsequent requests to update the list of jobs currently running on this
+        computer. A value that is not larger than the minimum interval disables adaptive polling.
+
+        :param interval: The maximum interval in seconds
+        :type interval: float
+        """
+        self.set_property(self.PROPERTY_MAXIMUM_SCHEDULER_POLL_INTERVAL, interval)
+
+    def get_job_array_window(self):
+        """
+        Get the interval during which submissions of homogeneous jobs on this computer are collected to be submitted
+        together as a single job array. A value of zero disables the submission of job arrays.
+
+        :return: The interval (in seconds)
+        :rtype: float
+        """
+        return self.get_property(self.PROPERTY_JOB_ARRAY_WINDOW, self.PROPERTY_JOB_ARRAY_WINDOW__DEFAULT)
+
+    def set_job_array_window(self, interval):
+        """
+        Set the interval during which submissions of homogeneous jobs on this computer are collected to be submitted
+        together as a single job array. A value of zero disables the submission of job arrays.
+
+        :param interval: The interval in seconds
+        :type interval: float
+        """
+        self.set_property(self.PROPERTY_JOB_ARRAY_WINDOW, interval)
+
+    def get_job_array_maximum_size(self):
+        """
+        Get the maximum number of jobs that are submitted together in a single job array on this computer.
+
+        :return: The maximum number of tasks of a job array
+        :rtype: int
+        """
+        return self.get_property(self.PROPERTY_JOB_ARRAY_MAXIMUM_SIZE, self.PROPERTY_JOB_ARRAY_MAXIMUM_SIZE__DEFAULT)
+
+    def set_job_array_maximum_size(self, size):
+        """
+        Set the maximum number of jobs that are submitted together in a single job array on this computer.
+
+        :param size: The maximum number of tasks of a job array
+        :type size: int
+        """
+        self.set_property(self.PROPERTY_JOB_ARRAY_MAXIMUM_SIZE, size)
+
+    def get_job_bundle_window(self):
+        """
+        Get the interval during which submissions of homogeneous jobs on this computer are collected to be run
+        together inside a single scheduler allocation. A value of zero disables job bundling.
+        When enabled, job bundling takes precedence over the submission of job arrays.
+
+        :return: The interval (in seconds)
+        :rtype: float
+        """
+        return self.get_property(self.PROPERTY_JOB_BUNDLE_WINDOW, self.PROPERTY_JOB_BUNDLE_WINDOW__DEFAULT)
+
+    def set_job_bundle_window(self, interval):
+        """
+        Set the interval during which submissions of homogeneous jobs on this computer are collected to be run
+        together inside a single scheduler allocation. A value of zero disables job bundling.
+
+        :param interval: The interval in seconds
+        :type interval: float
+        """
+        self.set_property(self.PROPERTY_JOB_BUNDLE_WINDOW, interval)
+
+    def get_job_bundle_size(self):
+        """
+        Get the maximum number of jobs that are run together inside a single scheduler allocation on this computer.
+
+        :return: The maximum number of jobs of a bundle
+        :rtype: int
+        """
+        return self.get_property(self.PROPERTY_JOB_BUNDLE_SIZE, self.PROPERTY_JOB_BUNDLE_SIZE__DEFAULT)
+
+    def set_job_bundle_size(self, size):
+        """
+        Set the maximum number of jobs that are run together inside a single scheduler allocation on this computer.
+
+        :param size: The maximum number of jobs of a bundle
+        :type size: int
+        """
+        self.set_property(self.PROPERTY_JOB_BUNDLE_SIZE, size)
+
+    def get_job_bundle_parallel(self):
+        """
+        Get whether the jobs of a bundle on this computer run at the same time, rather than one after the other.
+
+        :rtype: bool
+        """
+        return self.get_property(self.PROPERTY_JOB_BUNDLE_PARALLEL, self.PROPERTY_JOB_BUNDLE_PARALLEL__DEFAULT)
+
+    def set_job_bundle_parallel(self, parallel):
+        """
+        Set whether the jobs of a bundle on this computer run at the same time, rather than one after the other.
+        Jobs that run at the same time request the resources of all jobs, jobs that run one after the other request
+        the wallclock time of all jobs.
+
+        :param parallel: True to run the jobs at the same time
+        :type parallel: bool
+        """
+        self.set_property(self.PROPERTY_JOB_BUNDLE_PARALLEL, parallel)
+
+    def get_maximum_queued_jobs(self):
+        """
+        Get the maximum number of calculation jobs of a user that the engine keeps with the scheduler of this computer
+        at the same time. Further calculation jobs wait for their submission until others have left the queue.
+        A value of zero means no limit.
+
+        :return: The maximum number of queued jobs
+        :rtype: int
+        """
+        return self.get_property(self.PROPERTY_MAXIMUM_QUEUED_JOBS, self.PROPERTY_MAXIMUM_QUEUED_JOBS__DEFAULT)
+
+    def set_maximum_queued_jobs(self, maximum):
+        """
+        Set the maximum number of calculation jobs of a user that the engine keeps with the scheduler of this computer
+        at the same time. A value of zero means no limit.
+
+        :param maximum: The maximum number of queued jobs
+        :type maximum: int
+        """
+        self.set_property(self.PROPERTY_MAXIMUM_QUEUED_JOBS, maximum)
+
+    def get_maximum_concurrent_transfers(self):
+        """
+        Get the maximum number of uploads and retrievals of calculation jobs that a daemon worker performs on this
+        computer at the same time. A value of zero means no limit.
+
+        :return: The maximum number of concurrent transfers
+        :rtype: int
+        """
+        return self.get_property(self.PROPERTY_MAXIMUM_CONCURRENT_TRANSFERS,
+                                 self.PROPERTY_MAXIMUM_CONCURRENT_TRANSFERS__DEFAULT)
+
+    def set_maximum_concurrent_transfers(self, maximum):
+        """
+        Set the maximum number of uploads and retrievals of calculation jobs that a daemon worker performs on this
+        computer at the same time. A value of zero means no limit.
+
+        :param maximum: The maximum number of concurrent transfers
+        :type maximum: int
+        """
+        self.set_property(self.PROPERTY_MAXIMUM_CONCURRENT_TRANSFERS, maximum)
+
+    def get_submission_rate(self):
+        """
+        Get the maximum rate at which a daemon worker submits calculation jobs to the scheduler of this computer.
+        A value of zero means no limit.
+
+        :return: The rate (in jobs per second)
+        :rtype: float
+        """
+        return self.get_property(self.PROPERTY_SUBMISSION_RATE, self.PROPERTY_SUBMISSION_RATE__DEFAULT)
+
+    def set_submission_rate(self, rate):
+        """
+        Set the maximum rate at which a daemon worker submits calculation jobs to the scheduler of this computer.
+        A value of zero means no limit.
+
+        :param rate: The rate in jobs per second
+        :type rate: float
+        """
+        self.set_property(self.PROPERTY_SUBMISSION_RATE, rate)
+
+    def get_submission_burst(self):
+        """
+        Get the number of calculation jobs that can be submitted at once to this computer before the submission rate
+        applies.
+
+        :return: The size of the burst
+        :rtype: int
+        """
+        return self.get_property(self.PROPERTY_SUBMISSION_BURST, self.PROPERTY_SUBMISSION_BURST__DEFAULT)
+
+    def set_submission_burst(self, burst):
+        """
+        Set the number of calculation jobs that can be submitted at once to this computer before the submission rate
+        applies.
+
+        :param burst: The size of the burst
+        :type burst: int
+        """
+        self.set_property(self.PROPERTY_SUBMISSION_BURST, burst)
+
     def get_transport_params(self):
         return self._backend_entity.get_transport_params()
 
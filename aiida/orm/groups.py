@@ -23,7 +23,7 @@ from . import convert
 from . import entities
 from . import users
 
-__all__ = ('Group', 'GroupTypeString')
+__all__ = ('Group', 'GroupNodeSet', 'GroupTypeString')
 
 
 class GroupTypeString(Enum):
@@ -322,6 +322,42 @@ class Group(entities.Entity):
 
         self._backend_entity.remove_nodes([node.backend_entity for node in nodes])
 
+    def union(self, *groups):
+        """
+        Return the nodes that are in this group or in any of the given groups.
+
+        The set operation is executed in the database when the result is used, see :class:`GroupNodeSet`.
+
+        :param groups: the other groups
+        :return: the lazy set of nodes
+        :rtype: :class:`aiida.orm.GroupNodeSet`
+        """
+        return GroupNodeSet('union', (self,) + groups, backend=self.backend)
+
+    def intersection(self, *groups):
+        """
+        Return the nodes that are in this group and in all of the given groups.
+
+        The set operation is executed in the database when the result is used, see :class:`GroupNodeSet`.
+
+        :param groups: the other groups
+        :return: the lazy set of nodes
+        :rtype: :class:`aiida.orm.GroupNodeSet`
+        """
+        return GroupNodeSet('intersection', (self,) + groups, backend=self.backend)
+
+    def difference(self, *groups):
+        """
+        Return the nodes that are in this group but in none of the given groups.
+
+        The set operation is executed in the database when the result is used, see :class:`GroupNodeSet`.
+
+        :param groups: the other groups
+        :return: the lazy set of nodes
+        :rtype: :class:`aiida.orm.GroupNodeSet`
+        """
+        return GroupNodeSet('difference', (self,) + groups, backend=self.backend)
+
     @classmethod
     def get(cls, **kwargs):
         """
@@ -478,3 +514,123 @@ class Group(entities.Entity):
                 "type": "unicode"
             }
         }
+
+
+class GroupNodeSet(object):
+    """
+    Lazy set of the nodes that result from a set operation on the nodes of groups.
+
+    The set operation is compiled to an SQL query on the table that relates groups and nodes, which is only executed
+    when the set is used: counting the nodes, iterating over them, or adding them to a group. The latter is done with a
+    single statement in the database, without transferring the pks of the nodes. When iterating, the nodes are loaded
+    in windows of `WINDOW_SIZE` nodes, ordered by their pk.
+    """
+
+    # pylint: disable=useless-object-inheritance
+
+    WINDOW_SIZE = 1000
+
+    def __init__(self, operation, groups, backend=None):
+        """
+        :param operation: the set operation, one of `union`, `intersection` or `difference`
+        :param groups: the groups on which to perform the set operation, for the `difference` the nodes of the first
+            group that are in none of the other groups
+        :param backend: the backend to use, by default the backend of the current profile
+        :raises ValueError: if the operation is unknown, no groups are given or one of the groups is not stored
+        """
+        self._backend = backend or get_manager().get_backend()
+
+        if operation not in self._backend.groups.SET_OPERATIONS:
+            raise ValueError('unknown set operation {}, valid operations are {}'.format(
+                operation, self._backend.groups.SET_OPERATIONS))
+
+        if not groups:
+            raise ValueError('at least one group is required for a set operation')
+
+        for group in groups:
+            type_check(group, Group)
+            if not group.is_stored:
+                raise ValueError('the group {} is not stored'.format(group))
+
+        self._operation = operation
+        self._groups = tuple(groups)
+
+    def __repr__(self):
+        return '<{}: {} of {}>'.format(self.__class__.__name__, self._operation,
+                                       ', '.join(str(group.pk) for group in self._groups))
+
+    @property
+    def operation(self):
+        """Return the set operation."""
+        return self._operation
+
+    @property
+    def groups(self):
+        """Return the groups on which the set operation is performed."""
+        return self._groups
+
+    @property
+    def _group_pks(self):
+        return [group.pk for group in self._groups]
+
+    def count(self):
+        """
+        Return the number of nodes in the set.
+
+        :return: the number of nodes
+        """
+        return self._backend.groups.count_set_operation(self._operation, self._group_pks)
+
+    def __len__(self):
+        return self.count()
+
+    def iter_pks(self):
+        """
+        Iterate over the pks of the nodes in the set, in ascending order.
+
+        :return: generator of the pks
+        """
+        last_pk = None
+
+        while True:
+            window = self._backend.groups.get_set_operation_pks(
+                self._operation, self._group_pks, after=last_pk, limit=self.WINDOW_SIZE)
+
+            for pk in window:
+                yield pk
+
+            if len(window) < self.WINDOW_SIZE:
+                break
+
+            last_pk = window[-1]
+
+    def __iter__(self):
+        """
+        Iterate over the nodes in the set, in ascending order of their pk.
+
+        :return: generator of the nodes
+        """
+        from aiida.common.utils import grouper
+        from .nodes import Node
+        from .querybuilder import QueryBuilder
+
+        for window in grouper(self.WINDOW_SIZE, self.iter_pks()):
+            builder = QueryBuilder(backend=self._backend)
+            builder.append(Node, filters={'id': {'in': list(window)}}, tag='node')
+            builder.order_by({'node': {'id': 'asc'}})
+
+            for node, in builder.all():
+                yield node
+
+    def add_to_group(self, group):
+        """
+        Add the nodes in the set to the given group, in a single statement in the database.
+
+        Nodes that are already in the group are skipped, the group may also be one of the groups of the set operation.
+
+        :param group: the stored group to which to add the nodes
+        """
+        if not group.is_stored:
+            raise exceptions.ModificationNotAllowed('cannot add nodes to an unstored group')
+
+        group.backend_entity.add_set_operation_nodes(self._operation, self._group_pks)
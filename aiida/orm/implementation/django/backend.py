@@ -110,6 +110,48 @@ class DjangoBackend(SqlBackend[models.Model]):
         finally:
             pass
 
+    def add_query_listener(self, listener):
+        """
+        Call the listener with the duration of every SQL statement that is executed by this interpreter.
+
+        Besides the SQLAlchemy engines used by the `QueryBuilder`, the cursors of the Django connections are wrapped,
+        both of the connections that exist and of those created later, e.g. by other threads.
+
+        :param listener: callable that takes the duration in seconds of the statement
+        """
+        # pylint: disable=import-error,no-name-in-module
+        import time
+        from django.db import connections
+        from django.db.backends import utils
+        from django.db.backends.signals import connection_created
+
+        super(DjangoBackend, self).add_query_listener(listener)
+
+        class TimedCursorWrapper(utils.CursorWrapper):
+            """Cursor wrapper that passes the duration of the executed statements to the listener."""
+
+            def execute(self, sql, params=None):
+                start = time.time()
+                try:
+                    return super(TimedCursorWrapper, self).execute(sql, params)
+                finally:
+                    listener(time.time() - start)
+
+            def executemany(self, sql, param_list):
+                start = time.time()
+                try:
+                    return super(TimedCursorWrapper, self).executemany(sql, param_list)
+                finally:
+                    listener(time.time() - start)
+
+        def wrap_connection(connection, **_):
+            connection.make_cursor = lambda cursor: TimedCursorWrapper(cursor, connection)
+
+        for connection in connections.all():
+            wrap_connection(connection)
+
+        connection_created.connect(wrap_connection, weak=False)
+
     def execute_raw(self, query):
         """Execute a raw SQL statement and return the result.
 
@@ -118,28 +118,48 @@ class DjangoGroup(entities.DjangoModelEntity[models.DbGroup], BackendGroup):  #
 
     @property
     def nodes(self):
-        """Get an iterator to the nodes in the group"""
+        """
+        Get an iterator to the nodes in the group.
+
+        The nodes are loaded from the database in windows ordered by their pk, with one query per window, such that
+        neither the nodes of a large group are loaded at once, nor a cursor has to be kept open while iterating.
+        """
 
         class NodesIterator(Iterator, Sized):
             """The nodes iterator"""
 
-            def __init__(self, dbnodes, backend):
+            def __init__(self, dbnodes, backend, window_size):
                 super(NodesIterator, self).__init__()
                 self._backend = backend
                 self._dbnodes = dbnodes
+                self._window_size = window_size
                 self.generator = self._genfunction()
 
             def _genfunction(self):
-                # Best to use dbnodes.iterator() so we load entities from the database as we need them
-                # see: http://blog.etianen.com/blog/2013/06/08/django-querysets/
-                for node in self._dbnodes.iterator():
-                    yield self._backend.get_backend_entity(node)
+                """Yield the nodes window by window, continuing after the last pk of the previous window."""
+                last_pk = None
+
+                while True:
+                    queryset = self._dbnodes.order_by('id')
+
+                    if last_pk is not None:
+                        queryset = queryset.filter(id__gt=last_pk)
+
+                    window = list(queryset[:self._window_size])
+
+                    for node in window:
+                        yield self._backend.get_backend_entity(node)
+
+                    if len(window) < self._window_size:
+                        break
+
+                    last_pk = window[-1].id
 
             def __iter__(self):
                 return self
 
             def __len__(self):
-                return len(self._dbnodes)
+                return self._dbnodes.count()
 
             def __getitem__(self, value):
                 if isinstance(value, slice):
@@ -154,9 +174,18 @@ class DjangoGroup(entities.DjangoModelEntity[models.DbGroup], BackendGroup):  #
             def next(self):
                 return next(self.generator)
 
-        return NodesIterator(self._dbmodel.dbnodes.all(), self._backend)
+        return NodesIterator(self._dbmodel.dbnodes.all(), self._backend, self.NODES_WINDOW_SIZE)
 
     def add_nodes(self, nodes, **kwargs):
+        """Add a node or a set of nodes to the group.
+
+        The nodes are added with a single set based `INSERT ... SELECT` statement per batch of nodes, that skips the
+        nodes that are already in the group.
+
+        :note: all the nodes *and* the group itself have to be stored.
+
+        :param nodes: a list of `BackendNode` instance to be added to this group
+        """
         from .nodes import DjangoNode
 
         super(DjangoGroup, self).add_nodes(nodes)
@@ -173,9 +202,21 @@ class DjangoGroup(entities.DjangoModelEntity[models.DbGroup], BackendGroup):  #
 
             node_pks.append(node.pk)
 
-        self._dbmodel.dbnodes.add(*node_pks)
+        sql = 'INSERT INTO {table} (dbgroup_id, dbnode_id) SELECT %s, id FROM {node_table} WHERE id = ANY(%s) ' \
+              'ON CONFLICT DO NOTHING'.format(table=self._get_nodes_table(), node_table=self._get_node_table())
+
+        self._execute_batches(sql, node_pks)
 
     def remove_nodes(self, nodes):
+        """Remove a node or a set of nodes from the group.
+
+        The nodes are removed with a single set based `DELETE` statement per batch of nodes, nodes that are not in the
+        group are ignored.
+
+        :note: all the nodes *and* the group itself have to be stored.
+
+        :param nodes: a list of `BackendNode` instance to be removed from this group
+        """
         from .nodes import DjangoNode
 
         super(DjangoGroup, self).remove_nodes(nodes)
@@ -192,7 +233,43 @@ class DjangoGroup(entities.DjangoModelEntity[models.DbGroup], BackendGroup):  #
 
             node_pks.append(node.pk)
 
-        self._dbmodel.dbnodes.remove(*node_pks)
+        sql = 'DELETE FROM {table} WHERE dbgroup_id = %s AND dbnode_id = ANY(%s)'.format(table=self._get_nodes_table())
+
+        self._execute_batches(sql, node_pks)
+
+    def _execute_statement(self, sql, parameters):
+        """Execute the given SQL statement that modifies the nodes of groups and commit it.
+
+        :param sql: the SQL statement with named parameters in the `pyformat` style
+        :param parameters: dictionary with the parameters of the SQL statement
+        """
+        with transaction.atomic():
+            with self._backend.get_connection().cursor() as cursor:
+                cursor.execute(sql, parameters)
+
+    @staticmethod
+    def _get_node_table():
+        """Return the name of the table of the nodes."""
+        return models.DbNode._meta.db_table  # pylint: disable=protected-access
+
+    @staticmethod
+    def _get_nodes_table():
+        """Return the name of the table of the many-to-many relationship between groups and nodes."""
+        return models.DbGroup.dbnodes.through._meta.db_table  # pylint: disable=protected-access
+
+    def _execute_batches(self, sql, node_pks):
+        """
+        Execute the given SQL statement for each batch of the given node pks in a single transaction.
+
+        :param sql: the SQL statement, with a parameter for the pk of the group and one for the list of node pks
+        :param node_pks: the list of node pks
+        """
+        from aiida.common.utils import grouper
+
+        with transaction.atomic():
+            with self._backend.get_connection().cursor() as cursor:
+                for batch in grouper(self.NODES_BATCH_SIZE, node_pks):
+                    cursor.execute(sql, [self.pk, list(batch)])
 
 
 class DjangoGroupCollection(BackendGroupCollection):
@@ -117,3 +117,20 @@ class DjangoLogCollection(BackendLogCollection):
             models.DbLog.objects.all().delete()
         else:
             raise NotImplementedError('Only deleting all by passing an empty filter dictionary is currently supported')
+
+    def bulk_create(self, entries):
+        """
+        Create and store multiple log entries at once, with a single multi-row insert
+
+        :param entries: list of dictionaries with the `time`, `loggername`, `levelname`, `dbnode_id`, `message` and
+            `metadata` of the log entries
+        """
+        models.DbLog.objects.bulk_create([
+            models.DbLog(
+                time=entry['time'],
+                loggername=entry['loggername'],
+                levelname=entry['levelname'],
+                dbnode_id=entry['dbnode_id'],
+                message=entry.get('message', ''),
+                metadata=json.dumps(entry['metadata']) if entry.get('metadata', None) else '{}') for entry in entries
+        ])
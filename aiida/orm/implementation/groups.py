@@ -29,6 +29,12 @@ class BackendGroup(backends.BackendEntity):
     An AiiDA ORM implementation of group of nodes.
     """
 
+    # Number of nodes that are added to or removed from the group with a single SQL statement
+    NODES_BATCH_SIZE = 10000
+
+    # Number of nodes that are loaded with a single query when iterating over the nodes of the group
+    NODES_WINDOW_SIZE = 1000
+
     @abc.abstractproperty
     def label(self):
         """
@@ -183,6 +189,33 @@ class BackendGroup(backends.BackendEntity):
         if any([not isinstance(node, BackendNode) for node in nodes]):
             raise TypeError('nodes have to be of type {}'.format(BackendNode))
 
+    def add_set_operation_nodes(self, operation, group_pks):
+        """Add the nodes that result from a set operation on groups to this group, without loading them.
+
+        :note: the group itself has to be stored.
+
+        :param operation: the set operation, one of `BackendGroupCollection.SET_OPERATIONS`
+        :param group_pks: list of the pks of the groups on which to perform the set operation
+        """
+        if not self.is_stored:
+            raise ValueError('group has to be stored before nodes can be added')
+
+        query, parameters = self._backend.groups.get_set_operation_sql(operation, group_pks)
+
+        sql = 'INSERT INTO {table} (dbgroup_id, dbnode_id) SELECT %(destination_group)s, dbnode_id FROM ({query}) ' \
+              'AS nodes ON CONFLICT DO NOTHING'.format(table=BackendGroupCollection.NODES_TABLE, query=query)
+        parameters['destination_group'] = self.pk
+
+        self._execute_statement(sql, parameters)
+
+    @abc.abstractmethod
+    def _execute_statement(self, sql, parameters):
+        """Execute the given SQL statement that modifies the nodes of groups and commit it.
+
+        :param sql: the SQL statement with named parameters in the `pyformat` style
+        :param parameters: dictionary with the parameters of the SQL statement
+        """
+
     def __repr__(self):
         return '<{}: {}>'.format(self.__class__.__name__, str(self))
 
@@ -199,6 +232,12 @@ class BackendGroupCollection(backends.BackendCollection[BackendGroup]):
 
     ENTITY_CLASS = BackendGroup
 
+    # The set operations on the nodes of groups that are executed in the database
+    SET_OPERATIONS = ('union', 'intersection', 'difference')
+
+    # The table of the many-to-many relationship between groups and nodes, which has the same name for all backends
+    NODES_TABLE = 'db_dbgroup_dbnodes'
+
     @abc.abstractmethod
     # pylint: disable=too-many-arguments
     def query(self,
@@ -264,6 +303,77 @@ class BackendGroupCollection(backends.BackendCollection[BackendGroup]):
             raise exceptions.NotExistent("No group bound matching criteria '{}'".format(filters))
         return results[0]
 
+    def get_set_operation_sql(self, operation, group_pks):
+        """
+        Return the SQL query that selects the pks of the nodes that result from a set operation on groups.
+
+        The `union` selects the nodes that are in any of the groups, the `intersection` those that are in all of the
+        groups and the `difference` those of the first group that are in none of the other groups.
+
+        :param operation: the set operation, one of `SET_OPERATIONS`
+        :param group_pks: list of the pks of the groups on which to perform the set operation
+        :return: tuple of the SQL query, which selects a single `dbnode_id` column, and the dictionary of its parameters
+        :raises ValueError: if the operation is unknown or no groups are given
+        """
+        if operation not in self.SET_OPERATIONS:
+            raise ValueError('unknown set operation {}, valid operations are {}'.format(operation, self.SET_OPERATIONS))
+
+        if not group_pks:
+            raise ValueError('at least one group is required for a set operation')
+
+        if operation == 'union':
+            sql = 'SELECT DISTINCT dbnode_id FROM {table} WHERE dbgroup_id = ANY(%(groups)s)'
+            parameters = {'groups': list(set(group_pks))}
+        elif operation == 'intersection':
+            # The relationship table has a unique constraint, so a node is in all groups if it occurs once for each
+            sql = 'SELECT dbnode_id FROM {table} WHERE dbgroup_id = ANY(%(groups)s) GROUP BY dbnode_id ' \
+                  'HAVING COUNT(*) = %(number_groups)s'
+            parameters = {'groups': list(set(group_pks)), 'number_groups': len(set(group_pks))}
+        else:
+            sql = 'SELECT included.dbnode_id FROM {table} AS included WHERE included.dbgroup_id = %(group)s ' \
+                  'AND NOT EXISTS (SELECT 1 FROM {table} AS excluded WHERE excluded.dbnode_id = included.dbnode_id ' \
+                  'AND excluded.dbgroup_id = ANY(%(other_groups)s))'
+            parameters = {'group': group_pks[0], 'other_groups': list(set(group_pks[1:]))}
+
+        return sql.format(table=self.NODES_TABLE), parameters
+
+    def count_set_operation(self, operation, group_pks):
+        """
+        Return the number of nodes that result from a set operation on groups.
+
+        :param operation: the set operation, one of `SET_OPERATIONS`
+        :param group_pks: list of the pks of the groups on which to perform the set operation
+        :return: the number of nodes
+        """
+        query, parameters = self.get_set_operation_sql(operation, group_pks)
+        sql = 'SELECT COUNT(*) FROM ({query}) AS nodes'.format(query=query)
+        return self.backend.execute_prepared_statement(sql, parameters)[0][0]
+
+    def get_set_operation_pks(self, operation, group_pks, after=None, limit=None):
+        """
+        Return the pks of the nodes that result from a set operation on groups, in ascending order.
+
+        :param operation: the set operation, one of `SET_OPERATIONS`
+        :param group_pks: list of the pks of the groups on which to perform the set operation
+        :param after: only return the pks that are larger than this pk
+        :param limit: return at most this number of pks
+        :return: list of the pks of the nodes
+        """
+        query, parameters = self.get_set_operation_sql(operation, group_pks)
+        sql = 'SELECT dbnode_id FROM ({query}) AS nodes'.format(query=query)
+
+        if after is not None:
+            sql += ' WHERE dbnode_id > %(after)s'
+            parameters['after'] = after
+
+        sql += ' ORDER BY dbnode_id'
+
+        if limit is not None:
+            sql += ' LIMIT %(limit)s'
+            parameters['limit'] = limit
+
+        return [row[0] for row in self.backend.execute_prepared_statement(sql, parameters)]
+
     @abc.abstractmethod
     def delete(self, id):  # pylint: disable=redefined-builtin, invalid-name
         """
@@ -109,3 +109,12 @@ class BackendLogCollection(backends.BackendCollection[BackendLog]):
         """
         Delete multiple log entries in the table
         """
+
+    @abc.abstractmethod
+    def bulk_create(self, entries):
+        """
+        Create and store multiple log entries at once, with a single multi-row insert
+
+        :param entries: list of dictionaries with the `time`, `loggername`, `levelname`, `dbnode_id`, `message` and
+            `metadata` of the log entries
+        """
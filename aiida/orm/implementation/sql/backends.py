@@ -63,6 +63,30 @@ class SqlBackend(typing.Generic[ModelType], backends.Backend):
         :return: the result of the query
         """
 
+    def add_query_listener(self, listener):
+        """
+        Call the listener with the duration of every SQL statement that is executed by this interpreter.
+
+        This implementation listens to all SQLAlchemy engines, which are also used by the `QueryBuilder` of backends
+        whose ORM is not SQLAlchemy. Such backends should extend it to listen to their own ORM.
+
+        :param listener: callable that takes the duration in seconds of the statement
+        """
+        import time
+        from sqlalchemy import event
+        from sqlalchemy.engine import Engine
+
+        def before_cursor_execute(conn, *_):
+            conn.info['query_start_time'] = time.time()
+
+        def after_cursor_execute(conn, *_):
+            start = conn.info.pop('query_start_time', None)
+            if start is not None:
+                listener(time.time() - start)
+
+        event.listen(Engine, 'before_cursor_execute', before_cursor_execute)
+        event.listen(Engine, 'after_cursor_execute', after_cursor_execute)
+
     def execute_prepared_statement(self, sql, parameters):
         """Execute an SQL statement with optional prepared statements.
 
@@ -135,20 +135,41 @@ class SqlaGroup(entities.SqlaModelEntity[DbGroup], BackendGroup):  # pylint: dis
 
     @property
     def nodes(self):
-        """Get an iterator to all the nodes in the group"""
+        """
+        Get an iterator to all the nodes in the group.
+
+        The nodes are loaded from the database in windows ordered by their pk, with one query per window, such that
+        neither the nodes of a large group are loaded at once, nor a cursor has to be kept open while iterating.
+        """
 
         class Iterator(object):  # pylint: disable=useless-object-inheritance
             """Nodes iterator"""
 
-            def __init__(self, dbnodes, backend):
+            def __init__(self, dbnodes, backend, window_size):
                 self._backend = backend
                 self._dbnodes = dbnodes
-                self._iter = dbnodes.__iter__()
+                self._window_size = window_size
                 self.generator = self._genfunction()
 
             def _genfunction(self):
-                for node in self._iter:
-                    yield self._backend.get_backend_entity(node)
+                """Yield the nodes window by window, continuing after the last pk of the previous window."""
+                last_pk = None
+
+                while True:
+                    query = self._dbnodes.order_by(DbNode.id)
+
+                    if last_pk is not None:
+                        query = query.filter(DbNode.id > last_pk)
+
+                    window = query.limit(self._window_size).all()
+
+                    for node in window:
+                        yield self._backend.get_backend_entity(node)
+
+                    if len(window) < self._window_size:
+                        break
+
+                    last_pk = window[-1].id
 
             def __iter__(self):
                 return self
@@ -169,83 +190,63 @@ class SqlaGroup(entities.SqlaModelEntity[DbGroup], BackendGroup):  # pylint: dis
             def next(self):
                 return next(self.generator)
 
-        return Iterator(self._dbmodel.dbnodes, self._backend)
+        return Iterator(self._dbmodel.dbnodes, self._backend, self.NODES_WINDOW_SIZE)
 
     def add_nodes(self, nodes, **kwargs):
         """Add a node or a set of nodes to the group.
 
+        The nodes are added with a single set based `INSERT ... SELECT` statement per batch of nodes, that skips the
+        nodes that are already in the group.
+
         :note: all the nodes *and* the group itself have to be stored.
 
         :param nodes: a list of `BackendNode` instance to be added to this group
 
         :param kwargs:
-            skip_orm: When the flag is on, the SQLA ORM is skipped and SQLA is used
-            to create a direct SQL INSERT statement to the group-node relationship
-            table (to improve speed).
+            skip_orm: ignored, the SQLA ORM is always skipped and SQLA is used to create direct SQL statements on the
+            group-node relationship table. The flag is only accepted for backwards compatibility.
         """
-        from sqlalchemy.exc import IntegrityError  # pylint: disable=import-error, no-name-in-module
+        # pylint: disable=unused-argument
+        from sqlalchemy import literal, select  # pylint: disable=import-error, no-name-in-module
         from sqlalchemy.dialects.postgresql import insert  # pylint: disable=import-error, no-name-in-module
+        from aiida.common.utils import grouper
         from aiida.orm.implementation.sqlalchemy.nodes import SqlaNode
         from aiida.backends.sqlalchemy import get_scoped_session
-        from aiida.backends.sqlalchemy.models.base import Base
 
         super(SqlaGroup, self).add_nodes(nodes)
-        skip_orm = kwargs.get('skip_orm', False)
 
-        def check_node(given_node):
-            """ Check if given node is of correct type and stored """
-            if not isinstance(given_node, SqlaNode):
-                raise TypeError('invalid type {}, has to be {}'.format(type(given_node), SqlaNode))
+        for node in nodes:
+            if not isinstance(node, SqlaNode):
+                raise TypeError('invalid type {}, has to be {}'.format(type(node), SqlaNode))
 
-            if not given_node.is_stored:
+            if not node.is_stored:
                 raise ValueError('At least one of the provided nodes is unstored, stopping...')
 
         with utils.disable_expire_on_commit(get_scoped_session()) as session:
-            if not skip_orm:
-                # Get dbnodes here ONCE, otherwise each call to dbnodes will re-read the current value in the database
-                dbnodes = self._dbmodel.dbnodes
-
-                for node in nodes:
-                    check_node(node)
-
-                    # Use pattern as suggested here:
-                    # http://docs.sqlalchemy.org/en/latest/orm/session_transaction.html#using-savepoint
-                    try:
-                        with session.begin_nested():
-                            dbnodes.append(node.dbmodel)
-                            session.flush()
-                    except IntegrityError:
-                        # Duplicate entry, skip
-                        pass
-            else:
-                ins_dict = list()
-                for node in nodes:
-                    check_node(node)
-                    ins_dict.append({'dbnode_id': node.id, 'dbgroup_id': self.id})
-
-                my_table = Base.metadata.tables['db_dbgroup_dbnodes']
-                ins = insert(my_table).values(ins_dict)
-                session.execute(ins.on_conflict_do_nothing(index_elements=['dbnode_id', 'dbgroup_id']))
+            for batch in grouper(self.NODES_BATCH_SIZE, [node.id for node in nodes]):
+                selection = select([literal(self.id), DbNode.id]).where(DbNode.id.in_(batch))
+                statement = insert(table_groups_nodes).from_select(['dbgroup_id', 'dbnode_id'], selection)
+                session.execute(statement.on_conflict_do_nothing(index_elements=['dbnode_id', 'dbgroup_id']))
 
-            # Commit everything as up till now we've just flushed
             session.commit()
 
     def remove_nodes(self, nodes):
         """Remove a node or a set of nodes from the group.
 
+        The nodes are removed with a single set based `DELETE` statement per batch of nodes, nodes that are not in the
+        group are ignored.
+
         :note: all the nodes *and* the group itself have to be stored.
 
         :param nodes: a list of `BackendNode` instance to be added to this group
         """
+        from sqlalchemy import and_  # pylint: disable=import-error, no-name-in-module
+        from aiida.common.utils import grouper
         from aiida.orm.implementation.sqlalchemy.nodes import SqlaNode
+        from aiida.backends.sqlalchemy import get_scoped_session
 
         super(SqlaGroup, self).remove_nodes(nodes)
 
-        # Get dbnodes here ONCE, otherwise each call to dbnodes will re-read the current value in the database
-        dbnodes = self._dbmodel.dbnodes
-
-        list_nodes = []
-
         for node in nodes:
             if not isinstance(node, SqlaNode):
                 raise TypeError('invalid type {}, has to be {}'.format(type(node), SqlaNode))
@@ -253,14 +254,33 @@ class SqlaGroup(entities.SqlaModelEntity[DbGroup], BackendGroup):  # pylint: dis
             if node.id is None:
                 raise ValueError('At least one of the provided nodes is unstored, stopping...')
 
-            # If we don't check first, SqlA might issue a DELETE statement for an unexisting key, resulting in an error
-            if node.dbmodel in dbnodes:
-                list_nodes.append(node.dbmodel)
+        with utils.disable_expire_on_commit(get_scoped_session()) as session:
+            for batch in grouper(self.NODES_BATCH_SIZE, [node.id for node in nodes]):
+                statement = table_groups_nodes.delete().where(
+                    and_(table_groups_nodes.c.dbgroup_id == self.id, table_groups_nodes.c.dbnode_id.in_(batch)))
+                session.execute(statement)
+
+            session.commit()
+
+    def _execute_statement(self, sql, parameters):
+        """Execute the given SQL statement that modifies the nodes of groups and commit it.
 
-        for node in list_nodes:
-            dbnodes.remove(node)
+        The statement is executed with a cursor of the connection of the session, such that it is part of its
+        transaction.
 
-        sa.get_scoped_session().commit()
+        :param sql: the SQL statement with named parameters in the `pyformat` style
+        :param parameters: dictionary with the parameters of the SQL statement
+        """
+        from aiida.backends.sqlalchemy import get_scoped_session
+
+        with utils.disable_expire_on_commit(get_scoped_session()) as session:
+            cursor = session.connection().connection.cursor()
+            try:
+                cursor.execute(sql, parameters)
+            finally:
+                cursor.close()
+
+            session.commit()
 
 
 class SqlaGroupCollection(BackendGroupCollection):
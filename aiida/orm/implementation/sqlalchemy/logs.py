@@ -119,3 +119,21 @@ class SqlaLogCollection(BackendLogCollection):
             get_scoped_session().commit()
         else:
             raise NotImplementedError('Only deleting all by passing an empty filter dictionary is currently supported')
+
+    def bulk_create(self, entries):
+        """
+        Create and store multiple log entries at once, with a single multi-row insert
+
+        :param entries: list of dictionaries with the `time`, `loggername`, `levelname`, `dbnode_id`, `message` and
+            `metadata` of the log entries
+        """
+        session = get_scoped_session()
+        session.bulk_insert_mappings(models.DbLog, [{
+            'time': entry['time'],
+            'loggername': entry['loggername'],
+            'levelname': entry['levelname'],
+            'dbnode_id': entry['dbnode_id'],
+            'message': entry.get('message', None),
+            '_metadata': entry.get('metadata', None) or {},
+        } for entry in entries])
+        session.commit()
@@ -22,10 +22,55 @@ ASCENDING = 'asc'
 DESCENDING = 'desc'
 
 
+# The attributes of log records that are not included in the metadata of the log entries, either because they are
+# stored in a dedicated column, or because they can be derived from other attributes or are of no use afterwards
+RECORD_ATTRIBUTES_EXCLUDED_FROM_METADATA = frozenset([
+    'args', 'backend', 'created', 'dbnode_id', 'exc_info', 'filename', 'levelname', 'levelno', 'message', 'module',
+    'msecs', 'msg', 'name', 'processName', 'relativeCreated', 'stack_info', 'thread', 'threadName'
+])
+
+
 def OrderSpecifier(field, direction):  # pylint: disable=invalid-name
     return {field: direction}
 
 
+def get_entry_fields_from_record(record):
+    """
+    Return the fields of the log entry for a record created by the python logging library.
+
+    The metadata of the entry contains the attributes of the record, except for those that are stored in the other
+    fields of the entry or that are not informative, see `RECORD_ATTRIBUTES_EXCLUDED_FROM_METADATA`. Attributes
+    without a value are omitted as well. The traceback of an exception is contained in the `exc_text` attribute,
+    provided that the record has been formatted by a handler.
+
+    :param record: The record created by the logging module
+    :type record: :class:`logging.record`
+    :return: dictionary with the fields that can be passed to the `Log` constructor, or None if the record is not
+        attached to a node
+    """
+    from datetime import datetime
+
+    dbnode_id = record.__dict__.get('dbnode_id', None)
+
+    if dbnode_id is None:
+        return None
+
+    metadata = {
+        key: value
+        for key, value in record.__dict__.items()
+        if key not in RECORD_ATTRIBUTES_EXCLUDED_FROM_METADATA and value is not None
+    }
+
+    return {
+        'time': timezone.make_aware(datetime.fromtimestamp(record.created)),
+        'loggername': record.name,
+        'levelname': record.levelname,
+        'dbnode_id': dbnode_id,
+        'message': record.getMessage(),
+        'metadata': metadata,
+    }
+
+
 class Log(entities.Entity):
     """
     An AiiDA Log entity.  Corresponds to a logged message against a particular AiiDA node.
@@ -47,28 +92,23 @@ class Log(entities.Entity):
             :return: An object implementing the log entry interface
             :rtype: :class:`aiida.orm.logs.Log`
             """
-            from datetime import datetime
-
-            dbnode_id = record.__dict__.get('dbnode_id', None)
+            fields = get_entry_fields_from_record(record)
 
             # Do not store if dbnode_id is not set
-            if dbnode_id is None:
+            if fields is None:
                 return None
 
-            metadata = dict(record.__dict__)
+            return Log(**fields)
 
-            # Stringify the content of `exc_info` and `args` if they exist in the metadata to ensure serializability
-            for key in ['exc_info', 'args']:
-                if key in metadata:
-                    metadata[key] = str(metadata[key])
+        def create_entries(self, entries):
+            """
+            Create and store multiple log entries at once, with a single multi-row insert
 
-            return Log(
-                time=timezone.make_aware(datetime.fromtimestamp(record.created)),
-                loggername=record.name,
-                levelname=record.levelname,
-                dbnode_id=dbnode_id,
-                message=record.getMessage(),
-                metadata=metadata)
+            :param entries: list of dictionaries with the fields of the log entries, as returned by
+                :func:`aiida.orm.logs.get_entry_fields_from_record`
+            """
+            if entries:
+                self._backend.logs.bulk_create(entries)
 
         def get_logs_for(self, entity, order_by=None):
             """
@@ -667,6 +667,16 @@ class Node(Entity):
         """
         return self._repository.open(key, mode)
 
+    def get_object_path(self, key):
+        """Return the absolute path of the object identified by key on this file system.
+
+        .. warning:: The object must only be read through this path, it must not be modified, moved or hard linked.
+
+        :param key: fully qualified identifier for the object within the repository
+        :return: the absolute path of the object
+        """
+        return self._repository.get_object_path(key)
+
     def get_object(self, key):
         """Return the object identified by key.
 
@@ -14,7 +14,7 @@ from __future__ import absolute_import
 
 import six
 
-__all__ = ('load_code', 'load_computer', 'load_group', 'load_node')
+__all__ = ('load_code', 'load_computer', 'load_group', 'load_node', 'load_nodes')
 
 
 def load_entity(entity_loader=None,
@@ -207,3 +207,25 @@ def load_node(identifier=None, pk=None, uuid=None, label=None, sub_classes=None,
         label=label,
         sub_classes=sub_classes,
         query_with_dashes=query_with_dashes)
+
+
+def load_nodes(identifiers, sub_classes=None, query_with_dashes=True):
+    """
+    Load the nodes for a list of identifiers, which can be a mix of pks, uuids and labels, the type of each of which is
+    inferred in the same way as for `load_node`.
+
+    Rather than querying for each identifier separately, the nodes are loaded with a single query per type of
+    identifier. If an identity map is active, see :py:mod:`aiida.orm.utils.identity_map`, nodes that were loaded before
+    in the same session are taken from the map instead of the database.
+
+    :param identifiers: an iterable of pks (integer), uuids (string) or labels (string) of nodes
+    :param sub_classes: an optional tuple of orm classes to narrow the queryset. Each class should be a strict sub class
+        of the ORM class of the given entity loader.
+    :param bool query_with_dashes: allow to query for a uuid with dashes
+    :returns: list of the node instances in the order of the identifiers
+    :raise ValueError: if any of the identifiers is invalid
+    :raise aiida.common.NotExistent: if no matching Node is found for any of the identifiers
+    :raise aiida.common.MultipleObjectsError: if more than one Node was found for any of the identifiers
+    """
+    from aiida.orm.utils.loaders import NodeEntityLoader
+    return NodeEntityLoader.load_entities(identifiers, sub_classes=sub_classes, query_with_dashes=query_with_dashes)
@@ -14,7 +14,7 @@ from __future__ import print_function
 from __future__ import absolute_import
 from aiida.common import exceptions
 
-__all__ = ('CalcJobResultManager',)
+__all__ = ('CalcJobResultManager', 'get_calcjob_state_counts')
 
 
 class CalcJobResultManager(object):  # pylint: disable=useless-object-inheritance
@@ -114,3 +114,41 @@ class CalcJobResultManager(object):  # pylint: disable=useless-object-inheritanc
             return self.get_results()[name]
         except AttributeError:
             raise AttributeError("Default result node<{}> does not contain key '{}'".format(self._result_node.pk, name))
+
+
+def get_calcjob_state_counts(computer, user=None, states=None):
+    """Return the number of active calculation jobs on a computer for each of the calculation job states.
+
+    Only calculation jobs whose process is still active, i.e. created, waiting or running, are counted. The counting
+    is done by the database, with one count query per requested state.
+
+    :param computer: the computer for which to count the calculation jobs
+    :param user: optional user to restrict the count to the calculation jobs of that user
+    :param states: optional list of `CalcJobState` to count, by default all states are counted
+    :return: dictionary with the `CalcJobState` values as keys and the number of calculation jobs as values
+    """
+    from aiida.common.datastructures import CalcJobState
+    from aiida.orm import CalcJobNode, Computer, QueryBuilder
+
+    if states is None:
+        states = list(CalcJobState)
+
+    counts = {}
+
+    for state in states:
+        filters = {
+            'attributes.process_state': {
+                'in': ['created', 'waiting', 'running']
+            },
+            'attributes.state': state.value,
+        }
+
+        if user is not None:
+            filters['user_id'] = user.id
+
+        builder = QueryBuilder()
+        builder.append(Computer, filters={'id': computer.id}, tag='computer')
+        builder.append(CalcJobNode, with_computer='computer', filters=filters)
+        counts[state.value] = builder.count()
+
+    return counts
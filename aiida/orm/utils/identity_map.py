@@ -0,0 +1,194 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida_core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""
+Identity map of the nodes that were loaded from the database.
+
+When an identity map is active in a thread, the entity loaders, and therefore `load_node` and `load_nodes`, first look
+up nodes that are identified by their pk or full UUID in the map and only query the database for those that are not
+in it. Every node that they load from the database is added to the map, such that loading the same node again returns
+the same instance without a query.
+
+The map holds weak references to all the nodes that it knows about, such that a node remains in the map as long as
+it is in use elsewhere, and strong references to the most recently added nodes, up to a maximum number, such that
+these remain in the map even if nobody else holds on to them.
+
+The map does not notice changes that other interpreters make to the nodes in the database, which is why it is not
+active by default. It should be activated for short sessions, like the preparation of a calculation or the handling of
+a single REST request, with the `identity_map` context manager::
+
+    with identity_map():
+        node = load_node(pk)
+        assert load_node(pk) is node
+
+The map is local to the thread that activates it. A session must therefore not span a point where an event loop can
+switch to another task, for example a `yield` in a coroutine.
+"""
+from __future__ import division
+from __future__ import print_function
+from __future__ import absolute_import
+
+import collections
+import contextlib
+import threading
+import weakref
+
+__all__ = ('NodeIdentityMap', 'get_identity_map', 'identity_map', 'start_identity_map', 'stop_identity_map')
+
+DEFAULT_MAXSIZE = 1000
+
+_LOCAL = threading.local()
+
+
+class NodeIdentityMap(object):
+    """
+    Map of the pks and UUIDs of stored nodes onto the node instances that were loaded for them.
+    """
+
+    # pylint: disable=useless-object-inheritance
+
+    def __init__(self, maxsize=DEFAULT_MAXSIZE):
+        """
+        :param maxsize: the maximum number of nodes to which the map holds a strong reference
+        """
+        super(NodeIdentityMap, self).__init__()
+        self._maxsize = max(maxsize, 0)
+        self._lock = threading.Lock()
+        self._by_pk = weakref.WeakValueDictionary()
+        self._by_uuid = weakref.WeakValueDictionary()
+        self._recent = collections.OrderedDict()
+
+    @property
+    def maxsize(self):
+        """Return the maximum number of nodes to which the map holds a strong reference."""
+        return self._maxsize
+
+    def __len__(self):
+        """Return the number of nodes in the map."""
+        return len(self._by_pk)
+
+    def get(self, pk=None, uuid=None):
+        """
+        Return the node with the given pk or UUID if it is in the map.
+
+        :param pk: the pk of the node
+        :param uuid: the full UUID of the node
+        :return: the node or None if it is not in the map
+        """
+        with self._lock:
+            if pk is not None:
+                node = self._by_pk.get(pk, None)
+            elif uuid is not None:
+                node = self._by_uuid.get(str(uuid), None)
+            else:
+                node = None
+
+            if node is not None and node.pk in self._recent:
+                self._recent.pop(node.pk)
+                self._recent[node.pk] = node
+
+        return node
+
+    def add(self, node):
+        """
+        Add a stored node to the map, replacing any other instance for the same node.
+
+        :param node: the node
+        :return: the node
+        """
+        if not node.is_stored:
+            raise ValueError('only stored nodes can be added to the identity map')
+
+        with self._lock:
+            self._by_pk[node.pk] = node
+            self._by_uuid[str(node.uuid)] = node
+
+            if self._maxsize:
+                self._recent.pop(node.pk, None)
+                self._recent[node.pk] = node
+
+                while len(self._recent) > self._maxsize:
+                    self._recent.popitem(last=False)
+
+        return node
+
+    def remove(self, node):
+        """
+        Remove a node from the map, if it is in it.
+
+        :param node: the node
+        """
+        with self._lock:
+            self._by_pk.pop(node.pk, None)
+            self._by_uuid.pop(str(node.uuid), None)
+            self._recent.pop(node.pk, None)
+
+    def clear(self):
+        """Remove all nodes from the map."""
+        with self._lock:
+            self._by_pk.clear()
+            self._by_uuid.clear()
+            self._recent.clear()
+
+
+def get_identity_map():
+    """
+    Return the identity map that is active in the current thread.
+
+    :return: the identity map or None if no identity map is active
+    :rtype: :class:`aiida.orm.utils.identity_map.NodeIdentityMap`
+    """
+    return getattr(_LOCAL, 'identity_map', None)
+
+
+def start_identity_map(maxsize=DEFAULT_MAXSIZE):
+    """
+    Activate an identity map in the current thread, if none is active yet.
+
+    Each call has to be matched by a call to `stop_identity_map`, the map is deactivated by the outermost one.
+
+    :param maxsize: the maximum number of nodes to which a new map holds a strong reference
+    :return: the active identity map
+    """
+    if get_identity_map() is None:
+        _LOCAL.identity_map = NodeIdentityMap(maxsize)
+        _LOCAL.depth = 0
+
+    _LOCAL.depth += 1
+
+    return _LOCAL.identity_map
+
+
+def stop_identity_map():
+    """
+    Deactivate the identity map of the current thread, if this call matches the outermost call to `start_identity_map`.
+    """
+    if get_identity_map() is None:
+        return
+
+    _LOCAL.depth -= 1
+
+    if _LOCAL.depth <= 0:
+        _LOCAL.identity_map = None
+
+
+@contextlib.contextmanager
+def identity_map(maxsize=DEFAULT_MAXSIZE):
+    """
+    Context manager that activates an identity map in the current thread for the duration of the context.
+
+    If an identity map is already active, for example when the context is nested, the active map is used.
+
+    :param maxsize: the maximum number of nodes to which a new map holds a strong reference
+    :return: the active identity map
+    """
+    try:
+        yield start_identity_map(maxsize)
+    finally:
+        stop_identity_map()
@@ -12,6 +12,7 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import absolute_import
 
+import collections
 from abc import ABCMeta
 from enum import Enum
 
@@ -121,6 +122,47 @@ class OrmEntityLoader(object):
         :param classes: a tuple of orm classes to which the identifier should be mapped
         :returns: the query builder instance
         """
+        uuid, is_full = cls._normalize_uuid_identifier(identifier, query_with_dashes)
+
+        builder = QueryBuilder()
+        builder.append(cls=classes, tag='entity', project=['*'])
+
+        # If a UUID can be constructed from the identifier, it is a full UUID and the query can use an equality operator
+        if is_full:
+            builder.add_filter('entity', {'uuid': uuid})
+        else:
+            builder.add_filter('entity', {'uuid': {'like': '{}%'.format(uuid)}})
+
+        return builder
+
+    @classmethod
+    def _get_query_builder_label_identifiers(cls, identifiers, classes):
+        """
+        Return the query builder instance that attempts to map each of the identifiers onto an entity of the orm class,
+        defined for this loader class, interpreting the identifiers as LABEL like identifiers
+
+        The entities are mapped back onto the identifiers through their `label` property. Loaders for which a LABEL
+        identifier does not simply correspond to that property should return None, in which case each of the
+        identifiers is loaded with a separate query.
+
+        :param identifiers: the LABEL identifiers
+        :param classes: a tuple of orm classes to which the identifiers should be mapped
+        :returns: the query builder instance or None if the identifiers cannot be loaded with a single query
+        """
+        builder = QueryBuilder()
+        builder.append(cls=classes, tag='entity', project=['*'], filters={'label': {'in': list(identifiers)}})
+
+        return builder
+
+    @staticmethod
+    def _normalize_uuid_identifier(identifier, query_with_dashes):
+        """
+        Return the UUID identifier in the format in which it is queried and whether it is a full UUID.
+
+        :param identifier: the UUID identifier
+        :param query_with_dashes: whether the dashes should be inserted in the identifier
+        :returns: tuple of the normalized identifier and a boolean that is True if it is a full UUID
+        """
         from uuid import UUID
 
         uuid = identifier.replace('-', '')
@@ -130,18 +172,12 @@ class OrmEntityLoader(object):
                 if len(uuid) > dash_pos:
                     uuid = '{}-{}'.format(uuid[:dash_pos], uuid[dash_pos:])
 
-        builder = QueryBuilder()
-        builder.append(cls=classes, tag='entity', project=['*'])
-
-        # If a UUID can be constructed from the identifier, it is a full UUID and the query can use an equality operator
         try:
             UUID(uuid)
         except ValueError:
-            builder.add_filter('entity', {'uuid': {'like': '{}%'.format(uuid)}})
-        else:
-            builder.add_filter('entity', {'uuid': uuid})
+            return uuid, False
 
-        return builder
+        return uuid, True
 
     @classmethod
     def get_query_builder(cls, identifier, identifier_type=None, sub_classes=None, query_with_dashes=True):
@@ -188,6 +224,19 @@ class OrmEntityLoader(object):
         :raises aiida.common.MultipleObjectsError: if the identifier maps onto multiple entities
         :raises aiida.common.NotExistent: if the identifier maps onto not a single entity
         """
+        identity_map = cls._get_identity_map()
+
+        if identity_map is not None:
+            classes = cls.get_query_classes(sub_classes)
+
+            if identifier_type is None:
+                identifier, identifier_type = cls.infer_identifier_type(identifier)
+
+            entity = cls._get_from_identity_map(identity_map, identifier, identifier_type, classes, query_with_dashes)
+
+            if entity is not None:
+                return entity
+
         builder, query_parameters = cls.get_query_builder(identifier, identifier_type, sub_classes, query_with_dashes)
         builder.limit(2)
 
@@ -204,6 +253,179 @@ class OrmEntityLoader(object):
             error = 'no {} found with {}<{}>: {}'.format(classes, identifier_type, identifier, exception)
             raise NotExistent(error)
 
+        if identity_map is not None:
+            identity_map.add(entity)
+
+        return entity
+
+    @classmethod
+    def load_entities(cls, identifiers, identifier_type=None, sub_classes=None, query_with_dashes=True):
+        """
+        Load the entities that uniquely correspond to each of the provided identifiers.
+
+        The identifiers can be a mix of ID, UUID and LABEL identifiers, the type of each is inferred unless the
+        identifier type is defined. The entities are loaded with a single query per identifier type: all IDs, all full
+        UUIDs and all LABEL identifiers are each resolved by one query. Partial UUIDs are resolved with a query each,
+        since a short prefix can match a large number of entities. Identifiers of entities that are already in the
+        active identity map, if any, are not queried at all.
+
+        :param identifiers: an iterable of identifiers
+        :param identifier_type: the type of the identifiers, by default inferred for each identifier
+        :param sub_classes: an optional tuple of orm classes, that should each be strict sub classes of the
+            base orm class of the loader, that will narrow the queryset
+        :returns: list with the loaded entities in the order of the identifiers
+        :raises aiida.common.MultipleObjectsError: if any identifier maps onto multiple entities
+        :raises aiida.common.NotExistent: if any identifier maps onto not a single entity
+        """
+        classes = cls.get_query_classes(sub_classes)
+        class_names = ' or '.join([sub_class.__name__ for sub_class in classes])
+        identity_map = cls._get_identity_map()
+
+        keys = []
+
+        for identifier in identifiers:
+            if identifier_type is None:
+                identifier, id_type = cls.infer_identifier_type(identifier)
+            else:
+                id_type = identifier_type
+            keys.append(cls._get_identifier_key(identifier, id_type, query_with_dashes))
+
+        # The entities that were resolved and the identifiers that still have to be queried, per identifier type
+        resolved = {}
+        pending = {IdentifierType.ID: set(), IdentifierType.UUID: set(), IdentifierType.LABEL: set()}
+
+        for key in keys:
+            id_type, identifier, is_partial = key
+
+            if key in resolved:
+                continue
+
+            if is_partial:
+                resolved[key] = cls.load_entity(identifier, id_type, sub_classes, query_with_dashes)
+                continue
+
+            if identity_map is not None:
+                entity = cls._get_from_identity_map(identity_map, identifier, id_type, classes, query_with_dashes)
+                if entity is not None:
+                    resolved[key] = entity
+                    continue
+
+            pending[id_type].add(identifier)
+
+        matches = collections.defaultdict(list)
+
+        if pending[IdentifierType.ID]:
+            builder = QueryBuilder()
+            builder.append(
+                cls=classes, tag='entity', project=['*'], filters={'id': {'in': list(pending[IdentifierType.ID])}})
+            for [entity] in builder.iterall():
+                matches[(IdentifierType.ID, entity.pk)].append(entity)
+
+        if pending[IdentifierType.UUID]:
+            builder = QueryBuilder()
+            builder.append(
+                cls=classes, tag='entity', project=['*'], filters={'uuid': {'in': list(pending[IdentifierType.UUID])}})
+            for [entity] in builder.iterall():
+                matches[(IdentifierType.UUID, str(entity.uuid))].append(entity)
+
+        if pending[IdentifierType.LABEL]:
+            builder = cls._get_query_builder_label_identifiers(pending[IdentifierType.LABEL], classes)
+            if builder is None:
+                for identifier in pending[IdentifierType.LABEL]:
+                    matches[(IdentifierType.LABEL, identifier)].append(
+                        cls.load_entity(identifier, IdentifierType.LABEL, sub_classes, query_with_dashes))
+            else:
+                for [entity] in builder.iterall():
+                    matches[(IdentifierType.LABEL, entity.label)].append(entity)
+
+        for id_type, identifiers_of_type in pending.items():
+            for identifier in identifiers_of_type:
+                entities = matches.get((id_type, identifier), [])
+
+                if not entities:
+                    error = 'no {} found with {}<{}>'.format(class_names, id_type.value, identifier)
+                    raise NotExistent(error)
+
+                if len(entities) > 1:
+                    error = 'multiple {} entries found with {}<{}>'.format(class_names, id_type.value, identifier)
+                    raise MultipleObjectsError(error)
+
+                if identity_map is not None:
+                    identity_map.add(entities[0])
+
+                resolved[(id_type, identifier, False)] = entities[0]
+
+        return [resolved[key] for key in keys]
+
+    @classmethod
+    def _get_identifier_key(cls, identifier, identifier_type, query_with_dashes):
+        """
+        Return the key under which an identifier is resolved by `load_entities`.
+
+        IDs are cast to integers and full UUIDs are written in their canonical form, such that they can be compared
+        with the `pk` and `uuid` of the loaded entities.
+
+        :param identifier: the identifier
+        :param identifier_type: the type of the identifier
+        :param query_with_dashes: whether the dashes should be inserted in a UUID identifier
+        :returns: tuple of the identifier type, the identifier and a boolean that is True for a partial UUID
+        :raises ValueError: if an ID identifier cannot be cast to an integer
+        """
+        from uuid import UUID
+
+        if identifier_type == IdentifierType.ID:
+            return identifier_type, int(identifier), False
+
+        if identifier_type == IdentifierType.UUID:
+            uuid, is_full = cls._normalize_uuid_identifier(identifier, query_with_dashes)
+            if is_full:
+                return identifier_type, str(UUID(uuid)), False
+            return identifier_type, uuid, True
+
+        return identifier_type, identifier, False
+
+    @classmethod
+    def _get_identity_map(cls):
+        """
+        Return the identity map that is active in the current thread, if the entities of this loader are nodes.
+
+        :returns: the identity map or None
+        """
+        from aiida.orm import Node
+        from aiida.orm.utils.identity_map import get_identity_map
+
+        if not issubclass(cls.orm_base_class, Node):
+            return None
+
+        return get_identity_map()
+
+    @classmethod
+    def _get_from_identity_map(cls, identity_map, identifier, identifier_type, classes, query_with_dashes):
+        """
+        Return the entity for the ID or full UUID identifier from the identity map, if it is in it.
+
+        :param identity_map: the identity map
+        :param identifier: the identifier
+        :param identifier_type: the type of the identifier
+        :param classes: a tuple of orm classes of which the entity should be an instance
+        :param query_with_dashes: whether the dashes should be inserted in a UUID identifier
+        :returns: the entity or None if it is not in the identity map
+        """
+        entity = None
+
+        if identifier_type == IdentifierType.ID:
+            try:
+                entity = identity_map.get(pk=int(identifier))
+            except ValueError:
+                return None
+        elif identifier_type == IdentifierType.UUID:
+            _, uuid, is_partial = cls._get_identifier_key(identifier, identifier_type, query_with_dashes)
+            if not is_partial:
+                entity = identity_map.get(uuid=uuid)
+
+        if entity is not None and not isinstance(entity, classes):
+            return None
+
         return entity
 
     @classmethod
@@ -434,6 +656,18 @@ class CodeEntityLoader(OrmEntityLoader):
 
         return builder
 
+    @classmethod
+    def _get_query_builder_label_identifiers(cls, identifiers, classes):  # pylint: disable=unused-argument
+        """
+        Return None, since the LABEL identifier of a Code can include the name of its computer as in `label@computer`
+        and therefore each of the identifiers has to be loaded with a separate query.
+
+        :param identifiers: the LABEL identifiers
+        :param classes: a tuple of orm classes to which the identifiers should be mapped
+        :returns: None
+        """
+        return None
+
 
 class ComputerEntityLoader(OrmEntityLoader):
     """Loader for the `Computer` entity and sub classes."""
@@ -467,6 +701,18 @@ class ComputerEntityLoader(OrmEntityLoader):
 
         return builder
 
+    @classmethod
+    def _get_query_builder_label_identifiers(cls, identifiers, classes):  # pylint: disable=unused-argument
+        """
+        Return None, since the LABEL identifier of a Computer is matched with its name and therefore each of the
+        identifiers is loaded with a separate query.
+
+        :param identifiers: the LABEL identifiers
+        :param classes: a tuple of orm classes to which the identifiers should be mapped
+        :returns: None
+        """
+        return None
+
 
 class DataEntityLoader(OrmEntityLoader):
     """Loader for the `Data` entity and sub classes."""
@@ -11,7 +11,12 @@
 from __future__ import division
 from __future__ import print_function
 from __future__ import absolute_import
+import collections
 import logging
+import threading
+import time
+
+LOGGER = logging.getLogger(__name__)
 
 
 class DBLogHandler(logging.Handler):
@@ -53,6 +58,141 @@ class DBLogHandler(logging.Handler):
             raise
 
 
+class BufferedDBLogHandler(DBLogHandler):
+    """
+    A db log handler that buffers the records and writes them to the database in batches from a background thread.
+
+    The records are converted to log entries when they are emitted, which is cheap, and then buffered. The buffer is
+    written with a single multi-row insert as soon as it contains `flush_size` entries or at the latest `flush_interval`
+    seconds after the previous write. The buffer holds at most `buffer_size` entries: when it is full, the oldest entry
+    is dropped to make room for the new one and the number of dropped entries is reported at the next write.
+
+    Calling `flush` writes the buffered entries from the calling thread and `close` stops the background thread after
+    writing the remaining entries, which happens automatically at interpreter exit through `logging.shutdown`.
+    """
+
+    def __init__(self, level=logging.NOTSET, buffer_size=10000, flush_size=500, flush_interval=1):
+        """
+        :param level: the minimum level of the records to store
+        :param buffer_size: the maximum number of entries in the buffer
+        :param flush_size: the number of buffered entries that triggers a write
+        :param flush_interval: the maximum time in seconds between writes
+        """
+        super(BufferedDBLogHandler, self).__init__(level)
+        self._buffer = collections.deque(maxlen=max(buffer_size, 1))
+        self._flush_size = max(flush_size, 1)
+        self._flush_interval = flush_interval
+        self._dropped = 0
+        self._closed = False
+        self._condition = threading.Condition()
+        self._write_lock = threading.Lock()
+        self._thread = None
+
+    def emit(self, record):
+        # If this is reached before a backend is defined, simply pass
+        from aiida.backends.utils import is_dbenv_loaded
+        if not is_dbenv_loaded():
+            return
+
+        from aiida.orm.logs import get_entry_fields_from_record
+
+        # The backend should be set. We silently absorb the records without one
+        backend = record.__dict__.pop('backend', None)
+        if backend is None:
+            return
+
+        if record.exc_info:
+            # Put the formatted traceback in `exc_text`, see `DBLogHandler.emit`
+            self.format(record)
+
+        try:
+            fields = get_entry_fields_from_record(record)
+        except Exception:  # pylint: disable=broad-except
+            self.handleError(record)
+            return
+
+        if fields is None:
+            return
+
+        with self._condition:
+            if len(self._buffer) == self._buffer.maxlen:
+                self._dropped += 1
+            self._buffer.append((backend, fields))
+
+            if len(self._buffer) >= self._flush_size:
+                self._condition.notify()
+
+            if self._thread is None and not self._closed:
+                self._thread = threading.Thread(target=self._run, name='BufferedDBLogHandler')
+                self._thread.daemon = True
+                self._thread.start()
+
+    def flush(self):
+        """Write all the buffered entries to the database."""
+        with self._write_lock:
+            with self._condition:
+                entries = list(self._buffer)
+                self._buffer.clear()
+                dropped, self._dropped = self._dropped, 0
+
+            if entries:
+                self._write(entries)
+
+        if dropped:
+            LOGGER.warning('the buffer of the database log handler was full, %d log records were dropped', dropped)
+
+    def close(self):
+        """Stop the background thread and write the remaining buffered entries to the database."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+            thread = self._thread
+
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+        self.flush()
+        super(BufferedDBLogHandler, self).close()
+
+    def _run(self):
+        """Write the buffered entries whenever enough have accumulated or the flush interval has passed."""
+        while True:
+            with self._condition:
+                deadline = time.time() + self._flush_interval
+                while not self._closed and len(self._buffer) < self._flush_size:
+                    remaining = deadline - time.time()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+                closed = self._closed
+
+            self.flush()
+
+            if closed:
+                return
+
+    @staticmethod
+    def _write(entries):
+        """
+        Write the given entries to the database, with a single multi-row insert for each backend.
+
+        :param entries: list of tuples of the backend and the fields of the log entry
+        """
+        from aiida import orm
+
+        entries_per_backend = collections.OrderedDict()
+        for backend, fields in entries:
+            entries_per_backend.setdefault(backend, []).append(fields)
+
+        for backend, backend_entries in entries_per_backend.items():
+            try:
+                orm.Log.objects(backend).create_entries(backend_entries)
+            except Exception:  # pylint: disable=broad-except
+                # To avoid loops with the error handler, I just print. The entries are lost.
+                import traceback
+                traceback.print_exc()
+
+
 def get_dblogger_extra(node):
     """Return the additional information necessary to attach any log records to the given node instance.
 
@@ -103,6 +103,18 @@ class Repository(object):  # pylint: disable=useless-object-inheritance
         """
         return io.open(self._get_base_folder().get_abs_path(key), mode=mode)
 
+    def get_object_path(self, key):
+        """Return the absolute path of the object identified by key on this file system.
+
+        .. warning:: The object must only be read through this path, it must not be modified, moved or hard linked.
+
+        :param key: fully qualified identifier for the object within the repository
+        :return: the absolute path of the object
+        """
+        self.validate_object_key(key)
+
+        return self._get_base_folder().get_abs_path(key)
+
     def get_object(self, key):
         """Return the object identified by key.
 
@@ -11,18 +11,20 @@ from __future__ import division
 from __future__ import print_function
 from __future__ import absolute_import
 
-import enum
-import six
+import collections
+import errno
+import hashlib
+import importlib
+import io
+import json
+import os
+import sys
+import tempfile
+import threading
 import traceback
 
-try:
-    from reentry.default_manager import PluginManager
-    # I don't use the default manager as it has scan_for_not_found=True
-    # by default, which re-runs scan if no entrypoints are found (which is
-    # quite possible if no aiida.tests entrypoints are registered)
-    ENTRYPOINT_MANAGER = PluginManager(scan_for_not_found=False)
-except ImportError:
-    import pkg_resources as ENTRYPOINT_MANAGER
+import enum
+import six
 
 from aiida.common.exceptions import MissingEntryPointError, MultipleEntryPointError, LoadingEntryPointError
 
@@ -32,6 +34,10 @@ __all__ = ('load_entry_point', 'load_entry_point_from_string')
 ENTRY_POINT_GROUP_PREFIX = 'aiida.'
 ENTRY_POINT_STRING_SEPARATOR = ':'
 
+# Version of the format of the entry point index file, to be incremented when the format changes
+ENTRY_POINT_INDEX_VERSION = 1
+ENTRY_POINT_INDEX_FILENAME_TEMPLATE = 'entry_points-{}.json'
+
 
 class EntryPointFormat(enum.Enum):
     """
@@ -68,6 +74,329 @@ entry_point_group_to_module_path_map = {
     'aiida.workflows': 'aiida.workflows',
 }
 
+ENTRY_POINT_INDEX = None
+
+
+class EntryPoint(object):
+    """
+    An entry point as stored in the entry point index, which can be loaded without `pkg_resources`.
+
+    It has the attributes of the entry points of `pkg_resources` that are used by AiiDA: the `name`, the `module_name`
+    and the `attrs` that lead from the module to the loaded object.
+    """
+
+    # pylint: disable=useless-object-inheritance
+
+    def __init__(self, name, module_name, attrs=()):
+        """
+        :param name: the name of the entry point
+        :param module_name: the path of the module of the entry point
+        :param attrs: tuple of the names of the attributes that lead from the module to the entry point
+        """
+        self.name = name
+        self.module_name = module_name
+        self.attrs = tuple(attrs)
+
+    @classmethod
+    def parse(cls, spec):
+        """
+        Parse an entry point specification of the form `name = module:attrs`, ignoring any extras.
+
+        :param spec: the entry point specification
+        :return: the entry point
+        :raises ValueError: if the specification is invalid
+        """
+        try:
+            name, value = [part.strip() for part in spec.split('=', 1)]
+        except ValueError:
+            raise ValueError('invalid entry point specification: {}'.format(spec))
+
+        module_name, _, attrs = value.split('[', 1)[0].strip().partition(':')
+
+        if not name or not module_name:
+            raise ValueError('invalid entry point specification: {}'.format(spec))
+
+        return cls(name, module_name, [attr for attr in attrs.strip().split('.') if attr])
+
+    def load(self):
+        """
+        Import the module of the entry point and return the object it points to.
+
+        :return: the object registered at the entry point
+        :raises ImportError: if the module cannot be imported or does not contain the object
+        """
+        loaded = importlib.import_module(self.module_name)
+
+        try:
+            for attr in self.attrs:
+                loaded = getattr(loaded, attr)
+        except AttributeError as exception:
+            raise ImportError(str(exception))
+
+        return loaded
+
+    def __eq__(self, other):
+        return isinstance(other, EntryPoint) and str(self) == str(other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash(str(self))
+
+    def __str__(self):
+        if self.attrs:
+            return '{} = {}:{}'.format(self.name, self.module_name, '.'.join(self.attrs))
+        return '{} = {}'.format(self.name, self.module_name)
+
+    def __repr__(self):
+        return 'EntryPoint.parse({!r})'.format(str(self))
+
+
+def get_entry_point_index():
+    """
+    Return the entry point index of the current interpreter, creating it if necessary.
+
+    :rtype: :class:`aiida.plugins.entry_point.EntryPointIndex`
+    """
+    global ENTRY_POINT_INDEX  # pylint: disable=global-statement
+
+    if ENTRY_POINT_INDEX is None:
+        ENTRY_POINT_INDEX = EntryPointIndex()
+
+    return ENTRY_POINT_INDEX
+
+
+def reset_entry_point_index():
+    """
+    Reset the entry point index, such that it is verified against the installed distributions again on the next lookup.
+
+    This is only necessary when distributions are installed or removed while the interpreter is running.
+    """
+    global ENTRY_POINT_INDEX  # pylint: disable=global-statement
+    ENTRY_POINT_INDEX = None
+
+
+def get_distributions_fingerprint():
+    """
+    Return a fingerprint of the distributions that are installed on the python path.
+
+    The fingerprint changes when a distribution is installed, upgraded or removed, or when the entry points of a
+    distribution installed in development mode are changed, but it does not require reading the metadata of all
+    distributions: only the modification times of the directories of the python path that contain distributions and of
+    the `entry_points.txt` files of the distributions are used.
+
+    :return: the fingerprint as a hexadecimal string
+    """
+    fingerprint = hashlib.md5()
+    fingerprint.update(sys.version.encode('utf-8'))
+
+    for path in sys.path:
+        try:
+            names = sorted(os.listdir(path or os.curdir))
+        except OSError:
+            continue
+
+        distributions = []
+
+        for name in names:
+            if name.endswith(('.egg-info', '.dist-info')):
+                filepath = os.path.join(path, name, 'entry_points.txt')
+            elif name.endswith('.egg'):
+                filepath = os.path.join(path, name, 'EGG-INFO', 'entry_points.txt')
+            else:
+                continue
+
+            try:
+                distributions.append('{}:{}'.format(name, os.stat(filepath).st_mtime))
+            except OSError:
+                distributions.append(name)
+
+        # Directories of the python path without distributions, like the directory of a script, do not matter
+        if distributions:
+            fingerprint.update(u'{}:{}'.format(path, os.stat(path or os.curdir).st_mtime).encode('utf-8'))
+            fingerprint.update(u'\n'.join(distributions).encode('utf-8'))
+
+    return fingerprint.hexdigest()
+
+
+def scan_entry_points():
+    """
+    Scan the metadata of the installed distributions for the entry points of all groups with the AiiDA prefix.
+
+    :return: dictionary with for each entry point group a list of entry point specifications `name = module:attrs`
+    """
+    import pkg_resources
+
+    entry_points = collections.defaultdict(list)
+
+    for distribution in pkg_resources.working_set:
+        for group, group_entry_points in distribution.get_entry_map().items():
+            if group.startswith(ENTRY_POINT_GROUP_PREFIX):
+                entry_points[group].extend(str(entry_point) for entry_point in group_entry_points.values())
+
+    return dict(entry_points)
+
+
+class EntryPointIndex(object):
+    """
+    Index of the entry points of all groups with the AiiDA prefix, that is persisted on disk.
+
+    The index is stored in a file in the cache directory of the configuration folder, one per python installation,
+    together with a fingerprint of the installed distributions. As long as the fingerprint does not change, the entry
+    points are read from the file instead of scanning the metadata of all installed distributions. The loaded entry
+    points are memoized, such that every entry point is only imported once.
+    """
+
+    # pylint: disable=useless-object-inheritance
+
+    def __init__(self, filepath=None):
+        """
+        :param filepath: the path of the index file, by default a file in the cache directory of the configuration
+        """
+        if filepath is None:
+            from aiida.manage.configuration.settings import CACHE_DIR
+            prefix = hashlib.md5(sys.prefix.encode('utf-8')).hexdigest()[:12]
+            filepath = os.path.join(CACHE_DIR, ENTRY_POINT_INDEX_FILENAME_TEMPLATE.format(prefix))
+
+        self._filepath = filepath
+        self._lock = threading.Lock()
+        self._entry_points = None
+        self._classes = None
+        self._loaded = {}
+
+    @property
+    def filepath(self):
+        """Return the path of the index file."""
+        return self._filepath
+
+    def _get_entry_points(self):
+        """Return the entry points per group and name, reading the index file or building it if necessary."""
+        if self._entry_points is None:
+            with self._lock:
+                if self._entry_points is None:
+                    self._set_entry_points(self._read_or_build())
+
+        return self._entry_points
+
+    def _set_entry_points(self, specs):
+        """Create the entry points from the specifications per group and the reverse mapping of classes."""
+        entry_points = {}
+        classes = {}
+
+        for group, group_specs in specs.items():
+            entry_points[group] = collections.OrderedDict()
+            for spec in group_specs:
+                entry_point = EntryPoint.parse(spec)
+                entry_points[group].setdefault(entry_point.name, []).append(entry_point)
+                for attr in entry_point.attrs:
+                    classes.setdefault((entry_point.module_name, attr), (group, entry_point))
+
+        self._classes = classes
+        self._entry_points = entry_points
+
+    def _read_or_build(self):
+        """Return the entry point specifications from the index file if it is up to date, else rebuild the index."""
+        fingerprint = get_distributions_fingerprint()
+
+        try:
+            with io.open(self._filepath, 'r', encoding='utf8') as handle:
+                index = json.load(handle)
+        except (IOError, OSError, ValueError):
+            index = {}
+
+        if index.get('version') == ENTRY_POINT_INDEX_VERSION and index.get('fingerprint') == fingerprint:
+            return index['entry_points']
+
+        entry_points = scan_entry_points()
+        self._write({'version': ENTRY_POINT_INDEX_VERSION, 'fingerprint': fingerprint, 'entry_points': entry_points})
+
+        return entry_points
+
+    def _write(self, index):
+        """Write the index file atomically, such that concurrent interpreters never read a partial index."""
+        dirpath = os.path.dirname(self._filepath)
+
+        try:
+            try:
+                os.makedirs(dirpath)
+            except OSError as exception:
+                if exception.errno != errno.EEXIST:
+                    raise
+
+            handle, temporary = tempfile.mkstemp(dir=dirpath, suffix='.tmp')
+        except (IOError, OSError):
+            # The index is then rebuilt by every interpreter, which is slower but correct
+            return
+
+        try:
+            with io.open(handle, 'w', encoding='utf8') as stream:
+                stream.write(six.text_type(json.dumps(index)))
+            os.rename(temporary, self._filepath)
+        except (IOError, OSError):
+            os.remove(temporary)
+
+    def get_entry_points(self, group):
+        """
+        Return the entry points of the given group.
+
+        :param group: the entry point group
+        :return: a list of entry points
+        """
+        return [entry_point for entries in self._get_entry_points().get(group, {}).values() for entry_point in entries]
+
+    def get_entry_point(self, group, name):
+        """
+        Return the entry point with the given name within the given group.
+
+        :param group: the entry point group
+        :param name: the name of the entry point
+        :return: the entry point
+        :raises aiida.common.MissingEntryPointError: entry point was not registered
+        :raises aiida.common.MultipleEntryPointError: entry point could not be uniquely resolved
+        """
+        entry_points = self._get_entry_points().get(group, {}).get(name, [])
+
+        if not entry_points:
+            raise MissingEntryPointError("Entry point '{}' not found in group '{}'".format(name, group))
+
+        if len(entry_points) > 1:
+            raise MultipleEntryPointError("Multiple entry points '{}' found in group '{}'".format(name, group))
+
+        return entry_points[0]
+
+    def get_entry_point_from_class(self, class_module, class_name):
+        """
+        Return the entry point of the class with the given module and name.
+
+        :param class_module: module of the class
+        :param class_name: name of the class
+        :return: a tuple of the corresponding group and entry point or (None, None) if not found
+        """
+        self._get_entry_points()
+        return self._classes.get((class_module, class_name), (None, None))
+
+    def load_entry_point(self, group, name):
+        """
+        Load the object registered at the entry point with the given group and name, importing it only once.
+
+        :param group: the entry point group
+        :param name: the name of the entry point
+        :return: the object registered at the entry point
+        :raises aiida.common.MissingEntryPointError: entry point was not registered
+        :raises aiida.common.MultipleEntryPointError: entry point could not be uniquely resolved
+        :raises ImportError: if the entry point could not be imported
+        """
+        try:
+            return self._loaded[(group, name)]
+        except KeyError:
+            pass
+
+        loaded = self.get_entry_point(group, name).load()
+        self._loaded[(group, name)] = loaded
+
+        return loaded
+
 
 def format_entry_point_string(group, name, fmt=EntryPointFormat.FULL):
     """
@@ -176,10 +505,8 @@ def load_entry_point(group, name):
     :raises aiida.common.MultipleEntryPointError: entry point could not be uniquely resolved
     :raises aiida.common.LoadingEntryPointError: entry point could not be loaded
     """
-    entry_point = get_entry_point(group, name)
-
     try:
-        loaded_entry_point = entry_point.load()
+        loaded_entry_point = get_entry_point_index().load_entry_point(group, name)
     except ImportError:
         raise LoadingEntryPointError("Failed to load entry point '{}':\n{}".format(name, traceback.format_exc()))
 
@@ -218,7 +545,7 @@ def get_entry_points(group):
     :param group: the entry point group
     :return: a list of entry points
     """
-    return [ep for ep in ENTRYPOINT_MANAGER.iter_entry_points(group=group)]
+    return get_entry_point_index().get_entry_points(group)
 
 
 def get_entry_point(group, name):
@@ -231,15 +558,7 @@ def get_entry_point(group, name):
     :raises aiida.common.MissingEntryPointError: entry point was not registered
     :raises aiida.common.MultipleEntryPointError: entry point could not be uniquely resolved
     """
-    entry_points = [ep for ep in get_entry_points(group) if ep.name == name]
-
-    if not entry_points:
-        raise MissingEntryPointError("Entry point '{}' not found in group '{}'".format(name, group))
-
-    if len(entry_points) > 1:
-        raise MultipleEntryPointError("Multiple entry points '{}' found in group".format(name, group))
-
-    return entry_points[0]
+    return get_entry_point_index().get_entry_point(group, name)
 
 
 def get_entry_point_from_class(class_module, class_name):
@@ -250,17 +569,7 @@ def get_entry_point_from_class(class_module, class_name):
     :param class_name: name of the class
     :return: a tuple of the corresponding group and entry point or None if not found
     """
-    for group in ENTRYPOINT_MANAGER.get_entry_map().keys():
-        for entry_point in ENTRYPOINT_MANAGER.iter_entry_points(group):
-
-            if entry_point.module_name != class_module:
-                continue
-
-            for entry_point_class_name in entry_point.attrs:
-                if entry_point_class_name == class_name:
-                    return group, entry_point
-
-    return None, None
+    return get_entry_point_index().get_entry_point_from_class(class_module, class_name)
 
 
 def get_entry_point_string_from_class(class_module, class_name):
@@ -40,6 +40,21 @@ class App(Flask):
         # Basic initialization
         super(App, self).__init__(*args, **kwargs)
 
+        # Nodes that are loaded more than once while handling a request are only queried once
+        from aiida.orm.utils.identity_map import start_identity_map, stop_identity_map
+
+        @self.before_request
+        def activate_identity_map():
+            # pylint: disable=unused-variable
+            """Activate an identity map for the nodes that are loaded while handling the request"""
+            start_identity_map()
+
+        @self.teardown_request
+        def deactivate_identity_map(_):
+            # pylint: disable=unused-variable
+            """Deactivate the identity map of the request"""
+            stop_identity_map()
+
         # Error handler
         from aiida.restapi.common.exceptions import RestInputValidationError, \
             RestValidationError, RestFeatureNotAvailable
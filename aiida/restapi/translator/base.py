@@ -520,7 +520,6 @@ class BaseTranslator(object):
                 raise RestValidationError('parameter id has to be an string')
 
             identifier_type = IdentifierType.UUID
-            qbobj, _ = loader.get_query_builder(node_id, identifier_type, sub_classes=(self._aiida_class,))
         else:
 
             # Similarly, check that id is an integer
@@ -528,13 +527,10 @@ class BaseTranslator(object):
                 raise RestValidationError('parameter id has to be an integer')
 
             identifier_type = IdentifierType.ID
-            qbobj, _ = loader.get_query_builder(node_id, identifier_type, sub_classes=(self._aiida_class,))
-
-        # For efficiency I don't go further than two results
-        qbobj.limit(2)
 
+        # The loader does not go further than two results and adds the entity to the identity map of the request
         try:
-            pk = qbobj.one()[0].pk
+            pk = loader.load_entity(node_id, identifier_type, sub_classes=(self._aiida_class,)).pk
         except MultipleObjectsError:
             raise RestValidationError("More than one node found." " Provide longer starting pattern" " for id.")
         except NotExistent:
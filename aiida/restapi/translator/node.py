@@ -549,7 +549,7 @@ class NodeTranslator(BaseTranslator):
         :return: json data to display node tree
         """
         from aiida.orm.querybuilder import QueryBuilder
-        from aiida.orm import Node
+        from aiida.orm import Node, load_node
 
         def get_node_shape(ntype):
             """
@@ -573,35 +573,33 @@ class NodeTranslator(BaseTranslator):
         # Check whether uuid_pattern identifies a unique node
         self._check_id_validity(uuid_pattern)
 
-        qb_obj = QueryBuilder()
-        qb_obj.append(Node, tag="main", project=["*"], filters=self._id_filter)
-
         nodes = []
         edges = []
         node_count = 0
 
-        if qb_obj.count() > 0:
-            main_node = qb_obj.first()[0]
-            pk = main_node.pk
-            uuid = main_node.uuid
-            nodetype = main_node.node_type
-            nodelabel = main_node.label
-            display_type = nodetype.split('.')[-2]
-            description = main_node.get_description()
-            if description == '':
-                description = main_node.node_type.split('.')[-2]
-
-            nodes.append({
-                "id": node_count,
-                "nodeid": pk,
-                "nodeuuid": uuid,
-                "nodetype": nodetype,
-                "nodelabel": nodelabel,
-                "displaytype": display_type,
-                "group": "main_node",
-                "description": description,
-                "shape": get_node_shape(nodetype)
-            })
+        # The main node was loaded by the validity check and is taken from the identity map of the request
+        main_node = load_node(pk=self._id_filter['id']['=='])
+
+        pk = main_node.pk
+        uuid = main_node.uuid
+        nodetype = main_node.node_type
+        nodelabel = main_node.label
+        display_type = nodetype.split('.')[-2]
+        description = main_node.get_description()
+        if description == '':
+            description = main_node.node_type.split('.')[-2]
+
+        nodes.append({
+            "id": node_count,
+            "nodeid": pk,
+            "nodeuuid": uuid,
+            "nodetype": nodetype,
+            "nodelabel": nodelabel,
+            "displaytype": display_type,
+            "group": "main_node",
+            "description": description,
+            "shape": get_node_shape(nodetype)
+        })
         node_count += 1
 
         # get all inputs
@@ -81,6 +81,7 @@ class DirectScheduler(aiida.schedulers.Scheduler):
     # Query only by list of jobs and not by user
     _features = {
         'can_query_by_user': True,
+        'can_submit_job_arrays': False,
     }
 
     # The class to be used for the job resource.
@@ -279,12 +280,16 @@ class DirectScheduler(aiida.schedulers.Scheduler):
 
         return job_list
 
-    def get_jobs(self, jobs=None, user=None, as_dict=False):
+    def get_jobs(self, jobs=None, user=None, as_dict=False, only_jobs=None):
         """
         Overrides original method from DirectScheduler in order to list
         missing processes as DONE.
         """
-        job_stats = super(DirectScheduler, self).get_jobs(jobs=jobs, user=user, as_dict=as_dict)
+        job_stats = super(DirectScheduler, self).get_jobs(jobs=jobs, user=user, as_dict=as_dict, only_jobs=only_jobs)
+
+        if jobs and only_jobs is not None:
+            only_jobs = set(only_jobs)
+            jobs = [job_id for job_id in jobs if job_id in only_jobs]
 
         found_jobs = []
         # Get the list of known jobs
@@ -14,6 +14,7 @@ This has been tested on the CERN lxplus cluster (LSF 9.1.3)
 from __future__ import print_function
 from __future__ import division
 from __future__ import absolute_import
+import re
 
 import six
 
@@ -89,6 +90,17 @@ _MAP_STATUS_LSF = {
 # Separator between fields in the output of bjobs
 _FIELD_SEPARATOR = "|"
 
+# The name of the tasks of a job array is the name of the array followed by the task index in square brackets
+_JOB_ARRAY_TASK_NAME_REGEXP = re.compile(r'.*\[(?P<index>\d+)\]$')
+
+# The time strings printed by bjobs, e.g. 'Feb  2 07:39 L', that can be parsed much faster than with strptime
+_TIME_STRING_REGEXP = re.compile(
+    r'^(?P<month>[A-Za-z]{3})\s+(?P<day>\d{1,2})\s+(?P<hour>\d{1,2}):(?P<minute>\d{1,2})( L)?$')
+_MONTHS = {
+    month: index + 1
+    for index, month in enumerate(['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'])
+}
+
 
 class LsfJobResource(JobResource):
     """
@@ -168,11 +180,18 @@ class LsfScheduler(aiida.schedulers.Scheduler):
     # Query only by list of jobs and not by user
     _features = {
         'can_query_by_user': False,
+        'can_submit_job_arrays': True,
     }
 
+    _can_parse_only_jobs = True
+
     # The class to be used for the job resource.
     _job_resource_class = LsfJobResource
 
+    # The tasks of a job array in LSF are numbered starting from one
+    _job_array_task_variable = 'LSB_JOBINDEX'
+    _job_array_first_index = 1
+
     # Unavailable field: substate
     # Note! If you change the fields or fields length, update accordingly
     # also the parsing function!
@@ -275,7 +294,8 @@ class LsfScheduler(aiida.schedulers.Scheduler):
                 if not isinstance(jobs, (tuple, list)):
                     raise TypeError("If provided, the 'jobs' variable must be a string or a list of strings")
                 joblist = jobs
-            command.append(' '.join(joblist))
+            # The job ids of the tasks of a job array contain square brackets, that should not be expanded by the shell
+            command.append(' '.join(escape_for_bash(job) for job in joblist))
 
         comm = ' '.join(command)
         self.logger.debug("bjobs command: {}".format(comm))
@@ -484,7 +504,7 @@ fi
 
         return submit_command
 
-    def _parse_joblist_output(self, retval, stdout, stderr):
+    def _parse_joblist_output(self, retval, stdout, stderr, only_jobs=None):
         """
         Parse the queue output string, as returned by executing the
         command returned by _get_joblist_command command,
@@ -500,6 +520,9 @@ fi
             This function will only return one element for each job find
             in the qstat output; missing jobs (for whatever reason) simply
             will not appear here.
+
+        :param only_jobs: optional set of job ids, if specified all other
+            jobs are skipped without being parsed
         """
         num_fields = len(self._joblist_fields)
 
@@ -530,8 +553,18 @@ fi
                 self.logger.error("Wrong line length in squeue output! '{}'" "".format(job))
                 continue
 
+            job_id = job[0]
+
+            # All tasks of a job array have the same job id, they can only be distinguished by their name
+            match = _JOB_ARRAY_TASK_NAME_REGEXP.match(job[-1])
+            if match:
+                job_id = self._get_job_array_task_id(job_id, match.group('index'))
+
+            if only_jobs is not None and job_id not in only_jobs:
+                continue
+
             this_job = JobInfo()
-            this_job.job_id = job[0]
+            this_job.job_id = job_id
             this_job.annotation = job[2]
             job_state_raw = job[1]
 
@@ -639,6 +672,20 @@ fi
 
         return job_list
 
+    def _get_job_array_directive(self, num_tasks):
+        """
+        Return the directives that turn the submit script into a job array. In LSF, the
+        array is defined through the job name; the output of the array itself is written
+        to a file per task, as otherwise LSF would send it by email.
+        """
+        return '#BSUB -J "aiida-array[1-{}]"\n#BSUB -o lsf-%J_%I.out'.format(num_tasks)
+
+    def _get_job_array_task_id(self, job_id, index):
+        """
+        Return the job id of a task of a job array, in the format <job_id>[<index>] accepted by bjobs.
+        """
+        return "{}[{}]".format(job_id, index)
+
     def _parse_submit_output(self, retval, stdout, stderr):
         """
         Parse the output of the submit command, as returned by executing the
@@ -681,14 +728,21 @@ fi
         # The year is not specified. I have to add it, and I set it to the
         # current year. This is actually not correct, if we are close
         # new year... we should ask the scheduler also the year.
-        actual_string = '{} {}'.format(datetime.datetime.now().year, string)
+        year = datetime.datetime.now().year
+        actual_string = '{} {}'.format(year, string)
         actual_fmt = '%Y {}'.format(fmt)
 
+        match = _TIME_STRING_REGEXP.match(string) if fmt == '%b %d %H:%M' else None
+
         try:
-            try:
-                thetime = datetime.datetime.strptime(actual_string, actual_fmt)
-            except ValueError:
-                thetime = datetime.datetime.strptime(actual_string, "{} L".format(actual_fmt))
+            if match and match.group('month') in _MONTHS:
+                thetime = datetime.datetime(year, _MONTHS[match.group('month')], int(match.group('day')),
+                                            int(match.group('hour')), int(match.group('minute')))
+            else:
+                try:
+                    thetime = datetime.datetime.strptime(actual_string, actual_fmt)
+                except ValueError:
+                    thetime = datetime.datetime.strptime(actual_string, "{} L".format(actual_fmt))
         except Exception as exc:
             self.logger.debug("Unable to parse time string {}, the message was {}".format(string, exc))
             raise ValueError("Problem parsing the time string.")
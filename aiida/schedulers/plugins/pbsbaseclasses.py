@@ -15,6 +15,7 @@ from __future__ import division
 from __future__ import absolute_import
 import abc
 import logging
+import re
 
 import six
 
@@ -69,6 +70,14 @@ _MAP_STATUS_PBS_COMMON = {
     'C': JobState.DONE,  # This is the completed state of PBS/Torque
 }
 
+# The time strings printed by qstat -f, e.g. 'Mon Oct 15 14:46:15 2012', that can be parsed much faster than strptime
+_TIME_STRING_REGEXP = re.compile(r'^(Mon|Tue|Wed|Thu|Fri|Sat|Sun)\s+(?P<month>[A-Za-z]{3})\s+(?P<day>\d{1,2})\s+'
+                                 r'(?P<hour>\d{1,2}):(?P<minute>\d{1,2}):(?P<second>\d{1,2})\s+(?P<year>\d{4})$')
+_MONTHS = {
+    month: index + 1
+    for index, month in enumerate(['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'])
+}
+
 
 class PbsJobResource(NodeNumberJobResource):
     """
@@ -126,8 +135,11 @@ class PbsBaseClass(Scheduler):
     # Query only by list of jobs and not by user
     _features = {
         'can_query_by_user': False,
+        'can_submit_job_arrays': True,
     }
 
+    _can_parse_only_jobs = True
+
     # The class to be used for the job resource.
     _job_resource_class = PbsJobResource
 
@@ -154,8 +166,8 @@ class PbsBaseClass(Scheduler):
         """
         The command to report full information on existing jobs.
 
-        TODO: in the case of job arrays, decide what to do (i.e., if we want
-              to pass the -t options to list each subjob).
+        If any of the jobs is a task of a job array, the -t option is passed
+        such that each subjob is listed separately.
         """
         from aiida.common.exceptions import FeatureNotAvailable
 
@@ -169,12 +181,15 @@ class PbsBaseClass(Scheduler):
 
         if jobs:
             if isinstance(jobs, six.string_types):
-                command.append('{}'.format(escape_for_bash(jobs)))
-            else:
-                try:
-                    command.append('{}'.format(' '.join(escape_for_bash(j) for j in jobs)))
-                except TypeError:
-                    raise TypeError("If provided, the 'jobs' variable must be a string or an iterable of strings")
+                jobs = [jobs]
+            try:
+                jobs = [escape_for_bash(j) for j in jobs]
+            except TypeError:
+                raise TypeError("If provided, the 'jobs' variable must be a string or an iterable of strings")
+            # The tasks of a job array are only listed individually with the -t option
+            if any('[' in j for j in jobs):
+                command.append('-t')
+            command.append('{}'.format(' '.join(jobs)))
 
         comm = ' '.join(command)
         _LOGGER.debug("qstat command: {}".format(comm))
@@ -344,7 +359,21 @@ class PbsBaseClass(Scheduler):
 
         return submit_command
 
-    def _parse_joblist_output(self, retval, stdout, stderr):
+    def _get_job_task_setup(self):
+        """
+        The submit script of each job changes to $PBS_O_WORKDIR, which for a job that is part
+        of a job array or job bundle is the directory of the combined job, so redefine it for each job.
+        """
+        return 'export PBS_O_WORKDIR="$PWD"'
+
+    def _get_job_array_task_id(self, job_id, index):
+        """
+        Return the job id of a task of a job array. The job id of the array
+        has the format <number>[].<server>, that of its tasks <number>[<index>].<server>
+        """
+        return job_id.replace('[]', '[{}]'.format(index), 1)
+
+    def _parse_joblist_output(self, retval, stdout, stderr, only_jobs=None):
         """
         Parse the queue output string, as returned by executing the
         command returned by _get_joblist_command command (qstat -f).
@@ -357,6 +386,9 @@ class PbsBaseClass(Scheduler):
             This function will only return one element for each job find
             in the qstat output; missing jobs (for whatever reason) simply
             will not appear here.
+
+        :param only_jobs: optional set of job ids, if specified the stanzas of
+            all other jobs are skipped without being parsed
         """
 
         # I don't raise because if I pass a list of jobs, I get a non-zero status
@@ -383,15 +415,19 @@ class PbsBaseClass(Scheduler):
                 raise SchedulerError("Error during qstat parsing (_parse_joblist_output function)")
 
         jobdata_raw = []  # will contain raw data parsed from qstat output
+        skip_job = False  # whether the lines of the current job stanza are skipped
         # Get raw data and split in lines
         for line_num, line in enumerate(stdout.split('\n'), start=1):
             # Each new job stanza starts with the string 'Job Id:': I
             # create a new item in the jobdata_raw list
             if line.startswith('Job Id:'):
-                jobdata_raw.append({'id': line.split(':', 1)[1].strip(), 'lines': [], 'warning_lines_idx': []})
+                job_id = line.split(':', 1)[1].strip()
+                skip_job = only_jobs is not None and job_id not in only_jobs
+                if not skip_job:
+                    jobdata_raw.append({'id': job_id, 'lines': [], 'warning_lines_idx': []})
                 # warning_lines_idx: lines that do not start either with
                 # tab or space
-            else:
+            elif not skip_job:
                 if line.strip():
                     # This is a non-empty line, therefore it is an attribute
                     # of the last job found
@@ -432,7 +468,14 @@ class PbsBaseClass(Scheduler):
             this_job = JobInfo()
             this_job.job_id = job['id']
 
-            lines_without_equals_sign = [i for i in job['lines'] if '=' not in i]
+            raw_data = {}
+            lines_without_equals_sign = []
+            for line in job['lines']:
+                key, equals_sign, value = line.partition('=')
+                if equals_sign:
+                    raw_data[key.strip().lower()] = value.lstrip()
+                else:
+                    lines_without_equals_sign.append(line)
 
             # There are lines without equals sign: this is bad
             if lines_without_equals_sign:
@@ -440,12 +483,6 @@ class PbsBaseClass(Scheduler):
                 _LOGGER.error("There are lines without equals sign! {}" "".format(lines_without_equals_sign))
                 raise SchedulerParsingError("There are lines without equals sign.")
 
-            raw_data = {
-                i.split('=', 1)[0].strip().lower(): i.split('=', 1)[1].lstrip()
-                for i in job['lines']
-                if '=' in i
-            }
-
             ## I ignore the errors for the time being - this seems to be
             ## a problem if there are \n in the content of some variables?
             ## I consider this a workaround...
@@ -687,8 +724,16 @@ class PbsBaseClass(Scheduler):
         import time
         import datetime
 
+        match = _TIME_STRING_REGEXP.match(string) if fmt == '%a %b %d %H:%M:%S %Y' else None
+
         try:
-            time_struct = time.strptime(string, fmt)
+            if match and match.group('month') in _MONTHS:
+                # Constructing the datetime validates the ranges of the fields, like strptime does
+                time_struct = datetime.datetime(
+                    int(match.group('year')), _MONTHS[match.group('month')], int(match.group('day')),
+                    int(match.group('hour')), int(match.group('minute')), int(match.group('second'))).timetuple()
+            else:
+                time_struct = time.strptime(string, fmt)
         except Exception as exc:
             _LOGGER.debug("Unable to parse time string {}, the message was {}".format(string, exc))
             raise ValueError("Problem parsing the time string.")
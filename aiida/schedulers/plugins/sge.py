@@ -17,8 +17,11 @@ Email: marco(DOT)dorigo(AT)rub(DOT)de
 from __future__ import print_function
 from __future__ import division
 from __future__ import absolute_import
-import xml.parsers.expat
-import xml.dom.minidom
+import io
+import sys
+from xml.etree import ElementTree
+
+import six
 
 from aiida.common.escaping import escape_for_bash
 import aiida.schedulers
@@ -102,11 +105,18 @@ class SgeScheduler(aiida.schedulers.Scheduler):
     # user, but not by job id
     _features = {
         'can_query_by_user': True,
+        'can_submit_job_arrays': True,
     }
 
+    _can_parse_only_jobs = True
+
     # The class to be used for the job resource.
     _job_resource_class = SgeJobResource
 
+    # The tasks of a job array in SGE are numbered starting from one
+    _job_array_task_variable = 'SGE_TASK_ID'
+    _job_array_first_index = 1
+
     def _get_joblist_command(self, jobs=None, user=None):
         """
         The command to report full information on existing jobs.
@@ -297,7 +307,16 @@ class SgeScheduler(aiida.schedulers.Scheduler):
 
         return submit_command
 
-    def _parse_joblist_output(self, retval, stdout, stderr):
+    def _parse_joblist_output(self, retval, stdout, stderr, only_jobs=None):
+        """
+        Parse the xml output of qstat, as returned by executing the command returned by _get_joblist_command.
+
+        The xml is parsed incrementally, converting each job element to JobInfo objects as soon as it is complete and
+        discarding it afterwards, such that even the output of tens of thousands of jobs is parsed quickly.
+
+        :param only_jobs: optional set of job ids, if specified all other jobs are skipped without being parsed
+        :return: a list of JobInfo objects, one for each job or each task of a job array
+        """
         if retval != 0:
             self.logger.error("Error in _parse_joblist_output: retval={}; "
                               "stdout={}; stderr={}".format(retval, stdout, stderr))
@@ -308,144 +327,210 @@ class SgeScheduler(aiida.schedulers.Scheduler):
             self.logger.warning("in _parse_joblist_output for {}: "
                                 "there was some text in stderr: {}".format(str(self.transport), stderr))
 
-        if stdout:
-            try:
-                xmldata = xml.dom.minidom.parseString(stdout)
-            except xml.parsers.expat.ExpatError:
-                self.logger.error("in sge._parse_joblist_output: xml parsing of stdout failed:" "{}".format(stdout))
-                raise SchedulerParsingError("Error during joblist retrieval," "xml parsing of stdout failed")
-        else:
+        if not stdout:
             self.logger.error("Error in sge._parse_joblist_output: retval={}; "
                               "stdout={}; stderr={}".format(retval, stdout, stderr))
             raise SchedulerError("Error during joblist retrieval," "no stdout produced")
 
+        # The job ids of the tasks of a job array are derived from the job number shared by all the tasks
+        only_job_numbers = None if only_jobs is None else {job_id.split('.')[0] for job_id in only_jobs}
+
+        joblist = []
+        job_index = 0
+        job_exc_info = None
+
         try:
-            first_child = xmldata.firstChild
-            second_childs = first_child.childNodes
-            tag_names_sec = [elem.tagName for elem in second_childs \
-                             if elem.nodeType == 1]
-            if 'queue_info' not in tag_names_sec:
-                self.logger.error("Error in sge._parse_joblist_output: "
-                                  "no queue_info: {}". \
-                                  format(stdout))
-                raise SchedulerError
-            if 'job_info' not in tag_names_sec:
+            events = ElementTree.iterparse(io.BytesIO(stdout.encode('utf-8')), events=('end',))
+            for _, element in events:
+                if element.tag != 'job_list':
+                    continue
+
+                # Errors in a job are only raised once the structure of the whole document has been checked
+                if job_exc_info is None:
+                    try:
+                        joblist.extend(self._parse_job_element(element, job_index, stdout, only_jobs, only_job_numbers))
+                    except Exception:  # pylint: disable=broad-except
+                        job_exc_info = sys.exc_info()
+
+                job_index += 1
+                element.clear()
+        except ElementTree.ParseError:
+            self.logger.error("in sge._parse_joblist_output: xml parsing of stdout failed:" "{}".format(stdout))
+            raise SchedulerParsingError("Error during joblist retrieval," "xml parsing of stdout failed")
+
+        tag_names_sec = [child.tag for child in events.root]
+        for tag_name in ['queue_info', 'job_info']:
+            if tag_name not in tag_names_sec:
                 self.logger.error("Error in sge._parse_joblist_output: "
-                                  "no job_info: {}". \
-                                  format(stdout))
+                                  "no {}: {}".format(tag_name, stdout))
+                raise SchedulerError("Error during xml processing, of stdout:"
+                                     "There is no 'job_info' or no 'queue_info'"
+                                     "element or there are no jobs!")
+
+        if job_exc_info is not None:
+            six.reraise(*job_exc_info)
+
+        return joblist
+
+    def _parse_job_element(self, job, job_index, stdout, only_jobs=None, only_job_numbers=None):
+        """
+        Parse a `job_list` element of the xml output of qstat.
+
+        :param job: the `job_list` element
+        :param job_index: the index of the element in the job list, used in error messages
+        :param stdout: the complete output of qstat, used in error messages
+        :param only_jobs: optional set of job ids, if specified all other jobs are skipped
+        :param only_job_numbers: the set of job numbers of `only_jobs`
+        :return: a list of JobInfo objects, one for the job or one for each task if it is a job array
+        """
+        # pylint: disable=too-many-branches,too-many-statements
+        # The text of the first child element with each tag, elements that are empty have no text
+        texts = {}
+        for child in job:
+            texts.setdefault(child.tag, child.text)
+
+        def get_text(tag):
+            """Return the stripped text of the element with the given tag, raising IndexError if it has none."""
+            text = texts.get(tag, None)
+            if text is None:
+                raise IndexError("No text for element '{}'".format(tag))
+            return str(text).strip()
+
+        this_job = JobInfo()
+
+        try:
+            this_job.job_id = get_text('JB_job_number')
+            if not this_job.job_id:
                 raise SchedulerError
         except SchedulerError:
-            self.logger.error("Error in sge._parse_joblist_output: stdout={}" \
+            self.logger.error("Error in sge._parse_joblist_output:"
+                              "no job id is given, stdout={}" \
                               .format(stdout))
-            raise SchedulerError("Error during xml processing, of stdout:"
-                                 "There is no 'job_info' or no 'queue_info'"
-                                 "element or there are no jobs!")
-        # If something weird happens while firstChild, pop, etc:
-        except Exception:
-            self.logger.error("Error in sge._parse_joblist_output: stdout={}" \
-                              .format(stdout))
-            raise SchedulerError("Error during xml processing, of stdout")
+            raise SchedulerError("Error in sge._parse_joblist_output:" "no job id is given")
+        except IndexError:
+            self.logger.error("No 'job_number' given for job index {} in "
+                              "job list, stdout={}".format(job_index, stdout))
+            raise IndexError("Error in sge._parse_joblist_output:" "no job id is given")
+
+        if only_job_numbers is not None and this_job.job_id not in only_job_numbers:
+            return []
+
+        # In case the user needs more information the xml-data for
+        # each job is stored:
+        job.tail = None
+        this_job.raw_data = ElementTree.tostring(job, encoding='utf-8' if six.PY2 else 'unicode')
+        if six.PY2:
+            this_job.raw_data = this_job.raw_data.decode('utf-8')
 
-        jobs = [i for i in first_child.getElementsByTagName('job_list')]
-        # jobs = [i for i in jobinfo.getElementsByTagName('job_list')]
-        # print [i[0].childNodes[0].data for i in job_numbers if i]
-        joblist = []
-        for job in jobs:
-            this_job = JobInfo()
+        try:
+            job_state_string = get_text('state')
+            try:
+                this_job.job_state = _MAP_STATUS_SGE[job_state_string]
+            except KeyError:
+                self.logger.warning("Unrecognized job_state '{}' for job "
+                                    "id {}".format(job_state_string, this_job.job_id))
+                this_job.job_state = JobState.UNDETERMINED
+        except IndexError:
+            self.logger.warning("No 'job_state' field for job id {} in" "stdout={}".format(this_job.job_id, stdout))
+            this_job.job_state = JobState.UNDETERMINED
 
-            # In case the user needs more information the xml-data for
-            # each job is stored:
-            this_job.raw_data = job.toxml()
+        try:
+            this_job.job_owner = get_text('JB_owner')
+        except IndexError:
+            self.logger.warning("No 'job_owner' field for job id {}".format(this_job.job_id))
 
-            try:
-                job_element = job.getElementsByTagName('JB_job_number').pop(0)
-                element_child = job_element.childNodes.pop(0)
-                this_job.job_id = str(element_child.data).strip()
-                if not this_job.job_id:
-                    raise SchedulerError
-            except SchedulerError:
-                self.logger.error("Error in sge._parse_joblist_output:"
-                                  "no job id is given, stdout={}" \
-                                  .format(stdout))
-                raise SchedulerError("Error in sge._parse_joblist_output:" "no job id is given")
-            except IndexError:
-                self.logger.error("No 'job_number' given for job index {} in "
-                                  "job list, stdout={}".format(jobs.index(job) \
-                                                               , stdout))
-                raise IndexError("Error in sge._parse_joblist_output:" "no job id is given")
+        try:
+            this_job.title = get_text('JB_name')
+        except IndexError:
+            self.logger.warning("No 'title' field for job id {}".format(this_job.job_id))
 
+        try:
+            this_job.queue_name = get_text('queue_name')
+        except IndexError:
+            if this_job.job_state == JobState.RUNNING:
+                self.logger.warning("No 'queue_name' field for job id {}".format(this_job.job_id))
+
+        try:
+            time_string = get_text('JB_submission_time')
             try:
-                job_element = job.getElementsByTagName('state').pop(0)
-                element_child = job_element.childNodes.pop(0)
-                job_state_string = str(element_child.data).strip()
+                this_job.submission_time = self._parse_time_string(time_string)
+            except ValueError:
+                self.logger.warning("Error parsing 'JB_submission_time' "
+                                    "for job id {} ('{}')".format(this_job.job_id, time_string))
+        except IndexError:
+            try:
+                time_string = get_text('JAT_start_time')
                 try:
-                    this_job.job_state = _MAP_STATUS_SGE[job_state_string]
-                except KeyError:
-                    self.logger.warning("Unrecognized job_state '{}' for job "
-                                        "id {}".format(job_state_string, this_job.job_id))
-                    this_job.job_state = JobState.UNDETERMINED
+                    this_job.dispatch_time = self._parse_time_string(time_string)
+                except ValueError:
+                    self.logger.warning("Error parsing 'JAT_start_time'"
+                                        "for job id {} ('{}')".format(this_job.job_id, time_string))
             except IndexError:
-                self.logger.warning("No 'job_state' field for job id {} in" "stdout={}".format(this_job.job_id, stdout))
-                this_job.job_state = JobState.UNDETERMINED
+                self.logger.warning("No 'JB_submission_time' and no "
+                                    "'JAT_start_time' field for job "
+                                    "id {}".format(this_job.job_id))
 
+        # There is also cpu_usage, mem_usage, io_usage information available:
+        if this_job.job_state == JobState.RUNNING:
             try:
-                job_element = job.getElementsByTagName('JB_owner').pop(0)
-                element_child = job_element.childNodes.pop(0)
-                this_job.job_owner = str(element_child.data).strip()
+                this_job.num_mpiprocs = get_text('slots')
             except IndexError:
-                self.logger.warning("No 'job_owner' field for job id {}".format(this_job.job_id))
+                self.logger.warning("No 'slots' field for job id {}".format(this_job.job_id))
 
-            try:
-                job_element = job.getElementsByTagName('JB_name').pop(0)
-                element_child = job_element.childNodes.pop(0)
-                this_job.title = str(element_child.data).strip()
-            except IndexError:
-                self.logger.warning("No 'title' field for job id {}".format(this_job.job_id))
+        # The tasks of a job array share the job number and are distinguished by the 'tasks' field,
+        # that is a single index for running tasks, but can be a range of indices for pending ones
+        try:
+            tasks_string = get_text('tasks')
+        except IndexError:
+            return [this_job] if only_jobs is None or this_job.job_id in only_jobs else []
 
-            try:
-                job_element = job.getElementsByTagName('queue_name').pop(0)
-                element_child = job_element.childNodes.pop(0)
-                this_job.queue_name = str(element_child.data).strip()
-            except IndexError:
-                if this_job.job_state == JobState.RUNNING:
-                    self.logger.warning("No 'queue_name' field for job id {}".format(this_job.job_id))
+        try:
+            task_indices = self._parse_task_indices(tasks_string)
+        except ValueError:
+            self.logger.warning("Error parsing 'tasks' for job id {} ('{}')".format(this_job.job_id, tasks_string))
+            return [this_job] if only_jobs is None or this_job.job_id in only_jobs else []
+
+        tasks = []
+        for task_index in task_indices:
+            task_id = self._get_job_array_task_id(this_job.job_id, task_index)
+            if only_jobs is None or task_id in only_jobs:
+                this_task = this_job.copy()
+                this_task.job_id = task_id
+                tasks.append(this_task)
+
+        return tasks
+
+    @staticmethod
+    def _parse_task_indices(string):
+        """
+        Parse the task indices of a job array as printed by qstat, i.e. a comma separated
+        list of single indices or ranges in the format 'first-last:step'.
 
-            try:
-                job_element = job.getElementsByTagName('JB_submission_time').pop(0)
-                element_child = job_element.childNodes.pop(0)
-                time_string = str(element_child.data).strip()
-                try:
-                    this_job.submission_time = self._parse_time_string(time_string)
-                except ValueError:
-                    self.logger.warning("Error parsing 'JB_submission_time' "
-                                        "for job id {} ('{}')".format(this_job.job_id, time_string))
-            except IndexError:
-                try:
-                    job_element = job.getElementsByTagName('JAT_start_time').pop(0)
-                    element_child = job_element.childNodes.pop(0)
-                    time_string = str(element_child.data).strip()
-                    try:
-                        this_job.dispatch_time = self._parse_time_string(time_string)
-                    except ValueError:
-                        self.logger.warning("Error parsing 'JAT_start_time'"
-                                            "for job id {} ('{}')".format(this_job.job_id, time_string))
-                except IndexError:
-                    self.logger.warning("No 'JB_submission_time' and no "
-                                        "'JAT_start_time' field for job "
-                                        "id {}".format(this_job.job_id))
-
-            # There is also cpu_usage, mem_usage, io_usage information available:
-            if this_job.job_state == JobState.RUNNING:
-                try:
-                    job_element = job.getElementsByTagName('slots').pop(0)
-                    element_child = job_element.childNodes.pop(0)
-                    this_job.num_mpiprocs = str(element_child.data).strip()
-                except IndexError:
-                    self.logger.warning("No 'slots' field for job id {}".format(this_job.job_id))
-
-            joblist.append(this_job)
-        # self.logger.debug("joblist final: {}".format(joblist))
-        return joblist
+        :return: a list of integers
+        :raises ValueError: if the string cannot be parsed
+        """
+        indices = []
+        for part in string.split(','):
+            if '-' in part:
+                index_range, _, step = part.partition(':')
+                first, last = index_range.split('-')
+                indices.extend(range(int(first), int(last) + 1, int(step) if step else 1))
+            else:
+                indices.append(int(part))
+        return indices
+
+    def _get_job_array_directive(self, num_tasks):
+        """
+        Return the directive that turns the submit script into a job array.
+        """
+        return "#$ -t 1-{}".format(num_tasks)
+
+    def _get_job_array_task_id(self, job_id, index):
+        """
+        Return the job id of a task of a job array. For a job array, qsub -terse
+        returns <number>.<first>-<last>:<step>, the tasks are identified by <number>.<index>
+        """
+        return "{}.{}".format(job_id.split('.')[0], index)
 
     def _parse_submit_output(self, retval, stdout, stderr):
         """
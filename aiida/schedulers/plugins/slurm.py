@@ -106,6 +106,9 @@ _TIME_REGEXP = re.compile(r"""
 # Separator between fields in the output of squeue
 _FIELD_SEPARATOR = "^^^"
 
+# The time strings printed by squeue, in the format '%Y-%m-%dT%H:%M:%S', that can be parsed much faster than strptime
+_TIME_STRING_REGEXP = re.compile(r'^(\d{4})-(\d{1,2})-(\d{1,2})T(\d{1,2}):(\d{1,2}):(\d{1,2})$')
+
 
 class SlurmJobResource(NodeNumberJobResource):
     """
@@ -160,11 +163,25 @@ class SlurmScheduler(aiida.schedulers.Scheduler):
     # Query only by list of jobs and not by user
     _features = {
         'can_query_by_user': False,
+        'can_submit_job_arrays': True,
     }
 
+    _can_parse_only_jobs = True
+
     # The class to be used for the job resource.
     _job_resource_class = SlurmJobResource
 
+    _job_array_task_variable = 'SLURM_ARRAY_TASK_ID'
+
+    # The fields that are requested from sacct for the detailed job info
+    _detailed_jobinfo_fields = (
+        'AllocCPUS', 'Account', 'AssocID', 'AveCPU', 'AvePages', 'AveRSS', 'AveVMSize', 'Cluster', 'Comment', 'CPUTime',
+        'CPUTimeRAW', 'DerivedExitCode', 'Elapsed', 'Eligible', 'End', 'ExitCode', 'GID', 'Group', 'JobID', 'JobName',
+        'MaxRSS', 'MaxRSSNode', 'MaxRSSTask', 'MaxVMSize', 'MaxVMSizeNode', 'MaxVMSizeTask', 'MinCPU', 'MinCPUNode',
+        'MinCPUTask', 'NCPUS', 'NNodes', 'NodeList', 'NTasks', 'Priority', 'Partition', 'QOSRAW', 'ReqCPUS', 'Reserved',
+        'ResvCPU', 'ResvCPURAW', 'Start', 'State', 'Submit', 'Suspended', 'SystemCPU', 'Timelimit', 'TotalCPU', 'UID',
+        'User', 'UserCPU')
+
     # Fields to query or to parse
     # Unavailable fields: substate, cputime
     fields = [
@@ -197,8 +214,10 @@ class SlurmScheduler(aiida.schedulers.Scheduler):
 
         # I add the environment variable SLURM_TIME_FORMAT in front to be
         # sure to get the times in 'standard' format
+        # The --array option prints one line per task of a job array, such that
+        # pending tasks are not collapsed in a single line with a range of indices
         command = [
-            "SLURM_TIME_FORMAT='standard'", "squeue", "--noheader", "-o '{}'".format(
+            "SLURM_TIME_FORMAT='standard'", "squeue", "--noheader", "--array", "-o '{}'".format(
                 _FIELD_SEPARATOR.join(_[0] for _ in self.fields))
         ]
 
@@ -231,13 +250,44 @@ class SlurmScheduler(aiida.schedulers.Scheduler):
         --parsable split the fields with a pipe (|), adding a pipe also at
         the end.
         """
-        return "sacct --format=AllocCPUS,Account,AssocID,AveCPU,AvePages," \
-               "AveRSS,AveVMSize,Cluster,Comment,CPUTime,CPUTimeRAW,DerivedExitCode," \
-               "Elapsed,Eligible,End,ExitCode,GID,Group,JobID,JobName,MaxRSS,MaxRSSNode," \
-               "MaxRSSTask,MaxVMSize,MaxVMSizeNode,MaxVMSizeTask,MinCPU,MinCPUNode," \
-               "MinCPUTask,NCPUS,NNodes,NodeList,NTasks,Priority,Partition,QOSRAW,ReqCPUS," \
-               "Reserved,ResvCPU,ResvCPURAW,Start,State,Submit,Suspended,SystemCPU,Timelimit," \
-               "TotalCPU,UID,User,UserCPU --parsable --jobs={}".format(jobid)
+        return "sacct --format={} --parsable --jobs={}".format(','.join(self._detailed_jobinfo_fields), jobid)
+
+    def _get_detailed_jobinfo_many_command(self, jobids):
+        """
+        Return the command to get the detailed information on multiple jobs, which sacct supports in a single call.
+        """
+        return self._get_detailed_jobinfo_command(','.join(jobids))
+
+    def _parse_detailed_jobinfo_many_output(self, jobids, command, retval, stdout, stderr):
+        """
+        Split the output of sacct per job: each job gets the header line and the lines of the job and its steps.
+        The return value and stderr are shared by all jobs.
+        """
+        lines = stdout.splitlines()
+
+        if not lines:
+            return {jobid: self._format_detailed_jobinfo(command, retval, stdout, stderr) for jobid in jobids}
+
+        header = lines[0]
+        try:
+            jobid_index = header.split('|').index('JobID')
+        except ValueError:
+            return {jobid: self._format_detailed_jobinfo(command, retval, stdout, stderr) for jobid in jobids}
+
+        rows = {jobid: [] for jobid in jobids}
+        for line in lines[1:]:
+            fields = line.split('|')
+            if len(fields) <= jobid_index:
+                continue
+            # The steps of a job are reported with a suffix, e.g. '1234.batch' or '1234.0'
+            jobid = fields[jobid_index].split('.')[0]
+            if jobid in rows:
+                rows[jobid].append(line)
+
+        return {
+            jobid: self._format_detailed_jobinfo(command, retval, '\n'.join([header] + rows[jobid]), stderr)
+            for jobid in jobids
+        }
 
     def _get_submit_script_header(self, job_tmpl):
         """
@@ -415,6 +465,21 @@ class SlurmScheduler(aiida.schedulers.Scheduler):
 
         return submit_command
 
+    def _get_job_array_directive(self, num_tasks):
+        """
+        Return the directive that turns the submit script into a job array.
+
+        :param num_tasks: the number of tasks of the job array
+        """
+        return "#SBATCH --array=0-{}".format(num_tasks - 1)
+
+    def _get_job_array_task_id(self, job_id, index):
+        """
+        Return the job id of a task of a job array, in the format
+        <array_job_id>_<task_index> that is accepted and printed by squeue.
+        """
+        return "{}_{}".format(job_id, index)
+
     def _parse_submit_output(self, retval, stdout, stderr):
         """
         Parse the output of the submit command, as returned by executing the
@@ -452,7 +517,7 @@ class SlurmScheduler(aiida.schedulers.Scheduler):
         raise SchedulerError("Error during submission, could not retrieve the jobID from "
                              "sbatch output; see log for more info.")
 
-    def _parse_joblist_output(self, retval, stdout, stderr):
+    def _parse_joblist_output(self, retval, stdout, stderr, only_jobs=None):
         """
         Parse the queue output string, as returned by executing the
         command returned by _get_joblist_command command,
@@ -468,8 +533,12 @@ class SlurmScheduler(aiida.schedulers.Scheduler):
             This function will only return one element for each job find
             in the qstat output; missing jobs (for whatever reason) simply
             will not appear here.
+
+        :param only_jobs: optional set of job ids, if specified the lines of
+            all other jobs are skipped without being parsed
         """
         num_fields = len(self.fields)
+        field_names = [field[1] for field in self.fields]
 
         # I don't raise because if I pass a list of jobs,
         # I get a non-zero status
@@ -494,13 +563,19 @@ class SlurmScheduler(aiida.schedulers.Scheduler):
         # the last field), I don't split the title.
         # This assumes that _field_separator never
         # appears in any previous field.
-        jobdata_raw = [l.split(_FIELD_SEPARATOR, num_fields) for l in stdout.splitlines() if _FIELD_SEPARATOR in l]
+        lines = [l for l in stdout.splitlines() if _FIELD_SEPARATOR in l]
+
+        # The job id is the first field, so the lines of the jobs that are not of interest can be skipped cheaply
+        if only_jobs is not None:
+            lines = [l for l in lines if l.split(_FIELD_SEPARATOR, 1)[0] in only_jobs]
+
+        jobdata_raw = [l.split(_FIELD_SEPARATOR, num_fields) for l in lines]
 
         # Create dictionary and parse specific fields
         job_list = []
         for job in jobdata_raw:
 
-            thisjob_dict = {k[1]: v for k, v in zip(self.fields, job)}
+            thisjob_dict = dict(zip(field_names, job))
 
             this_job = JobInfo()
             try:
@@ -551,7 +626,7 @@ class SlurmScheduler(aiida.schedulers.Scheduler):
                 # Also print a warning
                 self.logger.warning("Wrong line length in squeue output!"
                                     "Skipping optional fields. Line: '{}'"
-                                    "".format(jobdata_raw))
+                                    "".format(job))
                 # I append this job before continuing
                 job_list.append(this_job)
                 continue
@@ -654,8 +729,14 @@ class SlurmScheduler(aiida.schedulers.Scheduler):
         import time
         import datetime
 
+        match = _TIME_STRING_REGEXP.match(string) if fmt == '%Y-%m-%dT%H:%M:%S' else None
+
         try:
-            time_struct = time.strptime(string, fmt)
+            if match:
+                # Constructing the datetime validates the ranges of the fields, like strptime does
+                time_struct = datetime.datetime(*[int(group) for group in match.groups()]).timetuple()
+            else:
+                time_struct = time.strptime(string, fmt)
         except Exception as exc:
             self.logger.debug("Unable to parse time string {}, the message was {}".format(string, exc))
             raise ValueError("Problem parsing the time string.")
@@ -112,6 +112,22 @@ class TestParserBjobs(unittest.TestCase):
         # Important to enable again logs!
         logging.disable(logging.NOTSET)
 
+    def test_parse_only_jobs(self):
+        """
+        Test that only the requested jobs are parsed when `only_jobs` is specified
+        """
+        scheduler = LsfScheduler()
+
+        # Disable logging to avoid excessive output during test
+        logging.disable(logging.ERROR)
+        try:
+            job_list = scheduler._parse_joblist_output(0, BJOBS_STDOUT_TO_TEST, '', only_jobs={'764254593', '123'})
+        finally:
+            logging.disable(logging.NOTSET)
+
+        self.assertEquals([j.job_id for j in job_list], ['764254593'])
+        self.assertEquals(job_list[0].job_state, JobState.RUNNING)
+
 
 class TestSubmitScript(unittest.TestCase):
 
@@ -815,6 +815,17 @@ class TestParserQstat(unittest.TestCase):
                 self.assertTrue(j.num_cpus == num_cpus)
                 # TODO : parse the env_vars
 
+    def test_parse_only_jobs(self):
+        """
+        Test that only the requested jobs are parsed when `only_jobs` is specified
+        """
+        scheduler = PbsproScheduler()
+
+        only_jobs = {'69301.mycluster', '123.mycluster'}
+        job_list = scheduler._parse_joblist_output(0, text_qstat_f_to_test, '', only_jobs=only_jobs)
+        self.assertEquals([j.job_id for j in job_list], ['69301.mycluster'])
+        self.assertEquals(job_list[0].job_state, JobState.RUNNING)
+
     def test_parse_with_unexpected_newlines(self):
         """
         Test whether _parse_joblist can parse the qstat -f output
@@ -170,6 +170,34 @@ test_raw_data = """<job_list state="running">
       <slots>1</slots>
     </job_list>"""
 
+text_qstat_job_array = """<?xml version='1.0'?>
+<job_info  xmlns:xsd="http://www.w3.org/2001/XMLSchema">
+  <queue_info>
+    <job_list state="running">
+      <JB_job_number>1212400</JB_job_number>
+      <JB_name>aiida-array</JB_name>
+      <JB_owner>dorigm7s</JB_owner>
+      <state>r</state>
+      <JAT_start_time>2013-06-18T12:08:23</JAT_start_time>
+      <queue_name>serial.q@node080</queue_name>
+      <slots>1</slots>
+      <tasks>1</tasks>
+    </job_list>
+  </queue_info>
+  <job_info>
+    <job_list state="pending">
+      <JB_job_number>1212400</JB_job_number>
+      <JB_name>aiida-array</JB_name>
+      <JB_owner>dorigm7s</JB_owner>
+      <state>qw</state>
+      <JB_submission_time>2013-06-18T12:00:57</JB_submission_time>
+      <queue_name></queue_name>
+      <slots>1</slots>
+      <tasks>2-6:2</tasks>
+    </job_list>
+  </job_info>
+</job_info>"""
+
 
 class TestCommand(unittest.TestCase):
 
@@ -296,6 +324,38 @@ class TestCommand(unittest.TestCase):
             sge._parse_joblist_output(retval, stdout, stderr)
         logging.disable(logging.NOTSET)
 
+    def test_parse_joblist_output_job_array(self):
+        """
+        Test that the tasks of a job array are parsed as separate jobs.
+        """
+        sge = SgeScheduler()
+
+        job_list = sge._parse_joblist_output(0, text_qstat_job_array, '')
+        job_states = {job.job_id: job.job_state for job in job_list}
+
+        self.assertEquals(
+            job_states, {
+                '1212400.1': JobState.RUNNING,
+                '1212400.2': JobState.QUEUED,
+                '1212400.4': JobState.QUEUED,
+                '1212400.6': JobState.QUEUED,
+            })
+
+        self.assertEquals(sge._parse_task_indices('1,3,5-6'), [1, 3, 5, 6])
+        self.assertEquals(sge._get_job_array_task_id('1212400.1-4:1', 3), '1212400.3')
+
+    def test_parse_only_jobs(self):
+        """
+        Test that only the requested jobs and tasks of job arrays are parsed when `only_jobs` is specified
+        """
+        sge = SgeScheduler()
+
+        job_list = sge._parse_joblist_output(0, text_qstat_job_array, '', only_jobs={'1212400.2', '1212400.6', '123'})
+        self.assertEquals(sorted(job.job_id for job in job_list), ['1212400.2', '1212400.6'])
+
+        job_list = sge._parse_joblist_output(0, text_qstat_ext_urg_xml_test, '', only_jobs={'1212299'})
+        self.assertEquals([job.job_id for job in job_list], ['1212299'])
+
     def test_submit_script(self):
         from aiida.schedulers.datastructures import JobTemplate
 
@@ -329,6 +389,30 @@ class TestCommand(unittest.TestCase):
         self.assertTrue("export HOME='/home/users/dorigm7s/'" in submit_script_text)
         self.assertTrue("export WIENROOT='$HOME:/WIEN2k'" in submit_script_text)
 
+    def test_job_bundle_script(self):
+        """
+        Test that a job bundle requests the processes of all jobs if they run at the same time and the wallclock
+        time of all jobs if they run one after the other.
+        """
+        from aiida.schedulers.datastructures import JobTemplate
+
+        sge = SgeScheduler()
+
+        job_tmpl = JobTemplate()
+        job_tmpl.job_resource = sge.create_job_resource(parallel_env="mpi8", tot_num_mpiprocs=16)
+        job_tmpl.max_wallclock_seconds = 3600
+
+        working_directories = ['/scratch/aiida/00/11/aa', '/scratch/aiida/22/33/bb', '/scratch/aiida/44/55/cc']
+
+        script_lines = sge.get_job_bundle_script(job_tmpl, working_directories, '_aiidasubmit.sh').split('\n')
+        self.assertTrue('#$ -pe mpi8 16' in script_lines)
+        self.assertTrue('#$ -l h_rt=03:00:00' in script_lines)
+
+        script_lines = sge.get_job_bundle_script(
+            job_tmpl, working_directories, '_aiidasubmit.sh', parallel=True).split('\n')
+        self.assertTrue('#$ -pe mpi8 48' in script_lines)
+        self.assertTrue('#$ -l h_rt=01:00:00' in script_lines)
+
     @staticmethod
     def _parse_time_string(string, fmt='%Y-%m-%dT%H:%M:%S'):
         """
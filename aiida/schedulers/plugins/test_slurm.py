@@ -96,6 +96,16 @@ class TestParserSqueue(unittest.TestCase):
         #                self.assertTrue( j.num_machines==num_machines )
         #                self.assertTrue( j.num_mpiprocs==num_mpiprocs )
 
+    def test_parse_only_jobs(self):
+        """
+        Test that only the requested jobs are parsed when `only_jobs` is specified
+        """
+        scheduler = SlurmScheduler()
+
+        job_list = scheduler._parse_joblist_output(0, TEXT_SQUEUE_TO_TEST, '', only_jobs={'863553', '863100', '123'})
+        self.assertEquals(sorted(j.job_id for j in job_list), ['863100', '863553'])
+        self.assertEquals([j.job_state for j in job_list if j.job_id == '863553'][0], JobState.RUNNING)
+
 
 class TestTimes(unittest.TestCase):
 
@@ -320,5 +330,163 @@ class TestSubmitScript(unittest.TestCase):
                 num_machines=1, num_mpiprocs_per_machine=1, num_cores_per_machine=24, num_cores_per_mpiproc=23)
 
 
+class TestJobArray(unittest.TestCase):
+
+    def test_job_array_script(self):
+        """
+        Test the creation of the submission script of a job array.
+        """
+        from aiida.schedulers.datastructures import JobTemplate
+
+        scheduler = SlurmScheduler()
+
+        job_tmpl = JobTemplate()
+        job_tmpl.shebang = '#!/bin/bash'
+        job_tmpl.job_name = 'aiida-1'
+        job_tmpl.sched_output_path = '_scheduler-stdout.txt'
+        job_tmpl.sched_error_path = '_scheduler-stderr.txt'
+        job_tmpl.job_resource = scheduler.create_job_resource(num_machines=1, num_mpiprocs_per_machine=1)
+        job_tmpl.max_wallclock_seconds = 3600
+
+        working_directories = ['/scratch/aiida/00/11/aa', '/scratch/aiida/22/33/bb']
+        script_text = scheduler.get_job_array_script(job_tmpl, working_directories, '_aiidasubmit.sh')
+        script_lines = script_text.split('\n')
+
+        self.assertEquals(script_lines[0], '#!/bin/bash')
+        self.assertTrue('#SBATCH --array=0-1' in script_lines)
+        self.assertTrue('#SBATCH --time=01:00:00' in script_lines)
+        self.assertFalse('--job-name' in script_text)
+        self.assertFalse('--output' in script_text)
+        self.assertTrue('case "$SLURM_ARRAY_TASK_ID" in' in script_lines)
+        self.assertTrue("    0) cd '/scratch/aiida/00/11/aa' || exit 1 ;;" in script_lines)
+        self.assertTrue("    1) cd '/scratch/aiida/22/33/bb' || exit 1 ;;" in script_lines)
+        self.assertTrue(
+            "bash '_aiidasubmit.sh' > '_scheduler-stdout.txt' 2> '_scheduler-stderr.txt'" in script_lines)
+
+        # The array directive should come before any non-scheduler command
+        directive_index = script_lines.index('#SBATCH --array=0-1')
+        self.assertTrue(directive_index < script_lines.index('case "$SLURM_ARRAY_TASK_ID" in'))
+
+    def test_job_array_task_ids(self):
+        """
+        Test the job ids of the tasks of a job array.
+        """
+        scheduler = SlurmScheduler()
+
+        self.assertEquals(scheduler._get_job_array_task_id('1234', 0), '1234_0')
+        self.assertTrue('--array' in scheduler._get_joblist_command(jobs=['1234_0', '1234_1']))
+        self.assertTrue('--jobs=1234_0,1234_1' in scheduler._get_joblist_command(jobs=['1234_0', '1234_1']))
+
+
+class TestJobBundle(unittest.TestCase):
+
+    @staticmethod
+    def _get_job_template(scheduler):
+        from aiida.schedulers.datastructures import JobTemplate
+
+        job_tmpl = JobTemplate()
+        job_tmpl.shebang = '#!/bin/bash'
+        job_tmpl.job_name = 'aiida-1'
+        job_tmpl.sched_output_path = '_scheduler-stdout.txt'
+        job_tmpl.sched_error_path = '_scheduler-stderr.txt'
+        job_tmpl.job_resource = scheduler.create_job_resource(num_machines=1, num_mpiprocs_per_machine=1)
+        job_tmpl.max_wallclock_seconds = 3600
+        return job_tmpl
+
+    def test_job_bundle_script_serial(self):
+        """
+        Test the creation of the submission script of a job bundle whose jobs run one after the other.
+        """
+        scheduler = SlurmScheduler()
+        job_tmpl = self._get_job_template(scheduler)
+
+        working_directories = ['/scratch/aiida/00/11/aa', '/scratch/aiida/22/33/bb']
+        script_text = scheduler.get_job_bundle_script(job_tmpl, working_directories, '_aiidasubmit.sh')
+        script_lines = script_text.split('\n')
+
+        self.assertEquals(script_lines[0], '#!/bin/bash')
+        # The jobs run one after the other, so the bundle needs the wallclock time of both but the nodes of one
+        self.assertTrue('#SBATCH --time=02:00:00' in script_lines)
+        self.assertTrue('#SBATCH --nodes=1' in script_lines)
+        self.assertFalse('--job-name' in script_text)
+        self.assertFalse('--output' in script_text)
+        self.assertFalse('wait' in script_lines)
+
+        first = ("( cd '/scratch/aiida/00/11/aa' && "
+                 "bash '_aiidasubmit.sh' > '_scheduler-stdout.txt' 2> '_scheduler-stderr.txt' )")
+        second = ("( cd '/scratch/aiida/22/33/bb' && "
+                  "bash '_aiidasubmit.sh' > '_scheduler-stdout.txt' 2> '_scheduler-stderr.txt' )")
+        self.assertTrue(script_lines.index(first) < script_lines.index(second))
+
+    def test_job_bundle_script_parallel(self):
+        """
+        Test the creation of the submission script of a job bundle whose jobs run at the same time.
+        """
+        scheduler = SlurmScheduler()
+        job_tmpl = self._get_job_template(scheduler)
+        job_tmpl.sched_join_files = True
+
+        working_directories = ['/scratch/aiida/00/11/aa', '/scratch/aiida/22/33/bb']
+        script_text = scheduler.get_job_bundle_script(job_tmpl, working_directories, '_aiidasubmit.sh', parallel=True)
+        script_lines = script_text.split('\n')
+
+        self.assertTrue("( cd '/scratch/aiida/00/11/aa' && bash '_aiidasubmit.sh' > '_scheduler-stdout.txt' 2>&1 ) &" in
+                        script_lines)
+        self.assertTrue("( cd '/scratch/aiida/22/33/bb' && bash '_aiidasubmit.sh' > '_scheduler-stdout.txt' 2>&1 ) &" in
+                        script_lines)
+        self.assertEquals(script_lines[-2], 'wait')
+
+        # The jobs run at the same time, so the bundle needs the nodes of both but the wallclock time of one
+        self.assertTrue('#SBATCH --time=01:00:00' in script_lines)
+        self.assertTrue('#SBATCH --nodes=2' in script_lines)
+        self.assertTrue('#SBATCH --ntasks-per-node=1' in script_lines)
+
+    def test_job_bundle_script_resource(self):
+        """
+        Test that a parallel job bundle raises if the job resource cannot be scaled to the number of jobs.
+        """
+        from aiida.common.exceptions import FeatureNotAvailable
+        from aiida.schedulers.datastructures import JobResource
+
+        scheduler = SlurmScheduler()
+        job_tmpl = self._get_job_template(scheduler)
+        job_tmpl.job_resource = JobResource()
+
+        with self.assertRaises(FeatureNotAvailable):
+            scheduler.get_job_bundle_script(job_tmpl, ['/scratch/a', '/scratch/b'], '_aiidasubmit.sh', parallel=True)
+
+
+class TestDetailedJobinfo(unittest.TestCase):
+
+    def test_detailed_jobinfo_many_command(self):
+        """
+        Test that the detailed job info of multiple jobs is requested with a single sacct command.
+        """
+        scheduler = SlurmScheduler()
+
+        command = scheduler._get_detailed_jobinfo_many_command(['1234', '1235'])
+        self.assertEquals(command.count('sacct'), 1)
+        self.assertTrue(command.endswith('--parsable --jobs=1234,1235'))
+
+    def test_parse_detailed_jobinfo_many_output(self):
+        """
+        Test that the output of sacct is split per job, including the steps of each job.
+        """
+        scheduler = SlurmScheduler()
+
+        stdout = '\n'.join([
+            'JobID|JobName|State|', '1234|aiida-1|COMPLETED|', '1234.batch|batch|COMPLETED|', '1235|aiida-2|FAILED|',
+            '1235.0|pw.x|FAILED|'
+        ])
+        command = scheduler._get_detailed_jobinfo_many_command(['1234', '1235', '1236'])
+        detailed = scheduler._parse_detailed_jobinfo_many_output(['1234', '1235', '1236'], command, 0, stdout, '')
+
+        self.assertEquals(sorted(detailed.keys()), ['1234', '1235', '1236'])
+        self.assertTrue('1234.batch|batch|COMPLETED|' in detailed['1234'])
+        self.assertFalse('1235' in detailed['1234'].split('stdout:')[1])
+        self.assertTrue('1235.0|pw.x|FAILED|' in detailed['1235'])
+        self.assertTrue('JobID|JobName|State|' in detailed['1236'])
+
+
 if __name__ == '__main__':
     unittest.main()
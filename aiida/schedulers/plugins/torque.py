@@ -46,6 +46,14 @@ class TorqueScheduler(PbsBaseClass):
     ## for the time being, but I can redefine it if needed.
     # _map_status = _map_status_pbs_common
 
+    _job_array_task_variable = 'PBS_ARRAYID'
+
+    def _get_job_array_directive(self, num_tasks):
+        """
+        Return the directive that turns the submit script into a job array.
+        """
+        return "#PBS -t 0-{}".format(num_tasks - 1)
+
     def _get_resource_lines(self, num_machines, num_mpiprocs_per_machine, num_cores_per_machine, max_memory_kb,
                             max_wallclock_seconds):
         """
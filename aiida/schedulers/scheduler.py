@@ -20,6 +20,7 @@ from aiida.common.lang import classproperty
 from aiida.common.escaping import escape_for_bash
 from aiida.common.exceptions import AiidaException, FeatureNotAvailable
 from aiida.schedulers.datastructures import JobTemplate
+from aiida.transports.instrumentation import CATEGORY_SCHEDULER, measure_operation
 
 __all__ = ('Scheduler', 'SchedulerError', 'SchedulerParsingError')
 
@@ -45,11 +46,28 @@ class Scheduler(object):
     # 'can_query_by_user': True if I can pass the 'user' argument to
     # get_joblist_command (and in this case, no 'jobs' should be given).
     # Otherwise, if False, a list of jobs is passed, and no 'user' is given.
+    # 'can_submit_job_arrays': True if the plugin implements the job array
+    # methods, such that multiple homogeneous jobs can be submitted at once.
     _features = {}
 
     # The class to be used for the job resource.
     _job_resource_class = None
 
+    # The name of the environment variable that contains the index of the task of a job array
+    _job_array_task_variable = None
+
+    # The index of the first task of a job array: some schedulers count from zero, others from one
+    _job_array_first_index = 0
+
+    # The line that separates the output of the detailed job info of consecutive jobs in a batched command
+    _detailed_jobinfo_separator = '__AIIDA_DETAILED_JOBINFO_END__'
+
+    # The maximum number of jobs for which the detailed job info is requested in a single command
+    _detailed_jobinfo_batch_size = 500
+
+    # Whether `_parse_joblist_output` accepts the `only_jobs` argument, to skip the jobs that are not of interest
+    _can_parse_only_jobs = False
+
     def __init__(self):
         self._transport = None
 
@@ -303,9 +321,114 @@ class Scheduler(object):
         """
 
         command = self._get_detailed_jobinfo_command(jobid=jobid)  # pylint: disable=assignment-from-no-return
-        with self.transport:
+        with self._measure_operation('get_detailed_jobinfo'), self.transport:
             retval, stdout, stderr = self.transport.exec_command_wait(command)
 
+        return self._format_detailed_jobinfo(command, retval, stdout, stderr)
+
+    def get_detailed_jobinfo_many(self, jobids):
+        """
+        Return the output of the detailed_jobinfo command for multiple jobs, using a single remote command
+        for up to `_detailed_jobinfo_batch_size` jobs rather than one command per job.
+
+        :param jobids: a list of job ids
+        :return: a dictionary with the job ids as keys and the detailed job info strings as values, in the same
+            format as returned by `get_detailed_jobinfo`
+        :raises: :class:`aiida.common.exceptions.FeatureNotAvailable`
+        """
+        jobids = list(jobids)
+        detailed_jobinfo = {}
+
+        with self._measure_operation('get_detailed_jobinfo_many'), self.transport:
+            for start in range(0, len(jobids), self._detailed_jobinfo_batch_size):
+                batch = jobids[start:start + self._detailed_jobinfo_batch_size]
+                command = self._get_detailed_jobinfo_many_command(batch)
+                retval, stdout, stderr = self.transport.exec_command_wait(command)
+                detailed_jobinfo.update(self._parse_detailed_jobinfo_many_output(batch, command, retval, stdout, stderr))
+
+        return detailed_jobinfo
+
+    def _get_detailed_jobinfo_many_command(self, jobids):
+        """
+        Return the command to run to get the detailed information on multiple jobs.
+
+        By default, the commands of the individual jobs are chained, each followed by a separator line with its exit
+        status on both stdout and stderr, such that the output can be split per job. Plugins whose scheduler can query
+        multiple jobs at once can override this method together with `_parse_detailed_jobinfo_many_output`.
+
+        :param jobids: a list of job ids
+        :raises: :class:`aiida.common.exceptions.FeatureNotAvailable`
+        """
+        commands = []
+        for jobid in jobids:
+            command = self._get_detailed_jobinfo_command(jobid=jobid)  # pylint: disable=assignment-from-no-return
+            commands.append('{command}; echo "{separator} $?"; echo "{separator}" >&2'.format(
+                command=command, separator=self._detailed_jobinfo_separator))
+        return '; '.join(commands)
+
+    def _parse_detailed_jobinfo_many_output(self, jobids, command, retval, stdout, stderr):
+        """
+        Split the output of the command returned by `_get_detailed_jobinfo_many_command` per job.
+
+        :param jobids: the list of job ids that was passed to `_get_detailed_jobinfo_many_command`
+        :param command: the command that was executed
+        :param retval: the return value of the command
+        :param stdout: the standard output of the command
+        :param stderr: the standard error of the command
+        :return: a dictionary with the job ids as keys and the detailed job info strings as values
+        """
+        separator = self._detailed_jobinfo_separator
+        stdout_chunks = [[]]
+        retvals = []
+        stderr_chunks = [[]]
+
+        # The separator can end up at the end of a line if the output of the command does not end with a newline
+        for line in stdout.splitlines():
+            if separator in line:
+                prefix, _, suffix = line.partition(separator)
+                if prefix:
+                    stdout_chunks[-1].append(prefix)
+                try:
+                    retvals.append(int(suffix.strip()))
+                except ValueError:
+                    retvals.append(retval)
+                stdout_chunks.append([])
+            else:
+                stdout_chunks[-1].append(line)
+
+        for line in stderr.splitlines():
+            if separator in line:
+                prefix, _, _ = line.partition(separator)
+                if prefix:
+                    stderr_chunks[-1].append(prefix)
+                stderr_chunks.append([])
+            else:
+                stderr_chunks[-1].append(line)
+
+        detailed_jobinfo = {}
+        for index, jobid in enumerate(jobids):
+            job_command = self._get_detailed_jobinfo_command(jobid=jobid)  # pylint: disable=assignment-from-no-return
+            if index < len(retvals):
+                job_stdout = '\n'.join(stdout_chunks[index])
+                job_stderr = '\n'.join(stderr_chunks[index]) if index < len(stderr_chunks) else ''
+                detailed_jobinfo[jobid] = self._format_detailed_jobinfo(job_command, retvals[index], job_stdout,
+                                                                        job_stderr)
+            else:
+                # The chain was interrupted before reaching this job, so all that is left is the remaining output
+                detailed_jobinfo[jobid] = self._format_detailed_jobinfo(command, retval, stdout, stderr)
+
+        return detailed_jobinfo
+
+    @staticmethod
+    def _format_detailed_jobinfo(command, retval, stdout, stderr):
+        """
+        Return the string with the detailed job info as returned by `get_detailed_jobinfo`.
+
+        :param command: the command that was executed
+        :param retval: the return value of the command
+        :param stdout: the standard output of the command
+        :param stderr: the standard error of the command
+        """
         return u"""Detailed jobinfo obtained with command '{}'
 Return Code: {}
 -------------------------------------------------------------
@@ -325,10 +448,13 @@ stderr:
 
         Return a list of JobInfo objects, one of each job,
         each with at least its default params implemented.
+
+        Plugins that set `_can_parse_only_jobs` to True should also accept the `only_jobs` keyword argument, a set of
+        job ids: if it is not None, only the jobs with these ids should be parsed and returned.
         """
         raise NotImplementedError
 
-    def get_jobs(self, jobs=None, user=None, as_dict=False):
+    def get_jobs(self, jobs=None, user=None, as_dict=False, only_jobs=None):
         """
         Get the list of jobs and return it.
 
@@ -339,14 +465,27 @@ stderr:
         :param list as_dict: if False (default), a list of JobInfo objects is
              returned. If True, a dictionary is returned, having as key the
              job_id and as value the JobInfo object.
+        :param only_jobs: optional list of job ids: the scheduler is queried as
+             usual, but only the jobs with these ids are parsed and returned. This
+             is useful when querying by user while only a few of the jobs of the
+             user are of interest.
 
         Note: typically, only either jobs or user can be specified. See also
         comments in _get_joblist_command.
         """
-        with self.transport:
-            retval, stdout, stderr = self.transport.exec_command_wait(self._get_joblist_command(jobs=jobs, user=user))
+        with self._measure_operation('get_jobs'):
+            with self.transport:
+                retval, stdout, stderr = self.transport.exec_command_wait(
+                    self._get_joblist_command(jobs=jobs, user=user))
+
+            if only_jobs is None:
+                joblist = self._parse_joblist_output(retval, stdout, stderr)
+            elif self._can_parse_only_jobs:
+                joblist = self._parse_joblist_output(retval, stdout, stderr, only_jobs=set(only_jobs))
+            else:
+                only_jobs = set(only_jobs)
+                joblist = [job for job in self._parse_joblist_output(retval, stdout, stderr) if job.job_id in only_jobs]
 
-        joblist = self._parse_joblist_output(retval, stdout, stderr)
         if as_dict:
             jobdict = {job.job_id: job for job in joblist}
             if None in jobdict:
@@ -365,6 +504,15 @@ stderr:
 
         return self._transport
 
+    def _measure_operation(self, operation):
+        """
+        Return a context manager that records the duration and outcome of a scheduler operation, if the transport
+        is instrumented, see :mod:`aiida.transports.instrumentation`.
+
+        :param operation: the name of the operation
+        """
+        return measure_operation(self._transport, CATEGORY_SCHEDULER, operation)
+
     @abstractmethod
     def _get_submit_command(self, submit_script):
         """
@@ -401,10 +549,232 @@ stderr:
         Typically, this function does not need to be modified by the plugins.
         """
 
-        self.transport.chdir(working_directory)
-        retval, stdout, stderr = self.transport.exec_command_wait(
-            self._get_submit_command(escape_for_bash(submit_script)))
-        return self._parse_submit_output(retval, stdout, stderr)
+        with self._measure_operation('submit_from_script'):
+            self.transport.chdir(working_directory)
+            retval, stdout, stderr = self.transport.exec_command_wait(
+                self._get_submit_command(escape_for_bash(submit_script)))
+            return self._parse_submit_output(retval, stdout, stderr)
+
+    def get_job_array_script(self, job_tmpl, working_directories, submit_script):
+        """
+        Return the submit script of a job array in which each task runs the submit script of one job.
+
+        All jobs are assumed to be homogeneous, i.e. their scheduler directives are the same, such that the directives
+        of the given job template can be used for the job array as a whole. Each task changes to the working directory
+        of its job and executes the submit script of that job, redirecting its output to the scheduler output files
+        that the job would have had if it were submitted on its own.
+
+        :param job_tmpl: a `JobTemplate` of one of the jobs, whose scheduler directives are shared by all jobs
+        :param working_directories: a list with the absolute path of the working directory of each job
+        :param submit_script: the name of the submit script, relative to the working directory of each job
+        :return: the submit script of the job array as a string
+        :raises: :class:`aiida.common.exceptions.FeatureNotAvailable` if the plugin does not support job arrays
+        """
+        from aiida.common.exceptions import InternalError
+
+        if not isinstance(job_tmpl, JobTemplate):
+            raise InternalError("job_tmpl should be of type JobTemplate")
+
+        if self._job_array_task_variable is None:
+            raise FeatureNotAvailable("Cannot submit job arrays")
+
+        empty_line = ""
+
+        script_lines = []
+        script_lines.append(self._get_shared_submit_script_header(
+            job_tmpl, self._get_job_array_directive(len(working_directories))))
+        script_lines.append(empty_line)
+
+        script_lines.append('case "${}" in'.format(self._job_array_task_variable))
+        for index, working_directory in enumerate(working_directories, start=self._job_array_first_index):
+            script_lines.append("    {}) cd {} || exit 1 ;;".format(index, escape_for_bash(working_directory)))
+        script_lines.append("    *) exit 1 ;;")
+        script_lines.append("esac")
+        script_lines.append(empty_line)
+
+        task_setup = self._get_job_task_setup()  # pylint: disable=assignment-from-none
+        if task_setup:
+            script_lines.append(task_setup)
+
+        script_lines.append(self._get_job_run_line(job_tmpl, submit_script))
+        script_lines.append(empty_line)
+
+        return "\n".join(script_lines)
+
+    def get_job_bundle_script(self, job_tmpl, working_directories, submit_script, parallel=False):
+        """
+        Return the submit script of a job bundle, i.e. a single job that runs the submit script of each of the
+        given jobs inside one allocation, either one after the other or all at the same time.
+
+        All jobs are assumed to be homogeneous, i.e. their scheduler directives are the same, such that the directives
+        of the given job template can be used for the bundle as a whole once scaled to the number of jobs: the bundle
+        requests the wallclock time of all jobs if they run one after the other, and the resources of all jobs if they
+        run at the same time, see `_get_job_bundle_template`.
+
+        :param job_tmpl: a `JobTemplate` of one of the jobs, whose scheduler directives are shared by all jobs
+        :param working_directories: a list with the absolute path of the working directory of each job
+        :param submit_script: the name of the submit script, relative to the working directory of each job
+        :param parallel: if True, all jobs are started at the same time, otherwise they run one after the other
+        :return: the submit script of the job bundle as a string
+        :raises: :class:`aiida.common.exceptions.FeatureNotAvailable` if the resources of the jobs cannot be scaled
+        """
+        from aiida.common.exceptions import InternalError
+
+        if not isinstance(job_tmpl, JobTemplate):
+            raise InternalError("job_tmpl should be of type JobTemplate")
+
+        empty_line = ""
+
+        bundle_tmpl = self._get_job_bundle_template(job_tmpl, len(working_directories), parallel)
+
+        script_lines = []
+        script_lines.append(self._get_shared_submit_script_header(bundle_tmpl))
+        script_lines.append(empty_line)
+
+        task_setup = self._get_job_task_setup()  # pylint: disable=assignment-from-none
+        run_line = self._get_job_run_line(job_tmpl, submit_script)
+
+        # Each job runs in a subshell, such that changing directory does not affect the other jobs
+        for working_directory in working_directories:
+            commands = ["cd {}".format(escape_for_bash(working_directory))]
+            if task_setup:
+                commands.append(task_setup)
+            commands.append(run_line)
+            script_lines.append("( {} ){}".format(" && ".join(commands), " &" if parallel else ""))
+
+        if parallel:
+            script_lines.append("wait")
+        script_lines.append(empty_line)
+
+        return "\n".join(script_lines)
+
+    @staticmethod
+    def _get_job_bundle_template(job_tmpl, num_jobs, parallel):
+        """
+        Return a copy of the job template of one of the jobs of a bundle, whose requests cover all the jobs.
+
+        If the jobs run one after the other, the maximum wallclock time is multiplied by the number of jobs. If they
+        run at the same time, the resources are multiplied by the number of jobs: the number of machines for a
+        `NodeNumberJobResource` and the total number of MPI processes for a `ParEnvJobResource`.
+
+        :param job_tmpl: a `JobTemplate` of one of the jobs
+        :param num_jobs: the number of jobs of the bundle
+        :param parallel: if True, all jobs run at the same time, otherwise they run one after the other
+        :return: the `JobTemplate` of the bundle
+        :raises: :class:`aiida.common.exceptions.FeatureNotAvailable` if the resources cannot be scaled
+        """
+        from aiida.schedulers.datastructures import NodeNumberJobResource, ParEnvJobResource
+
+        bundle_tmpl = job_tmpl.copy()
+        resource = job_tmpl.job_resource
+
+        if not parallel:
+            if job_tmpl.max_wallclock_seconds is not None:
+                bundle_tmpl.max_wallclock_seconds = int(job_tmpl.max_wallclock_seconds) * num_jobs
+        elif isinstance(resource, NodeNumberJobResource):
+            kwargs = {
+                'num_machines': resource.num_machines * num_jobs,
+                'num_mpiprocs_per_machine': resource.num_mpiprocs_per_machine,
+            }
+            for key in ['num_cores_per_machine', 'num_cores_per_mpiproc']:
+                if resource.get(key, None) is not None:
+                    kwargs[key] = resource[key]
+            bundle_tmpl.job_resource = resource.__class__(**kwargs)
+        elif isinstance(resource, ParEnvJobResource):
+            bundle_tmpl.job_resource = resource.__class__(
+                parallel_env=resource.parallel_env, tot_num_mpiprocs=resource.tot_num_mpiprocs * num_jobs)
+        else:
+            raise FeatureNotAvailable("Cannot scale the job resource {} to run {} jobs at the same time".format(
+                resource.__class__.__name__, num_jobs))
+
+        return bundle_tmpl
+
+    def _get_shared_submit_script_header(self, job_tmpl, custom_scheduler_commands=None):
+        """
+        Return the shebang and the scheduler directives of a script that runs the submit scripts of multiple jobs.
+
+        The scheduler output of the combined job goes to the default files of the scheduler, whereas the output of
+        the individual jobs is redirected to the files in the working directory of each job by `_get_job_run_line`.
+
+        :param job_tmpl: a `JobTemplate` of one of the jobs, whose scheduler directives are shared by all jobs
+        :param custom_scheduler_commands: optional additional scheduler directives
+        """
+        shared_tmpl = job_tmpl.copy()
+        shared_tmpl.job_name = None
+        shared_tmpl.sched_output_path = None
+        shared_tmpl.sched_error_path = None
+        shared_tmpl.sched_join_files = False
+        shared_tmpl.custom_scheduler_commands = "\n".join(
+            line for line in [job_tmpl.custom_scheduler_commands, custom_scheduler_commands] if line)
+
+        shebang = job_tmpl.shebang if job_tmpl.shebang is not None else '#!/bin/bash'
+        return "\n".join([shebang, self._get_submit_script_header(shared_tmpl)])
+
+    @staticmethod
+    def _get_job_run_line(job_tmpl, submit_script):
+        """
+        Return the line that executes the submit script of a single job from within its working directory,
+        redirecting its output to the scheduler output files that the job would have had if it were submitted on its
+        own.
+
+        :param job_tmpl: the `JobTemplate` of the job
+        :param submit_script: the name of the submit script, relative to the working directory of the job
+        """
+        stdout_str = "> {}".format(escape_for_bash(job_tmpl.sched_output_path)) if job_tmpl.sched_output_path else ""
+        if job_tmpl.sched_join_files:
+            stderr_str = "2>&1"
+        else:
+            stderr_str = "2> {}".format(escape_for_bash(job_tmpl.sched_error_path)) if job_tmpl.sched_error_path else ""
+
+        return "bash {} {} {}".format(escape_for_bash(submit_script), stdout_str, stderr_str).strip()
+
+    def _get_job_array_directive(self, num_tasks):
+        """
+        Return the scheduler directive that turns the submit script into a job array with the given number of tasks.
+
+        To be implemented by the plugins that support job arrays.
+
+        :param num_tasks: the number of tasks of the job array
+        :raises: :class:`aiida.common.exceptions.FeatureNotAvailable`
+        """
+        # pylint: disable=no-self-use, unused-argument
+        raise FeatureNotAvailable("Cannot submit job arrays")
+
+    def _get_job_task_setup(self):
+        """
+        Return the lines that each job of a job array or job bundle should execute after having changed to its
+        working directory, but before the submit script of the job is executed, or None if nothing is needed.
+        """
+        # pylint: disable=no-self-use
+        return None
+
+    def _get_job_array_task_id(self, job_id, index):
+        """
+        Return the job id of a single task of a job array, in a format that can be used for querying.
+
+        To be implemented by the plugins that support job arrays.
+
+        :param job_id: the job id of the job array, as returned by `_parse_submit_output`
+        :param index: the index of the task in the job array
+        :raises: :class:`aiida.common.exceptions.FeatureNotAvailable`
+        """
+        # pylint: disable=no-self-use, unused-argument
+        raise FeatureNotAvailable("Cannot submit job arrays")
+
+    def submit_job_array_from_script(self, working_directory, submit_script, num_tasks):
+        """
+        Goes in the working directory and submits the submit_script of a job array.
+
+        Return a list with the job ids of the tasks, in a valid format to be used for querying, in the same order
+        as the working directories that were passed to `get_job_array_script`.
+
+        :param working_directory: the directory from which the job array is submitted
+        :param submit_script: the submit script of the job array, as returned by `get_job_array_script`
+        :param num_tasks: the number of tasks of the job array
+        """
+        job_id = self.submit_from_script(working_directory, submit_script)
+        first_index = self._job_array_first_index
+        return [self._get_job_array_task_id(job_id, index) for index in range(first_index, first_index + num_tasks)]
 
     def kill(self, jobid):
         """
@@ -418,8 +788,9 @@ stderr:
 
         :return: True if everything seems ok, False otherwise.
         """
-        retval, stdout, stderr = self.transport.exec_command_wait(self._get_kill_command(jobid))
-        return self._parse_kill_output(retval, stdout, stderr)
+        with self._measure_operation('kill'):
+            retval, stdout, stderr = self.transport.exec_command_wait(self._get_kill_command(jobid))
+            return self._parse_kill_output(retval, stdout, stderr)
 
     def _get_kill_command(self, jobid):
         """
@@ -0,0 +1,377 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida_core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""
+Instrumentation of the input/output operations performed through transports and schedulers.
+
+The statistics are kept per `AuthInfo` and per operation, where each operation belongs to a category:
+
+    * `transport`: a single call to a method of the transport, e.g. `exec_command_wait` or `putfile`
+    * `scheduler`: a call to the scheduler, e.g. `get_jobs`, which includes the time of the command it runs through
+      the transport and of parsing its output
+    * `engine`: a complete transport task of a calculation job, e.g. `upload`, which includes the transport
+      operations it performs as well as all the time spent in the database and on the local file system
+
+Comparing the time of the categories tells where the wall time of the calculation jobs goes: the latency of the
+connection, the responsiveness of the scheduler or the local work of the engine.
+
+The bytes of the output of executed commands are always counted. The bytes of the files that are put or retrieved are
+only counted if requested, because that requires walking the local files after each transfer.
+"""
+from __future__ import division
+from __future__ import print_function
+from __future__ import absolute_import
+
+import contextlib
+import functools
+import io
+import json
+import os
+import tempfile
+import threading
+import time
+
+import six
+
+__all__ = ('IoStatistics', 'InstrumentedTransport', 'get_io_statistics', 'measure_operation')
+
+CATEGORY_ENGINE = 'engine'
+CATEGORY_SCHEDULER = 'scheduler'
+CATEGORY_TRANSPORT = 'transport'
+
+IO_STATISTICS = None
+
+
+def get_io_statistics():
+    """
+    Return the statistics of the input/output operations of this interpreter, creating them if necessary.
+
+    :rtype: :class:`aiida.transports.instrumentation.IoStatistics`
+    """
+    global IO_STATISTICS  # pylint: disable=global-statement
+
+    if IO_STATISTICS is None:
+        IO_STATISTICS = IoStatistics()
+
+    return IO_STATISTICS
+
+
+def get_path_size(path):
+    """
+    Return the total size in bytes of the local file or of all the files in the local folder with the given path.
+
+    :param path: the path of a local file or folder
+    :return: the size in bytes, zero if the path does not exist
+    """
+    if not isinstance(path, six.string_types) or not os.path.exists(path):
+        return 0
+
+    if not os.path.isdir(path):
+        return os.path.getsize(path)
+
+    size = 0
+    for dirpath, _, filenames in os.walk(path):
+        for filename in filenames:
+            filepath = os.path.join(dirpath, filename)
+            if not os.path.islink(filepath):
+                size += os.path.getsize(filepath)
+
+    return size
+
+
+class IoStatistics(object):
+    """
+    Aggregate the number, the duration, the failures and the bytes transferred of input/output operations.
+    """
+
+    # pylint: disable=useless-object-inheritance
+
+    def __init__(self):
+        super(IoStatistics, self).__init__()
+        self._lock = threading.Lock()
+        self._labels = {}
+        self._operations = {}
+
+    def clear(self):
+        """Reset all the statistics."""
+        with self._lock:
+            self._labels = {}
+            self._operations = {}
+
+    def set_label(self, key, label):
+        """
+        Set the human readable label of the given key, e.g. the user and computer of an `AuthInfo`.
+
+        :param key: the key under which the operations are recorded, typically the pk of the `AuthInfo`
+        :param label: the label
+        """
+        with self._lock:
+            self._labels[key] = label
+
+    def record(self, key, category, operation, duration, failed=False, nbytes=0):
+        """
+        Record a single operation.
+
+        :param key: the key under which the operation is recorded, typically the pk of the `AuthInfo`
+        :param category: the category of the operation, e.g. `transport` or `scheduler`
+        :param operation: the name of the operation, e.g. `exec_command_wait`
+        :param duration: the duration of the operation in seconds
+        :param failed: whether the operation raised an exception
+        :param nbytes: the number of bytes transferred by the operation
+        """
+        with self._lock:
+            operations = self._operations.setdefault(key, {}).setdefault(category, {})
+            try:
+                entry = operations[operation]
+            except KeyError:
+                entry = {'count': 0, 'failures': 0, 'total_time': 0., 'max_time': 0., 'bytes': 0}
+                operations[operation] = entry
+
+            entry['count'] += 1
+            entry['total_time'] += duration
+            entry['max_time'] = max(entry['max_time'], duration)
+            entry['bytes'] += nbytes
+            if failed:
+                entry['failures'] += 1
+
+    @contextlib.contextmanager
+    def measure(self, key, category, operation):
+        """
+        Context manager that records the operation performed in its body, as failed if it raises.
+
+        :param key: the key under which the operation is recorded, typically the pk of the `AuthInfo`
+        :param category: the category of the operation
+        :param operation: the name of the operation
+        """
+        start = time.time()
+        try:
+            yield
+        except BaseException:
+            self.record(key, category, operation, time.time() - start, failed=True)
+            raise
+        else:
+            self.record(key, category, operation, time.time() - start)
+
+    def as_dict(self):
+        """
+        Return the statistics as a dictionary that can be serialized to JSON.
+
+        The statistics are stored under the `authinfos` key, as a dictionary with the keys, converted to strings, as
+        keys and as values a dictionary with the `label` and the `operations`, the latter being a dictionary of
+        categories, each mapping the name of the operations on the counters of that operation.
+
+        :return: dictionary with the statistics, the pid of the process and the time at which they were taken
+        """
+        import copy
+
+        with self._lock:
+            authinfos = {}
+            for key, operations in self._operations.items():
+                authinfos[str(key)] = {
+                    'label': self._labels.get(key, str(key)),
+                    'operations': copy.deepcopy(operations),
+                }
+
+        return {'pid': os.getpid(), 'timestamp': time.time(), 'authinfos': authinfos}
+
+    def dump(self, filepath, extra=None):
+        """
+        Write the statistics as JSON to the given file.
+
+        The content is first written to a temporary file in the same folder that then replaces the file, such that
+        readers never see a partially written file.
+
+        :param filepath: the absolute path of the file
+        :param extra: optional dictionary of additional entries to write along with the statistics
+        """
+        content = self.as_dict()
+        content.update(extra or {})
+
+        dirpath = os.path.dirname(filepath)
+        handle, temporary = tempfile.mkstemp(dir=dirpath, prefix='.', suffix='.tmp')
+        try:
+            with io.open(handle, 'w', encoding='utf8') as fhandle:
+                fhandle.write(six.text_type(json.dumps(content)))
+            os.rename(temporary, filepath)
+        except Exception:
+            os.remove(temporary)
+            raise
+
+    @staticmethod
+    def merge(statistics):
+        """
+        Merge the statistics of several processes, as returned by `as_dict`, into a single dictionary.
+
+        :param statistics: an iterable of dictionaries of statistics
+        :return: dictionary with the merged `authinfos` and the list of `pids` of the processes
+        """
+        authinfos = {}
+        pids = []
+
+        for entry in statistics:
+            pids.append(entry['pid'])
+            for key, authinfo in entry['authinfos'].items():
+                merged = authinfos.setdefault(key, {'label': authinfo['label'], 'operations': {}})
+                for category, operations in authinfo['operations'].items():
+                    merged_operations = merged['operations'].setdefault(category, {})
+                    for operation, counters in operations.items():
+                        if operation not in merged_operations:
+                            merged_operations[operation] = dict(counters)
+                            continue
+                        merged_counters = merged_operations[operation]
+                        for counter in ['count', 'failures', 'total_time', 'bytes']:
+                            merged_counters[counter] += counters[counter]
+                        merged_counters['max_time'] = max(merged_counters['max_time'], counters['max_time'])
+
+        return {'pids': pids, 'authinfos': authinfos}
+
+
+class InstrumentedTransport(object):
+    """
+    Wrapper around a transport that records the operations performed through it in the `IoStatistics`.
+
+    All the attributes of the wrapped transport are accessible through the wrapper. Only the calls made through the
+    wrapper are recorded, calls that the transport makes internally, e.g. `put` calling `putfile`, are included in the
+    duration of the outer call.
+    """
+
+    # pylint: disable=useless-object-inheritance
+
+    _MEASURED_OPERATIONS = frozenset([
+        'open', 'close', 'chdir', 'chmod', 'chown', 'copy', 'copyfile', 'copytree', 'copy_from_remote_to_remote',
+        'copy_and_symlink_many', 'exec_command_wait', 'get', 'getfile', 'gettree', 'get_archive', 'getcwd',
+        'get_attribute', 'get_mode', 'isdir', 'isfile', 'listdir', 'listdir_withattributes', 'makedirs', 'mkdir',
+        'normalize', 'put', 'putfile', 'puttree', 'put_archive', 'remove', 'rename', 'rmdir', 'rmtree', 'symlink',
+        'whoami', 'path_exists', 'glob'
+    ])
+
+    _PUT_OPERATIONS = frozenset(['put', 'putfile', 'puttree'])
+    _GET_OPERATIONS = frozenset(['get', 'getfile', 'gettree'])
+
+    def __init__(self, transport, key, label=None, statistics=None, count_file_bytes=False):
+        """
+        :param transport: the transport to wrap
+        :param key: the key under which the operations are recorded, typically the pk of the `AuthInfo`
+        :param label: optional human readable label of the key
+        :param statistics: the statistics in which to record, by default those returned by `get_io_statistics`
+        :param count_file_bytes: whether to count the bytes of the files that are put or retrieved, which requires
+            walking the local files after each transfer
+        """
+        super(InstrumentedTransport, self).__init__()
+        self._transport = transport
+        self._key = key
+        self._count_file_bytes = count_file_bytes
+        self._statistics = statistics if statistics is not None else get_io_statistics()
+
+        if label is not None:
+            self._statistics.set_label(key, label)
+
+    def __getattr__(self, name):
+        attribute = getattr(self._transport, name)
+
+        if name not in self._MEASURED_OPERATIONS or not callable(attribute):
+            return attribute
+
+        @functools.wraps(attribute)
+        def wrapper(*args, **kwargs):
+            """Call the method of the transport and record its duration, outcome and bytes transferred."""
+            start = time.time()
+            try:
+                result = attribute(*args, **kwargs)
+            except BaseException:
+                self._statistics.record(self._key, CATEGORY_TRANSPORT, name, time.time() - start, failed=True)
+                raise
+
+            duration = time.time() - start
+            nbytes = self._get_transferred_bytes(name, args, kwargs, result)
+            self._statistics.record(self._key, CATEGORY_TRANSPORT, name, duration, nbytes=nbytes)
+            return result
+
+        return wrapper
+
+    def __enter__(self):
+        self._transport.__enter__()
+        return self
+
+    def __exit__(self, type_, value, traceback):
+        return self._transport.__exit__(type_, value, traceback)
+
+    def __str__(self):
+        return str(self._transport)
+
+    def __repr__(self):
+        return '<InstrumentedTransport: {!r}>'.format(self._transport)
+
+    @property
+    def transport(self):
+        """Return the wrapped transport."""
+        return self._transport
+
+    def measure_operation(self, category, operation):
+        """
+        Return a context manager that records the operation performed in its body for the key of this transport.
+
+        :param category: the category of the operation, e.g. `scheduler`
+        :param operation: the name of the operation
+        """
+        return self._statistics.measure(self._key, category, operation)
+
+    def _get_transferred_bytes(self, name, args, kwargs, result):
+        """
+        Return the number of bytes transferred by a completed call to a method of the transport.
+
+        For executed commands this is the size of their output. For files put or retrieved this is the size of the
+        local source or destination, if the bytes of files are counted, and zero otherwise.
+        """
+        # pylint: disable=too-many-return-statements
+        try:
+            if name == 'exec_command_wait':
+                _, stdout, stderr = result
+                return len(stdout or '') + len(stderr or '')
+
+            if not self._count_file_bytes:
+                return 0
+
+            if name in self._PUT_OPERATIONS:
+                return get_path_size(kwargs.get('localpath', args[0] if args else None))
+
+            if name in self._GET_OPERATIONS:
+                return get_path_size(kwargs.get('localpath', args[1] if len(args) > 1 else None))
+
+            if name == 'put_archive':
+                entries = kwargs.get('entries', args[0] if args else [])
+                return sum(get_path_size(source) for source, _ in entries)
+
+            if name == 'get_archive':
+                entries = kwargs.get('entries', args[0] if args else [])
+                localpath = kwargs.get('localpath', args[1] if len(args) > 1 else None)
+                return sum(get_path_size(os.path.join(localpath, target)) for _, target in entries)
+        except (TypeError, ValueError, OSError, IOError):
+            return 0
+
+        return 0
+
+
+@contextlib.contextmanager
+def _null_context():
+    yield
+
+
+def measure_operation(transport, category, operation):
+    """
+    Return a context manager that records the operation performed in its body, if the transport is instrumented.
+
+    :param transport: the transport, the operation is only recorded if it is an `InstrumentedTransport`
+    :param category: the category of the operation, e.g. `scheduler`
+    :param operation: the name of the operation
+    """
+    if isinstance(transport, InstrumentedTransport):
+        return transport.measure_operation(category, operation)
+
+    return _null_context()
@@ -28,6 +28,7 @@ import shutil
 import subprocess
 import glob
 
+import click
 import six
 from six.moves import cStringIO as StringIO
 
@@ -46,8 +47,12 @@ class LocalTransport(Transport):
     with a ``prepend_text``. For example, the AiiDA daemon sets a ``PYTHONPATH``, so you might want to add
     ``unset PYTHONPATH`` if you plan on running calculations that use Python.
     """
-    # There are no valid parameters for the local transport
-    _valid_auth_options = []
+    _valid_auth_options = [
+        ('zero_copy', {'type': click.Choice(['none', 'reflink']), 'prompt': 'Zero-copy mode', 'help': 'avoid copying the content of files: none or reflink (copy-on-write clones, if supported by the filesystem)', 'non_interactive_default': True}),
+    ]
+
+    # The ioctl request to clone a file on filesystems supporting copy-on-write, such as btrfs and xfs
+    _FICLONE = 0x40049409
 
     # There is no real limit on how fast you can connect to localhost
     # you should not be banned (as instead it is the case in SSH).
@@ -67,6 +72,9 @@ class LocalTransport(Transport):
         if self._machine and self._machine != 'localhost':
             self.logger.debug('machine was passed, but it is not localhost')
         self._safe_open_interval = kwargs.pop('safe_interval', self._DEFAULT_SAFE_OPEN_INTERVAL)
+        self._zero_copy = kwargs.pop('zero_copy', 'none')
+        if self._zero_copy not in ('none', 'reflink'):
+            raise ValueError("Unknown value of the zero copy mode, allowed values are: none, reflink")
         if kwargs:
             raise ValueError("Input parameters to LocalTransport" " are not recognized")
 
@@ -342,7 +350,7 @@ class LocalTransport(Transport):
         if os.path.exists(the_destination) and not overwrite:
             raise OSError('Destination already exists: not overwriting it')
 
-        shutil.copyfile(localpath, the_destination)
+        self._copy_file(localpath, the_destination)
 
     def puttree(self, localpath, remotepath, *args, **kwargs):
         """
@@ -383,7 +391,7 @@ class LocalTransport(Transport):
 
         the_destination = os.path.join(self.curdir, remotepath)
 
-        shutil.copytree(localpath, the_destination, symlinks=not dereference)
+        self._copy_tree(localpath, the_destination, symlinks=not dereference)
 
     def rmtree(self, path):
         """
@@ -500,7 +508,7 @@ class LocalTransport(Transport):
         if os.path.exists(localpath) and not overwrite:
             raise OSError('Destination already exists: not overwriting it')
 
-        shutil.copyfile(the_source, localpath)
+        self._copy_file(the_source, localpath)
 
     def gettree(self, remotepath, localpath, *args, **kwargs):
         """
@@ -538,7 +546,42 @@ class LocalTransport(Transport):
             localpath = os.path.join(localpath, os.path.split(remotepath)[1])
 
         the_source = os.path.join(self.curdir, remotepath)
-        shutil.copytree(the_source, localpath, symlinks=not dereference)
+        self._copy_tree(the_source, localpath, symlinks=not dereference)
+
+    def put_archive(self, entries, remotepath='.'):
+        """
+        Put multiple files and folders from local sources to a remote destination folder at once.
+
+        There are no round trips to save for the local transport, so the entries are put one by one, which does not
+        copy their content in a zero copy mode. The content of file-like sources is written directly to the destination.
+
+        :param entries: a list of tuples (source, target), see the docstring of the base class
+        :param str remotepath: path to the remote destination folder, which should exist
+        """
+        for source, target in entries:
+            destination = os.path.join(remotepath, target)
+            if isinstance(source, six.string_types):
+                self.put(source, destination)
+            else:
+                with open(os.path.join(self.curdir, destination), 'wb') as handle:
+                    shutil.copyfileobj(source, handle)
+
+    def get_archive(self, entries, localpath):
+        """
+        Retrieve multiple remote files and folders at once into a local folder.
+
+        In a zero copy mode, the entries are retrieved one by one with `get`, such that their content is not copied,
+        rather than through an archive.
+
+        :param entries: a list of tuples (source, target), see the docstring of the base class
+        :param str localpath: absolute path to the local destination folder
+        """
+        if self._zero_copy == 'none':
+            super(LocalTransport, self).get_archive(entries, localpath)
+            return
+
+        for source, target in entries:
+            self.get(source, os.path.join(localpath, target), ignore_nonexisting=True)
 
     # please refactor: issue #1780 on github
     # pylint: disable=too-many-branches
@@ -588,7 +631,7 @@ class LocalTransport(Transport):
                 the_s = os.path.join(self.curdir, source)
                 if self.isfile(source):
                     # With shutil, use the full path (the_s)
-                    shutil.copy(the_s, the_destination)
+                    self._copy_file(the_s, the_destination, copy_function=shutil.copy)
                 else:
                     # With self.copytree, the (possible) relative path is OK
                     self.copytree(source, remotedestination, dereference)
@@ -598,7 +641,7 @@ class LocalTransport(Transport):
             the_source = os.path.join(self.curdir, remotesource)
             if self.isfile(remotesource):
                 # With shutil, use the full path (the_source)
-                shutil.copy(the_source, the_destination)
+                self._copy_file(the_source, the_destination, copy_function=shutil.copy)
             else:
                 # With self.copytree, the (possible) relative path is OK
                 self.copytree(remotesource, remotedestination, dereference)
@@ -628,7 +671,7 @@ class LocalTransport(Transport):
             linkto = os.readlink(the_source)
             os.symlink(linkto, the_destination)
         else:
-            shutil.copyfile(the_source, the_destination)
+            self._copy_file(the_source, the_destination)
 
     def copytree(self, remotesource, remotedestination, dereference=False):
         """
@@ -655,7 +698,66 @@ class LocalTransport(Transport):
         if self.isdir(remotedestination):
             the_destination = os.path.join(the_destination, os.path.split(remotesource)[1])
 
-        shutil.copytree(the_source, the_destination, symlinks=not dereference)
+        self._copy_tree(the_source, the_destination, symlinks=not dereference)
+
+    def _copy_file(self, source, destination, copy_function=shutil.copyfile):
+        """
+        Copy a file, avoiding to copy its content if the transport is configured with a zero copy mode.
+
+        In the `reflink` mode, the file is cloned if the filesystem supports it, such that the content is only copied
+        once either file is modified. Files are never hard linked, since the sources are typically files of the
+        repository, which must not change when the copy is modified, for example by a calculation or by a `chmod`.
+        If the file cannot be cloned, or in the `none` mode, it is copied.
+
+        :param source: the absolute path of the file to copy
+        :param destination: the absolute path of the destination file, or folder if `copy_function` supports it
+        :param copy_function: the function used to copy the file if it cannot be cloned
+        """
+        if self._zero_copy == 'none':
+            copy_function(source, destination)
+            return
+
+        if os.path.isdir(destination) and copy_function is not shutil.copyfile:
+            destination = os.path.join(destination, os.path.basename(source))
+
+        try:
+            import fcntl
+            with open(source, 'rb') as source_handle, open(destination, 'wb') as destination_handle:
+                fcntl.ioctl(destination_handle.fileno(), self._FICLONE, source_handle.fileno())
+        except (ImportError, IOError, OSError):
+            copy_function(source, destination)
+        else:
+            # Also copy the metadata that the copy function would have copied
+            if copy_function is shutil.copy2:
+                shutil.copystat(source, destination)
+            elif copy_function is shutil.copy:
+                shutil.copymode(source, destination)
+
+    def _copy_tree(self, source, destination, symlinks=False):
+        """
+        Copy a folder recursively, like `shutil.copytree`, but copying the files with `_copy_file`.
+
+        :param source: the absolute path of the folder to copy
+        :param destination: the absolute path of the destination folder, which should not exist
+        :param symlinks: if True symbolic links are copied as such, otherwise the files they point to are copied
+        """
+        if self._zero_copy == 'none':
+            shutil.copytree(source, destination, symlinks=symlinks)
+            return
+
+        os.makedirs(destination)
+
+        for name in os.listdir(source):
+            source_path = os.path.join(source, name)
+            destination_path = os.path.join(destination, name)
+            if symlinks and os.path.islink(source_path):
+                os.symlink(os.readlink(source_path), destination_path)
+            elif os.path.isdir(source_path):
+                self._copy_tree(source_path, destination_path, symlinks)
+            else:
+                self._copy_file(source_path, destination_path, copy_function=shutil.copy2)
+
+        shutil.copystat(source, destination)
 
     def get_attribute(self, path):
         """
@@ -768,6 +870,15 @@ class LocalTransport(Transport):
 
         return proc.stdin, proc.stdout, proc.stderr, proc
 
+    def _wait_command_internal(self, session):
+        """
+        Wait for a command started with `_exec_command_internal` to finish and return its exit status.
+
+        :param session: the process returned by `_exec_command_internal`
+        """
+        session.communicate()
+        return session.returncode
+
     def exec_command_wait(self, command, **kwargs):
         """
         Executes the specified command and waits for it to finish.
@@ -880,5 +991,9 @@ class LocalTransport(Transport):
     def _get_safe_interval_suggestion_string(cls, computer):
         return cls._DEFAULT_SAFE_OPEN_INTERVAL
 
+    @classmethod
+    def _get_zero_copy_suggestion_string(cls, computer):  # pylint: disable=unused-argument
+        return 'none'
+
 
 CONFIGURE_LOCAL_CMD = transport_cli.create_configure_cmd('local')
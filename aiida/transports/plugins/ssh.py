@@ -53,6 +53,12 @@ def convert_to_bool(string):
         raise ValueError("Invalid boolean value provided")
 
 
+class _PersistentShellUnavailable(Exception):
+    """
+    Raised when a command could not be sent to the persistent shell of the `SshTransport`.
+    """
+
+
 class SshTransport(Transport):
     """
     Support connection, command execution and data transfer to remote computers via SSH+SFTP.
@@ -90,13 +96,25 @@ class SshTransport(Transport):
     # instance
     _valid_auth_options = _valid_connect_options + [
         ('load_system_host_keys', {'switch': True, 'prompt': 'Load system host keys', 'help': 'switch loading system host keys on / off', 'non_interactive_default': True}),
-        ('key_policy', {'type': click.Choice(['RejectPolicy', 'WarningPolicy', 'AutoAddPolicy']), 'prompt': 'Key policy', 'help': 'SSH key policy', 'non_interactive_default': True})
+        ('key_policy', {'type': click.Choice(['RejectPolicy', 'WarningPolicy', 'AutoAddPolicy']), 'prompt': 'Key policy', 'help': 'SSH key policy', 'non_interactive_default': True}),
+        ('transfer_concurrency', {'type': int, 'prompt': 'Concurrent SFTP transfers', 'help': 'maximum number of SFTP channels used concurrently to transfer the files of a folder', 'non_interactive_default': True}),
+        ('use_persistent_shell', {'switch': True, 'prompt': 'Use a persistent shell', 'help': 'switch executing commands in a single long-lived login shell on / off', 'non_interactive_default': True})
     ]
 
     # I set the (default) value here to 5 secs between consecutive SSH checks.
     # This should be incremented to 30, probably.
     _DEFAULT_SAFE_OPEN_INTERVAL = 5
 
+    # Printed by the script of `copy_and_symlink_many` after each command, followed by its exit status
+    _copy_and_symlink_separator = '__AIIDA_COPY_AND_SYMLINK_END__'
+
+    # Printed by the persistent shell on both stdout and stderr after each command, followed by a unique token
+    _persistent_shell_separator = '__AIIDA_PERSISTENT_SHELL_END__'
+
+    # Time in seconds to wait for output of the persistent shell before checking that the connection is still alive,
+    # if no connection timeout is configured
+    _DEFAULT_PERSISTENT_SHELL_TIMEOUT = 60
+
     @classmethod
     def _get_username_suggestion_string(cls, computer):
         """
@@ -216,6 +234,20 @@ class SshTransport(Transport):
         """
         return "RejectPolicy"
 
+    @classmethod
+    def _get_transfer_concurrency_suggestion_string(cls, computer):
+        """
+        Return a suggestion for the specific field.
+        """
+        return "1"
+
+    @classmethod
+    def _get_use_persistent_shell_suggestion_string(cls, computer):
+        """
+        Return a suggestion for the specific field.
+        """
+        return "False"
+
     @classmethod
     def _get_gss_auth_suggestion_string(cls, computer):
         """
@@ -261,6 +293,10 @@ class SshTransport(Transport):
            if False, do not load the system host keys
         :param key_policy: (optional, default = paramiko.RejectPolicy())
            the policy to use for unknown keys
+        :param transfer_concurrency: (optional, default 1)
+           the maximum number of SFTP channels used concurrently by `puttree` and `gettree`
+        :param use_persistent_shell: (optional, default False)
+           if True, `exec_command_wait` runs the commands in a single long-lived login shell, see `_exec_command_shell`
 
         Other parameters valid for the ssh connect function (see the
         self._valid_connect_params list) are passed to the connect
@@ -272,7 +308,9 @@ class SshTransport(Transport):
 
         self._is_open = False
         self._sftp = None
+        self._sftp_pool = []
         self._proxy = None
+        self._shell = None
 
         self._machine = machine
 
@@ -282,6 +320,8 @@ class SshTransport(Transport):
             self._client.load_system_host_keys()
 
         self._safe_open_interval = kwargs.pop('safe_interval', self._DEFAULT_SAFE_OPEN_INTERVAL)
+        self._use_persistent_shell = kwargs.pop('use_persistent_shell', False)
+        self._transfer_concurrency = kwargs.pop('transfer_concurrency', 1)
 
         self._missing_key_policy = kwargs.pop('key_policy', 'RejectPolicy')  # This is paramiko default
         if self._missing_key_policy == 'RejectPolicy':
@@ -356,6 +396,10 @@ class SshTransport(Transport):
         if not self._is_open:
             raise InvalidOperation("Cannot close the transport: it is already closed")
 
+        self._close_persistent_shell()
+        for sftp in self._sftp_pool:
+            sftp.close()
+        self._sftp_pool = []
         self._sftp.close()
         self._client.close()
         self._is_open = False
@@ -733,23 +777,71 @@ class SshTransport(Transport):
 
         # TODO, NOTE: we are not using 'onerror' because we checked above that
         # the folder exists, but it would be better to use it
+        transfers = []
         for this_source in os.walk(localpath):
             # Get the relative path
             this_basename = os.path.relpath(path=this_source[0], start=localpath)
 
-            try:
-                self.sftp.stat(os.path.join(remotepath, this_basename))
-            except IOError as e:
-                import errno
-                if e.errno == errno.ENOENT:  # Missing file
-                    self.mkdir(os.path.join(remotepath, this_basename))
-                else:
-                    raise
+            # The remotepath has just been created, so none of its subfolders can exist yet
+            if this_basename != os.curdir:
+                self.mkdir(os.path.join(remotepath, this_basename))
 
             for this_file in this_source[2]:
                 this_local_file = os.path.join(localpath, this_basename, this_file)
                 this_remote_file = os.path.join(remotepath, this_basename, this_file)
-                self.putfile(this_local_file, this_remote_file)
+                transfers.append((this_local_file, this_remote_file))
+
+        self._transfer_files(transfers, put=True)
+
+    def put_archive(self, entries, remotepath='.'):
+        """
+        Put multiple files and folders at once, by streaming them as a single tar archive through one exec channel
+        to a remote `tar` process that unpacks it in the destination folder. This replaces the several SFTP round
+        trips per file of `put` by a single command. Note that folders are merged into existing remote folders.
+
+        If the archive cannot be unpacked on the remote, e.g. because `tar` is not available, the entries are put
+        one by one instead.
+
+        :param entries: a list of tuples (source, target), where source is either the absolute path of a local file
+            or folder, or a file-like object opened in binary mode whose content should be put, and target is the
+            path of the destination relative to `remotepath`
+        :param str remotepath: path to the remote destination folder, which should exist
+        """
+        # Remember the position of file-like sources, such that they can be rewound for the fallback. Only the content
+        # of sources that cannot be rewound is read upfront.
+        entries = list(entries)
+        positions = {}
+
+        for index, (source, target) in enumerate(entries):
+            if isinstance(source, six.string_types):
+                if not os.path.exists(source):
+                    raise OSError("The local path {} does not exist".format(source))
+                continue
+            try:
+                positions[index] = source.tell()
+            except (AttributeError, IOError, OSError, io.UnsupportedOperation):
+                entries[index] = (io.BytesIO(source.read()), target)
+                positions[index] = 0
+
+        command = 'tar -x -f - -C {}'.format(escape_for_bash(remotepath))
+        ssh_stdin, _, stderr, channel = self._exec_command_internal(command)
+
+        try:
+            self._write_archive(entries, ssh_stdin)
+            ssh_stdin.flush()
+            channel.shutdown_write()
+            retval = channel.recv_exit_status()
+            stderr_text = stderr.read().decode('utf-8')
+        except (IOError, OSError, EOFError) as exception:
+            channel.close()
+            retval, stderr_text = None, str(exception)
+
+        if retval != 0:
+            self.logger.warning('unpacking the archive on the remote failed ({}), putting the entries one by one: {}'
+                                .format(retval, stderr_text))
+            for index, position in positions.items():
+                entries[index][0].seek(position)
+            super(SshTransport, self).put_archive(entries, remotepath)
 
     def get(self, remotepath, localpath, callback=None, dereference=True, overwrite=True, ignore_nonexisting=False):
         """
@@ -840,15 +932,7 @@ class SshTransport(Transport):
         if not dereference:
             raise NotImplementedError
 
-        # Workaround for bug #724 in paramiko -- remove localpath on IOError
-        try:
-            return self.sftp.get(remotepath, localpath, callback)
-        except IOError:
-            try:
-                os.remove(localpath)
-            except OSError:
-                pass
-            raise
+        return self._get_with_client(self.sftp, remotepath, localpath, callback)
 
     def gettree(self, remotepath, localpath, callback=None, dereference=True, overwrite=True):
         """
@@ -892,16 +976,108 @@ class SshTransport(Transport):
             localpath = os.path.join(localpath, os.path.split(remotepath)[1])
             os.mkdir(localpath)  # create a nested folder
 
-        item_list = self.listdir(remotepath)
-        dest = str(localpath)
+        # Walk the remote folder with a single listing per subfolder, creating the local subfolders, and only then
+        # retrieve all the files at once
+        transfers = []
+        folders = [(remotepath, str(localpath))]
+
+        while folders:
+            remote_folder, local_folder = folders.pop()
+            for entry in self.listdir_withattributes(remote_folder):
+                remote_item = os.path.join(remote_folder, entry['name'])
+                local_item = os.path.join(local_folder, entry['name'])
+                if entry['isdir']:
+                    os.mkdir(local_item)
+                    folders.append((remote_item, local_item))
+                else:
+                    transfers.append((remote_item, local_item))
 
-        for item in item_list:
-            item = str(item)
+        self._transfer_files(transfers, put=False)
 
-            if self.isdir(os.path.join(remotepath, item)):
-                self.gettree(os.path.join(remotepath, item), os.path.join(dest, item))
-            else:
-                self.getfile(os.path.join(remotepath, item), os.path.join(dest, item))
+    def _get_sftp_pool(self, size):
+        """
+        Return a list of SFTP clients to transfer files concurrently, each in the current working directory.
+
+        The first client is the main one of the transport. The additional clients, each on its own channel, are
+        opened when first needed and are kept open until the transport is closed.
+
+        :param size: the number of clients to return
+        """
+        while len(self._sftp_pool) < size - 1:
+            self._sftp_pool.append(self.sshclient.open_sftp())
+
+        clients = [self.sftp] + self._sftp_pool[:size - 1]
+
+        for client in clients[1:]:
+            if client.getcwd() != self.getcwd():
+                client.chdir(self.getcwd())
+
+        return clients
+
+    def _transfer_files(self, transfers, put):
+        """
+        Transfer multiple files between the local and the remote.
+
+        The files are distributed over up to `transfer_concurrency` SFTP clients, each used by its own thread, such
+        that the latency of the requests of one file is hidden behind the transfer of the others. Each transfer is
+        itself pipelined by paramiko. When a transfer fails, no new transfers are started and the exception is raised
+        once all threads have finished.
+
+        :param transfers: a list of tuples (source, destination) with the paths of the files to transfer
+        :param put: if True the files are put from the local to the remote, otherwise they are retrieved
+        """
+        import threading
+        from six.moves import queue
+
+        size = max(1, min(self._transfer_concurrency, len(transfers)))
+        clients = self._get_sftp_pool(size)
+        pending = queue.Queue()
+        exceptions = []
+
+        for transfer in transfers:
+            pending.put(transfer)
+
+        def transfer_pending(client):
+            """Transfer files until there are none left or a transfer failed."""
+            while not exceptions:
+                try:
+                    source, destination = pending.get_nowait()
+                except queue.Empty:
+                    return
+                try:
+                    if put:
+                        client.put(source, destination)
+                    else:
+                        self._get_with_client(client, source, destination)
+                except Exception as exception:  # pylint: disable=broad-except
+                    exceptions.append(exception)
+
+        if size == 1:
+            transfer_pending(clients[0])
+        else:
+            threads = [threading.Thread(target=transfer_pending, args=(client,)) for client in clients]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        if exceptions:
+            raise exceptions[0]
+
+    @staticmethod
+    def _get_with_client(client, remotepath, localpath, callback=None):
+        """
+        Get a file from remote to local with the given SFTP client.
+        """
+        # Workaround for bug #724 in paramiko -- remove localpath on IOError
+        try:
+            return client.get(remotepath, localpath, callback)
+        except IOError:
+            try:
+                os.remove(localpath)
+            except OSError:
+                pass
+            raise
 
     def get_attribute(self, path):
         """
@@ -1038,6 +1214,41 @@ class SshTransport(Transport):
                 base_dir += '/'
             return [re.sub(base_dir, '', i) for i in filtered_list]
 
+    def listdir_withattributes(self, path='.', pattern=None):
+        """
+        Return a list of the names of the entries in the given path, together with their attributes.
+
+        Differently from the base implementation, all attributes are obtained with a single SFTP request for the whole
+        folder, rather than one per entry. Only for symbolic links an additional request is needed, to determine
+        whether they point to a folder.
+
+        :param str path: path to list (default to '.')
+        :param str pattern: if used, only the entries whose name matches the pattern in Unix style are returned
+        :return: a list of dictionaries, one per entry, see the docstring of the base class
+        """
+        import fnmatch
+        from stat import S_ISLNK
+        from aiida.transports.util import FileAttribute
+
+        retlist = []
+
+        for paramiko_attr in self.sftp.listdir_attr(path):
+            if pattern is not None and not fnmatch.fnmatch(paramiko_attr.filename, pattern):
+                continue
+
+            attributes = FileAttribute()
+            for key in attributes._valid_fields:  # pylint: disable=protected-access
+                attributes[key] = getattr(paramiko_attr, key)
+
+            if S_ISLNK(paramiko_attr.st_mode):
+                isdir = self.isdir(os.path.join(path, paramiko_attr.filename))
+            else:
+                isdir = S_ISDIR(paramiko_attr.st_mode)
+
+            retlist.append({'name': paramiko_attr.filename, 'attributes': attributes, 'isdir': isdir})
+
+        return retlist
+
     def remove(self, path):
         """
         Remove a single file at 'path'
@@ -1133,6 +1344,14 @@ class SshTransport(Transport):
 
         return stdin, stdout, stderr, channel
 
+    def _wait_command_internal(self, session):
+        """
+        Wait for a command started with `_exec_command_internal` to finish and return its exit status.
+
+        :param session: the paramiko.Channel returned by `_exec_command_internal`
+        """
+        return session.recv_exit_status()
+
     def exec_command_wait(self, command, stdin=None, combine_stderr=False, bufsize=-1):
         """
         Executes the specified command and waits for it to finish.
@@ -1149,6 +1368,14 @@ class SshTransport(Transport):
         """
         # TODO: To see if like this it works or hangs because of buffer problems.
 
+        if self._use_persistent_shell and stdin is None:
+            try:
+                return self._exec_command_shell(command, combine_stderr)
+            except _PersistentShellUnavailable as exception:
+                self.logger.warning(
+                    'persistent shell unavailable, falling back to a new channel per command: {}'.format(exception))
+                self._use_persistent_shell = False
+
         ssh_stdin, stdout, stderr, channel = self._exec_command_internal(command, combine_stderr, bufsize=bufsize)
 
         if stdin is not None:
@@ -1177,6 +1404,137 @@ class SshTransport(Transport):
 
         return retval, output_text, stderr_text
 
+    def _open_persistent_shell(self):
+        """
+        Open the channel of the persistent shell, running a login shell that reads the commands from its stdin.
+
+        The profiles of the login shell are therefore only loaded once, instead of for each command. Anything that they
+        print, like a banner, is read up to a first separator and discarded, such that it does not end up in the output
+        of the first command.
+        """
+        import uuid
+
+        separator = '{}_{}'.format(self._persistent_shell_separator, uuid.uuid4().hex)
+
+        channel = self.sshclient.get_transport().open_session()
+        channel.exec_command('bash -l -s')
+        self._shell = channel
+        self._shell.sendall(self._get_persistent_shell_separator_script(separator).encode('utf-8'))
+        self._read_persistent_shell(separator)
+
+    def _close_persistent_shell(self):
+        """
+        Close the channel of the persistent shell, if it was opened.
+        """
+        if self._shell is not None:
+            try:
+                self._shell.close()
+            finally:
+                self._shell = None
+
+    def _exec_command_shell(self, command, combine_stderr=False):
+        """
+        Execute a command in the persistent shell and wait for it to finish.
+
+        Each command is run in a subshell, such that changes of directory or environment do not leak into the following
+        commands, with its stdin redirected from /dev/null, such that it cannot consume the following commands. It is
+        followed by a separator with a unique token, printed on both stdout and stderr, which marks the end of the
+        output of the command and, on stdout, also carries its exit status.
+
+        :param command: the command to execute
+        :param combine_stderr: if True, combine stdout and stderr of the command in the returned stdout
+        :return: a tuple with (return_value, stdout, stderr) where stdout and stderr are strings.
+        :raises _PersistentShellUnavailable: if the shell could not be opened or the command could not be sent to it, in
+            which case the command was not executed and it can safely be executed on a new channel.
+        :raises IOError: if the shell was lost while the command was executing. The command may or may not have been
+            executed, so it is not executed again, but the persistent shell is no longer used.
+        """
+        import uuid
+
+        separator = '{}_{}'.format(self._persistent_shell_separator, uuid.uuid4().hex)
+
+        if self.getcwd() is not None:
+            command = 'cd {} && eval {}'.format(escape_for_bash(self.getcwd()), escape_for_bash(command))
+        else:
+            command = 'eval {}'.format(escape_for_bash(command))
+
+        script = '( {} ) < /dev/null{}\n{}'.format(command, ' 2>&1' if combine_stderr else '',
+                                                  self._get_persistent_shell_separator_script(separator))
+
+        try:
+            if self._shell is None or self._shell.closed or self._shell.exit_status_ready():
+                self._close_persistent_shell()
+                self._open_persistent_shell()
+            self.logger.debug("Command to be executed in the persistent shell: {}".format(command))
+            self._shell.sendall(script.encode('utf-8'))
+        except Exception as exception:
+            self._close_persistent_shell()
+            raise _PersistentShellUnavailable(exception)
+
+        try:
+            retval, stdout, stderr = self._read_persistent_shell(separator)
+        except Exception as exception:
+            self._close_persistent_shell()
+            self._use_persistent_shell = False
+            raise IOError('lost the persistent shell while executing `{}`, it will no longer be used: {}'.format(
+                command, exception))
+
+        return retval, stdout.decode('utf-8'), stderr.decode('utf-8')
+
+    @staticmethod
+    def _get_persistent_shell_separator_script(separator):
+        """
+        Return the lines to send to the persistent shell to print the separator, after the output of what precedes it.
+
+        :param separator: the separator, including its unique token
+        :return: the script, which prints the separator with the last exit status on stdout and the separator on stderr
+        """
+        return 'printf "\\n%s %d\\n" {} $?\nprintf "\\n%s\\n" {} >&2\n'.format(separator, separator)
+
+    def _read_persistent_shell(self, separator):
+        """
+        Read the stdout and stderr of the persistent shell up to the given separator.
+
+        While waiting for output, the connection is checked to still be alive every time the connection timeout passes
+        without any output, such that a lost connection does not block forever.
+
+        :param separator: the separator, including its unique token
+        :return: a tuple with (return_value, stdout, stderr) where stdout and stderr are the bytes read before the
+            separator
+        :raises IOError: if the persistent shell exited or the connection was lost before printing the separator
+        """
+        import re
+        import select
+
+        timeout = self._connect_args.get('timeout') or self._DEFAULT_PERSISTENT_SHELL_TIMEOUT
+        # The separator is searched for only in the part of the output that was received last, which has to include the
+        # length of the separator and of the newlines and exit status around it, in case it was split over two chunks
+        overlap = len(separator) + 16
+
+        stdout_end = re.compile(b'\n' + separator.encode('utf-8') + b' (-?\\d+)\n')
+        stderr_end = re.compile(b'\n' + separator.encode('utf-8') + b'\n')
+        stdout_match, stderr_match = None, None
+        stdout, stderr = bytearray(), bytearray()
+
+        while stdout_match is None or stderr_match is None:
+            if self._shell.recv_ready():
+                chunk = self._shell.recv(65536)
+                stdout += chunk
+                stdout_match = stdout_match or stdout_end.search(stdout, max(0, len(stdout) - len(chunk) - overlap))
+            elif self._shell.recv_stderr_ready():
+                chunk = self._shell.recv_stderr(65536)
+                stderr += chunk
+                stderr_match = stderr_match or stderr_end.search(stderr, max(0, len(stderr) - len(chunk) - overlap))
+            elif self._shell.eof_received or self._shell.closed or self._shell.exit_status_ready():
+                status = self._shell.recv_exit_status() if self._shell.exit_status_ready() else 'unknown'
+                raise IOError('the persistent shell exited with status {}'.format(status))
+            else:
+                readable, _, _ = select.select([self._shell], [], [], timeout)
+                if not readable and not self._shell.get_transport().is_active():
+                    raise IOError('the connection of the persistent shell was lost')
+
+        return int(stdout_match.group(1)), bytes(stdout[:stdout_match.start()]), bytes(stderr[:stderr_match.start()])
+
     def gotocomputer_command(self, remotedir):
         """
         Specific gotocomputer string to connect to a given remote computer via
@@ -1230,6 +1588,92 @@ class SshTransport(Transport):
         else:
             self.sftp.symlink(s, d)
 
+    def copy_and_symlink_many(self, operations):
+        """
+        Perform multiple remote copy and symlink operations at once, executing them as a single remote script.
+
+        Each operation is run as a `cp -f -r` or `ln -s` command, after which the script prints a separator with the
+        exit status of the command, such that the output and status of each operation can be reported separately.
+        Sources with patterns are expanded beforehand, with the same rules as `copy` and `symlink`.
+
+        :param operations: a list of tuples (operation, remotesource, remotedestination), see the base class
+        :raises ValueError: if any of the operations is unknown
+        :raises IOError: if any of the operations failed, with the error of each failed operation in the message
+        """
+        operations = self._validate_copy_and_symlink_operations(operations)
+        failures = []
+        commands = []
+
+        for index, (operation, source, destination) in enumerate(operations):
+            try:
+                for command in self._get_copy_and_symlink_commands(operation, source, destination):
+                    commands.append((index, command))
+            except (IOError, OSError, ValueError) as exception:
+                failures.append((index, exception))
+
+        if commands:
+            script = ''.join('{} 2>&1; printf "\\n%s %s\\n" {} $?\n'.format(command, self._copy_and_symlink_separator)
+                             for _, command in commands)
+            retval, stdout, stderr = self.exec_command_wait('bash', stdin=script)
+
+            outputs = []
+            lines = []
+            for line in stdout.splitlines():
+                if line.startswith(self._copy_and_symlink_separator + ' '):
+                    outputs.append((int(line.split()[-1]), '\n'.join(lines).strip()))
+                    lines = []
+                else:
+                    lines.append(line)
+
+            if len(outputs) != len(commands):
+                raise IOError('Error while executing the copy and symlink script. Exit code: {}, stdout: \'{}\', '
+                              'stderr: \'{}\''.format(retval, stdout, stderr))
+
+            for (index, command), (command_retval, output) in zip(commands, outputs):
+                if command_retval != 0:
+                    failures.append((index, 'command `{}` exited with status {}: {}'.format(
+                        command, command_retval, output)))
+
+        failures.sort(key=lambda failure: failure[0])
+        self._raise_copy_and_symlink_failures([operations[index] + (error,) for index, error in failures])
+
+    def _get_copy_and_symlink_commands(self, operation, remotesource, remotedestination):
+        """
+        Return the shell commands that perform a single operation of `copy_and_symlink_many`.
+
+        :raises ValueError: if the source or destination are not valid
+        :raises OSError: if a pattern matches multiple sources but the destination is not a folder
+        """
+        if not remotesource or not remotedestination:
+            raise ValueError('the source and destination must be non empty strings')
+
+        if self.has_magic(remotedestination):
+            raise ValueError('Pathname patterns are not allowed in the destination')
+
+        if operation == self.OPERATION_COPY:
+            if self.has_magic(remotesource):
+                sources = self.glob(remotesource)
+                if len(sources) > 1:
+                    if not self.path_exists(remotedestination) or self.isfile(remotedestination):
+                        raise OSError("Can't copy more than one file in the same destination file")
+            else:
+                sources = [remotesource]
+
+            return ['cp -f -r {} {}'.format(escape_for_bash(source), escape_for_bash(remotedestination))
+                    for source in sources]
+
+        source = os.path.normpath(remotesource)
+        destination = os.path.normpath(remotedestination)
+
+        if self.has_magic(source):
+            pairs = [(this_source, os.path.join(remotedestination, os.path.split(this_source)[-1]))
+                     for this_source in self.glob(source)]
+        else:
+            pairs = [(source, destination)]
+
+        return ['ln -s {} {}'.format(escape_for_bash(this_source), escape_for_bash(this_destination))
+                for this_source, this_destination in pairs]
+
     def path_exists(self, path):
         """
         Check if path exists
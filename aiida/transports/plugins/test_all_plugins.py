@@ -1247,6 +1247,160 @@ class TestPutGetTree(unittest.TestCase):
             t.rmdir(directory)
 
 
+class TestPutArchive(unittest.TestCase):
+    """
+    Test to put multiple files and folders at once.
+    """
+
+    @run_for_all_plugins
+    def test_put_archive(self, custom_transport):
+        import os
+        import shutil
+        import tempfile
+
+        local_dir = tempfile.mkdtemp()
+        remote_dir = tempfile.mkdtemp()
+
+        try:
+            os.mkdir(os.path.join(local_dir, 'folder'))
+            with io.open(os.path.join(local_dir, 'folder', 'nested.txt'), 'w', encoding='utf8') as fhandle:
+                fhandle.write(u'nested')
+            with io.open(os.path.join(local_dir, 'file.txt'), 'w', encoding='utf8') as fhandle:
+                fhandle.write(u'first')
+
+            with io.open(os.path.join(local_dir, 'handle.txt'), 'w', encoding='utf8') as fhandle:
+                fhandle.write(u'skipped-streamed')
+
+            with io.open(os.path.join(local_dir, 'handle.txt'), 'rb') as handle:
+                # The content of an open file is streamed from its current position
+                handle.read(len(b'skipped-'))
+
+                entries = [
+                    (os.path.join(local_dir, 'folder'), 'folder'),
+                    (os.path.join(local_dir, 'file.txt'), 'file.txt'),
+                    # Later entries overwrite earlier ones
+                    (io.BytesIO(b'second'), 'file.txt'),
+                    (io.BytesIO(b'object'), 'object.txt'),
+                    (handle, 'handle.txt'),
+                ]
+
+                with custom_transport as transport:
+                    transport.chdir(remote_dir)
+                    transport.put_archive(entries)
+
+                    self.assertEqual(sorted(transport.listdir('.')), ['file.txt', 'folder', 'handle.txt', 'object.txt'])
+                    self.assertEqual(transport.listdir('folder'), ['nested.txt'])
+
+            with io.open(os.path.join(remote_dir, 'file.txt'), 'rb') as fhandle:
+                self.assertEqual(fhandle.read(), b'second')
+            with io.open(os.path.join(remote_dir, 'object.txt'), 'rb') as fhandle:
+                self.assertEqual(fhandle.read(), b'object')
+            with io.open(os.path.join(remote_dir, 'handle.txt'), 'rb') as fhandle:
+                self.assertEqual(fhandle.read(), b'streamed')
+        finally:
+            shutil.rmtree(local_dir)
+            shutil.rmtree(remote_dir)
+
+
+class TestGetArchive(unittest.TestCase):
+    """
+    Test to get multiple files and folders at once.
+    """
+
+    @run_for_all_plugins
+    def test_get_archive(self, custom_transport):
+        import os
+        import shutil
+        import tempfile
+
+        local_dir = tempfile.mkdtemp()
+        remote_dir = tempfile.mkdtemp()
+
+        try:
+            os.makedirs(os.path.join(remote_dir, 'folder', 'deep'))
+            with io.open(os.path.join(remote_dir, 'folder', 'deep', 'nested.txt'), 'w', encoding='utf8') as fhandle:
+                fhandle.write(u'nested')
+            with io.open(os.path.join(remote_dir, 'file.txt'), 'w', encoding='utf8') as fhandle:
+                fhandle.write(u'file')
+
+            entries = [
+                ('folder', 'folder'),
+                ('file.txt', 'file.txt'),
+                # The same source can be retrieved multiple times, also when nested in another source
+                ('file.txt', os.path.join('copy', 'renamed.txt')),
+                (os.path.join('folder', 'deep', 'nested.txt'), 'nested.txt'),
+                # Sources that do not exist are ignored
+                ('nonexistent.txt', 'nonexistent.txt'),
+            ]
+
+            with custom_transport as transport:
+                transport.chdir(remote_dir)
+                transport.get_archive(entries, local_dir)
+
+            self.assertEqual(sorted(os.listdir(local_dir)), ['copy', 'file.txt', 'folder', 'nested.txt'])
+            self.assertEqual(os.listdir(os.path.join(local_dir, 'folder', 'deep')), ['nested.txt'])
+
+            for path, content in [('file.txt', b'file'), (os.path.join('copy', 'renamed.txt'), b'file'),
+                                  ('nested.txt', b'nested')]:
+                with io.open(os.path.join(local_dir, path), 'rb') as fhandle:
+                    self.assertEqual(fhandle.read(), content)
+        finally:
+            shutil.rmtree(local_dir)
+            shutil.rmtree(remote_dir)
+
+
+class TestCopyAndSymlinkMany(unittest.TestCase):
+    """
+    Test to copy and symlink multiple remote files and folders at once.
+    """
+
+    @run_for_all_plugins
+    def test_copy_and_symlink_many(self, custom_transport):
+        import os
+        import shutil
+        import tempfile
+
+        remote_dir = tempfile.mkdtemp()
+
+        try:
+            os.mkdir(os.path.join(remote_dir, 'folder'))
+            with io.open(os.path.join(remote_dir, 'folder', 'nested.txt'), 'w', encoding='utf8') as fhandle:
+                fhandle.write(u'nested')
+            with io.open(os.path.join(remote_dir, 'file.txt'), 'w', encoding='utf8') as fhandle:
+                fhandle.write(u'file')
+
+            with custom_transport as transport:
+                transport.chdir(remote_dir)
+                transport.copy_and_symlink_many([
+                    (transport.OPERATION_COPY, 'folder', 'copied_folder'),
+                    (transport.OPERATION_COPY, 'file.txt', 'copied.txt'),
+                    (transport.OPERATION_SYMLINK, os.path.join(remote_dir, 'file.txt'), 'link.txt'),
+                ])
+
+                self.assertEqual(
+                    sorted(transport.listdir('.')), ['copied.txt', 'copied_folder', 'file.txt', 'folder', 'link.txt'])
+                self.assertEqual(transport.listdir('copied_folder'), ['nested.txt'])
+
+                # All operations are attempted and the failures are reported together
+                with self.assertRaises(IOError) as context:
+                    transport.copy_and_symlink_many([
+                        (transport.OPERATION_COPY, 'nonexistent.txt', 'first.txt'),
+                        (transport.OPERATION_COPY, 'file.txt', 'second.txt'),
+                        (transport.OPERATION_SYMLINK, os.path.join(remote_dir, 'file.txt'), 'link.txt'),
+                    ])
+
+                self.assertIn('nonexistent.txt', str(context.exception))
+                self.assertIn('link.txt', str(context.exception))
+                self.assertTrue(transport.isfile('second.txt'))
+
+                with self.assertRaises(ValueError):
+                    transport.copy_and_symlink_many([('move', 'file.txt', 'moved.txt')])
+
+            self.assertEqual(os.readlink(os.path.join(remote_dir, 'link.txt')), os.path.join(remote_dir, 'file.txt'))
+        finally:
+            shutil.rmtree(remote_dir)
+
+
 class TestExecuteCommandWait(unittest.TestCase):
     """
     Test some simple command executions and stdin/stdout management.
@@ -10,6 +10,7 @@
 from __future__ import division
 from __future__ import print_function
 from __future__ import absolute_import
+import os
 import unittest
 
 from aiida.transports.plugins.local import *
@@ -52,5 +53,159 @@ class TestBasicConnection(unittest.TestCase):
             pass
 
 
+class TestZeroCopy(unittest.TestCase):
+    """
+    Test the zero copy modes of the local transport.
+    """
+
+    def setUp(self):
+        import io
+        import tempfile
+
+        self.local_dir = tempfile.mkdtemp()
+        self.remote_dir = tempfile.mkdtemp()
+        self.source = os.path.join(self.local_dir, 'source.txt')
+
+        with io.open(self.source, 'w', encoding='utf8') as handle:
+            handle.write(u'content')
+
+    def tearDown(self):
+        import shutil
+
+        shutil.rmtree(self.local_dir)
+        shutil.rmtree(self.remote_dir)
+
+    def test_invalid_mode(self):
+        with self.assertRaises(ValueError):
+            LocalTransport(zero_copy='invalid')
+
+    def test_reflink(self):
+        """Files are cloned if the filesystem supports it and copied otherwise, but never hard linked."""
+        import io
+
+        with LocalTransport(zero_copy='reflink') as transport:
+            transport.chdir(self.remote_dir)
+            transport.put(self.local_dir, 'folder')
+            transport.get('folder', os.path.join(self.local_dir, 'retrieved'))
+
+            transport.put(self.source, 'put.txt')
+            transport.chmod('put.txt', 0o755)
+            transport.put_archive([(io.BytesIO(b'overwritten'), 'put.txt')])
+
+        for path in [os.path.join(self.remote_dir, 'folder', 'source.txt'),
+                     os.path.join(self.local_dir, 'retrieved', 'source.txt')]:
+            self.assertFalse(os.path.samefile(self.source, path))
+            with io.open(path, 'rb') as handle:
+                self.assertEqual(handle.read(), b'content')
+
+        # Modifying a copy never modifies the source
+        self.assertNotEqual(os.stat(self.source).st_mode & 0o777, 0o755)
+        with io.open(self.source, 'rb') as handle:
+            self.assertEqual(handle.read(), b'content')
+
+
+class TestGetArchive(unittest.TestCase):
+    """
+    Test the retrieval of files through a streamed archive.
+    """
+
+    def test_tar_errors(self):
+        """Only the errors of tar about sources that do not exist are ignored."""
+        # pylint: disable=protected-access
+        import shutil
+        import tempfile
+
+        try:
+            from unittest import mock
+        except ImportError:
+            import mock
+
+        local_dir = tempfile.mkdtemp()
+        archive = 'tar -c -f - -T /dev/null; echo {} >&2; '.format(LocalTransport._ARCHIVE_ERROR_SENTINEL)
+
+        try:
+            with LocalTransport() as transport:
+                original = transport._exec_command_internal
+
+                command = archive + 'echo "tar: source: Cannot open: Permission denied" >&2; exit 2'
+                with mock.patch.object(transport, '_exec_command_internal', lambda _: original(command)):
+                    with self.assertRaises(IOError):
+                        transport._get_archive_streamed([('source', 'target')], local_dir)
+
+                command = archive + 'echo "tar: source: Cannot stat: No such file or directory" >&2; exit 2'
+                with mock.patch.object(transport, '_exec_command_internal', lambda _: original(command)):
+                    transport._get_archive_streamed([('source', 'target')], local_dir)
+
+                self.assertEqual(os.listdir(local_dir), [])
+        finally:
+            shutil.rmtree(local_dir)
+
+    def test_hard_links(self):
+        """Files that are hard links to files archived before are retrieved as separate copies."""
+        # pylint: disable=protected-access
+        import io
+        import shutil
+        import tempfile
+
+        remote_dir = tempfile.mkdtemp()
+        local_dir = tempfile.mkdtemp()
+
+        try:
+            os.mkdir(os.path.join(remote_dir, 'folder'))
+            with io.open(os.path.join(remote_dir, 'folder', 'a'), 'wb') as handle:
+                handle.write(b'content')
+            os.link(os.path.join(remote_dir, 'folder', 'a'), os.path.join(remote_dir, 'folder', 'b'))
+            os.link(os.path.join(remote_dir, 'folder', 'a'), os.path.join(remote_dir, 'c'))
+
+            with LocalTransport() as transport:
+                transport.chdir(remote_dir)
+                transport._get_archive_streamed([('folder', 'folder'), ('c', 'c')], local_dir)
+
+            paths = [os.path.join(local_dir, 'folder', 'a'), os.path.join(local_dir, 'folder', 'b')]
+            paths.append(os.path.join(local_dir, 'c'))
+            for path in paths:
+                with io.open(path, 'rb') as handle:
+                    self.assertEqual(handle.read(), b'content')
+
+            self.assertEqual(len(set(os.stat(path).st_ino for path in paths)), len(paths))
+        finally:
+            shutil.rmtree(remote_dir)
+            shutil.rmtree(local_dir)
+
+    def test_no_wait_command(self):
+        """A transport that cannot wait for commands retrieves the files one by one without running tar."""
+        import io
+        import shutil
+        import tempfile
+        from aiida.transports.transport import Transport
+
+        try:
+            from unittest import mock
+        except ImportError:
+            import mock
+
+        class NoWaitTransport(LocalTransport):
+            """Transport that can execute commands, but not wait for them."""
+            _wait_command_internal = Transport._wait_command_internal
+
+        remote_dir = tempfile.mkdtemp()
+        local_dir = tempfile.mkdtemp()
+
+        try:
+            with io.open(os.path.join(remote_dir, 'source'), 'wb') as handle:
+                handle.write(b'content')
+
+            with NoWaitTransport() as transport:
+                transport.chdir(remote_dir)
+                with mock.patch.object(transport, '_exec_command_internal', side_effect=AssertionError):
+                    transport.get_archive([('source', 'target')], local_dir)
+
+            with io.open(os.path.join(local_dir, 'target'), 'rb') as handle:
+                self.assertEqual(handle.read(), b'content')
+        finally:
+            shutil.rmtree(remote_dir)
+            shutil.rmtree(local_dir)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -13,6 +13,7 @@ Test ssh plugin on localhost
 from __future__ import division
 from __future__ import print_function
 from __future__ import absolute_import
+import os
 import unittest
 import logging
 
@@ -61,5 +62,184 @@ class TestBasicConnection(unittest.TestCase):
         logging.disable(logging.NOTSET)
 
 
+class TestPersistentShell(unittest.TestCase):
+    """
+    Test the execution of commands in the persistent shell.
+    """
+
+    def test_exec_command_wait(self):
+        """Commands run in isolated subshells of the same shell, with the current working directory of the transport."""
+        with SshTransport(
+                machine='localhost',
+                timeout=30,
+                load_system_host_keys=True,
+                key_policy='AutoAddPolicy',
+                use_persistent_shell=True) as transport:
+            transport.chdir('/tmp')
+
+            retval, stdout, stderr = transport.exec_command_wait('echo $$; echo error >&2; exit 3')
+            self.assertEqual(retval, 3)
+            self.assertEqual(stderr, 'error\n')
+            shell_pid = stdout.strip()
+
+            retval, stdout, stderr = transport.exec_command_wait('cd /; echo $$')
+            self.assertEqual(retval, 0)
+            self.assertEqual(stdout.strip(), shell_pid)
+
+            retval, stdout, stderr = transport.exec_command_wait('pwd', combine_stderr=True)
+            self.assertEqual((retval, stdout, stderr), (0, '/tmp\n', ''))
+
+            # Commands with stdin are executed on a new channel
+            retval, stdout, stderr = transport.exec_command_wait('cat', stdin='input')
+            self.assertEqual((retval, stdout, stderr), (0, 'input', ''))
+
+    def test_startup_output(self):
+        """What the profiles of the login shell print when it starts is not part of the output of the first command."""
+        import subprocess
+
+        try:
+            from unittest import mock
+        except ImportError:
+            import mock
+
+        class LocalShell(object):
+            """Channel that executes what is sent to it in a local shell that printed a banner when it started."""
+
+            # pylint: disable=useless-object-inheritance
+
+            closed = False
+            eof_received = False
+
+            def __init__(self):
+                self.stdout = b'Welcome to the cluster\n'
+                self.stderr = b'bash: module: command not found\n'
+
+            def exec_command(self, command):
+                pass
+
+            def sendall(self, script):
+                process = subprocess.Popen(['bash', '-s'], stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                           stderr=subprocess.PIPE)
+                stdout, stderr = process.communicate(script)
+                self.stdout += stdout
+                self.stderr += stderr
+
+            def recv_ready(self):
+                return bool(self.stdout)
+
+            def recv_stderr_ready(self):
+                return bool(self.stderr)
+
+            def recv(self, size):
+                data, self.stdout = self.stdout[:size], self.stdout[size:]
+                return data
+
+            def recv_stderr(self, size):
+                data, self.stderr = self.stderr[:size], self.stderr[size:]
+                return data
+
+            @staticmethod
+            def exit_status_ready():
+                return False
+
+            @staticmethod
+            def get_transport():
+                return mock.Mock(is_active=mock.Mock(return_value=True))
+
+        # pylint: disable=protected-access
+        transport = SshTransport(machine='localhost', use_persistent_shell=True)
+        transport._is_open = True
+        transport._sftp = mock.Mock(getcwd=mock.Mock(return_value=None))
+        transport._client = mock.Mock()
+        transport._client.get_transport.return_value.open_session.return_value = LocalShell()
+
+        with mock.patch('select.select'):
+            retval, stdout, stderr = transport.exec_command_wait('echo output; echo error >&2')
+
+        self.assertEqual((retval, stdout, stderr), (0, 'output\n', 'error\n'))
+
+    def test_shell_end_of_file(self):
+        """If the persistent shell exits before printing the separator, an error is raised instead of waiting."""
+        try:
+            from unittest import mock
+        except ImportError:
+            import mock
+
+        transport = SshTransport(machine='localhost', use_persistent_shell=True)
+        transport._shell = mock.Mock(  # pylint: disable=protected-access
+            eof_received=True,
+            closed=False,
+            recv_ready=mock.Mock(return_value=False),
+            recv_stderr_ready=mock.Mock(return_value=False),
+            exit_status_ready=mock.Mock(return_value=True),
+            recv_exit_status=mock.Mock(return_value=137))
+
+        with mock.patch('select.select') as select:
+            with self.assertRaises(IOError):
+                transport._read_persistent_shell('__separator__')  # pylint: disable=protected-access
+
+        self.assertFalse(select.called)
+
+    def test_lost_shell(self):
+        """If the shell is lost while executing a command, an error is raised and the shell is no longer used."""
+        with SshTransport(
+                machine='localhost',
+                timeout=30,
+                load_system_host_keys=True,
+                key_policy='AutoAddPolicy',
+                use_persistent_shell=True) as transport:
+            with self.assertRaises(IOError):
+                transport.exec_command_wait('kill -9 $$')
+
+            retval, stdout, _ = transport.exec_command_wait('echo fallback')
+            self.assertEqual((retval, stdout), (0, 'fallback\n'))
+
+
+class TestConcurrentTransfers(unittest.TestCase):
+    """
+    Test the transfer of folders over multiple SFTP channels.
+    """
+
+    def test_puttree_gettree(self):
+        """Put and get back a folder with many files, with more concurrent transfers than files in some folders."""
+        import filecmp
+        import shutil
+        import tempfile
+
+        local_dir = tempfile.mkdtemp()
+        remote_dir = tempfile.mkdtemp()
+
+        try:
+            for folder in ['', 'nested', os.path.join('nested', 'deeper'), 'empty']:
+                if not os.path.isdir(os.path.join(local_dir, 'source', folder)):
+                    os.makedirs(os.path.join(local_dir, 'source', folder))
+                for index in range(0 if folder == 'empty' else 10):
+                    with open(os.path.join(local_dir, 'source', folder, 'file_{}'.format(index)), 'w') as handle:
+                        handle.write(folder * index)
+
+            with SshTransport(
+                    machine='localhost',
+                    timeout=30,
+                    load_system_host_keys=True,
+                    key_policy='AutoAddPolicy',
+                    transfer_concurrency=4) as transport:
+                transport.chdir(remote_dir)
+                transport.puttree(os.path.join(local_dir, 'source'), 'remote')
+                transport.gettree('remote', os.path.join(local_dir, 'retrieved'))
+
+                entries = transport.listdir_withattributes('remote', pattern='file_1*')
+                self.assertEqual(sorted(entry['name'] for entry in entries), ['file_1'])
+                self.assertFalse(entries[0]['isdir'])
+
+            comparison = filecmp.dircmp(os.path.join(local_dir, 'source'), os.path.join(local_dir, 'retrieved'))
+            self.assertEqual(sorted(comparison.common_dirs), ['empty', 'nested'])
+            self.assertEqual(len(comparison.common_files), 10)
+            self.assertEqual(comparison.diff_files, [])
+            self.assertEqual(comparison.subdirs['nested'].diff_files, [])
+            self.assertEqual(comparison.subdirs['nested'].common_dirs, ['deeper'])
+        finally:
+            shutil.rmtree(local_dir)
+            shutil.rmtree(remote_dir)
+
 if __name__ == '__main__':
     unittest.main()
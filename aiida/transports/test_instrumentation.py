@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida_core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+"""
+Tests for the instrumentation of transports and schedulers
+"""
+from __future__ import division
+from __future__ import print_function
+from __future__ import absolute_import
+import io
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from aiida.transports.instrumentation import IoStatistics, InstrumentedTransport, measure_operation
+
+
+class TestIoStatistics(unittest.TestCase):
+    """Unit tests for the IoStatistics class."""
+
+    def test_record(self):
+        """Test that operations are aggregated per key, category and operation."""
+        statistics = IoStatistics()
+        statistics.set_label(1, 'user on computer')
+        statistics.record(1, 'transport', 'putfile', 0.5, nbytes=10)
+        statistics.record(1, 'transport', 'putfile', 1.5, failed=True)
+        statistics.record(2, 'scheduler', 'get_jobs', 2.)
+
+        authinfos = statistics.as_dict()['authinfos']
+        self.assertEqual(authinfos['1']['label'], 'user on computer')
+        self.assertEqual(authinfos['2']['label'], '2')
+        self.assertEqual(authinfos['1']['operations']['transport']['putfile'], {
+            'count': 2,
+            'failures': 1,
+            'total_time': 2.,
+            'max_time': 1.5,
+            'bytes': 10
+        })
+        self.assertEqual(authinfos['2']['operations']['scheduler']['get_jobs']['count'], 1)
+
+    def test_measure(self):
+        """Test that the measure context manager records failures and reraises the exception."""
+        statistics = IoStatistics()
+
+        with statistics.measure(1, 'engine', 'upload'):
+            pass
+
+        with self.assertRaises(RuntimeError):
+            with statistics.measure(1, 'engine', 'upload'):
+                raise RuntimeError
+
+        counters = statistics.as_dict()['authinfos']['1']['operations']['engine']['upload']
+        self.assertEqual(counters['count'], 2)
+        self.assertEqual(counters['failures'], 1)
+
+    def test_dump_and_merge(self):
+        """Test that the dumped statistics of several processes can be merged."""
+        dirpath = tempfile.mkdtemp()
+        try:
+            first = IoStatistics()
+            first.record(1, 'transport', 'exec_command_wait', 1., nbytes=5)
+            second = IoStatistics()
+            second.record(1, 'transport', 'exec_command_wait', 3., failed=True, nbytes=7)
+            second.record(1, 'transport', 'listdir', 1.)
+
+            dumped = []
+            for index, statistics in enumerate([first, second]):
+                filepath = os.path.join(dirpath, 'worker-{}.json'.format(index))
+                statistics.dump(filepath, extra={'worker': {'index': index}})
+                with io.open(filepath, 'r', encoding='utf8') as handle:
+                    dumped.append(json.load(handle))
+
+            self.assertEqual(dumped[1]['worker'], {'index': 1})
+
+            # The temporary files used to write the dumps atomically should have been renamed
+            self.assertEqual(sorted(os.listdir(dirpath)), ['worker-0.json', 'worker-1.json'])
+        finally:
+            shutil.rmtree(dirpath)
+
+        merged = IoStatistics.merge(dumped)
+        self.assertEqual(len(merged['pids']), 2)
+        operations = merged['authinfos']['1']['operations']['transport']
+        self.assertEqual(operations['exec_command_wait'], {
+            'count': 2,
+            'failures': 1,
+            'total_time': 4.,
+            'max_time': 3.,
+            'bytes': 12
+        })
+        self.assertEqual(operations['listdir']['count'], 1)
+
+
+class TestInstrumentedTransport(unittest.TestCase):
+    """Unit tests for the InstrumentedTransport class."""
+
+    def setUp(self):
+        from aiida.transports.plugins.local import LocalTransport
+
+        self.statistics = IoStatistics()
+        self.transport = InstrumentedTransport(LocalTransport(), 1, 'label', statistics=self.statistics)
+        self.dirpath = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.dirpath)
+
+    def get_operations(self, category='transport'):
+        return self.statistics.as_dict()['authinfos']['1']['operations'][category]
+
+    def test_operations(self):
+        """Test that the calls made through the wrapper are recorded with the bytes they transfer."""
+        source = os.path.join(self.dirpath, 'source')
+        with io.open(source, 'wb') as handle:
+            handle.write(b'content')
+
+        with self.transport as transport:
+            self.assertIs(transport, self.transport)
+            self.assertTrue(transport.is_open)
+            transport.chdir(self.dirpath)
+            transport.putfile(source, os.path.join(self.dirpath, 'target'))
+            transport.getfile(os.path.join(self.dirpath, 'target'), os.path.join(self.dirpath, 'local'))
+            retval, stdout, stderr = transport.exec_command_wait('echo hello')
+            with self.assertRaises(IOError):
+                transport.listdir(os.path.join(self.dirpath, 'non_existing'))
+
+        self.assertEqual(retval, 0)
+        operations = self.get_operations()
+        self.assertEqual(operations['putfile']['bytes'], 0)
+        self.assertEqual(operations['getfile']['bytes'], 0)
+        self.assertEqual(operations['exec_command_wait']['bytes'], len(stdout) + len(stderr))
+        self.assertEqual(operations['listdir']['failures'], 1)
+        self.assertNotIn('is_open', operations)
+
+    def test_count_file_bytes(self):
+        """Test that the bytes of the files put or retrieved are only counted if requested."""
+        from aiida.transports.plugins.local import LocalTransport
+
+        folder = os.path.join(self.dirpath, 'folder')
+        source = os.path.join(folder, 'source')
+        os.mkdir(folder)
+        with io.open(source, 'wb') as handle:
+            handle.write(b'content')
+
+        with InstrumentedTransport(LocalTransport(), 1, statistics=self.statistics, count_file_bytes=True) as transport:
+            transport.putfile(source, os.path.join(folder, 'target'))
+            transport.gettree(folder, os.path.join(self.dirpath, 'local'))
+
+        operations = self.get_operations()
+        self.assertEqual(operations['putfile']['bytes'], len(b'content'))
+        self.assertEqual(operations['gettree']['bytes'], 2 * len(b'content'))
+
+    def test_measure_operation(self):
+        """Test that operations of other layers are only recorded for instrumented transports."""
+        with measure_operation(self.transport, 'scheduler', 'get_jobs'):
+            pass
+
+        with measure_operation(self.transport.transport, 'scheduler', 'kill'):
+            pass
+
+        operations = self.get_operations('scheduler')
+        self.assertEqual(operations['get_jobs']['count'], 1)
+        self.assertNotIn('kill', operations)
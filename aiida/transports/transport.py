@@ -48,6 +48,16 @@ class Transport(object):
         'non_interactive_default': True
     })]
 
+    # The operations accepted by `copy_and_symlink_many`
+    OPERATION_COPY = 'copy'
+    OPERATION_SYMLINK = 'symlink'
+
+    # Size of the chunks in which the remainder of a streamed archive is discarded
+    _ARCHIVE_CHUNK_SIZE = 65536
+
+    # Line printed to the standard error of a streamed archive before the errors of tar
+    _ARCHIVE_ERROR_SENTINEL = '__AIIDA_TAR_ERRORS__'
+
     def __init__(self, *args, **kwargs):  # pylint: disable=unused-argument
         """
         __init__ method of the Transport base class.
@@ -408,6 +418,212 @@ class Transport(object):
         """
         raise NotImplementedError
 
+    def get_archive(self, entries, localpath):
+        """
+        Retrieve multiple remote files and folders at once into a local folder.
+
+        If the transport can execute commands and wait for them through `_wait_command_internal`, the sources are
+        packed in a single tar archive by a remote `tar` process, whose output is streamed back over one channel and
+        unpacked locally. Otherwise, or if that fails, e.g. because `tar` is not available on the remote, the entries
+        are retrieved one by one with `get`. Remote sources that do not exist are ignored in both cases.
+
+        :param entries: a list of tuples (source, target), where source is the path of a remote file or folder and
+            target is the path of the destination relative to `localpath`
+        :param str localpath: absolute path to the local destination folder
+        """
+        import tarfile
+
+        entries = list(entries)
+
+        if not entries:
+            return
+
+        try:
+            self._get_archive_streamed(entries, localpath)
+        except NotImplementedError:
+            pass
+        except (tarfile.TarError, IOError, OSError) as exception:
+            self.logger.warning('retrieving the files as an archive failed, retrieving them one by one: {}'.format(
+                exception))
+        else:
+            return
+
+        for source, target in entries:
+            self.get(source, os.path.join(localpath, target), ignore_nonexisting=True)
+
+    def _get_archive_streamed(self, entries, localpath):
+        """
+        Retrieve the entries of `get_archive` through a single tar archive that is streamed from the remote.
+
+        :raises NotImplementedError: if the transport cannot execute commands and wait for them
+        :raises tarfile.TarError: if the output of the remote command is not a valid archive
+        :raises IOError: if the remote command failed for another reason than sources that do not exist
+        """
+        import shutil
+        import tarfile
+        import tempfile
+        from aiida.common.escaping import escape_for_bash
+
+        # Checked before running the command, otherwise the whole archive would be transferred before finding out that
+        # the transport cannot wait for it, after which all the files would be transferred once more by `get_archive`
+        wait_command = six.get_unbound_function(type(self)._wait_command_internal)
+        if wait_command is six.get_unbound_function(Transport._wait_command_internal):
+            raise NotImplementedError('the transport cannot wait for a command started with `_exec_command_internal`')
+
+        # The sources are made absolute and archived relative to the root, such that the name of each member is known.
+        # The standard error of tar is written to a temporary file and only printed once the archive has been written,
+        # such that it does not have to be read while streaming the standard output. It is preceded by a sentinel that
+        # separates it from anything that the shell of the remote prints to the standard error by itself.
+        cwd = self.getcwd() or os.sep
+        names = [os.path.normpath(os.path.join(cwd, source)).lstrip(os.sep) for source, _ in entries]
+        command = ('error_file=$(mktemp) || exit 1; '
+                   'LC_ALL=C tar -c -h -f - -C / {} 2> "$error_file"; retval=$?; '
+                   'echo {} >&2; cat "$error_file" >&2; rm -f "$error_file"; exit $retval').format(
+                       ' '.join(escape_for_bash(name) for name in names), self._ARCHIVE_ERROR_SENTINEL)
+
+        _, stdout, stderr, session = self._exec_command_internal(command)
+        sandbox = tempfile.mkdtemp()
+
+        try:
+            try:
+                with tarfile.open(fileobj=stdout, mode='r|') as archive:
+                    for member in archive:
+                        name = os.path.normpath(member.name)
+                        if name.startswith(os.pardir) or os.path.isabs(name):
+                            continue
+                        if member.islnk():
+                            self._extract_hard_link(member, sandbox)
+                        elif member.isfile() or member.isdir():
+                            archive.extract(member, sandbox)
+            finally:
+                # The output has to be consumed entirely, also if it is not a valid archive, otherwise the command can
+                # block on writing it and never finish
+                while stdout.read(self._ARCHIVE_CHUNK_SIZE):
+                    pass
+                stderr_text = stderr.read().decode('utf-8', 'replace')
+                retval = self._wait_command_internal(session)
+
+            # Exit status 2 is also used for fatal errors, so it is only accepted if all the errors are about sources
+            # that do not exist, which are ignored just like `get` is told to
+            tar_errors = stderr_text.rpartition(self._ARCHIVE_ERROR_SENTINEL)[2]
+            errors = [line for line in tar_errors.splitlines() if line.strip()]
+            if retval != 0 and (retval != 2 or not all(self._is_missing_source_error(line) for line in errors)):
+                raise IOError('the remote tar command exited with status {}: {}'.format(retval, tar_errors.strip()))
+
+            # Sources can be repeated or nested in one another, in which case they are copied out of the sandbox
+            # instead of moved, such that the extracted files remain available for the following entries
+            later_names = set()
+            later_parents = set()
+            operations = []
+
+            for name, (_, target) in reversed(list(zip(names, entries))):
+                parents = self._get_parent_paths(name)
+                copy = name in later_names or name in later_parents or any(p in later_names for p in parents)
+                operations.append((name, target, copy))
+                later_names.add(name)
+                later_parents.update(parents)
+
+            for name, target, copy in reversed(operations):
+                extracted = os.path.join(sandbox, name)
+                if os.path.lexists(extracted):
+                    self._move_local_path(extracted, os.path.join(localpath, target), copy=copy)
+        finally:
+            shutil.rmtree(sandbox, ignore_errors=True)
+
+    @staticmethod
+    def _extract_hard_link(member, sandbox):
+        """
+        Extract a hard link member of a streamed archive as a copy of the file that it links to.
+
+        Tar archives a file that is a hard link to a file that was already archived as a hard link member, even when
+        dereferencing symbolic links. The file it links to was extracted before, so its content is copied, rather than
+        linked, such that the retrieved files do not share their content.
+
+        :param member: the hard link member
+        :type member: :class:`tarfile.TarInfo`
+        :param sandbox: the absolute path of the folder into which the archive is extracted
+        :raises tarfile.ExtractError: if the file that the member links to was not extracted
+        """
+        import shutil
+        import tarfile
+
+        linkname = os.path.normpath(member.linkname)
+        source = os.path.join(sandbox, linkname)
+
+        if linkname.startswith(os.pardir) or os.path.isabs(linkname) or not os.path.isfile(source):
+            raise tarfile.ExtractError('the target {} of the hard link {} was not extracted'.format(
+                member.linkname, member.name))
+
+        # A source that is archived more than once is a hard link to itself the second time
+        destination = os.path.join(sandbox, os.path.normpath(member.name))
+        if destination == source:
+            return
+
+        if not os.path.isdir(os.path.dirname(destination)):
+            os.makedirs(os.path.dirname(destination))
+
+        shutil.copyfile(source, destination)
+        shutil.copymode(source, destination)
+
+    @staticmethod
+    def _is_missing_source_error(line):
+        """Return whether a line of the standard error of `tar` reports a source that does not exist."""
+        return 'No such file or directory' in line or 'Exiting with failure status due to previous errors' in line
+
+    def _wait_command_internal(self, session):
+        """
+        Wait for a command that was started with `_exec_command_internal` to finish and return its exit status.
+
+        To be implemented by the plugins that can stream the output of a command, for example for `get_archive`.
+
+        :param session: the session as returned by `_exec_command_internal`
+        :return: the exit status of the command
+        :raises NotImplementedError:
+        """
+        raise NotImplementedError
+
+    @staticmethod
+    def _get_parent_paths(path):
+        """Return the list of all the parent paths of a normalized relative path."""
+        parents = []
+        path = os.path.dirname(path)
+        while path:
+            parents.append(path)
+            path = os.path.dirname(path)
+        return parents
+
+    @staticmethod
+    def _move_local_path(source, destination, copy=False):
+        """
+        Move or copy a local file or folder, merging folders into existing folders and overwriting existing files.
+
+        :param source: the local path to move
+        :param destination: the local path to move it to
+        :param copy: if True the source is copied instead of moved
+        """
+        import shutil
+
+        if os.path.isdir(source) and os.path.isdir(destination):
+            for name in os.listdir(source):
+                Transport._move_local_path(os.path.join(source, name), os.path.join(destination, name), copy)
+            return
+
+        if os.path.isdir(destination):
+            shutil.rmtree(destination)
+        elif os.path.lexists(destination):
+            os.remove(destination)
+
+        parent = os.path.dirname(destination)
+        if parent and not os.path.isdir(parent):
+            os.makedirs(parent)
+
+        if not copy:
+            shutil.move(source, destination)
+        elif os.path.isdir(source):
+            shutil.copytree(source, destination)
+        else:
+            shutil.copy2(source, destination)
+
     def getcwd(self):
         """
         Get working directory
@@ -581,6 +797,63 @@ class Transport(object):
         """
         raise NotImplementedError
 
+    def put_archive(self, entries, remotepath='.'):
+        """
+        Put multiple files and folders from local sources to a remote destination folder at once.
+
+        Transports for which every single put is costly, for example because each one requires several round
+        trips, can override this method to transfer all entries in a single archive. This default implementation
+        simply puts the entries one by one, in the given order, such that later entries overwrite earlier ones.
+
+        :param entries: a list of tuples (source, target), where source is either the absolute path of a local file
+            or folder, or a file-like object opened in binary mode whose content should be put, and target is the
+            path of the destination relative to `remotepath`
+        :param str remotepath: path to the remote destination folder, which should exist
+        """
+        import shutil
+        from tempfile import NamedTemporaryFile
+
+        for source, target in entries:
+            destination = os.path.join(remotepath, target)
+            if isinstance(source, six.string_types):
+                self.put(source, destination)
+            else:
+                with NamedTemporaryFile(mode='wb') as handle:
+                    shutil.copyfileobj(source, handle)
+                    handle.flush()
+                    self.put(handle.name, destination)
+
+    @staticmethod
+    def _write_archive(entries, fileobj):
+        """
+        Write the entries passed to `put_archive` as an uncompressed tar stream to a file-like object.
+
+        Symbolic links are followed, as they are by `put`. The content of file-like sources that are backed by a file
+        is streamed into the archive, only the content of other file-like sources is read into memory.
+
+        :param entries: a list of tuples (source, target) as described in `put_archive`
+        :param fileobj: a file-like object opened for writing in binary mode
+        """
+        import io
+        import tarfile
+        import time
+
+        with tarfile.open(fileobj=fileobj, mode='w|', dereference=True) as archive:
+            for source, target in entries:
+                target = os.path.normpath(target)
+                if isinstance(source, six.string_types):
+                    archive.add(source, arcname=target)
+                else:
+                    info = tarfile.TarInfo(name=target)
+                    try:
+                        info.size = os.fstat(source.fileno()).st_size - source.tell()
+                    except (AttributeError, OSError, IOError, io.UnsupportedOperation):
+                        source = io.BytesIO(source.read())
+                        info.size = len(source.getvalue())
+                    info.mtime = time.time()
+                    info.mode = 0o644
+                    archive.addfile(info, source)
+
     def remove(self, path):
         """
         Remove the file at the given path. This only works on files;
@@ -646,6 +919,64 @@ class Transport(object):
         """
         raise NotImplementedError
 
+    def copy_and_symlink_many(self, operations):
+        """
+        Perform multiple remote copy and symlink operations (on the same remote machine) at once.
+
+        All the operations are attempted, even if some of them fail, and the failures are reported together at the
+        end. The base implementation simply calls `copy` or `symlink` for each operation in turn, but plugins for which
+        each call requires a round trip to the remote can override it to perform all operations in one go.
+
+        :param operations: a list of tuples (operation, remotesource, remotedestination), where operation is either
+            `Transport.OPERATION_COPY` or `Transport.OPERATION_SYMLINK`. Sources and destinations have the same meaning
+            as for `copy`, which is called with the default arguments, and `symlink`.
+        :raises ValueError: if any of the operations is unknown
+        :raises IOError: if any of the operations failed, with the error of each failed operation in the message
+        """
+        operations = self._validate_copy_and_symlink_operations(operations)
+        failures = []
+
+        for operation, source, destination in operations:
+            method = self.copy if operation == self.OPERATION_COPY else self.symlink
+            try:
+                method(source, destination)
+            except (IOError, OSError, ValueError) as exception:
+                failures.append((operation, source, destination, exception))
+
+        self._raise_copy_and_symlink_failures(failures)
+
+    def _validate_copy_and_symlink_operations(self, operations):
+        """
+        Validate the operations passed to `copy_and_symlink_many`.
+
+        :return: the operations as a list of tuples
+        :raises ValueError: if any of the operations is unknown
+        """
+        operations = [tuple(operation) for operation in operations]
+
+        for operation in operations:
+            if len(operation) != 3 or operation[0] not in (self.OPERATION_COPY, self.OPERATION_SYMLINK):
+                raise ValueError('invalid copy or symlink operation: {}'.format(operation))
+
+        return operations
+
+    @staticmethod
+    def _raise_copy_and_symlink_failures(failures):
+        """
+        Raise a single exception for all the operations of `copy_and_symlink_many` that failed, if any.
+
+        :param failures: a list of tuples (operation, remotesource, remotedestination, error)
+        :raises IOError: if the list of failures is not empty
+        """
+        if not failures:
+            return
+
+        lines = ['{} of the copy and symlink operations failed:'.format(len(failures))]
+        for operation, source, destination, error in failures:
+            lines.append('  * {} {} to {}: {}'.format(operation, source, destination, error))
+
+        raise IOError('\n'.join(lines))
+
     def whoami(self):
         """
         Get the remote username
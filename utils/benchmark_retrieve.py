@@ -0,0 +1,91 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida_core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+""" Benchmark the retrieval of many small files through a transport.
+
+Compares retrieving the files one by one with `Transport.get`, as the engine used to do, with retrieving them all at
+once with `Transport.get_archive`, using the `local` transport. Since the local transport has no network round trips,
+a latency can be added to each transport operation to model a remote computer: the loop pays it once per file, while
+the archive pays it once in total. Note that the archive is created by a login shell, so its startup time is included.
+"""
+from __future__ import division
+from __future__ import print_function
+from __future__ import absolute_import
+
+import os
+import shutil
+import tempfile
+import time
+import timeit
+
+import click
+
+
+def create_remote_folder(number_files, file_size):
+    """Create a temporary folder with the given number of files of the given size in bytes and return its path."""
+    remote_dir = tempfile.mkdtemp()
+
+    for index in range(number_files):
+        with open(os.path.join(remote_dir, 'file_{}.dat'.format(index)), 'wb') as handle:
+            handle.write(os.urandom(file_size))
+
+    return remote_dir
+
+
+def retrieve_loop(transport, entries, local_dir, latency):
+    """Retrieve the entries one by one, with one round trip per entry."""
+    for source, target in entries:
+        time.sleep(latency)
+        transport.get(source, os.path.join(local_dir, target), ignore_nonexisting=True)
+
+
+def retrieve_archive(transport, entries, local_dir, latency):
+    """Retrieve the entries with a single archive, with a single round trip."""
+    time.sleep(latency)
+    transport.get_archive(entries, local_dir)
+
+
+@click.command()
+@click.option('-n', '--number-files', type=int, default=1000, show_default=True, help='Number of files to retrieve.')
+@click.option('-s', '--file-size', type=int, default=1024, show_default=True, help='Size of each file in bytes.')
+@click.option('-r', '--repeat', type=int, default=3, show_default=True, help='Number of repetitions of each timing.')
+@click.option(
+    '-l', '--latency', type=float, default=0., show_default=True, help='Latency in seconds of each transport operation.')
+def benchmark(number_files, file_size, repeat, latency):
+    """Time the retrieval of many small files with `get` in a loop and with `get_archive`."""
+    from aiida.plugins import TransportFactory
+
+    remote_dir = create_remote_folder(number_files, file_size)
+    entries = [(filename, filename) for filename in sorted(os.listdir(remote_dir))]
+
+    try:
+        with TransportFactory('local')() as transport:
+            transport.chdir(remote_dir)
+
+            for name, function in [('get loop', retrieve_loop), ('get_archive', retrieve_archive)]:
+                timings = []
+                for _ in range(repeat):
+                    local_dir = tempfile.mkdtemp()
+                    try:
+                        start = timeit.default_timer()
+                        function(transport, entries, local_dir, latency)
+                        timings.append(timeit.default_timer() - start)
+                        assert len(os.listdir(local_dir)) == number_files
+                    finally:
+                        shutil.rmtree(local_dir)
+
+                click.echo('{:<12} best of {}: {:.3f} s for {} files of {} bytes with a latency of {} s'.format(
+                    name, repeat, min(timings), number_files, file_size, latency))
+    finally:
+        shutil.rmtree(remote_dir)
+
+
+if __name__ == '__main__':
+    benchmark()  # pylint: disable=no-value-for-parameter
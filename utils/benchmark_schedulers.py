@@ -0,0 +1,123 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida_core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+""" Benchmark the parsing of the job list output of the scheduler plugins.
+
+The outputs of the job list commands used by the tests of the scheduler plugins are scaled up to a large number of
+jobs, by repeating the jobs they contain with new job ids, as is the case when the engine polls a scheduler for all
+the jobs of a user with thousands of jobs in the queue. For each plugin the time to parse the complete output is
+compared with the time to parse only the jobs that the engine is actually waiting for, which is what the `only_jobs`
+argument of `Scheduler.get_jobs` does.
+"""
+from __future__ import division
+from __future__ import print_function
+from __future__ import absolute_import
+
+import logging
+import re
+import timeit
+
+import click
+
+
+def scale_lines(text, number_jobs, separator):
+    """Scale a job list with one job per line, in which the job id is the first field, to the given number of jobs."""
+    lines = [line for line in text.splitlines() if separator in line]
+    scaled = []
+    for index in range(number_jobs):
+        _, rest = lines[index % len(lines)].split(separator, 1)
+        scaled.append('{}{}{}'.format(100000 + index, separator, rest))
+    return '\n'.join(scaled), [str(100000 + index) for index in range(number_jobs)]
+
+
+def scale_stanzas(text, number_jobs):
+    """Scale a `qstat -f` job list, with a stanza starting with a `Job Id:` line per job, to the given number of jobs."""
+    stanzas = ['Job Id:' + stanza for stanza in text.split('Job Id:')[1:]]
+    scaled = []
+    job_ids = []
+    for index in range(number_jobs):
+        job_id = '{}.mycluster'.format(100000 + index)
+        stanza = stanzas[index % len(stanzas)]
+        scaled.append(re.sub(r'^Job Id: \S+', 'Job Id: {}'.format(job_id), stanza))
+        job_ids.append(job_id)
+    return ''.join(scaled), job_ids
+
+
+def scale_xml(text, number_jobs):
+    """Scale a `qstat -xml` job list of SGE to the given number of jobs, all put in the pending jobs."""
+    elements = re.findall(r'<job_list.*?</job_list>', text, re.DOTALL)
+    scaled = []
+    job_ids = []
+    for index in range(number_jobs):
+        job_id = str(100000 + index)
+        element = elements[index % len(elements)]
+        scaled.append(re.sub(r'<JB_job_number>\d+</JB_job_number>', '<JB_job_number>{}</JB_job_number>'.format(job_id),
+                             element))
+        job_ids.append(job_id)
+    body = '\n'.join(scaled)
+    return ("<?xml version='1.0'?>\n<job_info>\n<queue_info>\n</queue_info>\n<job_info>\n{}\n</job_info>\n"
+            "</job_info>\n".format(body)), job_ids
+
+
+def get_cases(number_jobs):
+    """Return a list of tuples (name, scheduler, stdout, job ids) with the scaled up output of each plugin."""
+    from aiida.schedulers.plugins import lsf, pbspro, sge, slurm, torque
+    from aiida.schedulers.plugins import test_lsf, test_pbspro, test_sge, test_slurm, test_torque
+
+    cases = []
+
+    stdout, job_ids = scale_lines(test_slurm.TEXT_SQUEUE_TO_TEST, number_jobs, slurm._FIELD_SEPARATOR)  # pylint: disable=protected-access
+    cases.append(('slurm', slurm.SlurmScheduler(), stdout, job_ids))
+
+    stdout, job_ids = scale_lines(test_lsf.BJOBS_STDOUT_TO_TEST, number_jobs, lsf._FIELD_SEPARATOR)  # pylint: disable=protected-access
+    cases.append(('lsf', lsf.LsfScheduler(), stdout, job_ids))
+
+    stdout, job_ids = scale_stanzas(test_pbspro.text_qstat_f_to_test, number_jobs)
+    cases.append(('pbspro', pbspro.PbsproScheduler(), stdout, job_ids))
+
+    stdout, job_ids = scale_stanzas(test_torque.text_qstat_f_to_test, number_jobs)
+    cases.append(('torque', torque.TorqueScheduler(), stdout, job_ids))
+
+    stdout, job_ids = scale_xml(test_sge.text_qstat_ext_urg_xml_test, number_jobs)
+    cases.append(('sge', sge.SgeScheduler(), stdout, job_ids))
+
+    return cases
+
+
+@click.command()
+@click.option('-n', '--number-jobs', type=int, default=20000, show_default=True, help='Number of jobs in the output.')
+@click.option(
+    '-w', '--number-waiting', type=int, default=100, show_default=True, help='Number of jobs the engine waits for.')
+@click.option('-r', '--repeat', type=int, default=3, show_default=True, help='Number of repetitions of each timing.')
+@click.option('-s', '--scheduler', 'schedulers', multiple=True, help='Only benchmark the given scheduler plugins.')
+def benchmark(number_jobs, number_waiting, repeat, schedulers):
+    """Time the parsing of the job list output of each scheduler plugin, in full and filtered on a few jobs."""
+    # The synthetic outputs trigger warnings, e.g. for jobs with an incomplete set of fields, that are not of interest
+    logging.disable(logging.CRITICAL)
+
+    for name, scheduler, stdout, job_ids in get_cases(number_jobs):
+        if schedulers and name not in schedulers:
+            continue
+
+        waiting = set(job_ids[::max(1, len(job_ids) // number_waiting)][:number_waiting])
+
+        for label, kwargs in [('all jobs', {}), ('{} jobs'.format(len(waiting)), {'only_jobs': waiting})]:
+            timings = []
+            for _ in range(repeat):
+                start = timeit.default_timer()
+                joblist = scheduler._parse_joblist_output(0, stdout, '', **kwargs)  # pylint: disable=protected-access
+                timings.append(timeit.default_timer() - start)
+
+            click.echo('{:<8} {:<10} best of {}: {:.3f} s for {} lines, {} jobs parsed'.format(
+                name, label, repeat, min(timings), stdout.count('\n') + 1, len(joblist)))
+
+
+if __name__ == '__main__':
+    benchmark()  # pylint: disable=no-value-for-parameter
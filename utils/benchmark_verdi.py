@@ -0,0 +1,120 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+###########################################################################
+# Copyright (c), The AiiDA team. All rights reserved.                     #
+# This file is part of the AiiDA code.                                    #
+#                                                                         #
+# The code is hosted on GitHub at https://github.com/aiidateam/aiida_core #
+# For further information on the license, see the LICENSE.txt file        #
+# For further information please visit http://www.aiida.net               #
+###########################################################################
+""" Benchmark the startup time of `verdi`.
+
+Every invocation of `verdi`, including the completion of its arguments by the shell, starts a new interpreter that
+imports the `verdi` command group. The modules of the subcommands are only imported when a subcommand is invoked, so
+the startup time of `verdi --help` and of the completion of the subcommands should not depend on the number of
+subcommands or on the modules that they import. Each case is run in a fresh interpreter and the best time is compared
+with the given maximum, such that the script can be used to catch regressions of the startup time.
+"""
+from __future__ import division
+from __future__ import print_function
+from __future__ import absolute_import
+
+import os
+import subprocess
+import sys
+import timeit
+
+import click
+
+# Modules that should not be imported by `verdi` before a subcommand that needs them is invoked
+HEAVY_MODULES = ('aiida.orm', 'aiida.engine', 'django', 'numpy', 'plumpy', 'sqlalchemy')
+
+SCRIPT = """
+import sys
+from aiida.cmdline.commands.cmd_verdi import verdi
+try:
+    verdi({arguments!r}, prog_name='verdi')
+except SystemExit:
+    pass
+heavy = [module for module in sys.modules if module.startswith({heavy!r})]
+sys.stderr.write(' '.join(sorted(set(module.split('.')[0] for module in heavy))))
+"""
+
+CASES = [
+    ('import', None, {}),
+    ('verdi --help', ['--help'], {}),
+    ('verdi <TAB>', [], {
+        '_VERDI_COMPLETE': 'complete-bash',
+        'COMP_WORDS': 'verdi ',
+        'COMP_CWORD': '1'
+    }),
+    ('verdi process <TAB>', [], {
+        '_VERDI_COMPLETE': 'complete-bash',
+        'COMP_WORDS': 'verdi process ',
+        'COMP_CWORD': '2'
+    }),
+    ('verdi process list --help', ['process', 'list', '--help'], {}),
+]
+
+
+def time_interpreter():
+    """Return the wall time of starting an interpreter that does nothing, which is subtracted from the timings."""
+    start = timeit.default_timer()
+    subprocess.check_call([sys.executable, '-c', 'pass'])
+    return timeit.default_timer() - start
+
+
+def run_case(arguments, environment):
+    """Run `verdi` with the given arguments in a fresh interpreter and return the wall time and the heavy modules."""
+    if arguments is None:
+        script = 'import aiida.cmdline.commands.cmd_verdi'
+    else:
+        script = SCRIPT.format(arguments=arguments, heavy=HEAVY_MODULES)
+
+    env = dict(os.environ)
+    env.update(environment)
+
+    start = timeit.default_timer()
+    process = subprocess.Popen([sys.executable, '-c', script], stdout=subprocess.PIPE, stderr=subprocess.PIPE, env=env)
+    _, stderr = process.communicate()
+    duration = timeit.default_timer() - start
+
+    if process.returncode != 0:
+        raise click.ClickException('`{}` failed:\n{}'.format(arguments, stderr.decode('utf-8', 'replace')))
+
+    return duration, stderr.decode('utf-8', 'replace').strip()
+
+
+@click.command()
+@click.option('-r', '--repeat', type=int, default=5, show_default=True, help='Number of repetitions of each timing.')
+@click.option(
+    '-m',
+    '--maximum',
+    type=float,
+    default=None,
+    help='Fail if the best time of a case, minus the startup of the interpreter, exceeds this number of seconds.')
+def benchmark(repeat, maximum):
+    """Time the startup of `verdi` for the help, the completion and a quick subcommand."""
+    python = min(time_interpreter() for _ in range(repeat))
+    click.echo('{:<28} best of {}: {:.3f} s'.format('python -c pass', repeat, python))
+
+    failed = []
+
+    for label, arguments, environment in CASES:
+        timings = [run_case(arguments, environment) for _ in range(repeat)]
+        best = min(duration for duration, _ in timings)
+        heavy = timings[-1][1]
+
+        click.echo('{:<28} best of {}: {:.3f} s, {:.3f} s above the interpreter{}'.format(
+            label, repeat, best, best - python, ', imports: {}'.format(heavy) if heavy else ''))
+
+        if maximum is not None and best - python > maximum:
+            failed.append(label)
+
+    if failed:
+        raise click.ClickException('the startup took longer than {} s for: {}'.format(maximum, ', '.join(failed)))
+
+
+if __name__ == '__main__':
+    benchmark()  # pylint: disable=no-value-for-parameter